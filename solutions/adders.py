@@ -1,6 +1,6 @@
 """Adders - Solution File."""
 
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 from solutions.gates import AND, OR, XOR, NOT
 
 
@@ -22,7 +22,7 @@ def full_adder(a: int, b: int, cin: int) -> Tuple[int, int]:
     return (sum2, cout)
 
 
-def ripple_carry_adder_8bit(a: List[int], b: List[int], cin: int = 0) -> Tuple[List[int], int]:
+def ripple_carry_adder_8bit(a: Sequence[int], b: Sequence[int], cin: int = 0) -> Tuple[List[int], int]:
     """8-bit Ripple Carry Adder."""
     result = []
     carry = cin
@@ -1,8 +1,9 @@
 """ALU - Arithmetic Logic Unit - Solution File."""
 
-from typing import List, Tuple, Dict
+from typing import List, Mapping, Sequence, Tuple
 from solutions.gates import AND, OR, XOR, NOT
 from solutions.adders import ripple_carry_adder_8bit, subtractor_8bit
+from solutions.flags import LazyFlags
 
 
 class ALU:
@@ -18,8 +19,8 @@ class ALU:
     OP_SHR = [1, 1, 1, 0]
     OP_CMP = [0, 0, 0, 1]
 
-    def __call__(self, a: List[int], b: List[int], opcode: List[int]) -> Tuple[List[int], Dict[str, int]]:
-        """Execute an ALU operation."""
+    def __call__(self, a: List[int], b: List[int], opcode: List[int]) -> Tuple[Sequence[int], Mapping[str, int]]:
+        """Execute an ALU operation (flags are evaluated when read, see LazyFlags)."""
         result = [0] * 8
         carry = 0
         overflow = 0
@@ -29,8 +30,8 @@ class ALU:
 
         if op_val == 0:  # ADD
             result, carry = self._add(a, b)
-            # Check for signed overflow
-            overflow = AND(XOR(a[7], result[7]), AND(NOT(XOR(a[7], b[7])), 1))
+            # Signed overflow is computed from the sign bits when V is read
+            return result, LazyFlags(result, carry, signs=(a[7], b[7]))
         elif op_val == 1:  # SUB
             result, borrow, overflow = self._sub(a, b)
             carry = borrow
@@ -50,12 +51,10 @@ class ALU:
             # Compare sets flags based on subtraction but returns A
             sub_result, carry, overflow = self._sub(a, b)
             result = a.copy()
-            # Calculate flags based on the subtraction result, not the returned result
-            flags = self._calculate_flags(sub_result, carry, overflow)
-            return result, flags
+            # Flags describe the subtraction result, not the returned result
+            return result, LazyFlags(sub_result, carry, overflow)
 
-        flags = self._calculate_flags(result, carry, overflow)
-        return result, flags
+        return result, LazyFlags(result, carry, overflow)
 
     def _add(self, a: List[int], b: List[int]) -> Tuple[List[int], int]:
         """Perform addition."""
@@ -92,20 +91,3 @@ class ALU:
         carry = a[0]  # LSB becomes carry
         result = a[1:8] + [0]  # Shift right, MSB becomes 0
         return result, carry
-
-    def _calculate_flags(self, result: List[int], carry: int, overflow: int) -> Dict[str, int]:
-        """Calculate status flags."""
-        # Zero flag: 1 if all bits are 0
-        z = NOT(
-            OR(
-                OR(OR(result[0], result[1]), OR(result[2], result[3])),
-                OR(OR(result[4], result[5]), OR(result[6], result[7])),
-            )
-        )
-
-        return {
-            "Z": z,
-            "C": carry,
-            "N": result[7],  # Negative = MSB
-            "V": overflow,
-        }
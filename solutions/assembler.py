@@ -1,26 +1,115 @@
 """Assembler - Solution File."""
 
 from typing import List, Dict, Optional
+from solutions.bits import bits_to_int
 from solutions.isa import encode_instruction
+from solutions.optimizer import PeepholeOptimizer
+
+
+ADDRESS_OPCODES = ["LOAD", "STORE", "JMP", "JZ", "JNZ"]
+
+
+class ObjectModule:
+    """Relocatable object module."""
+
+    def __init__(self, name: str = ""):
+        """Initialize an empty object module."""
+        self.name = name
+        self.code: List[int] = []  # section bytes, offset 0 = module base
+        self.symbols: Dict[str, int] = {}  # label -> offset
+        self.exports: Dict[str, int] = {}  # exported label -> offset
+        self.imports: List[str] = []
+        self.relocations: List[tuple] = []  # (offset of address byte, symbol)
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "code": list(self.code),
+            "symbols": dict(self.symbols),
+            "exports": dict(self.exports),
+            "imports": list(self.imports),
+            "relocations": [list(r) for r in self.relocations],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ObjectModule":
+        """Rebuild a module from to_dict() output."""
+        module = cls(data.get("name", ""))
+        module.code = list(data.get("code", []))
+        module.symbols = dict(data.get("symbols", {}))
+        module.exports = dict(data.get("exports", {}))
+        module.imports = list(data.get("imports", []))
+        module.relocations = [tuple(r) for r in data.get("relocations", [])]
+        return module
 
 
 class Assembler:
     """Two-pass assembler."""
 
-    def __init__(self):
+    def __init__(self, optimize: bool = False):
         """Initialize assembler state."""
+        self.optimize = optimize
+        self.optimizer = PeepholeOptimizer()
         self.symbol_table: Dict[str, int] = {}
         self.errors: List[str] = []
         self.data_bytes: Dict[int, int] = {}  # addr -> value
+        self.exports: List[str] = []
+        self.imports: List[str] = []
 
     def assemble(self, source: str) -> List[List[int]]:
         """Assemble source code to machine code."""
         self.symbol_table = {}
         self.errors = []
         self.data_bytes = {}
+        self.exports = []
+        self.imports = []
         parsed_lines = self.first_pass(source)
+        if self.optimize:
+            parsed_lines = self.optimizer.optimize(parsed_lines, self)
         return self.second_pass(parsed_lines)
 
+    def assemble_object(self, source: str, name: str = "") -> ObjectModule:
+        """Assemble source code to a relocatable object module."""
+        self.symbol_table = {}
+        self.errors = []
+        self.data_bytes = {}
+        self.exports = []
+        self.imports = []
+        parsed_lines = self.first_pass(source)
+        machine_code = self.second_pass(parsed_lines)
+        module = ObjectModule(name)
+
+        size = 0
+        for parsed in parsed_lines:
+            size = max(size, parsed["address"] + 2)
+        for addr in self.data_bytes:
+            size = max(size, addr + 1)
+        module.code = [0] * size
+
+        for parsed, instruction in zip(parsed_lines, machine_code):
+            addr = parsed["address"]
+            module.code[addr] = bits_to_int(instruction[:8])
+            module.code[addr + 1] = bits_to_int(instruction[8:])
+
+            # Address fields that name a symbol must be patched at link time
+            operands = parsed.get("operands", [])
+            if parsed["opcode"] in ADDRESS_OPCODES and operands:
+                target = operands[-1].strip()
+                if target in self.symbol_table or target in self.imports:
+                    module.relocations.append((addr, target))
+        for addr, value in self.data_bytes.items():
+            module.code[addr] = value & 0xFF
+
+        module.symbols = dict(self.symbol_table)
+        module.imports = list(self.imports)
+        for symbol in self.exports:
+            if symbol in self.symbol_table:
+                module.exports[symbol] = self.symbol_table[symbol]
+            else:
+                self.errors.append(f"Exported symbol '{symbol}' is not defined")
+        return module
+
     def first_pass(self, source: str) -> List[Dict]:
         """First pass: build symbol table and parse lines."""
         parsed_lines = []
@@ -42,6 +131,10 @@ class Assembler:
 
             if parsed.get("directive") == ".org":
                 address = parsed["value"]
+            elif parsed.get("directive") == ".global":
+                self.exports.extend(s for s in parsed["symbols"] if s not in self.exports)
+            elif parsed.get("directive") == ".extern":
+                self.imports.extend(s for s in parsed["symbols"] if s not in self.imports)
             elif parsed.get("directive") == ".byte":
                 # Store the byte value at current address
                 self.data_bytes[address] = parsed.get("value", 0)
@@ -101,7 +194,10 @@ class Assembler:
         if line.startswith("."):
             parts = line.split(None, 1)
             result["directive"] = parts[0].lower()
-            if len(parts) > 1:
+            if result["directive"] in [".global", ".extern"]:
+                # Symbol directives take a comma-separated list of names
+                result["symbols"] = [s.strip() for s in parts[1].split(",")] if len(parts) > 1 else []
+            elif len(parts) > 1:
                 result["value"] = self._parse_value(parts[1])
             return result
 
@@ -123,6 +219,8 @@ class Assembler:
         operand = operand.strip()
         if operand in self.symbol_table:
             return self.symbol_table[operand]
+        if operand in self.imports:
+            return 0  # resolved by the linker
         if operand.startswith("0x") or operand.startswith("0X"):
             return int(operand, 16)
         return int(operand)
@@ -0,0 +1,236 @@
+"""Memory-Mapped I/O Bus - Solution File."""
+
+from typing import Callable, Iterable, List, Optional
+from solutions.bits import bits_to_int, int_to_bits
+
+PAGE_BITS = 4  # 16 pages of 16 bytes
+PAGE_SIZE = 1 << PAGE_BITS
+
+# Standard memory map (all in the last page)
+CONSOLE_OUT = 0xF0
+CONSOLE_PENDING = 0xF1
+INPUT_DATA = 0xF2
+INPUT_STATUS = 0xF3
+CYCLES_LOW = 0xF4
+CYCLES_HIGH = 0xF5
+
+
+class Device:
+    """Base class for memory-mapped devices; offsets are relative to the mapped base."""
+
+    size = 1
+
+    def read(self, offset: int) -> int:
+        """Return the byte at offset."""
+        return 0
+
+    def write(self, offset: int, value: int) -> None:
+        """Handle a byte written at offset."""
+
+
+class ConsoleOutput(Device):
+    """Buffered output port: bytes are collected and flushed in bulk.
+
+    Offset 0 (write): output byte. Offset 1 (read): bytes waiting in the buffer.
+    """
+
+    size = 2
+
+    def __init__(self, sink: Optional[Callable[[bytes], object]] = None, buffer_size: int = 64):
+        """Initialize with a sink called with each flushed chunk (default: keep in self.output)."""
+        self.sink = sink
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+        self.output = bytearray()
+        self.flushes = 0
+
+    def read(self, offset: int) -> int:
+        """Offset 1 reports how many bytes are pending."""
+        return min(len(self.buffer), 0xFF) if offset == 1 else 0
+
+    def write(self, offset: int, value: int) -> None:
+        """Append a byte, flushing when the buffer is full."""
+        if offset == 0:
+            self.buffer.append(value)
+            if len(self.buffer) >= self.buffer_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Send all pending bytes to the sink in one call."""
+        if not self.buffer:
+            return
+        if self.sink is not None:
+            self.sink(bytes(self.buffer))
+        self.output += self.buffer
+        self.buffer.clear()
+        self.flushes += 1
+
+    def text(self) -> str:
+        """Everything written so far, flushed or not."""
+        return (self.output + self.buffer).decode("latin-1")
+
+
+class InputPort(Device):
+    """Input port fed from an iterator of bytes.
+
+    Offset 0 (read): next byte (0 when exhausted). Offset 1 (read): 1 if a byte is available.
+    """
+
+    size = 2
+
+    def __init__(self, source: Iterable[int] = ()):
+        """Initialize from any iterable of byte values (str is encoded as latin-1)."""
+        if isinstance(source, str):
+            source = source.encode("latin-1")
+        self.source = iter(source)
+        self.next_byte: Optional[int] = None
+        self._advance()
+
+    def _advance(self) -> None:
+        value = next(self.source, None)
+        self.next_byte = None if value is None else value & 0xFF
+
+    def read(self, offset: int) -> int:
+        """Consume a byte (offset 0) or report availability (offset 1)."""
+        if offset == 1:
+            return int(self.next_byte is not None)
+        if self.next_byte is None:
+            return 0
+        value = self.next_byte
+        self._advance()
+        return value
+
+
+class CycleCounter(Device):
+    """Free-running 16-bit cycle counter read from the CPU clock.
+
+    Offset 0: low byte, offset 1: high byte. Writing any offset restarts it at 0.
+    """
+
+    size = 2
+
+    def __init__(self, clock):
+        """Initialize from a Clock; nothing is counted per cycle, the clock is read on demand."""
+        self.clock = clock
+        self.start = clock.cycle
+
+    def read(self, offset: int) -> int:
+        """Return one byte of the cycles elapsed since start."""
+        elapsed = (self.clock.cycle - self.start) & 0xFFFF
+        return elapsed >> 8 if offset else elapsed & 0xFF
+
+    def write(self, offset: int, value: int) -> None:
+        """Restart the counter."""
+        self.start = self.clock.cycle
+
+
+class Bus:
+    """Address decoder in front of RAM.
+
+    A page table maps each 16-byte page either to None (plain RAM) or to a
+    per-address list of (device, offset). Ordinary RAM accesses cost a single
+    table lookup.
+    """
+
+    def __init__(self, ram):
+        """Initialize a bus with no devices."""
+        self.ram = ram
+        self.pages: List[Optional[list]] = [None] * (ram.size >> PAGE_BITS)
+        self.devices: List[Device] = []
+
+    def map(self, base: int, device: Device) -> Device:
+        """Map device.size addresses starting at base to a device; returns the device."""
+        for offset in range(device.size):
+            address = base + offset
+            if not 0 <= address < self.ram.size:
+                raise ValueError(f"Device address 0x{address:02X} is outside memory")
+            page = self.pages[address >> PAGE_BITS]
+            if page is None:
+                page = self.pages[address >> PAGE_BITS] = [None] * PAGE_SIZE
+            if page[address & (PAGE_SIZE - 1)] is not None:
+                raise ValueError(f"Address 0x{address:02X} is already mapped")
+            page[address & (PAGE_SIZE - 1)] = (device, offset)
+        self.devices.append(device)
+        return device
+
+    def device_addresses(self) -> set:
+        """All addresses mapped to devices."""
+        return {
+            (index << PAGE_BITS) | slot
+            for index, page in enumerate(self.pages)
+            if page is not None
+            for slot, entry in enumerate(page)
+            if entry is not None
+        }
+
+    def _lookup(self, address: List[int]):
+        index = bits_to_int(address)
+        page = self.pages[index >> PAGE_BITS]
+        return None if page is None else page[index & (PAGE_SIZE - 1)]
+
+    def read(self, address: List[int]) -> List[int]:
+        """Read from RAM or from the device mapped at address."""
+        entry = self._lookup(address)
+        if entry is None:
+            return self.ram.read(address)
+        device, offset = entry
+        value = device.read(offset)
+        return int_to_bits(value)
+
+    def write(self, address: List[int], data: List[int], enable: int) -> None:
+        """Write to RAM or to the device mapped at address."""
+        entry = self._lookup(address)
+        if entry is None:
+            self.ram.write(address, data, enable)
+        elif enable == 1:
+            device, offset = entry
+            device.write(offset, bits_to_int(data))
+
+    @property
+    def memory(self) -> List[List[int]]:
+        """Backing RAM contents."""
+        return self.ram.memory
+
+    @property
+    def size(self) -> int:
+        """Address space size."""
+        return self.ram.size
+
+    def load_program(self, program: List[List[int]], start_addr: int = 0) -> None:
+        """Load bytes directly into RAM."""
+        self.ram.load_program(program, start_addr)
+
+    def dump(self, start: int = 0, end: int = 16) -> str:
+        """Dump RAM contents."""
+        return self.ram.dump(start, end)
+
+    def flush(self) -> None:
+        """Flush every buffered device."""
+        for device in self.devices:
+            if isinstance(device, ConsoleOutput):
+                device.flush()
+
+    def attach(self, computer) -> None:
+        """Put the bus in front of a Computer's data memory.
+
+        Instruction fetch keeps reading RAM directly. Device addresses are
+        added to the optimizer's volatile set so loads from them are never folded.
+        """
+        computer.cpu.datapath.memory = self
+        computer.assembler.optimizer.volatile |= self.device_addresses()
+
+
+class IOSystem:
+    """Standard devices on a bus: console at 0xF0, input at 0xF2, cycle counter at 0xF4."""
+
+    def __init__(self, computer, input_data: Iterable[int] = (), sink: Optional[Callable] = None):
+        """Create the standard devices and attach the bus to a Computer."""
+        self.bus = Bus(computer.cpu.datapath.memory)
+        self.console = self.bus.map(CONSOLE_OUT, ConsoleOutput(sink))
+        self.input = self.bus.map(INPUT_DATA, InputPort(input_data))
+        self.cycles = self.bus.map(CYCLES_LOW, CycleCounter(computer.cpu.clock))
+        self.bus.attach(computer)
+
+    def flush(self) -> None:
+        """Flush the console."""
+        self.bus.flush()
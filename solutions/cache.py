@@ -0,0 +1,242 @@
+"""Cache Hierarchy - Solution File."""
+
+import random
+from array import array
+from typing import Dict, List, Optional
+from solutions.bits import bits_to_int
+
+POLICIES = ["lru", "fifo", "random"]
+
+
+class Cache:
+    """Set-associative cache model (tags only).
+
+    Data always comes from RAM, so a cache can never change what a program
+    computes; it only records which accesses would have hit.
+    """
+
+    def __init__(
+        self,
+        size: int = 32,
+        line_size: int = 4,
+        associativity: int = 2,
+        policy: str = "lru",
+        write_back: bool = False,
+        name: str = "cache",
+        seed: int = 0,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            size: Capacity in bytes (power of 2)
+            line_size: Bytes per line (power of 2)
+            associativity: Lines per set (power of 2; size // line_size for fully associative)
+            policy: Replacement policy: 'lru', 'fifo' or 'random'
+            write_back: Write-back with write-allocate (default: write-through, no allocate)
+            name: Name used in reports
+            seed: Seed for the 'random' policy
+        """
+        for label, value in (("size", size), ("line_size", line_size), ("associativity", associativity)):
+            if value < 1 or value & (value - 1):
+                raise ValueError(f"{label} must be a power of 2, got {value}")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown replacement policy: {policy}")
+        if line_size * associativity > size:
+            raise ValueError("size must hold at least one set")
+
+        self.size = size
+        self.line_size = line_size
+        self.associativity = associativity
+        self.policy = policy
+        self.write_back = write_back
+        self.name = name
+        self.num_sets = size // (line_size * associativity)
+        self.offset_bits = line_size.bit_length() - 1
+        self.rng = random.Random(seed)
+
+        lines = self.num_sets * associativity
+        self.tags = array("h", [-1]) * lines  # line number held by each way, -1 = invalid
+        self.stamps = array("L", [0]) * lines  # last use (LRU) or fill time (FIFO)
+        self.dirty = bytearray(lines)
+        self.time = 0
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Clear statistics (cache contents are kept)."""
+        self.stats = {
+            "reads": 0,
+            "writes": 0,
+            "read_misses": 0,
+            "write_misses": 0,
+            "evictions": 0,
+            "writebacks": 0,
+        }
+
+    def invalidate(self) -> None:
+        """Empty the cache (dirty lines are counted as written back)."""
+        self.stats["writebacks"] += sum(self.dirty)
+        for i in range(len(self.tags)):
+            self.tags[i] = -1
+            self.dirty[i] = 0
+
+    def access(self, address: int, write: bool = False) -> bool:
+        """Record one byte access; returns True on a hit."""
+        stats = self.stats
+        stats["writes" if write else "reads"] += 1
+        self.time += 1
+        line = address >> self.offset_bits
+        base = (line % self.num_sets) * self.associativity
+        ways = range(base, base + self.associativity)
+
+        for way in ways:
+            if self.tags[way] == line:
+                if self.policy == "lru":
+                    self.stamps[way] = self.time
+                if write and self.write_back:
+                    self.dirty[way] = 1
+                return True
+
+        stats["write_misses" if write else "read_misses"] += 1
+        if write and not self.write_back:
+            return False  # no-write-allocate: the write goes straight to RAM
+
+        way = self._victim(ways)
+        if self.tags[way] != -1:
+            stats["evictions"] += 1
+            if self.dirty[way]:
+                stats["writebacks"] += 1
+        self.tags[way] = line
+        self.stamps[way] = self.time
+        self.dirty[way] = write
+        return False
+
+    def _victim(self, ways: range) -> int:
+        """Pick the way to fill: an invalid one, else by replacement policy."""
+        for way in ways:
+            if self.tags[way] == -1:
+                return way
+        if self.policy == "random":
+            return self.rng.choice(ways)
+        return min(ways, key=self.stamps.__getitem__)
+
+    def report(self, miss_penalty: int = 10) -> Dict:
+        """Statistics plus hit rate and estimated stall cycles."""
+        stats = self.stats
+        accesses = stats["reads"] + stats["writes"]
+        misses = stats["read_misses"] + stats["write_misses"]
+        report = dict(stats, name=self.name, hits=accesses - misses, misses=misses)
+        report["hit_rate"] = (accesses - misses) / accesses if accesses else 0.0
+        # Misses that fill a line and dirty evictions each wait for RAM;
+        # write-through writes are assumed to be absorbed by a write buffer
+        fills = stats["read_misses"] + (stats["write_misses"] if self.write_back else 0)
+        report["stall_cycles"] = (fills + stats["writebacks"]) * miss_penalty
+        return report
+
+
+class CachedRAM:
+    """RAM port that records every access in a cache."""
+
+    def __init__(self, ram, cache: Cache):
+        """Wrap a RAM (or another port) with a cache."""
+        self.ram = ram
+        self.cache = cache
+
+    @property
+    def memory(self) -> List[List[int]]:
+        """Backing RAM contents (direct access is not counted)."""
+        return self.ram.memory
+
+    @property
+    def size(self) -> int:
+        """Backing RAM size."""
+        return self.ram.size
+
+    def read(self, address: List[int]) -> List[int]:
+        """Read a byte through the cache."""
+        self.cache.access(bits_to_int(address))
+        return self.ram.read(address)
+
+    def write(self, address: List[int], data: List[int], enable: int) -> None:
+        """Write a byte through the cache."""
+        if enable == 1:
+            self.cache.access(bits_to_int(address), write=True)
+        self.ram.write(address, data, enable)
+
+    def load_program(self, program: List[List[int]], start_addr: int = 0) -> None:
+        """Load bytes directly into RAM (not counted)."""
+        self.ram.load_program(program, start_addr)
+
+    def dump(self, start: int = 0, end: int = 16) -> str:
+        """Dump RAM contents."""
+        return self.ram.dump(start, end)
+
+
+class CacheHierarchy:
+    """Split I-cache and D-cache in front of a DataPath's RAM."""
+
+    def __init__(self, icache: Optional[Cache] = None, dcache: Optional[Cache] = None, miss_penalty: int = 10):
+        """Initialize with the given caches (either may be None for no cache)."""
+        self.icache = icache
+        self.dcache = dcache
+        self.miss_penalty = miss_penalty
+        self.datapath = None
+
+    def attach(self, datapath) -> None:
+        """Route instruction fetch through the I-cache and LOAD/STORE through the D-cache."""
+        self.datapath = datapath
+        ram = datapath.memory
+        if self.icache is not None:
+            datapath.instruction_memory = CachedRAM(ram, self.icache)
+        if self.dcache is not None:
+            datapath.memory = CachedRAM(ram, self.dcache)
+
+    def detach(self) -> None:
+        """Connect the DataPath straight to RAM again."""
+        datapath = self.datapath
+        if datapath is None:
+            return
+        ram = datapath.memory.ram if isinstance(datapath.memory, CachedRAM) else datapath.memory
+        datapath.memory = datapath.instruction_memory = ram
+        self.datapath = None
+
+    def caches(self) -> List[Cache]:
+        """The caches that are present."""
+        return [cache for cache in (self.icache, self.dcache) if cache is not None]
+
+    def reset_stats(self) -> None:
+        """Clear statistics of all caches."""
+        for cache in self.caches():
+            cache.reset_stats()
+
+    def report(self) -> Dict:
+        """Reports of the caches present (keyed 'icache' and 'dcache') plus total estimated memory stall cycles."""
+        report: Dict = {}
+        stall_cycles = 0
+        for role, cache in (("icache", self.icache), ("dcache", self.dcache)):
+            if cache is not None:
+                report[role] = cache.report(self.miss_penalty)
+                stall_cycles += report[role]["stall_cycles"]
+        report["stall_cycles"] = stall_cycles
+        return report
+
+
+def memory_profile(
+    source,
+    icache: Optional[Cache] = None,
+    dcache: Optional[Cache] = None,
+    miss_penalty: int = 10,
+    max_cycles: int = 10000,
+) -> Dict:
+    """Run a program with caches attached and report hits, misses and stall cycles."""
+    from solutions.system import Computer
+
+    if icache is None and dcache is None:
+        icache, dcache = Cache(name="icache"), Cache(name="dcache")
+    computer = Computer()
+    computer.load_program(source)
+    hierarchy = CacheHierarchy(icache, dcache, miss_penalty)
+    hierarchy.attach(computer.cpu.datapath)
+    steps = computer.cpu.run(max_cycles)
+    report = hierarchy.report()
+    report["instructions"] = steps
+    return report
@@ -102,6 +102,8 @@ def encoder_8to3(inputs: List[int]) -> List[int]:
     out1 = OR(OR(inputs[6], inputs[7]), AND(NOT(any_upper), OR(inputs[2], inputs[3])))
 
     # out0 is 1 when highest active has bit 0 set (1,3 in lower half; 5,7 in upper half)
-    out0 = OR(OR(inputs[5], inputs[7]), AND(NOT(any_upper), OR(inputs[1], inputs[3])))
+    upper_odd = OR(inputs[7], AND(inputs[5], NOT(inputs[6])))
+    lower_odd = OR(inputs[3], AND(inputs[1], NOT(inputs[2])))
+    out0 = OR(AND(any_upper, upper_odd), AND(NOT(any_upper), lower_odd))
 
     return [out0, out1, out2]
@@ -0,0 +1,640 @@
+"""Compiler - Solution File."""
+
+from typing import List, Dict, Optional, Tuple
+from solutions.bits import bits_to_int, int_to_bits
+
+SYMBOLS = ["<<", ">>", "==", "!=", "+", "-", "*", "&", "|", "^", "~", "(", ")", "{", "}", "=", ";"]
+KEYWORDS = ["while", "if", "else"]
+PRECEDENCE = [["|"], ["^"], ["&"], ["<<", ">>"], ["+", "-"], ["*"]]
+ALU_OPS = {"+": "ADD", "-": "SUB", "&": "AND", "|": "OR", "^": "XOR"}
+FLAG_OPS = ["ADD", "SUB", "AND", "OR", "XOR", "NOT", "SHL", "SHR"]
+NUM_REGISTERS = 8
+
+
+class CompileError(Exception):
+    """Error in the source program."""
+
+
+def tokenize(source: str) -> List[str]:
+    """Split source code into tokens."""
+    tokens = []
+    i = 0
+    while i < len(source):
+        ch = source[i]
+        if ch == "#":
+            while i < len(source) and source[i] != "\n":
+                i += 1
+        elif ch.isspace():
+            i += 1
+        elif ch.isalnum() or ch == "_":
+            j = i
+            while j < len(source) and (source[j].isalnum() or source[j] == "_"):
+                j += 1
+            tokens.append(source[i:j])
+            i = j
+        elif source[i : i + 2] in SYMBOLS:
+            tokens.append(source[i : i + 2])
+            i += 2
+        elif ch in SYMBOLS:
+            tokens.append(ch)
+            i += 1
+        else:
+            raise CompileError(f"Unexpected character '{ch}'")
+    return tokens
+
+
+def parse_number(token: str) -> int:
+    """Parse a decimal or 0x-prefixed number token."""
+    try:
+        return int(token, 16) if token.lower().startswith("0x") else int(token)
+    except ValueError:
+        raise CompileError(f"Invalid number '{token}'")
+
+
+class Parser:
+    """Recursive-descent parser producing a tuple-based syntax tree."""
+
+    def __init__(self, tokens: List[str]):
+        """Initialize parser over a token list."""
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self) -> Optional[str]:
+        """Return the next token without consuming it."""
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, expected: Optional[str] = None) -> str:
+        """Consume the next token, checking it if `expected` is given."""
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise CompileError(f"Expected '{expected or 'token'}' but found '{token or 'end of input'}'")
+        self.pos += 1
+        return token
+
+    def parse_program(self) -> List[Tuple]:
+        """Parse statements until the end of input."""
+        statements = []
+        while self.peek() is not None:
+            statements.append(self.parse_statement())
+        return statements
+
+    def parse_block(self) -> List[Tuple]:
+        """Parse a braced list of statements."""
+        self.take("{")
+        statements = []
+        while self.peek() != "}":
+            statements.append(self.parse_statement())
+        self.take("}")
+        return statements
+
+    def parse_statement(self) -> Tuple:
+        """Parse an assignment, while or if statement."""
+        token = self.take()
+        if token == "while":
+            condition = self.parse_condition()
+            return ("while", condition, self.parse_block())
+        if token == "if":
+            condition = self.parse_condition()
+            then = self.parse_block()
+            otherwise: List[Tuple] = []
+            if self.peek() == "else":
+                self.take()
+                otherwise = self.parse_block()
+            return ("if", condition, then, otherwise)
+        if not _is_name(token):
+            raise CompileError(f"Expected a statement but found '{token}'")
+        self.take("=")
+        statement = ("assign", token, self.parse_expr())
+        if self.peek() == ";":
+            self.take()
+        return statement
+
+    def parse_condition(self) -> Tuple:
+        """Parse `expr`, `expr == expr` or `expr != expr` as (negate, expr)."""
+        expr = self.parse_expr()
+        if self.peek() in ["==", "!="]:
+            negate = self.take() == "=="
+            return (negate, ("bin", "-", expr, self.parse_expr()))
+        return (False, expr)
+
+    def parse_expr(self, level: int = 0) -> Tuple:
+        """Parse a binary expression using precedence climbing."""
+        if level == len(PRECEDENCE):
+            return self.parse_unary()
+        node = self.parse_expr(level + 1)
+        while self.peek() in PRECEDENCE[level]:
+            op = self.take()
+            node = ("bin", op, node, self.parse_expr(level + 1))
+        return node
+
+    def parse_unary(self) -> Tuple:
+        """Parse a number, variable, negation or parenthesized expression."""
+        token = self.take()
+        if token == "~":
+            return ("not", self.parse_unary())
+        if token == "-":
+            return ("bin", "-", ("num", 0), self.parse_unary())
+        if token == "(":
+            node = self.parse_expr()
+            self.take(")")
+            return node
+        if token[0].isdigit():
+            return ("num", parse_number(token) & 0xFF)
+        if _is_name(token):
+            return ("var", token)
+        raise CompileError(f"Unexpected '{token}' in expression")
+
+
+def _is_name(token: str) -> bool:
+    return (token[0].isalpha() or token[0] == "_") and token not in KEYWORDS
+
+
+def evaluate(op: str, a: int, b: int) -> int:
+    """Evaluate a binary operator on 8-bit constants."""
+    if op == "+":
+        return (a + b) & 0xFF
+    if op == "-":
+        return (a - b) & 0xFF
+    if op == "*":
+        return (a * b) & 0xFF
+    if op == "&":
+        return a & b
+    if op == "|":
+        return a | b
+    if op == "^":
+        return a ^ b
+    if op == "<<":
+        return (a << b) & 0xFF
+    return a >> b
+
+
+def fold(node: Tuple) -> Tuple:
+    """Fold constant subexpressions and simplify algebraic identities."""
+    if node[0] == "not":
+        inner = fold(node[1])
+        return ("num", ~inner[1] & 0xFF) if inner[0] == "num" else ("not", inner)
+    if node[0] != "bin":
+        return node
+
+    op, left, right = node[1], fold(node[2]), fold(node[3])
+    if left[0] == "num" and right[0] == "num":
+        return ("num", evaluate(op, left[1], right[1]))
+    if right[0] == "num":
+        if right[1] == 0 and op in ["+", "-", "|", "^", "<<", ">>"]:
+            return left
+        if (right[1] == 0 and op in ["*", "&"]) or (op in ["<<", ">>"] and right[1] >= 8):
+            return ("num", 0)
+        if (right[1] == 1 and op == "*") or (right[1] == 0xFF and op == "&"):
+            return left
+    if left[0] == "num" and op in ["+", "*", "&", "|", "^"]:
+        return fold(("bin", op, right, left))
+    return ("bin", op, left, right)
+
+
+class CodeGenerator:
+    """Lowers a syntax tree to three-address code over virtual registers."""
+
+    def __init__(self, optimize: bool):
+        """Initialize generator state."""
+        self.optimize = optimize
+        self.ir: List[Tuple] = []
+        self.num_vregs = 0
+        self.num_labels = 0
+        self.depth = 0
+        self.variables: Dict[str, int] = {}  # name -> vreg (register-resident variables)
+        self.needs_init: List[str] = []
+        self.constants: Dict[int, int] = {}  # value -> hoisted vreg
+        self.slots: Dict[int, str] = {}  # vreg -> memory label holding its value
+        self.data: Dict[str, int] = {}  # label -> initial byte
+
+    def new_vreg(self) -> int:
+        """Allocate a virtual register."""
+        self.num_vregs += 1
+        return self.num_vregs - 1
+
+    def new_label(self) -> str:
+        """Allocate a code label."""
+        self.num_labels += 1
+        return f"L{self.num_labels - 1}"
+
+    def emit(self, *instr) -> None:
+        """Append an IR instruction."""
+        self.ir.append(instr)
+
+    def generate(self, program: List[Tuple]) -> List[Tuple]:
+        """Generate IR for a whole program."""
+        self.gen_block(program)
+        for name, vreg in self.variables.items():
+            self.emit("STORE", vreg, f"v_{name}")
+        self.emit("HALT")
+
+        prologue = [("LOAD", vreg, f"c_{value}") for value, vreg in self.constants.items()]
+        prologue += [("LOAD", self.variables[name], f"v_{name}") for name in self.needs_init]
+        return prologue + self.ir
+
+    def gen_block(self, statements: List[Tuple]) -> None:
+        """Generate IR for a list of statements."""
+        for statement in statements:
+            if statement[0] == "assign":
+                self.gen_assign(statement[1], statement[2])
+            elif statement[0] == "while":
+                self.gen_while(statement[1], statement[2])
+            else:
+                self.gen_if(statement[1], statement[2], statement[3])
+
+    def variable(self, name: str, read: bool) -> Optional[int]:
+        """Return the vreg of a register-resident variable (None when unoptimized)."""
+        label = f"v_{name}"
+        if label not in self.data:
+            self.data[label] = 0
+            if self.optimize:
+                self.variables[name] = self.new_vreg()
+                self.slots[self.variables[name]] = label
+                if read or self.depth > 0:
+                    self.needs_init.append(name)
+        return self.variables.get(name)
+
+    def constant(self, value: int, target: Optional[int] = None) -> int:
+        """Return a vreg holding a constant."""
+        label = f"c_{value}"
+        self.data.setdefault(label, value)
+        if self.optimize and target is None:
+            if value not in self.constants:
+                self.constants[value] = self.new_vreg()
+                self.slots[self.constants[value]] = label
+            return self.constants[value]
+        dest = self.new_vreg() if target is None else target
+        self.emit("LOAD", dest, label)
+        return dest
+
+    def gen_assign(self, name: str, expr: Tuple) -> None:
+        """Generate an assignment."""
+        if self.optimize:
+            expr = fold(expr)
+            self.gen_expr(expr, self.variable(name, read=_reads(expr, name)))
+        else:
+            self.variable(name, read=False)
+            self.emit("STORE", self.gen_expr(expr), f"v_{name}")
+
+    def gen_expr(self, node: Tuple, target: Optional[int] = None) -> int:
+        """Generate an expression, placing the result in `target` if given."""
+        kind = node[0]
+        if kind == "num":
+            return self.constant(node[1], target)
+        if kind == "var":
+            vreg = self.variable(node[1], read=True)
+            if vreg is None:
+                vreg = self.new_vreg() if target is None else target
+                self.emit("LOAD", vreg, f"v_{node[1]}")
+            elif target is not None and target != vreg:
+                self.emit("MOV", target, vreg)
+                return target
+            return vreg
+        if kind == "not":
+            source = self.gen_expr(node[1])
+            dest = self.new_vreg() if target is None else target
+            self.emit("NOT", dest, source)
+            return dest
+
+        op, left, right = node[1], node[2], node[3]
+        if op in ["<<", ">>"]:
+            return self.gen_shift(op, left, constant_value(right), target)
+        if op == "*":
+            if self.optimize and right[0] == "num":
+                return self.gen_mul_const(left, right[1], target)
+            return self.gen_mul_loop(left, right, target)
+        a = self.gen_expr(left)
+        b = self.gen_expr(right)
+        dest = self.new_vreg() if target is None else target
+        self.emit(ALU_OPS[op], dest, a, b)
+        return dest
+
+    def gen_shift(self, op: str, left: Tuple, count: int, target: Optional[int]) -> int:
+        """Generate a shift by a constant as a chain of SHL/SHR."""
+        source = self.gen_expr(left)
+        if count == 0:
+            if target is not None and target != source:
+                self.emit("MOV", target, source)
+                return target
+            return source
+        for step in range(min(count, 8)):
+            last = step == min(count, 8) - 1
+            dest = target if last and target is not None else self.new_vreg()
+            self.emit("SHL" if op == "<<" else "SHR", dest, source)
+            source = dest
+        return source
+
+    def gen_mul_const(self, left: Tuple, value: int, target: Optional[int]) -> int:
+        """Strength-reduce multiplication by a constant to shifts and adds."""
+        x = self.gen_expr(left)
+        ops = []
+        for bit in bin(value)[3:]:
+            ops.append("SHL")
+            if bit == "1":
+                ops.append("ADD")
+        acc = x
+        for i, opcode in enumerate(ops):
+            dest = target if i == len(ops) - 1 and target is not None else self.new_vreg()
+            if opcode == "SHL":
+                self.emit("SHL", dest, acc)
+            else:
+                self.emit("ADD", dest, acc, x)
+            acc = dest
+        return acc
+
+    def gen_mul_loop(self, left: Tuple, right: Tuple, target: Optional[int]) -> int:
+        """Generate multiplication as a repeated-addition loop."""
+        a = self.gen_expr(left)
+        count = self.new_vreg()
+        self.gen_expr(right, count)
+        acc = self.new_vreg()
+        one = self.constant(1)
+        loop, done = self.new_label(), self.new_label()
+        self.emit("SUB", acc, a, a)
+        self.emit("TEST", count)
+        self.emit("JZ", done)
+        self.emit("LABEL", loop)
+        self.emit("ADD", acc, acc, a)
+        self.emit("SUB", count, count, one)
+        self.emit("JNZ", loop)
+        self.emit("LABEL", done)
+        if target is not None:
+            self.emit("MOV", target, acc)
+            return target
+        return acc
+
+    def gen_condition(self, condition: Tuple) -> Optional[bool]:
+        """Set the Z flag for a condition; return its value if it is constant."""
+        negate, expr = condition
+        if self.optimize:
+            expr = fold(expr)
+            if expr[0] == "num":
+                return (expr[1] == 0) == negate
+        vreg = self.gen_expr(expr)
+        last = self.ir[-1] if self.ir else ()
+        if not (self.optimize and last and last[0] in FLAG_OPS and last[1] == vreg):
+            self.emit("TEST", vreg)
+        return None
+
+    def gen_while(self, condition: Tuple, body: List[Tuple]) -> None:
+        """Generate a while loop (rotated so each iteration ends in one branch)."""
+        taken, exit_jump = ("JZ", "JNZ") if condition[0] else ("JNZ", "JZ")
+        top, end = self.new_label(), self.new_label()
+        self.depth += 1
+        if not self.optimize:
+            self.emit("LABEL", top)
+            self.gen_condition(condition)
+            self.emit(exit_jump, end)
+            self.gen_block(body)
+            self.emit("JMP", top)
+            self.emit("LABEL", end)
+        else:
+            constant = self.gen_condition(condition)
+            if constant is False:
+                pass
+            elif constant is True:
+                self.emit("LABEL", top)
+                self.gen_block(body)
+                self.emit("JMP", top)
+            else:
+                self.emit(exit_jump, end)
+                self.emit("LABEL", top)
+                self.gen_block(body)
+                self.gen_condition(condition)
+                self.emit(taken, top)
+                self.emit("LABEL", end)
+        self.depth -= 1
+
+    def gen_if(self, condition: Tuple, then: List[Tuple], otherwise: List[Tuple]) -> None:
+        """Generate an if/else statement."""
+        exit_jump = "JNZ" if condition[0] else "JZ"
+        self.depth += 1
+        constant = self.gen_condition(condition)
+        if constant is not None:
+            self.gen_block(then if constant else otherwise)
+        else:
+            skip, end = self.new_label(), self.new_label()
+            self.emit(exit_jump, skip)
+            self.gen_block(then)
+            if otherwise:
+                self.emit("JMP", end)
+            self.emit("LABEL", skip)
+            if otherwise:
+                self.gen_block(otherwise)
+                self.emit("LABEL", end)
+        self.depth -= 1
+
+
+def _reads(node: Tuple, name: str) -> bool:
+    if node[0] == "var":
+        return node[1] == name
+    return any(_reads(child, name) for child in node[1:] if isinstance(child, tuple))
+
+
+def constant_value(node: Tuple) -> int:
+    """Evaluate a constant expression (used for shift counts)."""
+    node = fold(node)
+    if node[0] != "num":
+        raise CompileError("Shift amount must be a constant")
+    return node[1]
+
+
+def defs_uses(instr: Tuple) -> Tuple[List[int], List[int]]:
+    """Return the vregs defined and used by an IR instruction."""
+    opcode = instr[0]
+    if opcode == "LOAD":
+        return [instr[1]], []
+    if opcode in ["STORE", "TEST"]:
+        return [], [instr[1]]
+    if opcode in ["MOV", "NOT", "SHL", "SHR"]:
+        return [instr[1]], [instr[2]]
+    if opcode in ALU_OPS.values():
+        return [instr[1]], [instr[2], instr[3]]
+    return [], []
+
+
+def live_intervals(ir: List[Tuple]) -> Dict[int, Tuple[int, int]]:
+    """Compute a live interval (first, last instruction index) for every vreg."""
+    labels = {instr[1]: i for i, instr in enumerate(ir) if instr[0] == "LABEL"}
+    successors = []
+    for i, instr in enumerate(ir):
+        succ = [] if instr[0] in ["JMP", "HALT"] else [i + 1]
+        if instr[0] in ["JMP", "JZ", "JNZ"]:
+            succ.append(labels[instr[1]])
+        successors.append([s for s in succ if s < len(ir)])
+
+    info = [defs_uses(instr) for instr in ir]
+    live_in: List[set] = [set() for _ in ir]
+    live_out: List[set] = [set() for _ in ir]
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(ir) - 1, -1, -1):
+            out = set().union(*(live_in[s] for s in successors[i]))
+            new_in = set(info[i][1]) | (out - set(info[i][0]))
+            if out != live_out[i] or new_in != live_in[i]:
+                live_out[i], live_in[i] = out, new_in
+                changed = True
+
+    intervals: Dict[int, Tuple[int, int]] = {}
+    for i in range(len(ir)):
+        for vreg in set(info[i][0]) | set(info[i][1]) | live_in[i] | live_out[i]:
+            start, end = intervals.get(vreg, (i, i))
+            intervals[vreg] = (min(start, i), max(end, i))
+    return intervals
+
+
+def linear_scan(intervals: Dict[int, Tuple[int, int]], num_registers: int) -> Tuple[Dict[int, int], List[int]]:
+    """Assign physical registers to vregs; return (assignment, spilled vregs)."""
+    assignment: Dict[int, int] = {}
+    spilled: List[int] = []
+    active: List[int] = []  # vregs holding a register, sorted by interval end
+    free = list(range(num_registers))
+
+    for vreg in sorted(intervals, key=lambda v: intervals[v]):
+        start, end = intervals[vreg]
+        # An interval ending where this one starts can hand over its register
+        for old in list(active):
+            if intervals[old][1] <= start:
+                active.remove(old)
+                free.append(assignment[old])
+        if free:
+            assignment[vreg] = free.pop(0)
+            active.append(vreg)
+        else:
+            victim = active[-1]
+            if intervals[victim][1] > end:
+                assignment[vreg] = assignment.pop(victim)
+                spilled.append(victim)
+                active[-1] = vreg
+            else:
+                spilled.append(vreg)
+        active.sort(key=lambda v: intervals[v][1])
+    return assignment, spilled
+
+
+class Compiler:
+    """Compiles a tiny expression/loop language to assembly source."""
+
+    def __init__(self, optimize: bool = True):
+        """Initialize compiler; optimize=False gives naive code generation."""
+        self.optimize = optimize
+        self.errors: List[str] = []
+        self.variables: List[str] = []
+        self.spilled = 0
+
+    def compile(self, source: str) -> str:
+        """Compile source code to assembly source (empty string on error)."""
+        self.errors = []
+        self.variables = []
+        self.spilled = 0
+        try:
+            program = Parser(tokenize(source)).parse_program()
+            generator = CodeGenerator(self.optimize)
+            ir = generator.generate(program)
+        except CompileError as e:
+            self.errors.append(str(e))
+            return ""
+
+        self.variables = [label[2:] for label in generator.data if label.startswith("v_")]
+        lines = self.allocate(ir, generator)
+        for label, value in generator.data.items():
+            lines += [f"{label}:", f"    .byte {value}"]
+
+        size = 2 * _instruction_count("\n".join(lines)) + len(generator.data)
+        if size > 256:
+            self.errors.append(f"Program needs {size} bytes but memory has 256")
+        return "\n".join(lines) + "\n"
+
+    def allocate(self, ir: List[Tuple], generator: CodeGenerator) -> List[str]:
+        """Run linear-scan register allocation and emit assembly lines."""
+        intervals = live_intervals(ir)
+        assignment, spilled = linear_scan(intervals, NUM_REGISTERS)
+        scratch: List[int] = []
+        if spilled:
+            # Reserve two scratch registers for reloading spilled values
+            scratch = [NUM_REGISTERS - 2, NUM_REGISTERS - 1]
+            assignment, spilled = linear_scan(intervals, NUM_REGISTERS - 2)
+        self.spilled = len(spilled)
+        for vreg in spilled:
+            if vreg not in generator.slots:
+                generator.slots[vreg] = f"t_{vreg}"
+                generator.data[generator.slots[vreg]] = 0
+        spill_slots = {vreg: generator.slots[vreg] for vreg in spilled}
+
+        lines = []
+        for instr in ir:
+            opcode = instr[0]
+            if opcode == "LABEL":
+                lines.append(f"{instr[1]}:")
+                continue
+            if opcode in ["JMP", "JZ", "JNZ"]:
+                lines.append(f"    {opcode} {instr[1]}")
+                continue
+            if opcode == "HALT":
+                lines.append("    HALT")
+                continue
+            if opcode in ["LOAD", "STORE"] and spill_slots.get(instr[1]) == instr[2]:
+                continue  # value already lives in that memory slot
+
+            defs, uses = defs_uses(instr)
+            regs: Dict[int, int] = {}  # used vreg -> physical register
+            free_scratch = list(scratch)
+            for vreg in uses:
+                if vreg in spill_slots and vreg not in regs:
+                    regs[vreg] = free_scratch.pop(0)
+                    lines.append(f"    LOAD R{regs[vreg]}, {spill_slots[vreg]}")
+                elif vreg not in spill_slots:
+                    regs[vreg] = assignment[vreg]
+            physical = [regs[vreg] for vreg in uses]
+            if defs:
+                dest = scratch[0] if defs[0] in spill_slots else assignment[defs[0]]
+                physical.insert(0, dest)
+
+            if opcode == "TEST":
+                lines.append(f"    OR R{physical[0]}, R{physical[0]}, R{physical[0]}")
+            elif opcode in ["LOAD", "STORE"]:
+                lines.append(f"    {opcode} R{physical[0]}, {instr[2]}")
+            elif opcode != "MOV" or physical[0] != physical[1]:
+                lines.append(f"    {opcode} " + ", ".join(f"R{r}" for r in physical))
+
+            if defs and defs[0] in spill_slots:
+                lines.append(f"    STORE R{physical[0]}, {spill_slots[defs[0]]}")
+        return lines
+
+
+def run_compiled(assembly: str, max_cycles: int = 10000) -> Tuple[int, Dict[str, int]]:
+    """Run compiled assembly; return (cycles executed, final variable values)."""
+    from solutions.system import Computer
+
+    computer = Computer()
+    computer.load_program(assembly)
+    cycles = computer.cpu.run(max_cycles)
+    values = {}
+    for label, addr in computer.assembler.symbol_table.items():
+        if label.startswith("v_"):
+            bits = computer.cpu.datapath.memory.read(int_to_bits(addr))
+            values[label[2:]] = bits_to_int(bits)
+    return cycles, values
+
+
+def benchmark(source: str, max_cycles: int = 10000) -> Dict:
+    """Compare executed cycles of naive and optimized code for a program."""
+    naive_asm = Compiler(optimize=False).compile(source)
+    optimized_asm = Compiler(optimize=True).compile(source)
+    naive_cycles, naive_values = run_compiled(naive_asm, max_cycles)
+    optimized_cycles, optimized_values = run_compiled(optimized_asm, max_cycles)
+    return {
+        "naive": naive_cycles,
+        "optimized": optimized_cycles,
+        "saved": naive_cycles - optimized_cycles,
+        "speedup": naive_cycles / optimized_cycles if optimized_cycles else 0.0,
+        "naive_size": _instruction_count(naive_asm),
+        "optimized_size": _instruction_count(optimized_asm),
+        "results_match": naive_values == optimized_values,
+        "variables": optimized_values,
+    }
+
+
+def _instruction_count(assembly: str) -> int:
+    return sum(1 for line in assembly.split("\n") if line.startswith("    ") and not line.startswith("    ."))
@@ -1,6 +1,7 @@
 """Control Unit - Solution File."""
 
 from typing import Dict
+from solutions.bits import int_to_bits
 from solutions.clock import ControlSignals
 
 
@@ -35,7 +36,7 @@ class ControlUnit:
             # ALU operation: read registers, perform op, write result
             alu_ops = {"ADD": 0, "SUB": 1, "AND": 2, "OR": 3, "XOR": 4, "NOT": 5, "SHL": 6, "SHR": 7}
             op = alu_ops.get(opname, 0)
-            self.signals.alu_op = [(op >> i) & 1 for i in range(4)]
+            self.signals.alu_op = int_to_bits(op, 4)
             self.signals.reg_write = 1
 
         elif opname == "LOAD":
@@ -0,0 +1,208 @@
+"""Co-Simulation - Solution File."""
+
+import hashlib
+from typing import Dict, Iterable, Optional, Tuple
+from solutions.bits import bit_rows_to_bytes, int_to_bits
+from solutions.disassembler import Disassembler
+from solutions.fastcpu import FastCPU
+from solutions.isa import bits_to_int_n
+
+
+def ram_digest(ram: bytes | bytearray) -> str:
+    """Short hash of a RAM image."""
+    return hashlib.blake2b(bytes(ram), digest_size=8).hexdigest()
+
+
+def gate_ram(cpu) -> bytes:
+    """RAM of a gate-level CPU as bytes."""
+    return bit_rows_to_bytes(cpu.datapath.memory.memory)
+
+
+def gate_state(cpu) -> Dict:
+    """Architectural state of a gate-level CPU (PC, registers, flags, halted, RAM hash)."""
+    datapath = cpu.datapath
+    return {
+        "pc": bits_to_int_n(datapath.get_pc()),
+        "registers": [bits_to_int_n(datapath.reg_file.read(int_to_bits(i, 3))) for i in range(8)],
+        "flags": [datapath.flags.get(name, 0) for name in "ZCNV"],
+        "halted": cpu.halted,
+        "ram": ram_digest(gate_ram(cpu)),
+    }
+
+
+def fast_state(fast: FastCPU) -> Dict:
+    """Architectural state of a FastCPU, in the form of gate_state."""
+    return {
+        "pc": fast.pc,
+        "registers": list(fast.regs),
+        "flags": list(fast.flags),
+        "halted": fast.halted,
+        "ram": ram_digest(fast.mem),
+    }
+
+
+def differences(gate: Dict, fast: Dict, gate_mem: bytes = b"", fast_mem: bytes = b"") -> Dict[str, Tuple]:
+    """Fields where two states disagree, as {field: (gate value, fast value)}.
+
+    Registers are reported as R0-R7 and flags by name. When the RAM hashes
+    differ and both RAM images are given, each differing byte is reported
+    as mem[0xNN] instead of the hash.
+    """
+    diffs: Dict[str, Tuple] = {}
+    for key in ("pc", "halted"):
+        if gate[key] != fast[key]:
+            diffs[key] = (gate[key], fast[key])
+    for i, (a, b) in enumerate(zip(gate["registers"], fast["registers"])):
+        if a != b:
+            diffs[f"R{i}"] = (a, b)
+    for name, a, b in zip("ZCNV", gate["flags"], fast["flags"]):
+        if a != b:
+            diffs[name] = (a, b)
+    if gate["ram"] != fast["ram"]:
+        if gate_mem and fast_mem:
+            for addr, (a, b) in enumerate(zip(gate_mem, fast_mem)):
+                if a != b:
+                    diffs[f"mem[0x{addr:02X}]"] = (a, b)
+        else:
+            diffs["ram"] = (gate["ram"], fast["ram"])
+    return diffs
+
+
+class CoSimulator:
+    """Runs one program on the gate-level CPU and the FastCPU in lockstep.
+
+    States are compared every `checkpoint` instructions; between checks
+    each engine runs at full speed (the FastCPU with fused pairs). When a
+    check fails, both engines are rewound to the last matching checkpoint
+    and replayed one instruction at a time, so the report always names the
+    first instruction whose result differs. A difference that a later
+    instruction overwrites before the next checkpoint (a flag, say) is only
+    seen with checkpoint=1.
+    """
+
+    def __init__(self, computer, fast: Optional[FastCPU] = None, checkpoint: int = 1):
+        """Attach to a loaded Computer.
+
+        Args:
+            computer: Computer with the program loaded (its CPU is the gate-level engine)
+            fast: Fast engine to compare (default: FastCPU.from_computer(computer))
+            checkpoint: Instructions between state comparisons
+        """
+        if checkpoint < 1:
+            raise ValueError("checkpoint must be at least 1")
+        self.computer = computer
+        self.cpu = computer.cpu
+        self.fast = fast if fast is not None else FastCPU.from_computer(computer)
+        self.checkpoint = checkpoint
+        self.cycles = 0  # Instructions both engines have executed and agree on
+        self.checks = 0
+        self.disassembler = Disassembler()
+
+    def _differences(self) -> Dict[str, Tuple]:
+        self.checks += 1
+        return differences(gate_state(self.cpu), fast_state(self.fast), gate_ram(self.cpu), bytes(self.fast.mem))
+
+    def _snapshot(self) -> Tuple:
+        fast = self.fast
+        return bytes(fast.mem), list(fast.regs), list(fast.flags), fast.pc, fast.halted, fast.ticks
+
+    def _restore(self, snapshot: Tuple) -> None:
+        """Put both engines back into a (matching) snapshot of the fast engine."""
+        fast = self.fast
+        mem, regs, flags, fast.pc, fast.halted, fast.ticks = snapshot
+        fast.mem[:] = mem
+        fast.regs[:] = regs
+        fast.flags[:] = flags
+        fast.invalidate()
+        fast.write_back(self.computer)
+
+    def _diverged(self, pc: int, mem: bytes, diffs: Dict[str, Tuple]) -> Dict:
+        """Report for the instruction at pc (mem is the RAM it was fetched from)."""
+        word = mem[pc] | mem[(pc + 1) & 0xFF] << 8
+        return {
+            "cycle": self.cycles,
+            "pc": pc,
+            "word": word,
+            "instruction": self.disassembler.disassemble_word(word),
+            "differences": diffs,
+        }
+
+    def _replay(self, snapshot: Tuple, count: int) -> Optional[Dict]:
+        """Step both engines from a snapshot until their states differ."""
+        self._restore(snapshot)
+        for _ in range(count):
+            pc, mem = self.fast.pc, bytes(self.fast.mem)
+            gate_running = self.cpu.step()
+            fast_running = self.fast.step()
+            diffs = self._differences()
+            if gate_running != fast_running:
+                diffs["running"] = (gate_running, fast_running)
+            if diffs:
+                return self._diverged(pc, mem, diffs)
+            if not gate_running:
+                break
+            self.cycles += 1
+        return None
+
+    def run(self, max_cycles: int = 1000) -> Dict:
+        """Run both engines until HALT, max_cycles instructions or the first divergence.
+
+        Returns:
+            Dict with agree, cycles (instructions executed by both), checks
+            (state comparisons made), state (final gate-level state) and
+            divergence (None, or cycle, pc, word, instruction and differences
+            as {field: (gate value, fast value)})
+        """
+        divergence = None
+        diffs = self._differences()
+        if diffs:
+            divergence = self._diverged(self.fast.pc, bytes(self.fast.mem), diffs)
+        start = self.cycles
+        while divergence is None and self.cycles - start < max_cycles and not self.cpu.halted:
+            chunk = min(self.checkpoint, max_cycles - (self.cycles - start))
+            snapshot = self._snapshot()
+            gate_steps = self.cpu.run(chunk)
+            fast_steps = self.fast.run(chunk)
+            diffs = self._differences()
+            if gate_steps != fast_steps:
+                diffs["steps"] = (gate_steps, fast_steps)
+            if diffs:
+                checkpoint_cycles = self.cycles
+                divergence = self._replay(snapshot, chunk)
+                if divergence is None:  # Not reproducible one step at a time: report the checkpoint
+                    self.cycles = checkpoint_cycles
+                    divergence = self._diverged(snapshot[3], snapshot[0], diffs)
+                break
+            self.cycles += gate_steps
+        return {
+            "agree": divergence is None,
+            "cycles": self.cycles,
+            "checks": self.checks,
+            "state": gate_state(self.cpu),
+            "divergence": divergence,
+        }
+
+
+def format_report(report: Dict) -> str:
+    """Readable summary of a CoSimulator.run() result."""
+    if report["agree"]:
+        return f"Engines agree after {report['cycles']} instructions ({report['checks']} state comparisons)"
+    d = report["divergence"]
+    lines = [f"Engines diverge at instruction {d['cycle']}: PC=0x{d['pc']:02X}  {d['word']:04X}  {d['instruction']}"]
+    for field, (gate, fast) in d["differences"].items():
+        lines.append(f"  {field}: gate={gate} fast={fast}")
+    return "\n".join(lines)
+
+
+def cosimulate(
+    source,
+    max_cycles: int = 1000,
+    checkpoint: int = 1,
+    pairs: Optional[Iterable[Tuple[str, str]]] = None,
+) -> Dict:
+    """Load a program (assembly or bytes) and co-simulate it; see CoSimulator.run."""
+    from solutions.system import Computer
+
+    computer = Computer()
+    computer.load_program(source)
+    return CoSimulator(computer, FastCPU.from_computer(computer, pairs), checkpoint).run(max_cycles)
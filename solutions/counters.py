@@ -2,6 +2,10 @@
 
 from typing import List
 from solutions.adders import ripple_carry_adder_8bit
+from solutions.bits import BitVector
+
+ZERO = BitVector.from_int(0)
+ONE = BitVector.from_int(1)
 
 
 class BinaryCounter8:
@@ -9,20 +13,20 @@ class BinaryCounter8:
 
     def __init__(self):
         """Initialize binary counter."""
-        self.count = [0] * 8
+        self.count = ZERO
 
     def clock(self, enable: int = 1, reset: int = 0, clk: int = 1) -> List[int]:
         """Increment counter on clock edge."""
         if reset == 1:
-            self.count = [0] * 8
+            self.count = ZERO
         elif enable == 1:
-            one = [1, 0, 0, 0, 0, 0, 0, 0]
-            self.count, _ = ripple_carry_adder_8bit(self.count, one)
-        return self.count.copy()
+            count, _ = ripple_carry_adder_8bit(self.count, ONE)
+            self.count = BitVector(count)
+        return self.count
 
     def read(self) -> List[int]:
         """Read current counter value."""
-        return self.count.copy()
+        return self.count
 
 
 class ProgramCounter:
@@ -30,19 +34,19 @@ class ProgramCounter:
 
     def __init__(self):
         """Initialize program counter."""
-        self.value = [0] * 8
+        self.value = ZERO
 
     def clock(self, load: int, load_value: List[int], increment: int, reset: int, clk: int) -> List[int]:
         """Update PC on clock edge."""
         if reset == 1:
-            self.value = [0] * 8
+            self.value = ZERO
         elif load == 1:
-            self.value = load_value.copy()
+            self.value = BitVector(load_value)
         elif increment == 1:
-            one = [1, 0, 0, 0, 0, 0, 0, 0]
-            self.value, _ = ripple_carry_adder_8bit(self.value, one)
-        return self.value.copy()
+            value, _ = ripple_carry_adder_8bit(self.value, ONE)
+            self.value = BitVector(value)
+        return self.value
 
     def read(self) -> List[int]:
         """Read current PC value."""
-        return self.value.copy()
+        return self.value
@@ -5,6 +5,7 @@ from solutions.datapath import DataPath
 from solutions.control import ControlUnit
 from solutions.decoder import InstructionDecoder
 from solutions.clock import Clock
+from solutions.isa import bits_to_int_n
 
 
 class CPU:
@@ -18,6 +19,9 @@ class CPU:
         self.clock = Clock()
         self.halted = False
         self.current_instruction = None
+        self.branch_predictor = None  # Optional predictor notified of every jump
+        self.interrupts = None  # Optional InterruptController serviced before each instruction
+        self.tracer = None  # Optional TraceWriter recording every instruction
 
     def reset(self) -> None:
         """Reset CPU to initial state."""
@@ -44,6 +48,9 @@ class CPU:
 
     def step(self) -> bool:
         """Execute one instruction cycle."""
+        # Interrupts are taken between instructions and can wake a halted CPU
+        if self.interrupts is not None:
+            self.interrupts.service(self)
         if self.halted:
             return False
 
@@ -58,12 +65,17 @@ class CPU:
         # Generate control signals
         signals = self.control.generate_signals(decoded, self.datapath.flags)
 
+        # Report jumps to the branch predictor before the PC changes
+        opname = decoded.get("opcode_name", "")
+        pc = bits_to_int_n(self.datapath.get_pc())
+        if self.branch_predictor is not None and opname in ["JMP", "JZ", "JNZ"]:
+            self.branch_predictor.record(pc, opname, bool(signals.pc_load), decoded["rs2_imm"])
+
         # Execute
         self.execute(decoded, signals)
 
         # Increment PC by 2 (if not a jump that modified it, and not HALT)
         # 16-bit instructions take 2 bytes
-        opname = decoded.get("opcode_name", "")
         if opname == "HALT":
             pass  # Don't increment on HALT
         elif opname == "JMP":
@@ -79,8 +91,12 @@ class CPU:
             self.datapath.pc.clock(load=0, load_value=[0] * 8, increment=1, reset=0, clk=1)
             self.datapath.pc.clock(load=0, load_value=[0] * 8, increment=1, reset=0, clk=1)
 
+        if self.tracer is not None:
+            self.tracer.record_cpu(self, pc, instruction)
+
         self.clock.tick()
-        return not self.halted
+        # HALT waits for an interrupt if one can still arrive
+        return not self.halted or (self.interrupts is not None and self.interrupts.can_wake())
 
     def run(self, max_cycles: int = 1000) -> int:
         """Run until HALT or max cycles."""
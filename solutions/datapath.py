@@ -1,6 +1,7 @@
 """Data Path - Solution File."""
 
 from typing import List, Dict
+from solutions.bits import BitVector, bits_to_int, int_to_bits
 from solutions.counters import ProgramCounter
 from solutions.memory import RAM
 from solutions.registers import RegisterFile
@@ -15,9 +16,10 @@ class DataPath:
         """Initialize data path components."""
         self.pc = ProgramCounter()
         self.memory = RAM()
+        self.instruction_memory = self.memory  # Fetch port (a cache may replace either port)
         self.reg_file = RegisterFile()
         self.alu = ALU()
-        self.ir = [0] * 16
+        self.ir = BitVector.from_int(0, 16)
         self.flags = {"Z": 0, "C": 0, "N": 0, "V": 0}
 
     def execute_cycle(self, signals: ControlSignals, decoded: Dict) -> None:
@@ -67,17 +69,17 @@ class DataPath:
         """Fetch instruction at current PC."""
         pc_val = self.pc.read()
         # Fetch two bytes for 16-bit instruction
-        low_byte = self.memory.read(pc_val)
+        low_byte = self.instruction_memory.read(pc_val)
         # Calculate PC+1 for high byte (proper increment with carry)
-        pc_int = sum(bit << i for i, bit in enumerate(pc_val))
+        pc_int = bits_to_int(pc_val)
         pc_plus_int = (pc_int + 1) & 0xFF
-        pc_plus = [(pc_plus_int >> i) & 1 for i in range(8)]
-        high_byte = self.memory.read(pc_plus)
+        pc_plus = int_to_bits(pc_plus_int)
+        high_byte = self.instruction_memory.read(pc_plus)
         return low_byte + high_byte
 
     def load_instruction(self, instruction: List[int]) -> None:
         """Load instruction into IR."""
-        self.ir = instruction.copy()
+        self.ir = BitVector(instruction)
 
     def get_pc(self) -> List[int]:
         """Get current PC value."""
@@ -0,0 +1,221 @@
+"""Debugger - Solution File."""
+
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from solutions.bits import bits_to_int, int_to_bits
+from solutions.isa import OPCODES
+
+READ = 0x01
+WRITE = 0x02
+ACCESS_MODES = {"r": READ, "w": WRITE, "rw": READ | WRITE}
+
+# Register fields each opcode reads, and whether it writes rd
+_REG_READS: List[Tuple[str, ...]] = [()] * 16
+for _name in ["ADD", "SUB", "AND", "OR", "XOR"]:
+    _REG_READS[OPCODES[_name]] = ("rs1", "rs2")
+for _name in ["MOV", "NOT", "SHL", "SHR"]:
+    _REG_READS[OPCODES[_name]] = ("rs1",)
+_REG_READS[OPCODES["STORE"]] = ("rd",)
+_REG_WRITES = bytearray(16)
+for _name in ["LOAD", "MOV", "ADD", "SUB", "AND", "OR", "XOR", "NOT", "SHL", "SHR"]:
+    _REG_WRITES[OPCODES[_name]] = 1
+LOAD_OPCODE = OPCODES["LOAD"]
+STORE_OPCODE = OPCODES["STORE"]
+
+Condition = Union[None, int, Callable[[int], bool]]
+
+
+def _byte(bits) -> int:
+    return bits_to_int(bits)
+
+
+def _matches(condition: Condition, value: int) -> bool:
+    if condition is None:
+        return True
+    if callable(condition):
+        return bool(condition(value))
+    return value == condition
+
+
+class Debugger:
+    """Breakpoints and watchpoints for a Computer.
+
+    Breakpoints and watchpoints live in 256-entry bitmaps indexed by PC or
+    address, so each check is one array index. run() picks a loop for what
+    is set: no breakpoints at all runs CPU.run unchanged, PC/cycle
+    breakpoints add one index per instruction, and only watchpoints decode
+    the instruction's operands.
+
+    Breakpoints stop before the instruction at their PC runs; watchpoints
+    stop after the access. Watchpoints decode the instruction at the PC
+    before CPU.step, so an interrupt taken in that step is not seen.
+    """
+
+    def __init__(self, computer):
+        """Attach to a Computer with no breakpoints set."""
+        self.computer = computer
+        self.cpu = computer.cpu
+        self.breakpoints = bytearray(256)
+        self.memory_watch = bytearray(256)
+        self.register_watch = bytearray(8)
+        self.memory_conditions: Dict[int, Condition] = {}
+        self.register_conditions: Dict[int, Condition] = {}
+        self.cycle_break: Optional[int] = None
+        self.cycles = 0
+        self.resume_pc: Optional[int] = None  # Breakpoint to step over on the next run
+
+    # ----- Setting breakpoints -----
+
+    def break_at(self, pc: int) -> None:
+        """Stop before executing the instruction at pc."""
+        self.breakpoints[pc & 0xFF] = 1
+
+    def remove_breakpoint(self, pc: int) -> None:
+        """Remove a PC breakpoint."""
+        self.breakpoints[pc & 0xFF] = 0
+
+    def break_at_cycle(self, cycles: Optional[int]) -> None:
+        """Stop once `cycles` instructions have run under the debugger (None to clear)."""
+        self.cycle_break = cycles
+
+    def watch_memory(self, address: int, access: str = "w", condition: Condition = None) -> None:
+        """Stop after a LOAD ('r') or STORE ('w') of an address.
+
+        Args:
+            address: Memory address
+            access: 'r', 'w' or 'rw'
+            condition: Only stop for this value, or when condition(value) is True
+        """
+        self.memory_watch[address & 0xFF] = ACCESS_MODES[access]
+        self.memory_conditions[address & 0xFF] = condition
+
+    def watch_register(self, register: int, access: str = "w", condition: Condition = None) -> None:
+        """Stop after an instruction reads ('r') or writes ('w') a register (see watch_memory)."""
+        self.register_watch[register & 0x7] = ACCESS_MODES[access]
+        self.register_conditions[register & 0x7] = condition
+
+    def unwatch_memory(self, address: int) -> None:
+        """Remove a memory watchpoint."""
+        self.memory_watch[address & 0xFF] = 0
+        self.memory_conditions.pop(address & 0xFF, None)
+
+    def unwatch_register(self, register: int) -> None:
+        """Remove a register watchpoint."""
+        self.register_watch[register & 0x7] = 0
+        self.register_conditions.pop(register & 0x7, None)
+
+    def clear(self) -> None:
+        """Remove every breakpoint and watchpoint."""
+        self.breakpoints[:] = bytes(256)
+        self.memory_watch[:] = bytes(256)
+        self.register_watch[:] = bytes(8)
+        self.memory_conditions.clear()
+        self.register_conditions.clear()
+        self.cycle_break = None
+
+    # ----- Running -----
+
+    def _pc(self) -> int:
+        return _byte(self.cpu.datapath.get_pc())
+
+    def _stop(self, reason: str, pc: int, **details) -> Dict:
+        self.resume_pc = pc if reason == "breakpoint" else None
+        return {"reason": reason, "pc": pc, "cycles": self.cycles, **details}
+
+    def _end(self, executed: int, max_cycles: int) -> Dict:
+        reason = "max_cycles" if executed >= max_cycles and not self.cpu.halted else "halt"
+        return self._stop(reason, self._pc())
+
+    def run(self, max_cycles: int = 1000) -> Dict:
+        """Run until a breakpoint, watchpoint, HALT or max_cycles instructions.
+
+        Returns:
+            Stop event: reason ('breakpoint', 'watchpoint', 'cycle', 'halt' or
+            'max_cycles'), pc, cycles, and for watchpoints the address or
+            register, the access ('read' or 'write') and the value
+        """
+        if self.cycle_break is not None:
+            max_cycles = min(max_cycles, max(self.cycle_break - self.cycles, 0))
+        if any(self.memory_watch) or any(self.register_watch):
+            stop = self._run_watching(max_cycles)
+        elif any(self.breakpoints):
+            stop = self._run_breakpoints(max_cycles)
+        else:
+            # Nothing to check: the plain run loop
+            executed = self.cpu.run(max_cycles)
+            self.cycles += executed
+            stop = self._end(executed, max_cycles)
+        if stop["reason"] == "max_cycles" and self.cycles == self.cycle_break:
+            stop["reason"] = "cycle"
+        return stop
+
+    def step(self) -> Dict:
+        """Execute one instruction (ignoring a breakpoint at the current PC)."""
+        self.resume_pc = self._pc()
+        return self.run(1)
+
+    def _run_breakpoints(self, max_cycles: int) -> Dict:
+        """Run loop with PC breakpoints only: one bitmap index per instruction."""
+        cpu, breakpoints, get_pc = self.cpu, self.breakpoints, self.cpu.datapath.get_pc
+        skip, self.resume_pc = self.resume_pc, None
+        executed = 0
+        while executed < max_cycles:
+            pc = _byte(get_pc())
+            if breakpoints[pc] and pc != skip:
+                return self._stop("breakpoint", pc)
+            skip = None
+            if not cpu.step():
+                break
+            executed += 1
+            self.cycles += 1
+        return self._end(executed, max_cycles)
+
+    def _run_watching(self, max_cycles: int) -> Dict:
+        """Run loop with watchpoints: decodes each instruction's operands."""
+        cpu, datapath = self.cpu, self.cpu.datapath
+        breakpoints, memory_watch, register_watch = self.breakpoints, self.memory_watch, self.register_watch
+        skip, self.resume_pc = self.resume_pc, None
+        executed = 0
+        while executed < max_cycles:
+            pc = _byte(datapath.get_pc())
+            if breakpoints[pc] and pc != skip:
+                return self._stop("breakpoint", pc)
+            skip = None
+
+            code = datapath.instruction_memory.memory
+            word = _byte(code[pc]) | _byte(code[(pc + 1) & 0xFF]) << 8
+            opcode, rd, address = word >> 12, (word >> 8) & 7, word & 0xFF
+            fields = {"rd": rd, "rs1": (word >> 4) & 7, "rs2": word & 7}
+
+            # Reads are checked before the instruction runs, with the value read
+            hit = None
+            for field in _REG_READS[opcode]:
+                register = fields[field]
+                if register_watch[register] & READ:
+                    value = _byte(datapath.reg_file.read(int_to_bits(register, 3)))
+                    if _matches(self.register_conditions.get(register), value):
+                        hit = {"register": register, "access": "read", "value": value}
+                        break
+
+            running = cpu.step()
+            if running:
+                executed += 1
+                self.cycles += 1
+
+            if hit is None and opcode == LOAD_OPCODE and memory_watch[address] & READ:
+                value = _byte(datapath.reg_file.read(int_to_bits(rd, 3)))
+                if _matches(self.memory_conditions.get(address), value):
+                    hit = {"address": address, "access": "read", "value": value}
+            if hit is None and opcode == STORE_OPCODE and memory_watch[address] & WRITE:
+                value = _byte(datapath.reg_file.read(int_to_bits(rd, 3)))
+                if _matches(self.memory_conditions.get(address), value):
+                    hit = {"address": address, "access": "write", "value": value}
+            if hit is None and _REG_WRITES[opcode] and register_watch[rd] & WRITE:
+                value = _byte(datapath.reg_file.read(int_to_bits(rd, 3)))
+                if _matches(self.register_conditions.get(rd), value):
+                    hit = {"register": rd, "access": "write", "value": value}
+
+            if hit is not None:
+                return self._stop("watchpoint", pc, **hit)
+            if not running:
+                break
+        return self._end(executed, max_cycles)
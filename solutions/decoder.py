@@ -1,6 +1,7 @@
 """Instruction Decoder - Solution File."""
 
 from typing import List, Dict
+from solutions.bits import int_to_bits
 from solutions.isa import OPCODE_NAMES, bits_to_int_n
 
 
@@ -31,9 +32,9 @@ class InstructionDecoder:
             "rs1": rs1,
             "rs2_imm": rs2_imm,
             "instruction_type": self.get_instruction_type(opcode),
-            "rd_bits": [(rd >> i) & 1 for i in range(3)],
-            "rs1_bits": [(rs1 >> i) & 1 for i in range(3)],
-            "rs2_bits": [(rs2_imm >> i) & 1 for i in range(8)],  # 8 bits for addresses
+            "rd_bits": int_to_bits(rd, 3),
+            "rs1_bits": int_to_bits(rs1, 3),
+            "rs2_bits": int_to_bits(rs2_imm),  # 8 bits for addresses
         }
 
     def get_instruction_type(self, opcode: int) -> str:
@@ -0,0 +1,113 @@
+"""Disassembler - Solution File."""
+
+from typing import Any, List, Optional
+from solutions.isa import OPCODE_NAMES, bits_to_int_n
+
+np: Any
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+# Operand format of each mnemonic
+FORMATS = {
+    "NOP": "N",
+    "HALT": "N",
+    "LOAD": "I",
+    "STORE": "I",
+    "JMP": "J",
+    "JZ": "J",
+    "JNZ": "J",
+    "MOV": "R2",
+    "NOT": "R2",
+    "SHL": "R2",
+    "SHR": "R2",
+    "ADD": "R3",
+    "SUB": "R3",
+    "AND": "R3",
+    "OR": "R3",
+    "XOR": "R3",
+}
+
+# Bits that the assembler always leaves at 0 for each format
+UNUSED_BITS = {"N": 0x0FFF, "I": 0x0000, "J": 0x0F00, "R2": 0x000F, "R3": 0x0000}
+
+_TABLE: List[Optional[str]] = [None] * 65536  # word -> text, filled on demand
+
+
+def format_word(word: int) -> str:
+    """Format one 16-bit instruction word as assembly text."""
+    name = OPCODE_NAMES[(word >> 12) & 0xF]
+    fmt = FORMATS[name]
+    rd = (word >> 8) & 0xF
+    if fmt == "N":
+        text = name
+    elif fmt == "I":
+        text = f"{name} R{rd}, 0x{word & 0xFF:02X}"
+    elif fmt == "J":
+        text = f"{name} 0x{word & 0xFF:02X}"
+    elif fmt == "R2":
+        text = f"{name} R{rd}, R{(word >> 4) & 0xF}"
+    else:
+        text = f"{name} R{rd}, R{(word >> 4) & 0xF}, R{word & 0xF}"
+    if word & UNUSED_BITS[fmt]:
+        text += f"  ; non-canonical 0x{word:04X}"
+    return text
+
+
+def is_canonical(word: int) -> bool:
+    """Return True if the assembler can reproduce this word exactly."""
+    return not word & UNUSED_BITS[FORMATS[OPCODE_NAMES[(word >> 12) & 0xF]]]
+
+
+class Disassembler:
+    """Table-driven disassembler."""
+
+    def disassemble_word(self, word: int) -> str:
+        """Disassemble a 16-bit instruction word."""
+        text = _TABLE[word]
+        if text is None:
+            text = _TABLE[word] = format_word(word)
+        return text
+
+    def disassemble_instruction(self, instruction: List[int]) -> str:
+        """Disassemble a 16-bit instruction given as bits."""
+        return self.disassemble_word(bits_to_int_n(instruction))
+
+    def disassemble_words(self, words) -> List[str]:
+        """Disassemble a sequence of words (e.g. an execution trace)."""
+        if np is not None and len(words) > 256:
+            # Format each distinct word once, then scatter back
+            unique, inverse = np.unique(np.asarray(words, dtype=np.uint16), return_inverse=True)
+            texts = np.array([self.disassemble_word(int(w)) for w in unique], dtype=object)
+            return texts[inverse].tolist()
+        table = _TABLE
+        return [table[w] or self.disassemble_word(w) for w in words]
+
+    def image_words(self, image: List[int], start: int = 0, end: Optional[int] = None) -> List[int]:
+        """Split a byte image into little-endian instruction words."""
+        end = len(image) if end is None else end
+        end -= (end - start) & 1
+        if np is not None:
+            return np.frombuffer(bytes(image[start:end]), dtype="<u2").tolist()
+        return [image[a] | (image[a + 1] << 8) for a in range(start, end, 2)]
+
+    def disassemble_image(self, image: List[int], start: int = 0, end: Optional[int] = None) -> str:
+        """Produce an address/word/mnemonic listing of a byte image."""
+        words = self.image_words(image, start, end)
+        texts = self.disassemble_words(words)
+        return "\n".join(f"{start + 2 * i:02X}: {word:04X}  {text}" for i, (word, text) in enumerate(zip(words, texts)))
+
+    def disassemble_ram(self, ram, start: int = 0, end: Optional[int] = None) -> str:
+        """Produce a listing of RAM contents."""
+        return self.disassemble_image(ram_to_bytes(ram), start, end)
+
+    def to_source(self, image: List[int], start: int = 0, end: Optional[int] = None) -> str:
+        """Produce assembly source that reassembles to the same words."""
+        return "\n".join(self.disassemble_words(self.image_words(image, start, end)))
+
+
+def ram_to_bytes(ram) -> List[int]:
+    """Convert RAM contents to a list of byte values."""
+    return [bits_to_int_n(byte) for byte in ram.memory]
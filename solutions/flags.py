@@ -0,0 +1,92 @@
+"""Lazy ALU Flags - Solution File."""
+
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+from solutions.gates import AND, OR, XOR, NOT
+
+FLAG_NAMES = ("Z", "C", "N", "V")
+
+
+def zero_flag(result: Sequence[int]) -> int:
+    """Z flag: 1 if all 8 bits are 0 (a tree of OR gates)."""
+    return NOT(
+        OR(
+            OR(OR(result[0], result[1]), OR(result[2], result[3])),
+            OR(OR(result[4], result[5]), OR(result[6], result[7])),
+        )
+    )
+
+
+class LazyFlags(MutableMapping):
+    """Z, C, N, V flags of an ALU result, evaluated only when read.
+
+    Keeps a snapshot of the result plus carry and overflow; Z and N are
+    derived from the result when asked for, and the overflow of an ADD from
+    the operands' sign bits. Reads behave like the flags dict; copy() and
+    any write turn it into a plain dict first.
+    """
+
+    __slots__ = ("_result", "_carry", "_overflow", "_signs", "_flags")
+
+    def __init__(
+        self, result: Sequence[int], carry: int = 0, overflow: int = 0, signs: Optional[Tuple[int, int]] = None
+    ):
+        """Record an ALU result.
+
+        Args:
+            result: 8-bit value the flags describe (copied, so the caller may change it)
+            carry: Carry/borrow bit
+            overflow: Overflow bit (ignored when signs is given)
+            signs: (a[7], b[7]) of an ADD, to compute its overflow on demand
+        """
+        self._result = tuple(result)
+        self._carry = carry
+        self._overflow = overflow
+        self._signs = signs
+        self._flags: Optional[Dict[str, int]] = None
+
+    def __getitem__(self, name: str) -> int:
+        """Value of one flag, evaluated through the gates on first read."""
+        if self._flags is not None:
+            return self._flags[name]
+        if name == "Z":
+            return zero_flag(self._result)
+        if name == "N":
+            return self._result[7]
+        if name == "C":
+            return self._carry
+        if name == "V":
+            if self._signs is None:
+                return self._overflow
+            a7, b7 = self._signs
+            return AND(XOR(a7, self._result[7]), AND(NOT(XOR(a7, b7)), 1))
+        raise KeyError(name)
+
+    def _materialize(self) -> Dict[str, int]:
+        if self._flags is None:
+            self._flags = {name: self[name] for name in FLAG_NAMES}
+        return self._flags
+
+    def __setitem__(self, name: str, value: int) -> None:
+        """Set a flag (all flags are evaluated first)."""
+        self._materialize()[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        """Remove a flag (all flags are evaluated first)."""
+        del self._materialize()[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Flag names, Z C N V unless written since."""
+        return iter(FLAG_NAMES if self._flags is None else self._flags)
+
+    def __len__(self) -> int:
+        """Number of flags."""
+        return len(FLAG_NAMES if self._flags is None else self._flags)
+
+    def copy(self) -> Dict[str, int]:
+        """All flags as a new dict."""
+        return dict(self._materialize())
+
+    def __repr__(self) -> str:
+        """The flags as a dict."""
+        return repr(self._materialize())
@@ -0,0 +1,369 @@
+"""CPU Fuzzer - Solution File."""
+
+import random
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from solutions.disassembler import FORMATS, Disassembler
+from solutions.fastcpu import FastCPU
+from solutions.isa import OPCODES, OPCODE_NAMES
+
+DATA_BASE = 0x80  # Data bytes live at 0x80-0xFF, code below
+MAX_LENGTH = DATA_BASE // 2  # Instructions that fit below the data
+
+ALU_OPCODES = ["ADD", "SUB", "AND", "OR", "XOR", "NOT", "SHL", "SHR"]
+BRANCH_OPCODES = ["JZ", "JNZ"]
+
+# Relative weights of generated opcodes (HALT is rare so programs run a while)
+WEIGHTS = {name: 4 for name in OPCODES}
+WEIGHTS.update({"NOP": 1, "HALT": 1, "JMP": 2})
+
+Program = Tuple[List[int], bytes]  # instruction words, data bytes at DATA_BASE
+Coverage = Set[Tuple]
+
+
+# Flags each ALU op can set either way (the others are always 0)
+FLAG_EFFECTS = {"ADD": "ZCNV", "SUB": "ZCNV", "SHL": "ZCN", "SHR": "ZC"}
+FLAG_EFFECTS.update({name: "ZN" for name in ["AND", "OR", "XOR", "NOT"]})
+
+# Operand bits of each instruction format that keep it valid and canonical (registers R0-R7)
+OPERAND_BITS = {"I": list(range(11)), "R2": [4, 5, 6, 8, 9, 10], "R3": [0, 1, 2, 4, 5, 6, 8, 9, 10]}
+
+
+def all_coverage_points() -> Coverage:
+    """Every coverage point: opcodes, flag values after each ALU op, branch directions."""
+    points: Coverage = {("op", name) for name in OPCODES}
+    for name, flags in FLAG_EFFECTS.items():
+        points |= {("flag", name, flag, value) for flag in flags for value in (0, 1)}
+    points |= {("branch", name, taken) for name in BRANCH_OPCODES for taken in (False, True)}
+    return points
+
+
+def image(program: Program) -> bytearray:
+    """256-byte memory image of a program."""
+    words, data = program
+    mem = bytearray(256)
+    for i, word in enumerate(words):
+        mem[2 * i] = word & 0xFF
+        mem[2 * i + 1] = word >> 8
+    mem[DATA_BASE : DATA_BASE + len(data)] = data
+    return mem
+
+
+def listing(program: Program) -> str:
+    """Disassembly of a program's instructions."""
+    disassembler = Disassembler()
+    return "\n".join(f"{2 * i:02X}: {disassembler.disassemble_word(w)}" for i, w in enumerate(program[0]))
+
+
+def random_instruction(rng: random.Random, length: int) -> int:
+    """A valid, canonical instruction word: registers R0-R7, jumps to instructions of the program.
+
+    LOAD/STORE mostly address the data area; one in eight addresses the code
+    (so programs can read and rewrite themselves).
+    """
+    name = rng.choices(list(WEIGHTS), weights=list(WEIGHTS.values()))[0]
+    fmt = FORMATS[name]
+    op = OPCODES[name] << 12
+    if fmt == "J":
+        return op | 2 * rng.randrange(length)
+    if fmt == "I":
+        address = rng.randrange(2 * length) if rng.random() < 0.125 else DATA_BASE + rng.randrange(128)
+        return op | rng.randrange(8) << 8 | address
+    if fmt == "N":
+        return op
+    rs2 = rng.randrange(8) if fmt == "R3" else 0
+    return op | rng.randrange(8) << 8 | rng.randrange(8) << 4 | rs2
+
+
+def random_program(rng: random.Random, length: int) -> Program:
+    """A random program of `length` instructions ending in HALT, with random data."""
+    words = [random_instruction(rng, length) for _ in range(length - 1)] + [OPCODES["HALT"] << 12]
+    return words, bytes(rng.randrange(256) for _ in range(128))
+
+
+def mutate(rng: random.Random, program: Program) -> Program:
+    """Copy of a program with one to three small changes."""
+    words, data = list(program[0]), bytearray(program[1])
+    for _ in range(rng.randint(1, 3)):
+        choice = rng.random()
+        if choice < 0.5:
+            words[rng.randrange(len(words))] = random_instruction(rng, len(words))
+        elif choice < 0.7:
+            i, j = rng.randrange(len(words)), rng.randrange(len(words))
+            words[i], words[j] = words[j], words[i]
+        elif choice < 0.85:
+            # Change one operand, keeping the opcode
+            i = rng.randrange(len(words))
+            fmt = FORMATS[OPCODE_NAMES[words[i] >> 12]]
+            if fmt == "J":
+                words[i] = words[i] & 0xFF00 | 2 * rng.randrange(len(words))
+            elif fmt != "N":
+                words[i] ^= 1 << rng.choice(OPERAND_BITS[fmt])
+        else:
+            data[rng.randrange(len(data))] = rng.randrange(256)
+    return words, bytes(data)
+
+
+def reference_run(mem: bytearray, max_cycles: int, coverage: Optional[Coverage] = None) -> Dict:
+    """Run a memory image on a plain reference model of the ISA.
+
+    Args:
+        mem: Memory image (modified in place by STOREs)
+        max_cycles: Instructions to run at most (HALT is not counted, like CPU.run)
+        coverage: Set to add the opcode, flag and branch points reached to
+
+    Returns:
+        Final state: pc, registers, flags (Z C N V), halted, steps
+    """
+    regs = [0] * 8
+    z = c = n = v = 0
+    pc = 0
+    steps = 0
+    halted = False
+    while steps < max_cycles:
+        word = mem[pc] | mem[(pc + 1) & 0xFF] << 8
+        name = OPCODE_NAMES[word >> 12]
+        rd, a, b, imm = (word >> 8) & 7, regs[(word >> 4) & 7], regs[word & 7], word & 0xFF
+        next_pc = (pc + 2) & 0xFF
+        if name == "HALT":
+            halted = True
+            if coverage is not None:
+                coverage.add(("op", name))
+            break
+        if name == "LOAD":
+            regs[rd] = mem[imm]
+        elif name == "STORE":
+            mem[imm] = regs[rd]
+        elif name == "MOV":
+            regs[rd] = a
+        elif name == "JMP":
+            next_pc = imm
+        elif name in BRANCH_OPCODES:
+            taken = z == (name == "JZ")
+            next_pc = imm if taken else next_pc
+            if coverage is not None:
+                coverage.add(("branch", name, taken))
+        elif name != "NOP":
+            c = v = 0
+            if name == "ADD":
+                r = (a + b) & 0xFF
+                c = (a + b) >> 8
+                v = int(a >> 7 == b >> 7 != r >> 7)
+            elif name == "SUB":
+                r = (a - b) & 0xFF
+                c = int(a < b)
+                v = int(a >> 7 != b >> 7 and r >> 7 != a >> 7)
+            elif name == "AND":
+                r = a & b
+            elif name == "OR":
+                r = a | b
+            elif name == "XOR":
+                r = a ^ b
+            elif name == "NOT":
+                r = ~a & 0xFF
+            elif name == "SHL":
+                r = (a << 1) & 0xFF
+                c = a >> 7
+            else:  # SHR
+                r = a >> 1
+                c = a & 1
+            regs[rd] = r
+            z, n = int(r == 0), r >> 7
+            if coverage is not None:
+                coverage.update((("flag", name, "Z", z), ("flag", name, "C", c)))
+                coverage.update((("flag", name, "N", n), ("flag", name, "V", v)))
+        if coverage is not None:
+            coverage.add(("op", name))
+        pc = next_pc
+        steps += 1
+    return {"pc": pc, "registers": regs, "flags": [z, c, n, v], "halted": halted, "steps": steps}
+
+
+def engine_run(engine, mem: bytearray, max_cycles: int) -> Dict:
+    """Run a memory image from reset on a FastCPU-like engine (reused between programs)."""
+    engine.mem[:] = mem
+    engine.regs[:] = [0] * 8
+    engine.flags[:] = [0, 0, 0, 0]
+    engine.pc = 0
+    engine.halted = False
+    engine.ticks = 0
+    engine.invalidate()
+    steps = engine.run(max_cycles)
+    return {
+        "pc": engine.pc,
+        "registers": list(engine.regs),
+        "flags": list(engine.flags),
+        "halted": engine.halted,
+        "steps": steps,
+    }
+
+
+def cpu_run(mem: bytearray, max_cycles: int) -> Dict:
+    """Run a memory image on the gate-level CPU (slow; for differential execution)."""
+    from solutions.cosim import gate_ram, gate_state
+    from solutions.system import Computer
+
+    computer = Computer()
+    computer.load_program(list(mem))
+    steps = computer.cpu.run(max_cycles)
+    state = gate_state(computer.cpu)
+    del state["ram"]
+    state["steps"] = steps
+    mem[:] = gate_ram(computer.cpu)
+    return state
+
+
+def compare(expected: Dict, actual: Dict, expected_mem: bytes, actual_mem: bytes) -> Dict[str, Tuple]:
+    """Differing fields as {field: (expected, actual)}; RAM per byte as mem[0xNN]."""
+    diffs: Dict[str, Tuple] = {}
+    for key in ("pc", "halted", "steps"):
+        if expected[key] != actual[key]:
+            diffs[key] = (expected[key], actual[key])
+    for i, (a, b) in enumerate(zip(expected["registers"], actual["registers"])):
+        if a != b:
+            diffs[f"R{i}"] = (a, b)
+    for name, a, b in zip("ZCNV", expected["flags"], actual["flags"]):
+        if a != b:
+            diffs[name] = (a, b)
+    if expected_mem != actual_mem:
+        for addr, (a, b) in enumerate(zip(expected_mem, actual_mem)):
+            if a != b:
+                diffs[f"mem[0x{addr:02X}]"] = (a, b)
+    return diffs
+
+
+def minimize(program: Program, fails: Callable[[Program], bool]) -> Program:
+    """Shrink a failing program while fails(program) stays True.
+
+    Instructions are replaced by NOPs (in halving chunks, so addresses and
+    jump targets stay put), data bytes are zeroed the same way, and
+    trailing NOPs are dropped.
+    """
+    words, data = list(program[0]), bytearray(program[1])
+    chunk = len(words)
+    while chunk >= 1:
+        for start in range(0, len(words), chunk):
+            trial = words[:start] + [0] * len(words[start : start + chunk]) + words[start + chunk :]
+            if trial != words and fails((trial, bytes(data))):
+                words = trial
+        chunk //= 2
+    chunk = len(data)
+    while chunk >= 1:
+        for start in range(0, len(data), chunk):
+            zeroed = data[:start] + bytes(len(data[start : start + chunk])) + data[start + chunk :]
+            if zeroed != data and fails((words, bytes(zeroed))):
+                data = zeroed
+        chunk //= 2
+    while len(words) > 1 and words[-1] == 0 and fails((words[:-1], bytes(data))):
+        words.pop()
+    return words, bytes(data)
+
+
+class Fuzzer:
+    """Coverage-guided random program fuzzer for the CPU engines.
+
+    Programs run on the engine under test (FastCPU by default, at full
+    speed with fused pairs) and on an oracle: the reference model in this
+    module, which also records coverage, or the gate-level CPU for
+    differential execution. Programs that reach new coverage points join
+    a corpus that later programs are mutated from. Each mismatch is
+    minimized and kept as a failure.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        length: int = 16,
+        max_cycles: int = 256,
+        engine: Callable[[], FastCPU] = FastCPU,
+        oracle: str = "reference",
+    ):
+        """Create a fuzzer.
+
+        Args:
+            seed: Random seed (runs are reproducible)
+            length: Instructions per generated program (at most MAX_LENGTH)
+            max_cycles: Instructions each program may run
+            engine: Factory of the engine under test
+            oracle: 'reference' (fast) or 'cpu' (the gate-level CPU)
+        """
+        if not 2 <= length <= MAX_LENGTH:
+            raise ValueError(f"length must be between 2 and {MAX_LENGTH}")
+        if oracle not in ("reference", "cpu"):
+            raise ValueError(f"Unknown oracle: {oracle}")
+        self.rng = random.Random(seed)
+        self.length = length
+        self.max_cycles = max_cycles
+        self.engine = engine()
+        self.oracle = oracle
+        self.coverage: Coverage = set()
+        self.corpus: List[Program] = []
+        self.failures: List[Dict] = []
+        self.programs = 0
+        self.elapsed = 0.0
+
+    def generate(self) -> Program:
+        """A new random program, or (once there is a corpus) usually a mutated corpus entry."""
+        if self.corpus and self.rng.random() < 0.75:
+            return mutate(self.rng, self.rng.choice(self.corpus))
+        return random_program(self.rng, self.length)
+
+    def execute(self, program: Program, coverage: Optional[Coverage] = None) -> Dict[str, Tuple]:
+        """Run a program on the oracle and the engine; returns their differences."""
+        expected_mem = image(program)
+        actual_mem = bytearray(expected_mem)
+        if self.oracle == "cpu":
+            expected = cpu_run(expected_mem, self.max_cycles)
+            reference_run(bytearray(actual_mem), self.max_cycles, coverage)
+        else:
+            expected = reference_run(expected_mem, self.max_cycles, coverage)
+        actual = engine_run(self.engine, actual_mem, self.max_cycles)
+        return compare(expected, actual, bytes(expected_mem), bytes(self.engine.mem))
+
+    def run_batch(self, count: int) -> int:
+        """Generate and run `count` programs; returns how many reached new coverage."""
+        start = time.perf_counter()
+        batch = [self.generate() for _ in range(count)]
+        new = 0
+        for program in batch:
+            reached: Coverage = set()
+            diffs = self.execute(program, reached)
+            if diffs:
+                self._fail(program)
+            if not reached <= self.coverage:
+                self.coverage |= reached
+                self.corpus.append(program)
+                new += 1
+        self.programs += count
+        self.elapsed += time.perf_counter() - start
+        return new
+
+    def _fail(self, program: Program) -> None:
+        smallest = minimize(program, lambda p: bool(self.execute(p)))
+        self.failures.append(
+            {
+                "program": program,
+                "minimized": smallest,
+                "differences": self.execute(smallest),
+                "listing": listing(smallest),
+            }
+        )
+
+    def fuzz(self, programs: int = 1000, batch: int = 100, stop_on_failure: bool = True) -> Dict:
+        """Run programs in batches until `programs` have run (or a failure, if stop_on_failure)."""
+        while self.programs < programs and not (stop_on_failure and self.failures):
+            self.run_batch(min(batch, programs - self.programs))
+        return self.report()
+
+    def report(self) -> Dict:
+        """Programs run, programs per second, coverage, corpus size and failures."""
+        total = all_coverage_points()
+        return {
+            "programs": self.programs,
+            "programs_per_second": self.programs / self.elapsed if self.elapsed else 0.0,
+            "coverage": len(self.coverage & total),
+            "coverage_total": len(total),
+            "uncovered": sorted(total - self.coverage, key=str),
+            "corpus": len(self.corpus),
+            "failures": self.failures,
+        }
@@ -0,0 +1,184 @@
+"""Interrupts and Timer - Solution File."""
+
+from typing import List, Optional
+from solutions.bus import Bus, Device
+from solutions.isa import bits_to_int_n, int_to_bits_n
+
+# Memory map
+INTC_BASE = 0xF8
+INT_ENABLE = 0xF8  # r/w: enable mask, one bit per IRQ line
+INT_PENDING = 0xF9  # read: pending lines; write: 1 bits acknowledge (clear)
+INT_VECTOR = 0xFA  # r/w: handler address
+INT_RETURN = 0xFB  # write: return from the handler
+TIMER_BASE = 0xFC
+TIMER_PERIOD = 0xFC  # r/w: cycles between interrupts (0 stops the timer)
+TIMER_CONTROL = 0xFD  # r/w: bit 0 enable, bit 1 repeat
+TIMER_COUNT = 0xFE  # read: cycles until the next interrupt
+
+TIMER_ENABLE = 0x01
+TIMER_REPEAT = 0x02
+
+
+class InterruptController(Device):
+    """Interrupt controller with one vector, an enable mask and PC/flags save.
+
+    The CPU calls service() before every instruction. An enabled pending
+    line jumps to the vector after saving the PC and flags; writing
+    INT_RETURN restores them before the next instruction. HALT with an
+    interrupt that can still arrive waits instead of stopping, and the
+    clock skips straight to the next timer event.
+    """
+
+    size = 4
+
+    def __init__(self, clock):
+        """Initialize with interrupts disabled."""
+        self.clock = clock
+        self.mask = 0
+        self.pending = 0
+        self.vector = 0
+        self.sources: List["Timer"] = []
+        self.in_handler = False
+        self.returning = False
+        self.saved_pc = 0
+        self.saved_flags = {}
+        self.stats = {"interrupts": 0, "idle_cycles": 0}
+
+    # ----- Device registers -----
+
+    def read(self, offset: int) -> int:
+        """Read ENABLE, PENDING or VECTOR."""
+        return [self.mask, self.pending, self.vector, 0][offset]
+
+    def write(self, offset: int, value: int) -> None:
+        """Write ENABLE, acknowledge PENDING bits, set VECTOR or return."""
+        if offset == 0:
+            self.mask = value
+        elif offset == 1:
+            self.pending &= ~value & 0xFF
+        elif offset == 2:
+            self.vector = value
+        elif self.in_handler:
+            self.returning = True
+
+    # ----- Interrupt lines -----
+
+    def raise_irq(self, line: int) -> None:
+        """Mark an IRQ line pending."""
+        self.pending |= 1 << line
+
+    def add_source(self, source: "Timer") -> None:
+        """Register a device that schedules events (e.g. a timer)."""
+        self.sources.append(source)
+
+    def next_event(self) -> Optional[int]:
+        """Earliest scheduled cycle among sources on enabled lines."""
+        events = [s.deadline for s in self.sources if s.deadline is not None and self.mask >> s.line & 1]
+        return min(events) if events else None
+
+    def can_wake(self) -> bool:
+        """Return True if a halted CPU can still be woken by an interrupt."""
+        return not self.in_handler and bool(self.pending & self.mask or self.next_event() is not None)
+
+    def _fire_due(self) -> None:
+        for source in self.sources:
+            source.fire(self.clock.cycle)
+
+    # ----- CPU interface -----
+
+    def service(self, cpu) -> None:
+        """Called by CPU.step before each instruction."""
+        datapath = cpu.datapath
+        if self.returning:
+            datapath.set_pc(int_to_bits_n(self.saved_pc, 8))
+            datapath.flags = dict(self.saved_flags)
+            self.in_handler = self.returning = False
+
+        self._fire_due()
+        if self.in_handler:
+            return
+
+        # Halted with nothing pending: skip idle time to the next event
+        if cpu.halted and not self.pending & self.mask:
+            event = self.next_event()
+            if event is None:
+                return
+            self.stats["idle_cycles"] += event - self.clock.cycle
+            self.clock.cycle = event
+            self._fire_due()
+
+        if self.pending & self.mask:
+            pc = bits_to_int_n(datapath.get_pc())
+            # A halted CPU resumes after its HALT
+            self.saved_pc = (pc + 2) & 0xFF if cpu.halted else pc
+            self.saved_flags = dict(datapath.flags)
+            datapath.set_pc(int_to_bits_n(self.vector, 8))
+            cpu.halted = False
+            self.in_handler = True
+            self.stats["interrupts"] += 1
+
+
+class Timer(Device):
+    """Programmable interval timer raising an IRQ line.
+
+    Instead of counting every cycle, the timer stores the cycle of its next
+    expiry (deadline), so the simulator can jump straight to it.
+    """
+
+    size = 3
+
+    def __init__(self, controller: InterruptController, line: int = 0):
+        """Initialize a stopped timer on an IRQ line."""
+        self.controller = controller
+        self.clock = controller.clock
+        self.line = line
+        self.period = 0
+        self.control = 0
+        self.deadline: Optional[int] = None
+        controller.add_source(self)
+
+    def read(self, offset: int) -> int:
+        """Read PERIOD, CONTROL or the remaining COUNT."""
+        if offset == 2:
+            return 0 if self.deadline is None else min(self.deadline - self.clock.cycle, 0xFF)
+        return self.period if offset == 0 else self.control
+
+    def write(self, offset: int, value: int) -> None:
+        """Write PERIOD or CONTROL; enabling (re)starts the countdown."""
+        if offset == 0:
+            self.period = value
+        elif offset == 1:
+            self.control = value
+        else:
+            return
+        running = self.control & TIMER_ENABLE and self.period
+        self.deadline = self.clock.cycle + self.period if running else None
+
+    def fire(self, now: int) -> None:
+        """Raise the IRQ if the deadline has passed; re-arm when repeating."""
+        if self.deadline is None or self.deadline > now:
+            return
+        self.controller.raise_irq(self.line)
+        if self.control & TIMER_REPEAT:
+            # Missed periods are merged into one interrupt
+            self.deadline = now + self.period - (now - self.deadline) % self.period
+        else:
+            self.deadline = None
+            self.control &= ~TIMER_ENABLE
+
+
+class InterruptSystem:
+    """Interrupt controller at 0xF8 and timer at 0xFC on a Computer's bus."""
+
+    def __init__(self, computer, bus: Optional[Bus] = None):
+        """Map the devices (creating a bus if needed) and connect the controller to the CPU."""
+        memory = computer.cpu.datapath.memory
+        if bus is None:
+            bus = memory if isinstance(memory, Bus) else Bus(memory)
+        self.bus = bus
+        self.controller = InterruptController(computer.cpu.clock)
+        self.timer = Timer(self.controller, line=0)
+        bus.map(INTC_BASE, self.controller)
+        bus.map(TIMER_BASE, self.timer)
+        bus.attach(computer)
+        computer.cpu.interrupts = self.controller
@@ -1,6 +1,7 @@
 """ISA - Solution File."""
 
 from typing import List, Dict
+from solutions.bits import bits_to_int, int_to_bits
 
 
 OPCODES = {
@@ -27,12 +28,12 @@ OPCODE_NAMES = {v: k for k, v in OPCODES.items()}
 
 def int_to_bits_n(value: int, n: int) -> List[int]:
     """Convert integer to n-bit list (LSB first)."""
-    return [(value >> i) & 1 for i in range(n)]
+    return int_to_bits(value, n)
 
 
 def bits_to_int_n(bits: List[int]) -> int:
     """Convert bit list to integer."""
-    return sum(bit << i for i, bit in enumerate(bits))
+    return bits_to_int(bits)
 
 
 def encode_instruction(opcode: str, rd: int = 0, rs1: int = 0, rs2_imm: int = 0) -> List[int]:
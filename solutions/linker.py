@@ -0,0 +1,58 @@
+"""Linker - Solution File."""
+
+from typing import List, Dict
+from solutions.assembler import ObjectModule
+
+
+class Linker:
+    """Links relocatable object modules into one memory image."""
+
+    def __init__(self):
+        """Initialize linker state."""
+        self.symbol_table: Dict[str, int] = {}  # exported symbol -> absolute address
+        self.layout: List[int] = []  # base address of each module
+        self.errors: List[str] = []
+
+    def link(self, modules: List[ObjectModule], base: int = 0, size: int = 256) -> List[int]:
+        """Lay out modules, resolve symbols and return the linked image bytes."""
+        self.symbol_table = {}
+        self.errors = []
+        self.layout = self.layout_modules(modules, base)
+
+        if self.layout and self.layout[-1] + len(modules[-1].code) > size:
+            self.errors.append(f"Linked image does not fit in {size} bytes")
+            return [0] * size
+
+        for module, module_base in zip(modules, self.layout):
+            for symbol, offset in module.exports.items():
+                if symbol in self.symbol_table:
+                    self.errors.append(f"Duplicate symbol '{symbol}' in module '{module.name}'")
+                    continue
+                self.symbol_table[symbol] = module_base + offset
+
+        image = [0] * size
+        for module, module_base in zip(modules, self.layout):
+            image[module_base : module_base + len(module.code)] = module.code
+            for offset, symbol in module.relocations:
+                image[module_base + offset] = self.resolve(module, module_base, symbol) & 0xFF
+
+        return image
+
+    def layout_modules(self, modules: List[ObjectModule], base: int = 0) -> List[int]:
+        """Assign each module a base address, keeping instructions 2-byte aligned."""
+        layout = []
+        address = base
+        for module in modules:
+            address += address & 1
+            layout.append(address)
+            address += len(module.code)
+        return layout
+
+    def resolve(self, module: ObjectModule, module_base: int, symbol: str) -> int:
+        """Resolve a relocation symbol to an absolute address."""
+        if symbol in module.symbols:
+            return module_base + module.symbols[symbol]
+        if symbol in self.symbol_table:
+            return self.symbol_table[symbol]
+        self.errors.append(f"Undefined symbol '{symbol}' in module '{module.name}'")
+        return 0
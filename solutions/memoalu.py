@@ -0,0 +1,152 @@
+"""Memoized ALU - Solution File."""
+
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+from solutions.alu import ALU
+from solutions.bits import BitVector, bits_to_int, int_to_bits
+
+MODES = ["lru", "table"]
+OPS = ["ADD", "SUB", "AND", "OR", "XOR", "NOT", "SHL", "SHR", "CMP"]  # Index = ALU op code
+UNARY_OPS = (5, 6, 7)  # NOT, SHL, SHR ignore b
+
+Flags = Tuple[int, int, int, int]  # Z, C, N, V
+
+# Every (Z, C, N, V) combination, indexed by Z | C << 1 | N << 2 | V << 3
+FLAG_TUPLES: Tuple[Flags, ...] = tuple(((i >> 0) & 1, (i >> 1) & 1, (i >> 2) & 1, (i >> 3) & 1) for i in range(16))
+
+
+def _pack(result: BitVector, flags: Flags) -> int:
+    """Result byte in bits 0-7, flags in bits 8-11."""
+    z, c, n, v = flags
+    return result.value | (z | c << 1 | n << 2 | v << 3) << 8
+
+
+def _unpack(packed: int) -> Tuple[BitVector, Flags]:
+    return BitVector.from_int(packed & 0xFF), FLAG_TUPLES[packed >> 8]
+
+
+class MemoALU(ALU):
+    """ALU that remembers results instead of evaluating its gates again.
+
+    mode='lru' keeps the `capacity` most recently used (op, a, b) results.
+    mode='table' gives each op a packed 65536-entry table (allocated on the
+    op's first use, each entry computed on first use) and never evicts;
+    fill() computes whole ops up front.
+    """
+
+    def __init__(self, mode: str = "lru", capacity: int = 4096):
+        """Initialize an empty cache.
+
+        Args:
+            mode: 'lru' (bounded memory) or 'table' (up to 9 x 65536 entries, fastest)
+            capacity: Entries kept in 'lru' mode
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode}")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.mode = mode
+        self.capacity = capacity
+        self.entries: "OrderedDict[int, Tuple[BitVector, Flags]]" = OrderedDict()
+        self.tables: Dict[int, array] = {}
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Clear statistics (cached results are kept)."""
+        self.stats = {"calls": 0, "hits": 0, "misses": 0, "evictions": 0}
+
+    def clear(self) -> None:
+        """Forget every cached result."""
+        self.entries.clear()
+        self.tables.clear()
+
+    def _compute(self, op: int, a: int, b: int) -> Tuple[BitVector, Flags]:
+        """Evaluate the gates once."""
+        result, flags = ALU.__call__(self, int_to_bits(a), int_to_bits(b), int_to_bits(op, 4))
+        return BitVector(result), (flags["Z"], flags["C"], flags["N"], flags["V"])
+
+    def lookup(self, op: int, a: int, b: int) -> Tuple[BitVector, Flags]:
+        """Result bits and (Z, C, N, V) flags of one operation on integers."""
+        stats = self.stats
+        stats["calls"] += 1
+        if op in UNARY_OPS:
+            b = 0  # One entry per a
+        if self.mode == "table":
+            table = self.tables.get(op)
+            if table is None:
+                table = self.tables[op] = array("h", [-1]) * 65536
+            index = a << 8 | b
+            packed = table[index]
+            if packed >= 0:
+                stats["hits"] += 1
+                return _unpack(packed)
+            stats["misses"] += 1
+            entry = self._compute(op, a, b)
+            table[index] = _pack(*entry)
+            return entry
+
+        entries = self.entries
+        key = op << 16 | a << 8 | b
+        cached = entries.get(key)
+        if cached is not None:
+            stats["hits"] += 1
+            entries.move_to_end(key)
+            return cached
+        stats["misses"] += 1
+        entry = entries[key] = self._compute(op, a, b)
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+            stats["evictions"] += 1
+        return entry
+
+    def __call__(self, a: List[int], b: List[int], opcode: List[int]) -> Tuple[BitVector, Mapping[str, int]]:
+        """Execute an ALU operation (same interface as ALU; the flags dict is new on every call)."""
+        result, (z, c, n, v) = self.lookup(bits_to_int(opcode), bits_to_int(a), bits_to_int(b))
+        return result, {"Z": z, "C": c, "N": n, "V": v}
+
+    def fill(self, ops: Optional[Iterable[str]] = None) -> int:
+        """Compute every input of the given ops (default: all) into the table; returns entries added.
+
+        Each binary op is 65536 gate-level evaluations (about a second for ADD).
+        """
+        if self.mode != "table":
+            raise ValueError("fill() needs mode='table'")
+        added = 0
+        for name in OPS if ops is None else ops:
+            if name not in OPS:
+                raise ValueError(f"Unknown ALU operation: {name}")
+            op = OPS.index(name)
+            table = self.tables.get(op)
+            if table is None:
+                table = self.tables[op] = array("h", [-1]) * 65536
+            for a in range(256):
+                for b in (0,) if op in UNARY_OPS else range(256):
+                    if table[a << 8 | b] < 0:
+                        table[a << 8 | b] = _pack(*self._compute(op, a, b))
+                        added += 1
+        return added
+
+    def size(self) -> int:
+        """Number of cached results."""
+        if self.mode == "table":
+            return sum(len(table) - table.count(-1) for table in self.tables.values())
+        return len(self.entries)
+
+    def report(self) -> Dict:
+        """Statistics plus hit rate, cached entries and approximate table memory."""
+        stats = self.stats
+        report = dict(stats, mode=self.mode, entries=self.size())
+        report["hit_rate"] = stats["hits"] / stats["calls"] if stats["calls"] else 0.0
+        if self.mode == "table":
+            report["table_bytes"] = sum(table.itemsize * len(table) for table in self.tables.values())
+        else:
+            report["capacity"] = self.capacity
+        return report
+
+
+def memoize_alu(datapath, mode: str = "lru", capacity: int = 4096) -> MemoALU:
+    """Replace a DataPath's ALU with a MemoALU and return it."""
+    alu = MemoALU(mode, capacity)
+    datapath.alu = alu
+    return alu
@@ -0,0 +1,197 @@
+"""Peephole Optimizer - Solution File."""
+
+from typing import List, Dict, Iterable
+
+JUMP_OPCODES = ["JMP", "JZ", "JNZ"]
+MEMORY_OPCODES = ["LOAD", "STORE"]
+REG_WRITE_OPCODES = ["MOV", "ADD", "SUB", "AND", "OR", "XOR", "NOT", "SHL", "SHR"]
+
+
+class PeepholeOptimizer:
+    """Optimizes parsed assembly lines between the assembler's two passes."""
+
+    def __init__(self, volatile: Iterable[int] = ()):
+        """Initialize optimizer with addresses whose loads must never be folded."""
+        self.volatile = set(volatile)
+        self.stats: Dict[str, int] = {}
+
+    def optimize(self, parsed_lines: List[Dict], assembler) -> List[Dict]:
+        """Return optimized parsed lines and update code labels in the symbol table."""
+        self.stats = {"nop_moves": 0, "folded_loads": 0, "threaded_jumps": 0, "unreachable": 0}
+        if not parsed_lines:
+            return parsed_lines
+
+        lines = [dict(p, operands=list(p.get("operands", []))) for p in parsed_lines]
+        base = lines[0]["address"]
+        code_end = base + 2 * len(lines)
+
+        # Only straight-line code from `base` with no data inside it can be moved safely
+        if any(p["address"] != base + 2 * i for i, p in enumerate(lines)):
+            return parsed_lines
+        if any(base <= addr < code_end for addr in assembler.data_bytes):
+            return parsed_lines
+
+        targets: Dict[int, int] = {}  # line index -> jump target index
+        addresses: Dict[int, int] = {}  # line index -> LOAD/STORE address
+        for i, p in enumerate(lines):
+            operands = p["operands"]
+            if p["opcode"] in MEMORY_OPCODES and len(operands) >= 2:
+                addresses[i] = assembler._parse_value(operands[1]) & 0xFF
+                if base <= addresses[i] < code_end:
+                    return parsed_lines  # program reads or writes its own code
+            elif p["opcode"] in JUMP_OPCODES and operands:
+                target = assembler._parse_value(operands[0])
+                if not (base <= target < code_end) or (target - base) & 1:
+                    return parsed_lines  # jump leaves the code we can see
+                targets[i] = (target - base) // 2
+
+        self._thread_jumps(lines, targets)
+        removed = self._unreachable(lines, targets)
+        self._remove_nop_moves(lines, removed)
+        self._fold_loads(lines, targets, addresses, removed)
+        while self._remove_jumps_to_next(lines, targets, removed):
+            pass
+
+        # Re-layout surviving instructions and remap code addresses
+        new_index = []
+        count = 0
+        for i in range(len(lines)):
+            new_index.append(count)
+            if i not in removed:
+                count += 1
+        new_index.append(count)
+
+        for label, value in assembler.symbol_table.items():
+            if base <= value < code_end:
+                assembler.symbol_table[label] = base + 2 * new_index[(value - base) // 2]
+
+        result = []
+        for i, p in enumerate(lines):
+            if i in removed:
+                continue
+            p["address"] = base + 2 * new_index[i]
+            if i in targets:
+                p["operands"] = [f"0x{base + 2 * new_index[targets[i]]:02X}"]
+            result.append(p)
+        return result
+
+    def _thread_jumps(self, lines: List[Dict], targets: Dict[int, int]) -> None:
+        """Retarget jumps whose destination is an unconditional JMP."""
+        for i in targets:
+            target = targets[i]
+            seen = {i}
+            while lines[target]["opcode"] == "JMP" and target not in seen:
+                seen.add(target)
+                target = targets[target]
+            if target != targets[i]:
+                targets[i] = target
+                self.stats["threaded_jumps"] += 1
+
+    def _unreachable(self, lines: List[Dict], targets: Dict[int, int]) -> set:
+        """Return indices of lines that can never execute."""
+        reachable = set()
+        worklist = [0]
+        while worklist:
+            i = worklist.pop()
+            if i in reachable or i >= len(lines):
+                continue
+            reachable.add(i)
+            opcode = lines[i]["opcode"]
+            if opcode in JUMP_OPCODES:
+                worklist.append(targets[i])
+            if opcode not in ["HALT", "JMP"]:
+                worklist.append(i + 1)
+        removed = set(range(len(lines))) - reachable
+        self.stats["unreachable"] += len(removed)
+        return removed
+
+    def _remove_nop_moves(self, lines: List[Dict], removed: set) -> None:
+        """Remove MOV Rx, Rx."""
+        for i, p in enumerate(lines):
+            if i in removed or p["opcode"] != "MOV" or len(p["operands"]) < 2:
+                continue
+            if _reg(p["operands"][0]) == _reg(p["operands"][1]):
+                removed.add(i)
+                self.stats["nop_moves"] += 1
+
+    def _fold_loads(self, lines: List[Dict], targets: Dict[int, int], addresses: Dict[int, int], removed: set) -> None:
+        """Replace loads of values already held in a register within a basic block."""
+        leaders = set(targets.values()) | {i + 1 for i in targets}
+        holds: Dict[int, int] = {}  # register -> memory address it currently mirrors
+        for i, p in enumerate(lines):
+            if i in leaders:
+                holds = {}
+            if i in removed or i not in addresses and p["opcode"] not in REG_WRITE_OPCODES:
+                continue
+            opcode, operands = p["opcode"], p["operands"]
+            rd = _reg(operands[0]) if operands else 0
+            if opcode == "LOAD":
+                addr = addresses[i]
+                if addr in self.volatile:
+                    holds.pop(rd, None)
+                    continue
+                source = rd if holds.get(rd) == addr else next((r for r, a in holds.items() if a == addr), None)
+                if source is not None:
+                    p["opcode"], p["operands"] = "MOV", [f"R{rd}", f"R{source}"]
+                    self.stats["folded_loads"] += 1
+                holds[rd] = addr
+            elif opcode == "STORE":
+                addr = addresses[i]
+                holds = {r: a for r, a in holds.items() if a != addr}
+                if addr not in self.volatile:
+                    holds[rd] = addr
+            else:
+                copied = holds.get(_reg(operands[1])) if opcode == "MOV" and len(operands) >= 2 else None
+                holds.pop(rd, None)
+                if copied is not None:
+                    holds[rd] = copied
+
+        # A LOAD that became MOV Rx, Rx is now a no-op
+        self._remove_nop_moves(lines, removed)
+
+    def _remove_jumps_to_next(self, lines: List[Dict], targets: Dict[int, int], removed: set) -> bool:
+        """Remove jumps whose target is the next surviving instruction."""
+        changed = False
+        for i in sorted(targets):
+            if i in removed:
+                continue
+            following = next((j for j in range(i + 1, len(lines)) if j not in removed), len(lines))
+            target = next((j for j in range(targets[i], len(lines)) if j not in removed), len(lines))
+            if target == following:
+                removed.add(i)
+                self.stats["threaded_jumps"] += 1
+                changed = True
+        return changed
+
+
+def _reg(operand: str) -> int:
+    """Register number as seen by the 3-bit register file address."""
+    operand = operand.strip().upper()
+    return int(operand[1:]) & 0x7 if operand.startswith("R") else 0
+
+
+def measure_cycles(source: str, max_cycles: int = 1000, volatile: Iterable[int] = ()) -> Dict:
+    """Run a program with and without optimization and report the cycles saved."""
+    from solutions.assembler import Assembler
+    from solutions.system import Computer
+
+    runs = []
+    for optimize in (False, True):
+        computer = Computer()
+        computer.assembler = Assembler(optimize=optimize)
+        computer.assembler.optimizer.volatile = set(volatile)
+        computer.load_program(source)
+        instructions = len(computer.assembler.assemble(source))
+        cycles = computer.cpu.run(max_cycles)
+        runs.append((cycles, instructions, computer.dump_state()["registers"]))
+
+    (before, size_before, regs_before), (after, size_after, regs_after) = runs
+    return {
+        "before": before,
+        "after": after,
+        "saved": before - after,
+        "instructions_before": size_before,
+        "instructions_after": size_after,
+        "registers_match": regs_before == regs_after,
+        "stats": dict(computer.assembler.optimizer.stats),
+    }
@@ -0,0 +1,284 @@
+"""Pipelined CPU - Solution File."""
+
+from typing import Dict, List, Optional
+from solutions.cpu import CPU
+from solutions.control import ControlUnit
+from solutions.isa import bits_to_int_n, int_to_bits_n
+
+BRANCH_POLICIES = ["flush", "stall"]
+CONDITIONAL_BRANCHES = ["JZ", "JNZ"]
+TWO_SOURCE_OPCODES = ["ADD", "SUB", "AND", "OR", "XOR"]
+ONE_SOURCE_OPCODES = ["MOV", "NOT", "SHL", "SHR"]
+MAX_RETIRE_GAP = 8  # An instruction retires at most a few cycles after the previous one
+
+
+def sources(decoded: Dict) -> List[int]:
+    """Registers an instruction reads (3-bit register numbers)."""
+    name = decoded["opcode_name"]
+    if name in TWO_SOURCE_OPCODES:
+        return [decoded["rs1"] & 0x7, decoded["rs2_imm"] & 0x7]
+    if name in ONE_SOURCE_OPCODES:
+        return [decoded["rs1"] & 0x7]
+    if name == "STORE":
+        return [decoded["rd"] & 0x7]
+    return []
+
+
+def destination(decoded: Dict) -> Optional[int]:
+    """Register an instruction writes, or None."""
+    if decoded["opcode_name"] in TWO_SOURCE_OPCODES + ONE_SOURCE_OPCODES + ["LOAD"]:
+        return decoded["rd"] & 0x7
+    return None
+
+
+class PipelinedCPU(CPU):
+    """4-stage pipelined CPU: FETCH, DECODE, EXECUTE, WRITEBACK.
+
+    Latches between the stages hold one instruction each. All architectural
+    state (registers, flags, memory, PC) is written in WRITEBACK, so the
+    program computes exactly what the single-cycle CPU computes.
+    """
+
+    def __init__(self, forwarding: bool = True, branch_policy: str = "flush"):
+        """Initialize pipeline.
+
+        Args:
+            forwarding: Forward EXECUTE results instead of stalling on RAW hazards
+            branch_policy: 'flush' (predict not taken, flush when taken) or
+                'stall' (stop fetching until JZ/JNZ resolves)
+        """
+        if branch_policy not in BRANCH_POLICIES:
+            raise ValueError(f"Unknown branch policy: {branch_policy}")
+        super().__init__()
+        self.forwarding = forwarding
+        self.branch_policy = branch_policy
+        self.reset_pipeline()
+
+    def reset(self) -> None:
+        """Reset CPU and empty the pipeline."""
+        super().reset()
+        self.reset_pipeline()
+
+    def reset_pipeline(self) -> None:
+        """Empty all latches and clear statistics."""
+        self.if_id: Optional[Dict] = None
+        self.id_ex: Optional[Dict] = None
+        self.ex_wb: Optional[Dict] = None
+        self.fetch_pc: Optional[int] = None
+        self.stats: Dict[str, int] = {
+            "cycles": 0,
+            "instructions": 0,
+            "raw_hazards": 0,
+            "forwards": 0,
+            "stalls": 0,
+            "flushes": 0,
+        }
+
+    # ----- Stages -----
+
+    def clock_cycle(self) -> Optional[Dict]:
+        """Advance every stage by one clock cycle; returns the retired instruction."""
+        if self.halted:
+            return None
+        if self.fetch_pc is None:
+            self.fetch_pc = bits_to_int_n(self.datapath.get_pc())
+
+        retired = self.ex_wb
+        squash = self._writeback(retired) if retired else False
+        if retired and self.tracer is not None:
+            self.tracer.record_cpu(self, retired["pc"], retired["instruction"])
+
+        executing = None if squash else self.id_ex
+        ex_wb = self._execute(executing, retired) if executing else None
+        redirect = ex_wb.get("redirect") if ex_wb else None
+
+        id_ex, stall = None, False
+        if self.if_id and not squash and redirect is None:
+            id_ex, stall = self._decode_stage(self.if_id, executing)
+            if id_ex and id_ex["decoded"]["opcode_name"] == "JMP":
+                redirect = id_ex["decoded"]["rs2_imm"]
+
+        if squash and retired is not None:
+            self.fetch_pc = retired["next_pc"]
+            if_id = None
+            self.stats["flushes"] += 1
+        elif redirect is not None:
+            self.fetch_pc = redirect
+            if_id = None
+            # Under 'stall' the branch fetched nothing, so there is nothing to flush
+            from_branch = ex_wb is not None and "taken" in ex_wb
+            self.stats["stalls" if from_branch and self.branch_policy == "stall" else "flushes"] += 1
+        elif stall:
+            if_id = self.if_id
+            self.stats["stalls"] += 1
+        elif self._fetch_blocked(executing, id_ex, ex_wb):
+            if_id = None
+            if self.branch_policy == "stall" and not self._halting(id_ex, ex_wb):
+                self.stats["stalls"] += 1
+        else:
+            if_id = self._fetch(self.fetch_pc)
+            self.fetch_pc = (self.fetch_pc + 2) & 0xFF
+
+        self.if_id, self.id_ex, self.ex_wb = if_id, id_ex, ex_wb
+        self.stats["cycles"] += 1
+        self.clock.tick()
+        self.clock.tick()
+        return retired
+
+    def _fetch(self, pc: int) -> Dict:
+        """FETCH: read the instruction at pc."""
+        memory = self.datapath.instruction_memory
+        instruction = memory.read(int_to_bits_n(pc, 8)) + memory.read(int_to_bits_n((pc + 1) & 0xFF, 8))
+        return {"pc": pc, "instruction": instruction}
+
+    def _fetch_blocked(self, executing: Optional[Dict], id_ex: Optional[Dict], ex_wb: Optional[Dict]) -> bool:
+        """Return True if FETCH must insert a bubble this cycle."""
+        if self._halting(id_ex, ex_wb):
+            return True
+        # 'stall' policy: wait until the branch has left EXECUTE
+        if self.branch_policy == "stall":
+            return any(
+                entry and entry["decoded"]["opcode_name"] in CONDITIONAL_BRANCHES for entry in (id_ex, executing)
+            )
+        return False
+
+    def _halting(self, id_ex: Optional[Dict], ex_wb: Optional[Dict]) -> bool:
+        """Return True if a HALT has been decoded (nothing after it is fetched)."""
+        return any(entry and entry["decoded"]["opcode_name"] == "HALT" for entry in (id_ex, ex_wb))
+
+    def _decode_stage(self, entry: Dict, executing: Optional[Dict]):
+        """DECODE: decode and read registers; returns (latch, stall)."""
+        decoded = self.decode(entry["instruction"])
+        reads = sources(decoded)
+
+        # RAW hazard: the instruction in EXECUTE writes a register this one reads
+        producer = destination(executing["decoded"]) if executing else None
+        if producer is not None and producer in reads:
+            self.stats["raw_hazards"] += 1
+            if not self.forwarding:
+                return None, True
+
+        reg_file = self.datapath.reg_file
+        values = {r: reg_file.read(int_to_bits_n(r, 3)) for r in reads}
+        return dict(entry, decoded=decoded, values=values), False
+
+    def _execute(self, entry: Dict, retiring: Optional[Dict]) -> Dict:
+        """EXECUTE: ALU, memory read and branch resolution."""
+        decoded = entry["decoded"]
+        name = decoded["opcode_name"]
+        values = dict(entry["values"])
+
+        # Forward the result being written back this cycle
+        if self.forwarding and retiring and retiring["dest"] is not None and retiring["dest"] in values:
+            values[retiring["dest"]] = retiring["result"]
+            self.stats["forwards"] += 1
+
+        signals = self.control.generate_signals(decoded, self.datapath.flags)
+        result, flags = None, None
+        address = decoded["rs2_imm"] & 0xFF
+        next_pc = (entry["pc"] + 2) & 0xFF
+
+        if name == "LOAD":
+            result = self.datapath.memory.read(int_to_bits_n(address, 8))
+        elif name == "STORE":
+            result = values[decoded["rd"] & 0x7]
+        elif name == "MOV":
+            result = values[decoded["rs1"] & 0x7]
+        elif name in TWO_SOURCE_OPCODES + ONE_SOURCE_OPCODES:
+            a = values[decoded["rs1"] & 0x7]
+            b = values.get(decoded["rs2_imm"] & 0x7, [0] * 8)
+            result, flags = self.datapath.alu(a, b, signals.alu_op)
+        elif name == "JMP":
+            next_pc = address
+        elif name == "HALT":
+            next_pc = entry["pc"]
+
+        latch = dict(entry, result=result, flags=flags, dest=destination(decoded), next_pc=next_pc)
+        if name in CONDITIONAL_BRANCHES:
+            taken = latch["taken"] = bool(signals.pc_load)
+            if taken:
+                latch["next_pc"] = address
+            # 'flush' predicted not taken, 'stall' fetched nothing
+            if taken or self.branch_policy == "stall":
+                latch["redirect"] = latch["next_pc"]
+        if self.branch_predictor is not None and name in CONDITIONAL_BRANCHES + ["JMP"]:
+            self.branch_predictor.record(entry["pc"], name, name == "JMP" or latch["taken"], decoded["rs2_imm"])
+        return latch
+
+    def _writeback(self, entry: Dict) -> bool:
+        """WRITEBACK: commit the instruction; returns True if younger ones must be squashed."""
+        decoded = entry["decoded"]
+        name = decoded["opcode_name"]
+
+        if entry["dest"] is not None:
+            self.datapath.reg_file.write(int_to_bits_n(entry["dest"], 3), entry["result"], 1, 1)
+        if entry["flags"] is not None:
+            self.datapath.flags = entry["flags"]
+        self.datapath.set_pc(int_to_bits_n(entry["next_pc"], 8))
+        self.current_instruction = decoded
+        self.stats["instructions"] += 1
+
+        if name == "HALT":
+            self.halted = True
+        elif name == "STORE":
+            address = decoded["rs2_imm"] & 0xFF
+            self.datapath.memory.write(int_to_bits_n(address, 8), entry["result"], 1)
+            # Self-modifying code: refetch anything fetched from the old bytes
+            for younger in (self.id_ex, self.if_id):
+                if younger and address in (younger["pc"], (younger["pc"] + 1) & 0xFF):
+                    return True
+        return False
+
+    # ----- CPU interface -----
+
+    def step(self) -> bool:
+        """Run clock cycles until one instruction retires."""
+        if self.interrupts is not None:
+            self._service_interrupts()
+        for _ in range(MAX_RETIRE_GAP):
+            if self.halted or self.clock_cycle():
+                return not self.halted or (self.interrupts is not None and self.interrupts.can_wake())
+        raise RuntimeError("Pipeline stopped retiring instructions")
+
+    def _service_interrupts(self) -> None:
+        """Take or return from an interrupt between two retirements.
+
+        The datapath PC is the next_pc of the last retired instruction. If
+        the controller moves it, everything fetched behind that instruction
+        is flushed and fetching restarts from the new PC.
+        """
+        pc, in_handler = self.datapath.get_pc(), self.interrupts.in_handler
+        self.interrupts.service(self)
+        if self.datapath.get_pc() == pc and self.interrupts.in_handler == in_handler:
+            return
+        if self.if_id or self.id_ex or self.ex_wb:
+            self.stats["flushes"] += 1
+        self.if_id = self.id_ex = self.ex_wb = None
+        self.fetch_pc = None
+
+    def pipeline_state(self) -> Dict[str, Optional[int]]:
+        """PC of the instruction held in each stage (None for a bubble)."""
+        fetched = self.fetch_pc if self.fetch_pc is not None else bits_to_int_n(self.datapath.get_pc())
+        return {
+            ControlUnit.FETCH: None if self.halted else fetched,
+            ControlUnit.DECODE: self.if_id["pc"] if self.if_id else None,
+            ControlUnit.EXECUTE: self.id_ex["pc"] if self.id_ex else None,
+            ControlUnit.WRITEBACK: self.ex_wb["pc"] if self.ex_wb else None,
+        }
+
+    def report(self) -> Dict:
+        """Cycle-accurate statistics, including cycles per instruction."""
+        report: Dict[str, float] = dict(self.stats)
+        report["cpi"] = self.stats["cycles"] / self.stats["instructions"] if self.stats["instructions"] else 0.0
+        return report
+
+
+def cpi_report(source, max_cycles: int = 10000, forwarding: bool = True, branch_policy: str = "flush") -> Dict:
+    """Run a program on the pipelined CPU and report its CPI."""
+    from solutions.system import Computer
+
+    cpu = PipelinedCPU(forwarding=forwarding, branch_policy=branch_policy)
+    computer = Computer(cpu=cpu)
+    computer.load_program(source)
+    cpu.run(max_cycles)
+    return cpu.report()
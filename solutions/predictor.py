@@ -0,0 +1,266 @@
+"""Branch Predictors - Solution File."""
+
+from array import array
+from typing import Dict, List, Optional
+
+# Cycle cost of a control hazard in the 4-stage pipeline (see pipeline.py)
+RESOLVE_PENALTY = 2  # JZ/JNZ resolved in EXECUTE: two wrong-path instructions
+DECODE_PENALTY = 1  # Target known in DECODE: one wrong-path instruction
+
+CONDITIONAL_BRANCHES = ["JZ", "JNZ"]
+JUMP_OPCODES = ["JMP"] + CONDITIONAL_BRANCHES
+
+
+class BranchPredictor:
+    """Base class: records outcomes reported by CPU.step and keeps statistics.
+
+    Subclasses implement predict() (direction), update() and optionally
+    target() (a BTB). Table indices use pc >> 1 since instructions are 2 bytes.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        """Initialize statistics."""
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Clear statistics (predictor state is kept)."""
+        self.stats = {
+            "branches": 0,
+            "correct": 0,
+            "taken": 0,
+            "jumps": 0,
+            "target_hits": 0,
+            "cycles_saved": 0,
+        }
+
+    def predict(self, pc: int) -> bool:
+        """Predict whether the branch at pc is taken."""
+        return False
+
+    def target(self, pc: int) -> Optional[int]:
+        """Predicted target of the jump at pc, if known at fetch."""
+        return None
+
+    def update(self, pc: int, taken: bool, target: int) -> None:
+        """Train on the actual outcome of a conditional branch."""
+
+    def update_target(self, pc: int, target: int) -> None:
+        """Train on the target of a taken branch or jump."""
+
+    def record(self, pc: int, opname: str, taken: bool, target: int) -> None:
+        """Called by CPU.step for every JZ/JNZ/JMP before it executes.
+
+        Args:
+            pc: Address of the jump
+            opname: 'JZ', 'JNZ' or 'JMP'
+            taken: Whether the jump is taken
+            target: Jump target address
+        """
+        stats = self.stats
+        target_hit = self.target(pc) == target
+
+        if opname in CONDITIONAL_BRANCHES:
+            predicted = self.predict(pc)
+            stats["branches"] += 1
+            stats["taken"] += taken
+            stats["correct"] += predicted == taken
+            if predicted != taken:
+                cost = RESOLVE_PENALTY
+            elif taken:
+                cost = 0 if target_hit else DECODE_PENALTY
+            else:
+                cost = 0
+            # Baseline: predict not taken, no BTB
+            stats["cycles_saved"] += (RESOLVE_PENALTY if taken else 0) - cost
+            self.update(pc, taken, target)
+        else:
+            stats["jumps"] += 1
+            stats["cycles_saved"] += DECODE_PENALTY if target_hit else 0
+
+        stats["target_hits"] += taken and target_hit
+        if taken:
+            self.update_target(pc, target)
+
+    def report(self) -> Dict:
+        """Statistics plus prediction accuracy."""
+        report = dict(self.stats, name=self.name)
+        report["accuracy"] = self.stats["correct"] / self.stats["branches"] if self.stats["branches"] else 1.0
+        return report
+
+
+class StaticPredictor(BranchPredictor):
+    """Fixed prediction: 'not_taken', 'taken', or 'btfn' (backward taken, forward not)."""
+
+    MODES = ["not_taken", "taken", "btfn"]
+
+    def __init__(self, mode: str = "btfn"):
+        """Initialize with a static prediction mode."""
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown static mode: {mode}")
+        super().__init__()
+        self.mode = mode
+        self.name = f"static-{mode}"
+        self.targets = bytearray(128)  # Jump targets are in the instruction itself
+
+    def predict(self, pc: int) -> bool:
+        """Predict from the mode (and branch direction for 'btfn')."""
+        if self.mode == "btfn":
+            return self.targets[pc >> 1] <= pc
+        return self.mode == "taken"
+
+    def record(self, pc: int, opname: str, taken: bool, target: int) -> None:
+        """Remember the encoded target so 'btfn' can see the branch direction."""
+        self.targets[pc >> 1] = target
+        super().record(pc, opname, taken, target)
+
+
+class OneBitPredictor(BranchPredictor):
+    """Predicts the last outcome of each branch."""
+
+    name = "1-bit"
+
+    def __init__(self, size: int = 128):
+        """Initialize a table of `size` entries (power of 2)."""
+        super().__init__()
+        self.mask = size - 1
+        self.table = bytearray(size)
+
+    def predict(self, pc: int) -> bool:
+        """Predict the last outcome."""
+        return bool(self.table[(pc >> 1) & self.mask])
+
+    def update(self, pc: int, taken: bool, target: int) -> None:
+        """Remember the outcome."""
+        self.table[(pc >> 1) & self.mask] = taken
+
+
+class TwoBitPredictor(BranchPredictor):
+    """2-bit saturating counters: 0-1 predict not taken, 2-3 predict taken."""
+
+    name = "2-bit"
+
+    def __init__(self, size: int = 128):
+        """Initialize counters to weakly not taken."""
+        super().__init__()
+        self.mask = size - 1
+        self.table = bytearray([1]) * size
+
+    def _index(self, pc: int) -> int:
+        return (pc >> 1) & self.mask
+
+    def predict(self, pc: int) -> bool:
+        """Predict taken if the counter is 2 or 3."""
+        return self.table[self._index(pc)] >= 2
+
+    def update(self, pc: int, taken: bool, target: int) -> None:
+        """Count up on taken, down on not taken, saturating at 0 and 3."""
+        i = self._index(pc)
+        if taken:
+            if self.table[i] < 3:
+                self.table[i] += 1
+        elif self.table[i] > 0:
+            self.table[i] -= 1
+
+
+class GsharePredictor(TwoBitPredictor):
+    """2-bit counters indexed by pc XOR global branch history."""
+
+    name = "gshare"
+
+    def __init__(self, size: int = 128, history_bits: int = 6):
+        """Initialize counters and an empty history register."""
+        super().__init__(size)
+        self.history_mask = (1 << history_bits) - 1
+        self.history = 0
+
+    def _index(self, pc: int) -> int:
+        return ((pc >> 1) ^ self.history) & self.mask
+
+    def update(self, pc: int, taken: bool, target: int) -> None:
+        """Train the counter, then shift the outcome into the history."""
+        super().update(pc, taken, target)
+        self.history = ((self.history << 1) | taken) & self.history_mask
+
+
+class BranchTargetBuffer(BranchPredictor):
+    """Direct-mapped BTB: supplies targets at fetch so taken jumps cost nothing.
+
+    A hit predicts taken unless a `direction` predictor is given.
+    """
+
+    name = "btb"
+
+    def __init__(self, size: int = 16, direction: Optional[BranchPredictor] = None):
+        """Initialize `size` entries (power of 2), all invalid."""
+        super().__init__()
+        self.mask = size - 1
+        self.tags = array("h", [-1]) * size
+        self.targets = bytearray(size)
+        self.direction = direction
+        if direction is not None:
+            self.name = f"btb+{direction.name}"
+
+    def _lookup(self, pc: int) -> Optional[int]:
+        i = (pc >> 1) & self.mask
+        return self.targets[i] if self.tags[i] == pc else None
+
+    def predict(self, pc: int) -> bool:
+        """Predict taken on a hit (or ask the direction predictor)."""
+        if self.direction is not None:
+            return self.direction.predict(pc)
+        return self._lookup(pc) is not None
+
+    def target(self, pc: int) -> Optional[int]:
+        """Return the stored target on a hit."""
+        return self._lookup(pc)
+
+    def update(self, pc: int, taken: bool, target: int) -> None:
+        """Train the direction predictor; without one, drop not-taken branches."""
+        if self.direction is not None:
+            self.direction.update(pc, taken, target)
+        elif not taken and self._lookup(pc) is not None:
+            self.tags[(pc >> 1) & self.mask] = -1
+
+    def update_target(self, pc: int, target: int) -> None:
+        """Store the target of a taken branch or jump."""
+        i = (pc >> 1) & self.mask
+        self.tags[i] = pc
+        self.targets[i] = target
+
+
+PREDICTORS = {
+    "static": StaticPredictor,
+    "1-bit": OneBitPredictor,
+    "2-bit": TwoBitPredictor,
+    "gshare": GsharePredictor,
+    "btb": BranchTargetBuffer,
+}
+
+
+def compare_predictors(source, predictors: Optional[List[BranchPredictor]] = None, max_cycles: int = 10000) -> Dict:
+    """Run a program once per predictor and report each one's accuracy.
+
+    Args:
+        source: Assembly source or raw bytes
+        predictors: Predictor instances (default: one of each kind, plus BTB+2-bit)
+        max_cycles: Maximum instructions to execute
+
+    Returns:
+        Dict of predictor name -> report()
+    """
+    from solutions.system import Computer
+
+    if predictors is None:
+        predictors = [cls() for cls in PREDICTORS.values()]
+        predictors.append(BranchTargetBuffer(direction=TwoBitPredictor()))
+
+    reports = {}
+    for predictor in predictors:
+        computer = Computer()
+        computer.cpu.branch_predictor = predictor
+        computer.load_program(source)
+        computer.cpu.run(max_cycles)
+        reports[predictor.name] = predictor.report()
+    return reports
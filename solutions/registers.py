@@ -1,6 +1,7 @@
 """Registers - Solution File."""
 
 from typing import List
+from solutions.bits import bits_to_int
 from solutions.sequential import DFlipFlop
 
 
@@ -37,7 +38,7 @@ class RegisterFile:
 
     def _addr_to_index(self, addr: List[int]) -> int:
         """Convert bit address to integer index."""
-        return sum(bit << i for i, bit in enumerate(addr))
+        return bits_to_int(addr)
 
     def read(self, addr: List[int]) -> List[int]:
         """Read from a register."""
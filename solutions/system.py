@@ -1,6 +1,7 @@
 """Full System - Solution File."""
 
-from typing import List, Dict
+from typing import List, Dict, Optional
+from solutions.bits import bits_to_int, int_to_bits
 from solutions.cpu import CPU
 from solutions.assembler import Assembler
 
@@ -8,9 +9,13 @@ from solutions.assembler import Assembler
 class Computer:
     """Complete 8-bit computer system."""
 
-    def __init__(self):
-        """Initialize computer with CPU and assembler."""
-        self.cpu = CPU()
+    def __init__(self, cpu: Optional[CPU] = None):
+        """Initialize computer with CPU and assembler.
+
+        Args:
+            cpu: CPU to use (e.g. a PipelinedCPU); default is the single-cycle CPU
+        """
+        self.cpu = cpu if cpu is not None else CPU()
         self.assembler = Assembler()
 
     def load_program(self, source) -> None:
@@ -25,14 +30,14 @@ class Computer:
             self.load_machine_code(code)
             # Also load data bytes from .byte directives
             for addr, value in self.assembler.data_bytes.items():
-                addr_bits = [(addr >> i) & 1 for i in range(8)]
-                value_bits = [(value >> i) & 1 for i in range(8)]
+                addr_bits = int_to_bits(addr)
+                value_bits = int_to_bits(value)
                 self.cpu.datapath.memory.write(addr_bits, value_bits, 1)
         else:
             # Raw bytes - load directly into memory
             for addr, byte_val in enumerate(source):
-                addr_bits = [(addr >> i) & 1 for i in range(8)]
-                value_bits = [(byte_val >> i) & 1 for i in range(8)]
+                addr_bits = int_to_bits(addr)
+                value_bits = int_to_bits(byte_val)
                 self.cpu.datapath.memory.write(addr_bits, value_bits, 1)
 
     def load_machine_code(self, code: List[List[int]], start_addr: int = 0) -> None:
@@ -43,9 +48,9 @@ class Computer:
             # Split into two bytes
             low_byte = instruction[:8]
             high_byte = instruction[8:] if len(instruction) > 8 else [0] * 8
-            addr_bits = [(addr >> j) & 1 for j in range(8)]
+            addr_bits = int_to_bits(addr)
             self.cpu.datapath.memory.write(addr_bits, low_byte, 1)
-            addr_bits = [((addr + 1) >> j) & 1 for j in range(8)]
+            addr_bits = int_to_bits(addr + 1)
             self.cpu.datapath.memory.write(addr_bits, high_byte, 1)
 
     def run(self, max_cycles: int = 1000, debug: bool = False) -> Dict:
@@ -68,7 +73,7 @@ class Computer:
         state = self.cpu.get_state()
         state["registers"] = {}
         for i in range(8):
-            addr = [(i >> j) & 1 for j in range(3)]
+            addr = int_to_bits(i, 3)
             val = self.cpu.datapath.reg_file.read(addr)
             state["registers"][f"R{i}"] = self._bits_to_int(val)
         return state
@@ -77,13 +82,13 @@ class Computer:
         """Get formatted register dump."""
         lines = []
         for i in range(8):
-            addr = [(i >> j) & 1 for j in range(3)]
+            addr = int_to_bits(i, 3)
             val = self.cpu.datapath.reg_file.read(addr)
             lines.append(f"R{i}: {self._bits_to_int(val):3d} (0x{self._bits_to_int(val):02X})")
         return "\n".join(lines)
 
     def _bits_to_int(self, bits: List[int]) -> int:
-        return sum(bit << i for i, bit in enumerate(bits))
+        return bits_to_int(bits)
 
     def _format_bits(self, bits: List[int]) -> str:
         val = self._bits_to_int(bits)
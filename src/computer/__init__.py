@@ -10,6 +10,7 @@ Bit Representation:
 """
 
 from typing import List
+from computer.bits import bits_to_int as _bits_to_int, int_to_bits as _int_to_bits
 
 
 def int_to_bits(value: int, num_bits: int = 8) -> List[int]:
@@ -30,10 +31,8 @@ def int_to_bits(value: int, num_bits: int = 8) -> List[int]:
     if value < 0:
         value = (1 << num_bits) + value
 
-    # Mask to ensure we only use num_bits
-    value = value & ((1 << num_bits) - 1)
-
-    return [(value >> i) & 1 for i in range(num_bits)]
+    # Lookup-table conversion (masks to num_bits)
+    return _int_to_bits(value, num_bits)
 
 
 def bits_to_int(bits: List[int], signed: bool = False) -> int:
@@ -50,7 +49,7 @@ def bits_to_int(bits: List[int], signed: bool = False) -> int:
         >>> bits_to_int([1, 0, 1, 0, 0, 0, 0, 0])
         5
     """
-    result = sum(bit << i for i, bit in enumerate(bits))
+    result = _bits_to_int(bits)
 
     if signed and len(bits) > 0 and bits[-1] == 1:
         # Two's complement: subtract 2^n if MSB is 1
@@ -12,7 +12,7 @@ Components:
 Bit representation: Lists with LSB at index 0.
 """
 
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
 from computer.gates import AND, NOT, OR, XOR  # noqa: F401
 
@@ -72,7 +72,7 @@ def full_adder(a: int, b: int, cin: int) -> Tuple[int, int]:
     ...
 
 
-def ripple_carry_adder_8bit(a: List[int], b: List[int], cin: int = 0) -> Tuple[List[int], int]:
+def ripple_carry_adder_8bit(a: Sequence[int], b: Sequence[int], cin: int = 0) -> Tuple[List[int], int]:
     """8-bit Ripple Carry Adder.
 
     Adds two 8-bit numbers using a chain of full adders.
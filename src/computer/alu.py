@@ -19,11 +19,20 @@ Flags:
 - C (Carry): Carry/borrow occurred
 - N (Negative): Result MSB is 1
 - V (Overflow): Signed overflow occurred
+
+Lazy flags:
+    Most instructions never look at the flags (only JZ/JNZ read Z), so
+    __call__ may return LazyFlags(result, carry, overflow) (provided in
+    computer.flags) instead of a dict. It reads like the dict, but Z and N
+    are only worked out from the result when someone asks for them. For
+    ADD, LazyFlags(result, carry, signs=(a[7], b[7])) also defers the
+    overflow check.
 """
 
-from typing import Dict, List, Tuple
+from typing import List, Mapping, Sequence, Tuple
 
 from computer.adders import ripple_carry_adder_8bit, subtractor_8bit  # noqa: F401
+from computer.flags import LazyFlags  # noqa: F401
 from computer.gates import AND, NOT, OR, XOR  # noqa: F401
 
 
@@ -41,7 +50,7 @@ class ALU:
     OP_SHR = [1, 1, 1, 0]
     OP_CMP = [0, 0, 0, 1]
 
-    def __call__(self, a: List[int], b: List[int], opcode: List[int]) -> Tuple[List[int], Dict[str, int]]:
+    def __call__(self, a: List[int], b: List[int], opcode: List[int]) -> Tuple[Sequence[int], Mapping[str, int]]:
         """Execute an ALU operation.
 
         Args:
@@ -52,11 +61,11 @@ class ALU:
         Returns:
             Tuple of (result, flags)
             - result: 8-bit result (LSB at index 0)
-            - flags: Dictionary with keys 'Z', 'C', 'N', 'V'
+            - flags: Mapping with keys 'Z', 'C', 'N', 'V' (a dict or LazyFlags)
         """
         # TODO: Implement ALU
         # 1. Decode opcode and perform the operation
-        # 2. Calculate flags based on the result
+        # 2. Calculate flags based on the result (or record them in LazyFlags)
         # 3. Return (result, flags)
         ...
 
@@ -99,17 +108,3 @@ class ALU:
         """Shift right by 1. Returns (result, carry_out)."""
         # TODO: Implement shift right
         ...
-
-    def _calculate_flags(self, result: List[int], carry: int, overflow: int) -> Dict[str, int]:
-        """Calculate status flags.
-
-        Args:
-            result: 8-bit result
-            carry: Carry/borrow bit
-            overflow: Overflow bit
-
-        Returns:
-            Dictionary with Z, C, N, V flags
-        """
-        # TODO: Implement flag calculation
-        ...
@@ -1,21 +1,76 @@
 """Assembler.
 
 Converts assembly language to machine code.
+
+Besides absolute machine code, the assembler can produce relocatable
+object modules for the linker:
+- .global name  exports a label to other modules
+- .extern name  imports a label defined in another module
+- Addresses are offsets from the module start, and every LOAD/STORE/JMP/JZ/JNZ
+  address field that names a symbol gets a relocation entry
 """
 
 from typing import Dict, List, Optional
 
 from computer.isa import encode_instruction  # noqa: F401
+from computer.optimizer import PeepholeOptimizer
+
+
+# Instructions whose low byte is an 8-bit address field
+ADDRESS_OPCODES = ["LOAD", "STORE", "JMP", "JZ", "JNZ"]
+
+
+class ObjectModule:
+    """Relocatable object module produced by Assembler.assemble_object()."""
+
+    def __init__(self, name: str = ""):
+        """Initialize an empty object module."""
+        self.name = name
+        self.code: List[int] = []  # Section bytes, offset 0 is the module base
+        self.symbols: Dict[str, int] = {}  # label -> offset
+        self.exports: Dict[str, int] = {}  # exported label -> offset
+        self.imports: List[str] = []  # labels defined in other modules
+        self.relocations: List[tuple] = []  # (offset of address byte, symbol)
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary (for caching pre-assembled modules)."""
+        return {
+            "name": self.name,
+            "code": list(self.code),
+            "symbols": dict(self.symbols),
+            "exports": dict(self.exports),
+            "imports": list(self.imports),
+            "relocations": [list(r) for r in self.relocations],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ObjectModule":
+        """Rebuild a module from the output of to_dict()."""
+        module = cls(data.get("name", ""))
+        module.code = list(data.get("code", []))
+        module.symbols = dict(data.get("symbols", {}))
+        module.exports = dict(data.get("exports", {}))
+        module.imports = list(data.get("imports", []))
+        module.relocations = [tuple(r) for r in data.get("relocations", [])]
+        return module
 
 
 class Assembler:
     """Two-pass assembler for our 8-bit CPU."""
 
-    def __init__(self):
-        """Initialize assembler state."""
+    def __init__(self, optimize: bool = False):
+        """Initialize assembler state.
+
+        Args:
+            optimize: If True, run the peephole optimizer between the two passes
+        """
+        self.optimize = optimize
+        self.optimizer = PeepholeOptimizer()
         self.symbol_table: Dict[str, int] = {}
         self.errors: List[str] = []
         self.data_bytes: Dict[int, int] = {}  # addr -> value
+        self.exports: List[str] = []  # from .global directives
+        self.imports: List[str] = []  # from .extern directives
 
     def assemble(self, source: str) -> List[List[int]]:
         """Assemble source code to machine code.
@@ -27,6 +82,24 @@ class Assembler:
             List of 16-bit instructions (each as list of bits)
         """
         # TODO: Implement assembler
+        # If self.optimize is set, pass the first-pass output through
+        # self.optimizer.optimize(parsed_lines, self) before the second pass
+        ...
+
+    def assemble_object(self, source: str, name: str = "") -> ObjectModule:
+        """Assemble source code to a relocatable object module.
+
+        Args:
+            source: Assembly source code (may use .global and .extern)
+            name: Module name used in linker error messages
+
+        Returns:
+            ObjectModule with code bytes, symbols, exports, imports and relocations
+        """
+        # TODO: Implement object output
+        # 1. Run both passes (imported symbols encode as address 0)
+        # 2. Lay out instruction and .byte data into module.code
+        # 3. Add a relocation for every address field that names a symbol
         ...
 
     def first_pass(self, source: str) -> List[Dict]:
@@ -90,6 +163,8 @@ class Assembler:
         operand = operand.strip()
         if operand in self.symbol_table:
             return self.symbol_table[operand]
+        if operand in self.imports:
+            return 0  # Resolved by the linker
         if operand.startswith("0x") or operand.startswith("0X"):
             return int(operand, 16)
         return int(operand)
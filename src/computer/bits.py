@@ -0,0 +1,232 @@
+"""Bit Conversion.
+
+The simulator stores every byte as a list of 8 bits (LSB first), so
+converting between integers and bit lists happens on every register read,
+memory access and instruction fetch. Building the list bit by bit, or
+summing bit << i, costs a Python loop per call.
+
+Instead, the conversions are table lookups:
+
+    BYTE_BITS[value]    bits of every byte value (256 tuples)
+    VALUES[bits]        value of every bit tuple of 1 to 8 bits
+
+Wider values (16-bit instructions) take one lookup per byte.
+
+int_to_bits always returns a new list, since callers modify the bits they
+get back. BitVector is the immutable alternative: an integer plus a width
+that indexes, slices, iterates and compares like a list of bits, so RAM
+rows, the PC and the instruction register can be shared without copies.
+
+Whole memory images can be converted at once with bytes_to_bit_rows /
+bit_rows_to_bytes (or bytes_to_vectors), or with NumPy (if installed) as
+an (n, 8) matrix.
+
+Usage:
+    int_to_bits(5)              # [1, 0, 1, 0, 0, 0, 0, 0]
+    int_to_bits(5, 3)           # [1, 0, 1]
+    bits_to_int([1, 0, 1])      # 5
+    bit_rows_to_bytes(ram.memory)
+    BitVector([1, 0, 1]) == [1, 0, 1]      # True
+    BitVector.from_int(0x1234, 16)[8:]     # BitVector of the high byte
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union, overload
+
+np: Any
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Bits of every byte value, LSB first
+BYTE_BITS: Tuple[Tuple[int, ...], ...] = tuple(tuple((value >> i) & 1 for i in range(8)) for value in range(256))
+
+# Value of every bit tuple of 1 to 8 bits
+VALUES: Dict[Tuple[int, ...], int] = {
+    BYTE_BITS[value][:width]: value for width in range(1, 9) for value in range(1 << width)
+}
+
+
+def int_to_bits(value: int, num_bits: int = 8) -> List[int]:
+    """Convert an integer to a new list of bits (LSB first), masked to num_bits."""
+    if num_bits <= 8:
+        return list(BYTE_BITS[value & 0xFF][:num_bits])
+    # Wider values: one byte lookup per 8 bits
+    bits: Tuple[int, ...] = ()
+    for shift in range(0, num_bits, 8):
+        bits += BYTE_BITS[(value >> shift) & 0xFF]
+    return list(bits[:num_bits])
+
+
+def bits_to_int(bits: Iterable[int]) -> int:
+    """Convert bits (LSB first) to an unsigned integer."""
+    if type(bits) is BitVector:
+        return bits.value
+    key = tuple(bits)
+    value = VALUES.get(key)
+    if value is not None:
+        return value
+    if len(key) == 16:
+        low = VALUES.get(key[:8])
+        high = VALUES.get(key[8:])
+        if low is not None and high is not None:
+            return low | high << 8
+    # Other widths (or values other than 0/1)
+    return sum(bit << i for i, bit in enumerate(key))
+
+
+def bytes_to_bit_rows(data: Iterable[int]) -> List[List[int]]:
+    """Convert bytes to one new 8-bit list per byte (like RAM.memory)."""
+    return [list(BYTE_BITS[value]) for value in data]
+
+
+def bit_rows_to_bytes(rows: Iterable[List[int]]) -> bytes:
+    """Convert 8-bit lists (like RAM.memory) to bytes."""
+    return bytes(bits_to_int(row) for row in rows)
+
+
+def bytes_to_vectors(data: Iterable[int]) -> List["BitVector"]:
+    """Convert bytes to one (shared, immutable) 8-bit BitVector per byte."""
+    return [_BYTE_VECTORS[value] for value in data]
+
+
+def bytes_to_bit_matrix(data: Iterable[int]):
+    """Convert bytes to a NumPy (n, 8) uint8 matrix of bits, LSB in column 0."""
+    if np is None:
+        raise ImportError("bytes_to_bit_matrix() needs NumPy")
+    array = np.frombuffer(bytes(data), dtype=np.uint8)
+    return np.unpackbits(array[:, None], axis=1, bitorder="little")
+
+
+def bit_matrix_to_bytes(matrix) -> bytes:
+    """Convert an (n, 8) matrix of bits (LSB in column 0) to bytes."""
+    if np is None:
+        raise ImportError("bit_matrix_to_bytes() needs NumPy")
+    return np.packbits(np.asarray(matrix, dtype=np.uint8), axis=1, bitorder="little").tobytes()
+
+
+class BitVector(Sequence[int]):
+    """Immutable bits (LSB first) stored as an integer and a width.
+
+    Behaves like a read-only List[int]: it can be indexed, sliced, iterated,
+    concatenated with + and compared with lists (but not with tuples, whose
+    hash differs). Since it cannot change, components can hand out and
+    store the same instance without copying, and it can be hashed (for
+    example as a memoization key).
+    """
+
+    __slots__ = ("value", "width")
+
+    value: int
+    width: int
+
+    def __new__(cls, bits: Iterable[int] = ()) -> "BitVector":
+        """Create from bits (LSB first); a BitVector is returned as is."""
+        if type(bits) is cls:
+            return bits
+        key = tuple(bits)
+        value = VALUES.get(key)
+        if value is not None and len(key) == 8:
+            return _BYTE_VECTORS[value]
+        if value is None:
+            if any(bit != 0 and bit != 1 for bit in key):
+                raise ValueError(f"Bits must be 0 or 1, got {list(key)}")
+            value = bits_to_int(key)
+        return cls._make(value, len(key))
+
+    @classmethod
+    def _make(cls, value: int, width: int) -> "BitVector":
+        vector = object.__new__(cls)
+        object.__setattr__(vector, "value", value)
+        object.__setattr__(vector, "width", width)
+        return vector
+
+    @classmethod
+    def from_int(cls, value: int, width: int = 8) -> "BitVector":
+        """Create from an integer, masked to width bits."""
+        if width == 8:
+            return _BYTE_VECTORS[value & 0xFF]
+        return cls._make(value & ((1 << width) - 1), width)
+
+    def __setattr__(self, name, value):
+        """Refuse: a BitVector cannot change."""
+        raise AttributeError("BitVector is immutable")
+
+    def __delattr__(self, name):
+        """Refuse: a BitVector cannot change."""
+        raise AttributeError("BitVector is immutable")
+
+    def __reduce__(self):
+        """Pickle through from_int (there is no __dict__ to restore)."""
+        return BitVector.from_int, (self.value, self.width)
+
+    def __len__(self) -> int:
+        """Number of bits."""
+        return self.width
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "BitVector": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, "BitVector"]:
+        """One bit, or a BitVector for a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.width)
+            if step == 1:
+                width = max(0, stop - start)
+                return BitVector.from_int(self.value >> start, width) if width else _EMPTY
+            return BitVector(self.tolist()[index])
+        if index < 0:
+            index += self.width
+        if not 0 <= index < self.width:
+            raise IndexError("BitVector index out of range")
+        return (self.value >> index) & 1
+
+    def __iter__(self) -> Iterator[int]:
+        """Bits, LSB first."""
+        if self.width <= 8:
+            return iter(BYTE_BITS[self.value][: self.width])
+        return iter(self.tolist())
+
+    def __add__(self, other: Iterable[int]) -> "BitVector":
+        """Concatenate (self supplies the low bits)."""
+        other = BitVector(other)
+        return BitVector._make(self.value | other.value << self.width, self.width + other.width)
+
+    def __radd__(self, other: Iterable[int]) -> "BitVector":
+        """Concatenate (other supplies the low bits)."""
+        return BitVector(other) + self
+
+    def __eq__(self, other) -> bool:
+        """Equal to a BitVector or list with the same bits."""
+        if type(other) is BitVector:
+            return self.value == other.value and self.width == other.width
+        if isinstance(other, list):
+            return len(other) == self.width and self.tolist() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash of the value and width."""
+        return hash((self.value, self.width))
+
+    def __int__(self) -> int:
+        """The bits as an unsigned integer."""
+        return self.value
+
+    def __repr__(self) -> str:
+        """BitVector([...]) with the bits as a list."""
+        return f"BitVector({self.tolist()})"
+
+    def tolist(self) -> List[int]:
+        """A new (mutable) list of the bits."""
+        return int_to_bits(self.value, self.width)
+
+    def copy(self) -> "BitVector":
+        """Return self: there is nothing to protect (kept so list call sites still work)."""
+        return self
+
+
+_BYTE_VECTORS: Tuple[BitVector, ...] = tuple(BitVector._make(value, 8) for value in range(256))
+_EMPTY = BitVector._make(0, 0)
@@ -21,6 +21,9 @@ class CPU:
         self.clock = Clock()
         self.halted = False
         self.current_instruction = None
+        self.branch_predictor = None  # Optional predictor notified of every jump
+        self.interrupts = None  # Optional InterruptController serviced before each instruction
+        self.tracer = None  # Optional TraceWriter recording every instruction
 
     def reset(self) -> None:
         """Reset CPU to initial state."""
@@ -67,6 +70,12 @@ class CPU:
             True if CPU is still running, False if halted
         """
         # TODO: Implement single step
+        # If self.interrupts is set, call its service(self) first; a HALT
+        # keeps the CPU running while self.interrupts.can_wake() is True
+        # If self.branch_predictor is set, call its record(pc, opname, taken, target)
+        # for every JMP/JZ/JNZ before executing it
+        # If self.tracer is set, call its record_cpu(self, pc, instruction) after
+        # executing (pc is the address the instruction was fetched from)
         ...
 
     def run(self, max_cycles: int = 1000) -> int:
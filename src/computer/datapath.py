@@ -11,6 +11,7 @@ It routes data between components based on control signals.
 """
 
 from typing import List, Dict
+from computer.bits import BitVector
 from computer.counters import ProgramCounter
 from computer.memory import RAM
 from computer.registers import RegisterFile
@@ -25,9 +26,10 @@ class DataPath:
         """Initialize data path components."""
         self.pc = ProgramCounter()
         self.memory = RAM()
+        self.instruction_memory = self.memory  # Fetch port (a cache may replace either port)
         self.reg_file = RegisterFile()
         self.alu = ALU()
-        self.ir = [0] * 16  # Instruction register (16-bit)
+        self.ir = BitVector.from_int(0, 16)  # Instruction register (16-bit)
         self.flags = {"Z": 0, "C": 0, "N": 0, "V": 0}
 
     def execute_cycle(self, signals: ControlSignals, decoded: Dict) -> None:
@@ -47,11 +49,12 @@ class DataPath:
             16-bit instruction
         """
         # TODO: Implement instruction fetch
+        # Read both bytes from self.instruction_memory
         ...
 
     def load_instruction(self, instruction: List[int]) -> None:
         """Load instruction into IR."""
-        self.ir = instruction.copy()
+        self.ir = BitVector(instruction)
 
     def get_pc(self) -> List[int]:
         """Get current PC value."""
@@ -0,0 +1,152 @@
+"""Disassembler.
+
+Turns machine code back into assembly text - the inverse of the assembler.
+
+The disassembler is table-driven:
+- The opcode (bits 15-12) selects the mnemonic from isa.OPCODE_NAMES
+- The mnemonic selects an operand format from FORMATS
+- Formatted text is cached per 16-bit word, so each distinct word is
+  formatted at most once no matter how large the image or trace is
+
+Listing format (one line per instruction):
+    08: 4001  ADD R0, R0, R1
+"""
+
+from typing import Any, List, Optional
+
+from computer.isa import OPCODE_NAMES, bits_to_int_n  # noqa: F401
+
+np: Any
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+# Operand format of each mnemonic
+# - N:  no operands          (NOP, HALT)
+# - I:  register, address    (LOAD R0, 0x10)
+# - J:  address              (JMP 0x08)
+# - R2: two registers        (MOV R0, R1)
+# - R3: three registers      (ADD R0, R1, R2)
+FORMATS = {
+    "NOP": "N",
+    "HALT": "N",
+    "LOAD": "I",
+    "STORE": "I",
+    "JMP": "J",
+    "JZ": "J",
+    "JNZ": "J",
+    "MOV": "R2",
+    "NOT": "R2",
+    "SHL": "R2",
+    "SHR": "R2",
+    "ADD": "R3",
+    "SUB": "R3",
+    "AND": "R3",
+    "OR": "R3",
+    "XOR": "R3",
+}
+
+# Bits that the assembler always leaves at 0 for each format
+UNUSED_BITS = {"N": 0x0FFF, "I": 0x0000, "J": 0x0F00, "R2": 0x000F, "R3": 0x0000}
+
+_TABLE: List[Optional[str]] = [None] * 65536  # word -> text, filled on demand
+
+
+def format_word(word: int) -> str:
+    """Format one 16-bit instruction word as assembly text.
+
+    Args:
+        word: Instruction as an integer (0-65535)
+
+    Returns:
+        Assembly text, e.g. 'LOAD R1, 0x10'. Words the assembler cannot
+        produce get a '; non-canonical 0x....' comment.
+
+    Example:
+        >>> format_word(0x4012)
+        'ADD R0, R1, R2'
+    """
+    # TODO: Implement word formatting
+    # Use FORMATS to decide which fields to print
+    ...
+
+
+def is_canonical(word: int) -> bool:
+    """Return True if the assembler can reproduce this word exactly."""
+    return not word & UNUSED_BITS[FORMATS[OPCODE_NAMES[(word >> 12) & 0xF]]]
+
+
+class Disassembler:
+    """Table-driven disassembler."""
+
+    def disassemble_word(self, word: int) -> str:
+        """Disassemble a 16-bit instruction word.
+
+        Args:
+            word: Instruction as an integer
+
+        Returns:
+            Assembly text (cached in _TABLE)
+        """
+        # TODO: Implement cached lookup using format_word()
+        ...
+
+    def disassemble_instruction(self, instruction: List[int]) -> str:
+        """Disassemble a 16-bit instruction given as bits (LSB at index 0)."""
+        return self.disassemble_word(bits_to_int_n(instruction))
+
+    def disassemble_words(self, words) -> List[str]:
+        """Disassemble a sequence of words (e.g. an execution trace).
+
+        Args:
+            words: Sequence of instruction words
+
+        Returns:
+            List of assembly text, one per word
+        """
+        # TODO: Implement batch disassembly
+        # With NumPy, format only the distinct words (np.unique) and scatter back
+        ...
+
+    def image_words(self, image: List[int], start: int = 0, end: Optional[int] = None) -> List[int]:
+        """Split a byte image into instruction words.
+
+        Args:
+            image: List of byte values
+            start: First address (even)
+            end: Address after the last byte (default: end of image)
+
+        Returns:
+            List of words (low byte at the lower address)
+        """
+        # TODO: Implement word extraction
+        ...
+
+    def disassemble_image(self, image: List[int], start: int = 0, end: Optional[int] = None) -> str:
+        """Produce an address/word/mnemonic listing of a byte image.
+
+        Args:
+            image: List of byte values
+            start: First address
+            end: Address after the last byte
+
+        Returns:
+            Listing with one 'AA: WWWW  TEXT' line per instruction
+        """
+        # TODO: Implement listing generation
+        ...
+
+    def disassemble_ram(self, ram, start: int = 0, end: Optional[int] = None) -> str:
+        """Produce a listing of RAM contents."""
+        return self.disassemble_image(ram_to_bytes(ram), start, end)
+
+    def to_source(self, image: List[int], start: int = 0, end: Optional[int] = None) -> str:
+        """Produce assembly source that reassembles to the same words."""
+        return "\n".join(self.disassemble_words(self.image_words(image, start, end)))
+
+
+def ram_to_bytes(ram) -> List[int]:
+    """Convert RAM contents to a list of byte values."""
+    return [bits_to_int_n(byte) for byte in ram.memory]
@@ -0,0 +1,183 @@
+"""DMA Controller.
+
+A memory-mapped DMA (direct memory access) engine for bulk copies.
+Copying a buffer with LOAD/STORE costs two instructions per byte; the DMA
+controller copies the whole block while the CPU keeps running.
+
+Memory map:
+    0xE8  DMA_SRC      source address
+    0xE9  DMA_DST      destination address
+    0xEA  DMA_LEN      number of bytes
+    0xEB  DMA_CONTROL  write: bit 0 start, bit 1 interrupt when done
+                       read:  bit 0 busy, bit 1 interrupt enabled, bit 7 done
+
+Timing:
+    The simulator moves the block in one host-side slice copy as soon as
+    the transfer starts, then reports busy for
+
+        setup_cycles + cycles_per_byte * length
+
+    cycles. Programs wait for bit 7 of DMA_CONTROL (or the completion
+    interrupt on IRQ line 1, see interrupts.py) before using the
+    destination. A start written while busy is ignored.
+
+Example:
+    LOAD R0, src
+    STORE R0, 0xE8
+    ...                 ; DST and LEN
+    LOAD R0, go         ; go: .byte 1
+    STORE R0, 0xEB
+wait:
+    LOAD R1, 0xEB
+    AND R1, R1, R2      ; R2 = 0x80
+    JZ wait
+"""
+
+from typing import Optional
+from computer.bus import Bus, Device
+
+# Memory map
+DMA_BASE = 0xE8
+DMA_SRC = 0xE8  # r/w: source address
+DMA_DST = 0xE9  # r/w: destination address
+DMA_LEN = 0xEA  # r/w: bytes to copy
+DMA_CONTROL = 0xEB  # write: start; read: status
+
+# DMA_CONTROL bits
+DMA_START = 0x01  # write: start a transfer / read: busy
+DMA_IRQ = 0x02  # write: raise an interrupt when done
+DMA_DONE = 0x80  # read: last transfer complete
+
+DMA_IRQ_LINE = 1
+
+
+class DMAController(Device):
+    """Copies a block of RAM in one host operation, then stays busy for its cycle cost.
+
+    The bytes are moved as soon as the transfer starts; the status register
+    reports busy until setup_cycles + cycles_per_byte * length cycles have
+    passed, and the CPU keeps executing meanwhile. Programs must wait for
+    DMA_DONE (or the interrupt) before using the destination.
+    """
+
+    size = 4
+
+    def __init__(
+        self,
+        ram,
+        clock,
+        cycles_per_byte: int = 1,
+        setup_cycles: int = 4,
+        controller=None,
+        line: int = DMA_IRQ_LINE,
+    ):
+        """Initialize an idle controller.
+
+        Args:
+            ram: RAM whose `memory` list is copied (device addresses are not involved)
+            clock: Clock used for completion times
+            cycles_per_byte: Cycles charged per byte copied
+            setup_cycles: Cycles charged per transfer
+            controller: InterruptController to notify (optional)
+            line: IRQ line raised on completion
+        """
+        self.ram = ram
+        self.clock = clock
+        self.cycles_per_byte = cycles_per_byte
+        self.setup_cycles = setup_cycles
+        self.controller = controller
+        self.line = line
+        self.registers = bytearray(3)  # SRC, DST, LEN
+        self.irq = False
+        self.done_at: Optional[int] = None
+        self.deadline: Optional[int] = None  # Pending interrupt, for InterruptController.next_event
+        self.stats = {"transfers": 0, "bytes": 0, "busy_cycles": 0, "ignored": 0}
+        if controller is not None:
+            controller.add_source(self)
+
+    # ----- Device registers -----
+
+    def busy(self) -> bool:
+        """Return True while a transfer's cycle cost has not elapsed."""
+        return self.done_at is not None and self.clock.cycle < self.done_at
+
+    def read(self, offset: int) -> int:
+        """Read SRC, DST, LEN or the status (busy, IRQ enabled, done)."""
+        if offset < 3:
+            return self.registers[offset]
+        if self.done_at is None:
+            return 0
+        busy = self.busy()
+        return (DMA_START if busy else DMA_DONE) | (DMA_IRQ if self.irq else 0)
+
+    def write(self, offset: int, value: int) -> None:
+        """Write SRC, DST, LEN, or start a transfer (ignored while busy)."""
+        if offset < 3:
+            self.registers[offset] = value
+        elif value & DMA_START:
+            if self.busy():
+                self.stats["ignored"] += 1
+                return
+            src, dst, length = self.registers
+            self.start(src, dst, length, irq=bool(value & DMA_IRQ))
+
+    # ----- Transfers -----
+
+    def start(self, src: int, dst: int, length: int, irq: bool = False) -> int:
+        """Copy length bytes from src to dst and schedule completion; returns the cycle cost."""
+        self._copy(src, dst, length)
+        cost = self.setup_cycles + self.cycles_per_byte * length if length else 0
+        self.done_at = self.clock.cycle + cost
+        self.irq = irq
+        self.deadline = self.done_at if irq and self.controller is not None else None
+        self.stats["transfers"] += 1
+        self.stats["bytes"] += length
+        self.stats["busy_cycles"] += cost
+        return cost
+
+    def _copy(self, src: int, dst: int, length: int) -> None:
+        """Move bytes as one slice assignment (overlapping blocks copy like memmove)."""
+        # TODO: Copy length bytes of self.ram.memory from src to dst
+        # Use one slice assignment (share BitVector rows, copy bit lists);
+        # the result must be as if the source was read
+        # completely before writing (overlaps), and blocks running past the
+        # end of memory wrap around to address 0
+        ...
+
+    def fire(self, now: int) -> None:
+        """Raise the completion interrupt once the transfer is done (called by the controller)."""
+        if self.deadline is None or self.deadline > now:
+            return
+        self.deadline = None
+        self.controller.raise_irq(self.line)
+
+
+class DMASystem:
+    """DMA controller at 0xE8 on a Computer's bus."""
+
+    def __init__(
+        self,
+        computer,
+        bus: Optional[Bus] = None,
+        controller=None,
+        cycles_per_byte: int = 1,
+        setup_cycles: int = 4,
+    ):
+        """Map the controller (creating a bus if needed).
+
+        Args:
+            computer: Computer to attach to
+            bus: Bus to map on (default: the data memory if it is a Bus, else a new one)
+            controller: InterruptController for completion interrupts (optional)
+            cycles_per_byte: Cycles charged per byte copied
+            setup_cycles: Cycles charged per transfer
+        """
+        memory = computer.cpu.datapath.memory
+        if bus is None:
+            bus = memory if isinstance(memory, Bus) else Bus(memory)
+        self.bus = bus
+        self.dma = bus.map(
+            DMA_BASE,
+            DMAController(bus.ram, computer.cpu.clock, cycles_per_byte, setup_cycles, controller),
+        )
+        bus.attach(computer)
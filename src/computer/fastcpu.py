@@ -0,0 +1,248 @@
+"""Fast Interpreter.
+
+An integer-only interpreter with exactly the same behaviour as CPU.step,
+for running long programs without simulating every gate.
+
+Each address is decoded once into a handler - a small function that
+executes the instruction and returns the next PC (or HALTED). The run loop
+just looks up the handler for the current PC and calls it.
+
+Superinstructions:
+    Looking up and calling a handler costs about as much as executing a
+    simple instruction. Loops are dominated by a few adjacent opcode pairs
+    (SUB+JNZ, ADD+MOV), so such pairs are dispatched as one fused handler
+    that executes both instructions.
+
+    - Pairs are chosen with static_scan() or profile() and select_pairs()
+    - The first half of a pair must always fall through to the second
+    - A jump to the second half still works: every address keeps its own
+      handler, the fused one is only used when entering at the first half
+    - A STORE drops the handlers covering the byte it writes, so
+      self-modifying code behaves as on the real CPU
+"""
+
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from computer.bits import bit_rows_to_bytes, bytes_to_vectors, int_to_bits
+from computer.isa import OPCODE_NAMES, bits_to_int_n
+
+ALU_OPCODES = ["ADD", "SUB", "AND", "OR", "XOR", "NOT", "SHL", "SHR"]
+JUMP_OPCODES = ["JMP", "JZ", "JNZ"]
+# The first half of a pair must always fall through and must not write memory
+# (a STORE could rewrite the second half after it was decoded)
+FUSABLE_FIRST = ["NOP", "LOAD", "MOV"] + ALU_OPCODES
+FUSABLE_SECOND = FUSABLE_FIRST + ["STORE"] + JUMP_OPCODES
+DEFAULT_PAIRS = {("SUB", "JNZ"), ("SUB", "JZ"), ("ADD", "MOV")}
+
+HALTED = -1  # Returned by a handler instead of the next PC
+
+
+def select_pairs(counts: Dict[Tuple[str, str], int], limit: int = 4) -> set:
+    """Pick the most frequent fusable pairs from profile or scan counts."""
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return set([pair for pair, count in ranked if count and _fusable(*pair)][:limit])
+
+
+def _fusable(first: str, second: str) -> bool:
+    return first in FUSABLE_FIRST and second in FUSABLE_SECOND
+
+
+class FastCPU:
+    """Integer interpreter with the same semantics as CPU.step.
+
+    Each address is decoded once into a handler (a closure returning the next
+    PC). Adjacent instructions whose opcode pair is in `pairs` share one
+    fused handler, so a loop like SUB+JNZ takes one dispatch instead of two.
+    """
+
+    def __init__(self, pairs: Optional[Iterable[Tuple[str, str]]] = None):
+        """Initialize an empty machine that fuses the given opcode pairs."""
+        self.mem = bytearray(256)
+        self.regs = [0] * 8
+        self.flags = [0, 0, 0, 0]  # Z, C, N, V
+        self.pc = 0
+        self.halted = False
+        self.ticks = 0  # Clock half-cycles, one per step as in CPU.step
+        self.pairs = set(DEFAULT_PAIRS if pairs is None else pairs)
+        self.stats = {"steps": 0, "dispatches": 0, "fused": 0}
+        self._single: List[Optional[Callable[[], int]]] = [None] * 256
+        self._entry: List[Optional[Tuple[Callable[[], int], int]]] = [None] * 256
+
+    # ----- Loading and state -----
+
+    def load_bytes(self, image: Iterable[int], start: int = 0) -> None:
+        """Copy bytes into memory starting at `start`."""
+        for offset, value in enumerate(image):
+            self.mem[(start + offset) & 0xFF] = value & 0xFF
+        self.invalidate()
+
+    @classmethod
+    def from_computer(cls, computer, pairs: Optional[Iterable[Tuple[str, str]]] = None) -> "FastCPU":
+        """Create a FastCPU holding a copy of a Computer's state."""
+        fast = cls(pairs)
+        datapath = computer.cpu.datapath
+        fast.mem[:] = bit_rows_to_bytes(datapath.memory.memory)
+        fast.regs[:] = [bits_to_int_n(datapath.reg_file.read(int_to_bits(i, 3))) for i in range(8)]
+        fast.flags[:] = [datapath.flags.get(name, 0) for name in "ZCNV"]
+        fast.pc = bits_to_int_n(datapath.get_pc())
+        fast.halted = computer.cpu.halted
+        fast.ticks = 2 * computer.cpu.clock.cycle + computer.cpu.clock.state
+        return fast
+
+    def write_back(self, computer) -> None:
+        """Copy this machine's state into a Computer."""
+        datapath = computer.cpu.datapath
+        datapath.memory.memory[:] = bytes_to_vectors(self.mem)
+        for i, value in enumerate(self.regs):
+            datapath.reg_file.write(int_to_bits(i, 3), int_to_bits(value), 1, 1)
+        datapath.flags = dict(zip("ZCNV", self.flags))
+        datapath.set_pc(int_to_bits(self.pc))
+        computer.cpu.halted = self.halted
+        computer.cpu.clock.cycle, computer.cpu.clock.state = divmod(self.ticks, 2)
+
+    def get_state(self) -> Dict:
+        """Get current state (integers, like Computer.dump_state but PC as int)."""
+        return {
+            "pc": self.pc,
+            "flags": dict(zip("ZCNV", self.flags)),
+            "halted": self.halted,
+            "cycle": self.ticks // 2,
+            "registers": {f"R{i}": value for i, value in enumerate(self.regs)},
+        }
+
+    def invalidate(self, address: Optional[int] = None) -> None:
+        """Drop decoded handlers (all, or those covering one byte)."""
+        if address is None:
+            self._single[:] = [None] * 256
+            self._entry[:] = [None] * 256
+            return
+        # A pair starting up to 3 bytes earlier covers this byte
+        for a in range(address - 3, address + 1):
+            self._single[a & 0xFF] = None
+            self._entry[a & 0xFF] = None
+
+    # ----- Execution -----
+
+    def step(self) -> bool:
+        """Execute one instruction; same contract as CPU.step."""
+        if self.halted:
+            return False
+        handler = self._single[self.pc] or self._decode(self.pc)
+        next_pc = handler()
+        self.ticks += 1
+        self.stats["steps"] += 1
+        self.stats["dispatches"] += 1
+        if next_pc == HALTED:
+            self.halted = True
+            return False
+        self.pc = next_pc
+        return True
+
+    def run(self, max_cycles: int = 1000) -> int:
+        """Run until HALT or max cycles; returns steps like CPU.run."""
+        if self.halted:
+            return 0
+        entries = self._entry
+        pc = self.pc
+        count = 0
+        dispatches = 0
+        while count < max_cycles:
+            handler, width = entries[pc] or self._fuse(pc)
+            if width > max_cycles - count:
+                handler, width = self._single[pc] or self._decode(pc), 1
+            next_pc = handler()
+            dispatches += 1
+            if next_pc == HALTED:
+                self.halted = True
+                self.ticks += 1
+                break
+            pc = next_pc
+            count += width
+        self.pc = pc
+        self.ticks += count
+        self.stats["steps"] += count + self.halted
+        self.stats["dispatches"] += dispatches
+        self.stats["fused"] += count + self.halted - dispatches
+        return count
+
+    # ----- Pair selection -----
+
+    def static_scan(self, start: int = 0, end: int = 256) -> Counter:
+        """Count adjacent fusable opcode pairs in memory."""
+        counts: Counter = Counter()
+        names = [self._name(a) for a in range(start, end, 2)]
+        for first, second in zip(names, names[1:]):
+            if _fusable(first, second):
+                counts[(first, second)] += 1
+        return counts
+
+    def profile(self, max_cycles: int = 1000) -> Counter:
+        """Count fall-through opcode pairs executed by a copy of this machine."""
+        probe = FastCPU(pairs=())
+        probe.mem[:] = self.mem
+        probe.regs[:] = self.regs
+        probe.flags[:] = self.flags
+        probe.pc, probe.halted = self.pc, self.halted
+        counts: Counter = Counter()
+        for _ in range(max_cycles):
+            pc = probe.pc
+            first = probe._name(pc)
+            if not probe.step():
+                break
+            if probe.pc == (pc + 2) & 0xFF:
+                second = probe._name(probe.pc)
+                if _fusable(first, second):
+                    counts[(first, second)] += 1
+        return counts
+
+    def set_pairs(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """Fuse a new set of opcode pairs."""
+        self.pairs = set(pairs)
+        self._entry[:] = [None] * 256
+
+    # ----- Decoding -----
+
+    def _name(self, pc: int) -> str:
+        return OPCODE_NAMES[self.mem[(pc + 1) & 0xFF] >> 4]
+
+    def _fuse(self, pc: int) -> Tuple[Callable[[], int], int]:
+        """Build the dispatch entry for `pc`: a fused pair or a single handler.
+
+        Args:
+            pc: Address of the first instruction
+
+        Returns:
+            (handler, width) where width is the number of instructions the
+            handler executes (2 for a fused pair). Cached in self._entry.
+        """
+        # TODO: Fuse with the instruction at pc + 2 if the opcode pair is in self.pairs
+        # Use self._sub_branch() for SUB followed by JZ/JNZ
+        ...
+
+    def _sub_branch(self, pc: int, on_zero: bool) -> Callable[[], int]:
+        """Compare-and-branch superinstruction for SUB followed by JZ/JNZ."""
+        mem, regs, flags = self.mem, self.regs, self.flags
+        word = mem[pc] | (mem[(pc + 1) & 0xFF] << 8)
+        rd, rs1, rs2 = (word >> 8) & 7, (word >> 4) & 7, word & 7
+        target, fall = mem[(pc + 2) & 0xFF], (pc + 4) & 0xFF
+
+        def sub_branch():
+            a = regs[rs1]
+            b = regs[rs2]
+            r = (a - b) & 0xFF
+            regs[rd] = r
+            z = int(r == 0)
+            flags[:] = (z, int(a < b), r >> 7, ((a ^ b) & (a ^ r)) >> 7)
+            return target if z == on_zero else fall
+
+        return sub_branch
+
+    def _decode(self, pc: int) -> Callable[[], int]:
+        """Decode the instruction at `pc` into a handler returning the next PC."""
+        # TODO: Implement a handler for each opcode
+        # - Registers use 3 address bits, so rd/rs1/rs2 are taken & 7
+        # - ALU ops replace all four flags (see ALU.__call__); MOV/LOAD/STORE keep them
+        # - STORE must call self.invalidate(address)
+        # - Jumps return their target; everything else returns (pc + 2) & 0xFF
+        # - Cache the handler in self._single[pc] before returning it
+        ...
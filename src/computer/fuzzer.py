@@ -0,0 +1,328 @@
+"""CPU Fuzzer.
+
+A handful of hand-written programs only exercise a few paths through the
+CPU. A fuzzer generates thousands of random (but valid) programs and checks
+that the engine under test computes exactly what a reference model does.
+
+    generate   random instruction words from the ISA encodings: registers
+               R0-R7, jump targets inside the program, LOAD/STORE mostly
+               into a data area at 0x80
+    run        each program on the engine (FastCPU, the fastest engine)
+               and on the oracle: a plain reference model of the ISA, or
+               the gate-level CPU for differential execution
+    coverage   opcodes executed, flag values each ALU op produced, and
+               branch directions (JZ/JNZ taken and not taken)
+    feedback   programs that reach new coverage join a corpus; later
+               programs are mostly mutations of corpus entries
+    minimize   a failing program is shrunk (instructions replaced by NOPs,
+               data zeroed) while it still fails
+
+Usage:
+    fuzzer = Fuzzer(seed=1)
+    report = fuzzer.fuzz(programs=5000, batch=100)
+    report["programs_per_second"], report["coverage"], report["failures"]
+"""
+
+import random
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from computer.disassembler import FORMATS, Disassembler
+from computer.fastcpu import FastCPU
+from computer.isa import OPCODES, OPCODE_NAMES
+
+DATA_BASE = 0x80  # Data bytes live at 0x80-0xFF, code below
+MAX_LENGTH = DATA_BASE // 2  # Instructions that fit below the data
+
+ALU_OPCODES = ["ADD", "SUB", "AND", "OR", "XOR", "NOT", "SHL", "SHR"]
+BRANCH_OPCODES = ["JZ", "JNZ"]
+
+# Relative weights of generated opcodes (HALT is rare so programs run a while)
+WEIGHTS = {name: 4 for name in OPCODES}
+WEIGHTS.update({"NOP": 1, "HALT": 1, "JMP": 2})
+
+Program = Tuple[List[int], bytes]  # instruction words, data bytes at DATA_BASE
+Coverage = Set[Tuple]
+
+
+# Flags each ALU op can set either way (the others are always 0)
+FLAG_EFFECTS = {"ADD": "ZCNV", "SUB": "ZCNV", "SHL": "ZCN", "SHR": "ZC"}
+FLAG_EFFECTS.update({name: "ZN" for name in ["AND", "OR", "XOR", "NOT"]})
+
+# Operand bits of each instruction format that keep it valid and canonical (registers R0-R7)
+OPERAND_BITS = {"I": list(range(11)), "R2": [4, 5, 6, 8, 9, 10], "R3": [0, 1, 2, 4, 5, 6, 8, 9, 10]}
+
+
+def all_coverage_points() -> Coverage:
+    """Every coverage point: opcodes, flag values after each ALU op, branch directions."""
+    points: Coverage = {("op", name) for name in OPCODES}
+    for name, flags in FLAG_EFFECTS.items():
+        points |= {("flag", name, flag, value) for flag in flags for value in (0, 1)}
+    points |= {("branch", name, taken) for name in BRANCH_OPCODES for taken in (False, True)}
+    return points
+
+
+def image(program: Program) -> bytearray:
+    """256-byte memory image of a program."""
+    words, data = program
+    mem = bytearray(256)
+    for i, word in enumerate(words):
+        mem[2 * i] = word & 0xFF
+        mem[2 * i + 1] = word >> 8
+    mem[DATA_BASE : DATA_BASE + len(data)] = data
+    return mem
+
+
+def listing(program: Program) -> str:
+    """Disassembly of a program's instructions."""
+    disassembler = Disassembler()
+    return "\n".join(f"{2 * i:02X}: {disassembler.disassemble_word(w)}" for i, w in enumerate(program[0]))
+
+
+def random_instruction(rng: random.Random, length: int) -> int:
+    """A valid, canonical instruction word: registers R0-R7, jumps to instructions of the program.
+
+    LOAD/STORE mostly address the data area; one in eight addresses the code
+    (so programs can read and rewrite themselves).
+    """
+    name = rng.choices(list(WEIGHTS), weights=list(WEIGHTS.values()))[0]
+    fmt = FORMATS[name]
+    op = OPCODES[name] << 12
+    if fmt == "J":
+        return op | 2 * rng.randrange(length)
+    if fmt == "I":
+        address = rng.randrange(2 * length) if rng.random() < 0.125 else DATA_BASE + rng.randrange(128)
+        return op | rng.randrange(8) << 8 | address
+    if fmt == "N":
+        return op
+    rs2 = rng.randrange(8) if fmt == "R3" else 0
+    return op | rng.randrange(8) << 8 | rng.randrange(8) << 4 | rs2
+
+
+def random_program(rng: random.Random, length: int) -> Program:
+    """A random program of `length` instructions ending in HALT, with random data."""
+    words = [random_instruction(rng, length) for _ in range(length - 1)] + [OPCODES["HALT"] << 12]
+    return words, bytes(rng.randrange(256) for _ in range(128))
+
+
+def mutate(rng: random.Random, program: Program) -> Program:
+    """Copy of a program with one to three small changes."""
+    words, data = list(program[0]), bytearray(program[1])
+    for _ in range(rng.randint(1, 3)):
+        choice = rng.random()
+        if choice < 0.5:
+            words[rng.randrange(len(words))] = random_instruction(rng, len(words))
+        elif choice < 0.7:
+            i, j = rng.randrange(len(words)), rng.randrange(len(words))
+            words[i], words[j] = words[j], words[i]
+        elif choice < 0.85:
+            # Change one operand, keeping the opcode
+            i = rng.randrange(len(words))
+            fmt = FORMATS[OPCODE_NAMES[words[i] >> 12]]
+            if fmt == "J":
+                words[i] = words[i] & 0xFF00 | 2 * rng.randrange(len(words))
+            elif fmt != "N":
+                words[i] ^= 1 << rng.choice(OPERAND_BITS[fmt])
+        else:
+            data[rng.randrange(len(data))] = rng.randrange(256)
+    return words, bytes(data)
+
+
+def reference_run(mem: bytearray, max_cycles: int, coverage: Optional[Coverage] = None) -> Dict:
+    """Run a memory image on a plain reference model of the ISA.
+
+    Args:
+        mem: Memory image (modified in place by STOREs)
+        max_cycles: Instructions to run at most (HALT is not counted, like CPU.run)
+        coverage: Set to add the opcode, flag and branch points reached to
+
+    Returns:
+        Final state: pc, registers, flags (Z C N V), halted, steps
+    """
+    # TODO: Interpret instructions from pc = 0 until HALT or max_cycles steps
+    # - word = mem[pc] | mem[pc + 1] << 8; opcode in bits 12-15, rd = bits 8-10,
+    #   rs1 = bits 4-6, rs2 = bits 0-2, address/target = bits 0-7
+    # - Same semantics as FastCPU: ALU ops set all four flags (C and V are 0
+    #   for AND/OR/XOR/NOT; SHL/SHR put the shifted-out bit in C)
+    # - HALT sets halted and is not counted; the PC stays on it
+    # - If coverage is given, add ("op", name) for each instruction run,
+    #   ("flag", name, flag, value) for all four flags after an ALU op and
+    #   ("branch", name, taken) for JZ/JNZ
+    ...
+
+
+def engine_run(engine, mem: bytearray, max_cycles: int) -> Dict:
+    """Run a memory image from reset on a FastCPU-like engine (reused between programs)."""
+    engine.mem[:] = mem
+    engine.regs[:] = [0] * 8
+    engine.flags[:] = [0, 0, 0, 0]
+    engine.pc = 0
+    engine.halted = False
+    engine.ticks = 0
+    engine.invalidate()
+    steps = engine.run(max_cycles)
+    return {
+        "pc": engine.pc,
+        "registers": list(engine.regs),
+        "flags": list(engine.flags),
+        "halted": engine.halted,
+        "steps": steps,
+    }
+
+
+def cpu_run(mem: bytearray, max_cycles: int) -> Dict:
+    """Run a memory image on the gate-level CPU (slow; for differential execution)."""
+    from computer.cosim import gate_ram, gate_state
+    from computer.system import Computer
+
+    computer = Computer()
+    computer.load_program(list(mem))
+    steps = computer.cpu.run(max_cycles)
+    state = gate_state(computer.cpu)
+    del state["ram"]
+    state["steps"] = steps
+    mem[:] = gate_ram(computer.cpu)
+    return state
+
+
+def compare(expected: Dict, actual: Dict, expected_mem: bytes, actual_mem: bytes) -> Dict[str, Tuple]:
+    """Differing fields as {field: (expected, actual)}; RAM per byte as mem[0xNN]."""
+    diffs: Dict[str, Tuple] = {}
+    for key in ("pc", "halted", "steps"):
+        if expected[key] != actual[key]:
+            diffs[key] = (expected[key], actual[key])
+    for i, (a, b) in enumerate(zip(expected["registers"], actual["registers"])):
+        if a != b:
+            diffs[f"R{i}"] = (a, b)
+    for name, a, b in zip("ZCNV", expected["flags"], actual["flags"]):
+        if a != b:
+            diffs[name] = (a, b)
+    if expected_mem != actual_mem:
+        for addr, (a, b) in enumerate(zip(expected_mem, actual_mem)):
+            if a != b:
+                diffs[f"mem[0x{addr:02X}]"] = (a, b)
+    return diffs
+
+
+def minimize(program: Program, fails: Callable[[Program], bool]) -> Program:
+    """Shrink a failing program while fails(program) stays True.
+
+    Instructions are replaced by NOPs (in halving chunks, so addresses and
+    jump targets stay put), data bytes are zeroed the same way, and
+    trailing NOPs are dropped.
+    """
+    # TODO: Shrink the program, keeping only changes for which fails() is still True
+    # 1. Replace chunks of instructions with NOP (0), halving the chunk size
+    #    from len(words) down to 1
+    # 2. Zero chunks of data bytes the same way
+    # 3. Drop trailing NOPs
+    ...
+
+
+class Fuzzer:
+    """Coverage-guided random program fuzzer for the CPU engines.
+
+    Programs run on the engine under test (FastCPU by default, at full
+    speed with fused pairs) and on an oracle: the reference model in this
+    module, which also records coverage, or the gate-level CPU for
+    differential execution. Programs that reach new coverage points join
+    a corpus that later programs are mutated from. Each mismatch is
+    minimized and kept as a failure.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        length: int = 16,
+        max_cycles: int = 256,
+        engine: Callable[[], FastCPU] = FastCPU,
+        oracle: str = "reference",
+    ):
+        """Create a fuzzer.
+
+        Args:
+            seed: Random seed (runs are reproducible)
+            length: Instructions per generated program (at most MAX_LENGTH)
+            max_cycles: Instructions each program may run
+            engine: Factory of the engine under test
+            oracle: 'reference' (fast) or 'cpu' (the gate-level CPU)
+        """
+        if not 2 <= length <= MAX_LENGTH:
+            raise ValueError(f"length must be between 2 and {MAX_LENGTH}")
+        if oracle not in ("reference", "cpu"):
+            raise ValueError(f"Unknown oracle: {oracle}")
+        self.rng = random.Random(seed)
+        self.length = length
+        self.max_cycles = max_cycles
+        self.engine = engine()
+        self.oracle = oracle
+        self.coverage: Coverage = set()
+        self.corpus: List[Program] = []
+        self.failures: List[Dict] = []
+        self.programs = 0
+        self.elapsed = 0.0
+
+    def generate(self) -> Program:
+        """A new random program, or (once there is a corpus) usually a mutated corpus entry."""
+        if self.corpus and self.rng.random() < 0.75:
+            return mutate(self.rng, self.rng.choice(self.corpus))
+        return random_program(self.rng, self.length)
+
+    def execute(self, program: Program, coverage: Optional[Coverage] = None) -> Dict[str, Tuple]:
+        """Run a program on the oracle and the engine; returns their differences."""
+        expected_mem = image(program)
+        actual_mem = bytearray(expected_mem)
+        if self.oracle == "cpu":
+            expected = cpu_run(expected_mem, self.max_cycles)
+            reference_run(bytearray(actual_mem), self.max_cycles, coverage)
+        else:
+            expected = reference_run(expected_mem, self.max_cycles, coverage)
+        actual = engine_run(self.engine, actual_mem, self.max_cycles)
+        return compare(expected, actual, bytes(expected_mem), bytes(self.engine.mem))
+
+    def run_batch(self, count: int) -> int:
+        """Generate and run `count` programs; returns how many reached new coverage."""
+        start = time.perf_counter()
+        batch = [self.generate() for _ in range(count)]
+        new = 0
+        for program in batch:
+            reached: Coverage = set()
+            diffs = self.execute(program, reached)
+            if diffs:
+                self._fail(program)
+            if not reached <= self.coverage:
+                self.coverage |= reached
+                self.corpus.append(program)
+                new += 1
+        self.programs += count
+        self.elapsed += time.perf_counter() - start
+        return new
+
+    def _fail(self, program: Program) -> None:
+        smallest = minimize(program, lambda p: bool(self.execute(p)))
+        self.failures.append(
+            {
+                "program": program,
+                "minimized": smallest,
+                "differences": self.execute(smallest),
+                "listing": listing(smallest),
+            }
+        )
+
+    def fuzz(self, programs: int = 1000, batch: int = 100, stop_on_failure: bool = True) -> Dict:
+        """Run programs in batches until `programs` have run (or a failure, if stop_on_failure)."""
+        while self.programs < programs and not (stop_on_failure and self.failures):
+            self.run_batch(min(batch, programs - self.programs))
+        return self.report()
+
+    def report(self) -> Dict:
+        """Programs run, programs per second, coverage, corpus size and failures."""
+        total = all_coverage_points()
+        return {
+            "programs": self.programs,
+            "programs_per_second": self.programs / self.elapsed if self.elapsed else 0.0,
+            "coverage": len(self.coverage & total),
+            "coverage_total": len(total),
+            "uncovered": sorted(total - self.coverage, key=str),
+            "corpus": len(self.corpus),
+            "failures": self.failures,
+        }
@@ -26,6 +26,7 @@ N-type (NOP, HALT, MOV, NOT, SHL, SHR):
 """
 
 from typing import List, Dict
+from computer.bits import bits_to_int, int_to_bits
 
 
 # Opcode definitions
@@ -87,9 +88,9 @@ def decode_instruction(instruction: List[int]) -> Dict:
 
 def int_to_bits_n(value: int, n: int) -> List[int]:
     """Convert integer to n-bit list (LSB first)."""
-    return [(value >> i) & 1 for i in range(n)]
+    return int_to_bits(value, n)
 
 
 def bits_to_int_n(bits: List[int]) -> int:
     """Convert bit list to integer."""
-    return sum(bit << i for i, bit in enumerate(bits))
+    return bits_to_int(bits)
@@ -0,0 +1,74 @@
+"""Linker.
+
+Combines relocatable object modules from Assembler.assemble_object()
+into a single memory image.
+
+Linking steps:
+1. Layout: place modules one after another from the base address
+   (each module starts on an even address so instructions stay aligned)
+2. Symbol resolution: collect the exported symbols of every module
+3. Relocation: patch each address field with the absolute address of its symbol
+
+Pre-assembled library modules (saved with ObjectModule.to_dict()) can be
+linked into a program without assembling them again.
+"""
+
+from typing import Dict, List
+
+from computer.assembler import ObjectModule
+
+
+class Linker:
+    """Links relocatable object modules into one memory image."""
+
+    def __init__(self):
+        """Initialize linker state."""
+        self.symbol_table: Dict[str, int] = {}  # exported symbol -> absolute address
+        self.layout: List[int] = []  # base address of each module
+        self.errors: List[str] = []
+
+    def link(self, modules: List[ObjectModule], base: int = 0, size: int = 256) -> List[int]:
+        """Link modules into one image.
+
+        Args:
+            modules: Object modules, laid out in the given order
+            base: Address of the first module
+            size: Image size in bytes
+
+        Returns:
+            List of `size` byte values, loadable with Computer.load_program()
+            Problems (undefined/duplicate symbols, overflow) are recorded in self.errors
+        """
+        # TODO: Implement linking
+        # 1. Compute self.layout with layout_modules()
+        # 2. Build self.symbol_table from each module's exports
+        # 3. Copy module code into the image and apply relocations
+        ...
+
+    def layout_modules(self, modules: List[ObjectModule], base: int = 0) -> List[int]:
+        """Assign a base address to each module.
+
+        Args:
+            modules: Object modules
+            base: Address of the first module
+
+        Returns:
+            List of base addresses (all even)
+        """
+        # TODO: Implement module layout
+        ...
+
+    def resolve(self, module: ObjectModule, module_base: int, symbol: str) -> int:
+        """Resolve a relocation symbol to an absolute address.
+
+        Args:
+            module: Module containing the relocation
+            module_base: Base address of that module
+            symbol: Symbol name (local label or import)
+
+        Returns:
+            Absolute address (0 and an error entry if undefined)
+        """
+        # TODO: Implement symbol resolution
+        # Local labels take precedence over exported symbols
+        ...
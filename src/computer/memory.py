@@ -6,7 +6,8 @@ Our RAM has:
 - 8-bit data width
 """
 
-from typing import List
+from typing import List, Sequence
+from computer.bits import BitVector, bits_to_int
 
 
 class RAM:
@@ -15,13 +16,13 @@ class RAM:
     def __init__(self, size: int = 256):
         """Initialize RAM with given size."""
         self.size = size
-        self.memory = [[0] * 8 for _ in range(size)]
+        self.memory = [BitVector.from_int(0)] * size  # Rows are immutable, so they can be shared
 
     def _addr_to_index(self, address: List[int]) -> int:
         """Convert bit address to integer index."""
-        return sum(bit << i for i, bit in enumerate(address))
+        return bits_to_int(address)
 
-    def read(self, address: List[int]) -> List[int]:
+    def read(self, address: List[int]) -> Sequence[int]:
         """Read from memory.
 
         Args:
@@ -54,12 +55,12 @@ class RAM:
         for i, byte in enumerate(program):
             addr = start_addr + i
             if addr < self.size:
-                self.memory[addr] = byte.copy()
+                self.memory[addr] = BitVector(byte)
 
     def dump(self, start: int = 0, end: int = 16) -> str:
         """Dump memory contents for debugging."""
         lines = []
         for addr in range(start, min(end, self.size)):
-            val = sum(bit << i for i, bit in enumerate(self.memory[addr]))
+            val = bits_to_int(self.memory[addr])
             lines.append(f"{addr:02X}: {val:02X}")
         return "\n".join(lines)
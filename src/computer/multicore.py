@@ -0,0 +1,251 @@
+"""Multi-Core Computer.
+
+Several cores running over one shared RAM, for experimenting with
+parallel algorithms. Each core is a FastCPU (fastcpu.py), so even 16
+cores run faster than a single gate-level CPU.
+
+Scheduling:
+    The cores are not threads. A deterministic scheduler runs them one at
+    a time in index order, giving each `quantum` instructions per round:
+
+        round 1: core 0 (quantum instructions), core 1, ..., core N-1
+        round 2: core 0, core 1, ...
+
+    Every instruction is atomic and a program always interleaves the
+    same way, so races are reproducible. With quantum=1 the cores
+    alternate after every instruction.
+
+Core identity:
+    All cores start at address 0 (or at per-core entry points given to
+    reset()) with their core index in R7, so a program can branch on R7
+    to split the work.
+
+Synchronization:
+    When two cores LOAD, modify and STORE the same byte, one update can
+    be lost (a race). The test-and-set device at 0xEC-0xEF
+    provides four locks: LOAD returns the old value and sets the lock
+    to 1 in one step, STORE of 0 releases it.
+
+        acquire:
+            LOAD R3, 0xEC      ; R3 = old value, lock is now taken
+            SUB R4, R3, R0     ; R0 = 0: sets Z if the lock was free
+            JNZ acquire
+            ...                ; critical section
+            STORE R0, 0xEC     ; release
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple, TypeVar
+from computer.assembler import Assembler
+from computer.bus import Device
+from computer.fastcpu import FastCPU
+from computer.isa import OPCODE_NAMES, bits_to_int_n
+
+LOCK_BASE = 0xEC  # Test-and-set locks at 0xEC-0xEF
+NUM_LOCKS = 4
+CORE_ID_REGISTER = 7  # Each core starts with its index in R7
+
+DeviceT = TypeVar("DeviceT", bound=Device)
+
+
+class TestAndSet(Device):
+    """Atomic test-and-set locks: reading returns the old value and sets it to 1.
+
+    A core acquires lock n by loading LOCK_BASE + n until it reads 0, and
+    releases it by storing 0 there.
+    """
+
+    def __init__(self, size: int = NUM_LOCKS):
+        """Initialize `size` free locks."""
+        self.size = size
+        self.locks = bytearray(size)
+        self.stats = {"acquired": 0, "contended": 0}
+
+    def read(self, offset: int) -> int:
+        """Test-and-set: return the old value, leave the lock taken."""
+        # TODO: Return the old value and set the lock to 1 in one step
+        # Count "acquired" (old value 0) or "contended" (old value 1) in stats
+        ...
+
+    def write(self, offset: int, value: int) -> None:
+        """Store a value (0 releases the lock)."""
+        self.locks[offset] = value & 0xFF
+
+
+class Core(FastCPU):
+    """FastCPU sharing its memory (and device map) with the other cores."""
+
+    def __init__(self, machine: "MultiCoreComputer", index: int, pairs: Optional[Iterable[Tuple[str, str]]] = None):
+        """Initialize core `index` of a machine."""
+        super().__init__(pairs)
+        self.machine = machine
+        self.index = index
+        self.mem = machine.mem
+
+    def invalidate(self, address: Optional[int] = None) -> None:
+        """A write by any core drops the decoded handlers of every core."""
+        for core in self.machine.cores:
+            FastCPU.invalidate(core, address)
+
+    def _decode(self, pc: int):
+        """Decode as FastCPU, but send LOAD/STORE on device addresses to the device."""
+        mem, regs = self.mem, self.regs
+        word = mem[pc] | (mem[(pc + 1) & 0xFF] << 8)
+        name = OPCODE_NAMES[word >> 12]
+        entry = self.machine.devices.get(word & 0xFF) if name in ["LOAD", "STORE"] else None
+        if entry is None:
+            return super()._decode(pc)
+
+        device, offset = entry
+        rd, nxt = (word >> 8) & 7, (pc + 2) & 0xFF
+        if name == "LOAD":
+
+            def handler():
+                regs[rd] = device.read(offset)
+                return nxt
+
+        else:
+
+            def handler():
+                device.write(offset, regs[rd])
+                return nxt
+
+        self._single[pc] = handler
+        return handler
+
+
+class MultiCoreComputer:
+    """N cores over one shared RAM with a deterministic scheduler.
+
+    Cores run one at a time in index order, each for `quantum` instructions
+    per round (quantum=1 interleaves single instructions). Every instruction
+    is therefore atomic, and the same program always interleaves the same way.
+    """
+
+    def __init__(self, num_cores: int = 2, quantum: int = 1, pairs: Optional[Iterable[Tuple[str, str]]] = None):
+        """Initialize cores, shared memory and the lock device.
+
+        Args:
+            num_cores: Number of cores
+            quantum: Instructions each core runs before the next core's turn
+            pairs: Opcode pairs each core's FastCPU fuses (default: FastCPU's)
+        """
+        if num_cores < 1:
+            raise ValueError("num_cores must be at least 1")
+        if quantum < 1:
+            raise ValueError("quantum must be at least 1")
+        self.mem = bytearray(256)
+        self.quantum = quantum
+        self.devices: Dict[int, Tuple[Device, int]] = {}
+        self.cores: List[Core] = []
+        self.cores.extend(Core(self, i, pairs) for i in range(num_cores))
+        self.assembler = Assembler()
+        self.rounds = 0
+        self.locks = self.map(LOCK_BASE, TestAndSet())
+        self.reset()
+
+    # ----- Memory and devices -----
+
+    def map(self, base: int, device: DeviceT) -> DeviceT:
+        """Map device.size addresses starting at base to a device; returns the device."""
+        addresses = range(base, base + device.size)
+        for address in addresses:
+            if not 0 <= address < len(self.mem):
+                raise ValueError(f"Device address 0x{address:02X} is outside memory")
+            if address in self.devices:
+                raise ValueError(f"Address 0x{address:02X} is already mapped")
+        for offset, address in enumerate(addresses):
+            self.devices[address] = (device, offset)
+        self.assembler.optimizer.volatile |= set(addresses)
+        self.invalidate()
+        return device
+
+    def invalidate(self, address: Optional[int] = None) -> None:
+        """Drop decoded handlers on every core."""
+        self.cores[0].invalidate(address)
+
+    def load_bytes(self, image: Iterable[int], start: int = 0) -> None:
+        """Copy bytes into shared memory starting at `start`."""
+        for offset, value in enumerate(image):
+            self.mem[(start + offset) & 0xFF] = value & 0xFF
+        self.invalidate()
+
+    def load_program(self, source) -> None:
+        """Load a program from assembly source or raw bytes into shared memory."""
+        if not isinstance(source, str):
+            self.load_bytes(source)
+            return
+        image = []
+        for instruction in self.assembler.assemble(source):
+            image += [bits_to_int_n(instruction[:8]), bits_to_int_n(instruction[8:])]
+        self.load_bytes(image)
+        for addr, value in self.assembler.data_bytes.items():
+            self.mem[addr] = value & 0xFF
+        self.invalidate()
+
+    def reset(self, entries: Optional[List[int]] = None) -> None:
+        """Reset every core (memory is kept).
+
+        Args:
+            entries: Start PC of each core (default: all start at 0)
+        """
+        for core in self.cores:
+            core.regs[:] = [0] * 8
+            core.regs[CORE_ID_REGISTER] = core.index
+            core.flags[:] = [0, 0, 0, 0]
+            core.pc = entries[core.index] if entries is not None else 0
+            core.halted = False
+            core.ticks = 0
+            core.stats = {"steps": 0, "dispatches": 0, "fused": 0}
+        self.rounds = 0
+
+    # ----- Scheduling -----
+
+    @property
+    def halted(self) -> bool:
+        """True when every core has halted."""
+        return all(core.halted for core in self.cores)
+
+    def _round(self, budget: int) -> int:
+        """Give each running core up to `budget` instructions; returns instructions run."""
+        # TODO: Run each core that has not halted for up to `budget`
+        # instructions (core.run), in index order; count the round in
+        # self.rounds and return the total instructions executed
+        ...
+
+    def step(self) -> bool:
+        """Run one scheduler round; returns True while any core is running."""
+        if not self.halted:
+            self._round(self.quantum)
+        return not self.halted
+
+    def run(self, max_cycles: int = 1000) -> int:
+        """Run until every core halts, with each core getting at most max_cycles instructions.
+
+        Returns:
+            Instructions executed over all cores (HALTs not counted, as in CPU.run)
+        """
+        executed = 0
+        elapsed = 0
+        while elapsed < max_cycles and not self.halted:
+            budget = min(self.quantum, max_cycles - elapsed)
+            executed += self._round(budget)
+            elapsed += budget
+        return executed
+
+    # ----- State -----
+
+    def read(self, address: int) -> int:
+        """Read a byte of shared RAM."""
+        return self.mem[address & 0xFF]
+
+    def get_state(self) -> Dict:
+        """State of every core (as FastCPU.get_state)."""
+        return {"halted": self.halted, "rounds": self.rounds, "cores": [core.get_state() for core in self.cores]}
+
+    def report(self) -> Dict:
+        """Per-core statistics plus totals."""
+        cores: List[Dict] = [dict(core.stats, core=core.index, halted=core.halted) for core in self.cores]
+        total = sum(core["steps"] for core in cores)
+        for core in cores:
+            core["share"] = core["steps"] / total if total else 0.0
+        return {"cores": cores, "instructions": total, "rounds": self.rounds, "locks": dict(self.locks.stats)}
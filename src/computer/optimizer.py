@@ -0,0 +1,201 @@
+"""Peephole Optimizer.
+
+An optimization pass that runs between the assembler's first pass (parse)
+and second pass (encode). It rewrites the parsed lines so the program
+executes fewer instructions while computing the same result.
+
+Optimizations:
+- No-op moves:      MOV R1, R1 is removed
+- Load folding:     a LOAD of an address whose value is already in a register
+                    (from an earlier LOAD or STORE in the same basic block)
+                    becomes a MOV, or disappears if it is the same register
+- Jump threading:   a jump to a JMP goes straight to the final target, and
+                    a jump to the very next instruction is removed
+- Dead code:        instructions that no path from the entry can reach
+                    (e.g. after HALT or JMP) are removed
+
+Code is only rearranged when it is one contiguous block with no data inside
+it and no LOAD/STORE touches it; otherwise the lines are returned unchanged.
+"""
+
+from typing import Dict, Iterable, List
+
+JUMP_OPCODES = ["JMP", "JZ", "JNZ"]
+MEMORY_OPCODES = ["LOAD", "STORE"]
+REG_WRITE_OPCODES = ["MOV", "ADD", "SUB", "AND", "OR", "XOR", "NOT", "SHL", "SHR"]
+
+
+class PeepholeOptimizer:
+    """Optimizes parsed assembly lines between the assembler's two passes."""
+
+    def __init__(self, volatile: Iterable[int] = ()):
+        """Initialize optimizer.
+
+        Args:
+            volatile: Addresses whose loads must never be folded (e.g. I/O devices)
+        """
+        self.volatile = set(volatile)
+        self.stats: Dict[str, int] = {}
+
+    def optimize(self, parsed_lines: List[Dict], assembler) -> List[Dict]:
+        """Optimize the output of Assembler.first_pass().
+
+        Args:
+            parsed_lines: Parsed instruction lines (with 'address')
+            assembler: Assembler whose symbol table is updated for moved code labels
+
+        Returns:
+            Optimized parsed lines, ready for Assembler.second_pass()
+        """
+        self.stats = {"nop_moves": 0, "folded_loads": 0, "threaded_jumps": 0, "unreachable": 0}
+        if not parsed_lines:
+            return parsed_lines
+
+        lines = [dict(p, operands=list(p.get("operands", []))) for p in parsed_lines]
+        base = lines[0]["address"]
+        code_end = base + 2 * len(lines)
+
+        # Only straight-line code from `base` with no data inside it can be moved safely
+        if any(p["address"] != base + 2 * i for i, p in enumerate(lines)):
+            return parsed_lines
+        if any(base <= addr < code_end for addr in assembler.data_bytes):
+            return parsed_lines
+
+        targets: Dict[int, int] = {}  # line index -> jump target index
+        addresses: Dict[int, int] = {}  # line index -> LOAD/STORE address
+        for i, p in enumerate(lines):
+            operands = p["operands"]
+            if p["opcode"] in MEMORY_OPCODES and len(operands) >= 2:
+                addresses[i] = assembler._parse_value(operands[1]) & 0xFF
+                if base <= addresses[i] < code_end:
+                    return parsed_lines  # program reads or writes its own code
+            elif p["opcode"] in JUMP_OPCODES and operands:
+                target = assembler._parse_value(operands[0])
+                if not (base <= target < code_end) or (target - base) & 1:
+                    return parsed_lines  # jump leaves the code we can see
+                targets[i] = (target - base) // 2
+
+        self._thread_jumps(lines, targets)
+        removed = self._unreachable(lines, targets)
+        self._remove_nop_moves(lines, removed)
+        self._fold_loads(lines, targets, addresses, removed)
+        while self._remove_jumps_to_next(lines, targets, removed):
+            pass
+
+        # Re-layout surviving instructions and remap code addresses
+        new_index = []
+        count = 0
+        for i in range(len(lines)):
+            new_index.append(count)
+            if i not in removed:
+                count += 1
+        new_index.append(count)
+
+        for label, value in assembler.symbol_table.items():
+            if base <= value < code_end:
+                assembler.symbol_table[label] = base + 2 * new_index[(value - base) // 2]
+
+        result = []
+        for i, p in enumerate(lines):
+            if i in removed:
+                continue
+            p["address"] = base + 2 * new_index[i]
+            if i in targets:
+                p["operands"] = [f"0x{base + 2 * new_index[targets[i]]:02X}"]
+            result.append(p)
+        return result
+
+    def _thread_jumps(self, lines: List[Dict], targets: Dict[int, int]) -> None:
+        """Retarget jumps whose destination is an unconditional JMP.
+
+        Args:
+            lines: Parsed lines
+            targets: Line index -> jump target line index (updated in place)
+        """
+        # TODO: Follow chains of JMPs (guard against JMP loops)
+        ...
+
+    def _unreachable(self, lines: List[Dict], targets: Dict[int, int]) -> set:
+        """Find lines that can never execute.
+
+        Args:
+            lines: Parsed lines
+            targets: Line index -> jump target line index
+
+        Returns:
+            Set of unreachable line indices
+        """
+        # TODO: Walk from line 0 following fall-through and jump edges
+        # HALT and JMP do not fall through to the next line
+        ...
+
+    def _remove_nop_moves(self, lines: List[Dict], removed: set) -> None:
+        """Add every MOV Rx, Rx to the removed set."""
+        # TODO: Implement no-op move removal
+        ...
+
+    def _fold_loads(self, lines: List[Dict], targets: Dict[int, int], addresses: Dict[int, int], removed: set) -> None:
+        """Replace loads of values already held in a register within a basic block.
+
+        Args:
+            lines: Parsed lines (LOADs are rewritten in place)
+            targets: Line index -> jump target line index
+            addresses: Line index -> LOAD/STORE address
+            removed: Set of removed line indices
+        """
+        # TODO: Track which register mirrors which address
+        # - Forget everything at the start of a basic block (jump target or after a jump)
+        # - A STORE invalidates its address; any register write invalidates that register
+        ...
+
+    def _remove_jumps_to_next(self, lines: List[Dict], targets: Dict[int, int], removed: set) -> bool:
+        """Remove jumps whose target is the next surviving instruction.
+
+        Returns:
+            True if anything was removed
+        """
+        # TODO: Implement jump-to-next removal
+        ...
+
+
+def _reg(operand: str) -> int:
+    """Register number as seen by the 3-bit register file address."""
+    operand = operand.strip().upper()
+    return int(operand[1:]) & 0x7 if operand.startswith("R") else 0
+
+
+def measure_cycles(source: str, max_cycles: int = 1000, volatile: Iterable[int] = ()) -> Dict:
+    """Run a program with and without optimization and report the cycles saved.
+
+    Args:
+        source: Assembly source code
+        max_cycles: Cycle limit for each run
+        volatile: Addresses whose loads must never be folded
+
+    Returns:
+        Dictionary with 'before', 'after' and 'saved' cycle counts, instruction
+        counts, whether the final registers match, and per-optimization stats
+    """
+    from computer.assembler import Assembler
+    from computer.system import Computer
+
+    runs = []
+    for optimize in (False, True):
+        computer = Computer()
+        computer.assembler = Assembler(optimize=optimize)
+        computer.assembler.optimizer.volatile = set(volatile)
+        computer.load_program(source)
+        instructions = len(computer.assembler.assemble(source))
+        cycles = computer.cpu.run(max_cycles)
+        runs.append((cycles, instructions, computer.dump_state()["registers"]))
+
+    (before, size_before, regs_before), (after, size_after, regs_after) = runs
+    return {
+        "before": before,
+        "after": after,
+        "saved": before - after,
+        "instructions_before": size_before,
+        "instructions_after": size_after,
+        "registers_match": regs_before == regs_after,
+        "stats": dict(computer.assembler.optimizer.stats),
+    }
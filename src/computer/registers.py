@@ -9,6 +9,7 @@ Components:
 """
 
 from typing import List
+from computer.bits import bits_to_int
 from computer.sequential import DFlipFlop
 
 
@@ -54,7 +55,7 @@ class RegisterFile:
 
     def _addr_to_index(self, addr: List[int]) -> int:
         """Convert bit address to integer index."""
-        return sum(bit << i for i, bit in enumerate(addr))
+        return bits_to_int(addr)
 
     def read(self, addr: List[int]) -> List[int]:
         """Read from a register.
@@ -4,10 +4,11 @@ The complete computer system integrating:
 - CPU
 - Assembler
 - Memory initialization
-- I/O (simulated)
+- I/O (simulated; memory-mapped devices in bus.py)
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
+from computer.bits import bits_to_int
 from computer.cpu import CPU
 from computer.assembler import Assembler
 
@@ -15,9 +16,13 @@ from computer.assembler import Assembler
 class Computer:
     """Complete 8-bit computer system."""
 
-    def __init__(self):
-        """Initialize computer with CPU and assembler."""
-        self.cpu = CPU()
+    def __init__(self, cpu: Optional[CPU] = None):
+        """Initialize computer with CPU and assembler.
+
+        Args:
+            cpu: CPU to use (e.g. a PipelinedCPU); default is the single-cycle CPU
+        """
+        self.cpu = cpu if cpu is not None else CPU()
         self.assembler = Assembler()
 
     def load_program(self, source) -> None:
@@ -79,7 +84,7 @@ class Computer:
 
     def _bits_to_int(self, bits: List[int]) -> int:
         """Convert bit list to integer."""
-        return sum(bit << i for i, bit in enumerate(bits))
+        return bits_to_int(bits)
 
     def _format_bits(self, bits: List[int]) -> str:
         """Format bit list as decimal and hex."""
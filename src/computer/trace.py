@@ -0,0 +1,285 @@
+"""Execution Trace.
+
+Records every executed instruction as a fixed-size binary record, so long
+runs can be traced cheaply and analysed afterwards (instead of printing a
+line per cycle with Computer.run(debug=True)).
+
+Record (13 bytes, little-endian):
+    cycle      uint32  clock cycle when the instruction started
+    pc         uint8   address of the instruction
+    word       uint16  instruction word
+    flags      uint8   Z, C, N, V after execution in bits 0-3
+    writes     uint8   bit 0: register written, bit 1: memory written
+    reg        uint8   register written
+    reg_value  uint8   value written to it
+    address    uint8   memory address written (STORE)
+    mem_value  uint8   value stored
+
+File format:
+    header  "P8TR", version, compression (0 none, 1 zlib, 2 zstd), record size
+    blocks  uint32 payload length + payload (records, compressed or not)
+
+Records are packed into a preallocated buffer and written one block at a
+time, so tracing costs a small constant factor per instruction.
+
+Usage:
+    writer = TraceWriter("run.trace", compression="zlib")
+    computer.cpu.tracer = writer          # or trace_fast(fast_cpu, writer)
+    computer.cpu.run(1000)
+    writer.close()
+
+    for record in TraceReader("run.trace"):
+        print(record.pc, record.word)
+    array = TraceReader("run.trace").to_numpy()   # needs NumPy
+"""
+
+import struct
+import zlib
+from collections import namedtuple
+from collections.abc import Mapping
+from typing import Any, BinaryIO, Iterator, Optional, Union
+from computer.bits import int_to_bits
+from computer.isa import OPCODES, bits_to_int_n
+
+try:
+    import zstandard
+except ImportError:  # zstd compression is optional
+    zstandard = None
+
+np: Any
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+MAGIC = b"P8TR"
+VERSION = 1
+HEADER = struct.Struct("<4sBBB")  # magic, version, compression, record size
+BLOCK = struct.Struct("<I")  # payload length of each block
+
+# One record per instruction: cycle, pc, instruction word, flags (Z C N V in
+# bits 0-3), writes (bit 0 register, bit 1 memory), register + value, address + value
+RECORD = struct.Struct("<IBHBBBBBB")
+TraceRecord = namedtuple(
+    "TraceRecord", ["cycle", "pc", "word", "flags", "writes", "reg", "reg_value", "address", "mem_value"]
+)
+FIELDS = list(TraceRecord._fields)
+
+WRITE_REG = 0x01
+WRITE_MEM = 0x02
+
+COMPRESSIONS = {None: 0, "zlib": 1, "zstd": 2}
+REGISTER_OPCODES = ["LOAD", "MOV", "ADD", "SUB", "AND", "OR", "XOR", "NOT", "SHL", "SHR"]
+
+# What each 4-bit opcode writes
+_WRITES = [0] * 16
+for _name in REGISTER_OPCODES:
+    _WRITES[OPCODES[_name]] = WRITE_REG
+_WRITES[OPCODES["STORE"]] = WRITE_MEM
+
+
+def pack_flags(flags) -> int:
+    """Pack Z, C, N, V (a flags dict or FastCPU list) into bits 0-3."""
+    if isinstance(flags, Mapping):
+        flags = [flags.get(name, 0) for name in "ZCNV"]
+    return flags[0] | flags[1] << 1 | flags[2] << 2 | flags[3] << 3
+
+
+def unpack_flags(bits: int) -> dict:
+    """Inverse of pack_flags."""
+    return {name: (bits >> i) & 1 for i, name in enumerate("ZCNV")}
+
+
+def _compressor(compression: Optional[str]):
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression: {compression}")
+    if compression == "zstd":
+        if zstandard is None:
+            raise ImportError("zstd compression needs the 'zstandard' package")
+        return zstandard.ZstdCompressor().compress
+    if compression == "zlib":
+        return zlib.compress
+    return None
+
+
+class TraceWriter:
+    """Buffered writer of fixed-size binary trace records.
+
+    Records are packed into blocks of `block_records` records; each block
+    is optionally compressed and written with its length in front.
+    """
+
+    def __init__(self, file: Union[str, BinaryIO], compression: Optional[str] = None, block_records: int = 4096):
+        """Open a trace for writing.
+
+        Args:
+            file: Path or binary file object
+            compression: None, 'zlib' or 'zstd' (needs the zstandard package)
+            block_records: Records buffered per block
+        """
+        self.compress = _compressor(compression)
+        self.compression = compression
+        self.block_records = block_records
+        self.owns_file = isinstance(file, str)
+        self.file: BinaryIO = open(file, "wb") if isinstance(file, str) else file
+        self.file.write(HEADER.pack(MAGIC, VERSION, COMPRESSIONS[compression], RECORD.size))
+        self.buffer = bytearray(RECORD.size * block_records)
+        self.pending = 0
+        self.count = 0
+        self.bytes_written = HEADER.size
+
+    def record(self, cycle, pc, word, flags, writes, reg, reg_value, address, mem_value) -> None:
+        """Append one record (flags already packed, see pack_flags)."""
+        # TODO: Pack the fields into self.buffer at record slot self.pending
+        # (RECORD.pack_into; keep only the low 32 bits of cycle), then flush()
+        # once block_records records are buffered
+        ...
+
+    def record_cpu(self, cpu, pc: int, instruction) -> None:
+        """Record the instruction CPU.step just executed from pc."""
+        datapath = cpu.datapath
+        word = bits_to_int_n(instruction)
+        writes = _WRITES[word >> 12]
+        rd = (word >> 8) & 7
+        value = bits_to_int_n(datapath.reg_file.read(int_to_bits(rd, 3))) if writes else 0
+        address = word & 0xFF if writes == WRITE_MEM else 0
+        self.record(
+            cpu.clock.cycle,
+            pc,
+            word,
+            pack_flags(datapath.flags),
+            writes,
+            rd if writes == WRITE_REG else 0,
+            value if writes == WRITE_REG else 0,
+            address,
+            value if writes == WRITE_MEM else 0,
+        )
+
+    def flush(self) -> None:
+        """Write buffered records as one block."""
+        if not self.pending:
+            return
+        self._write_block(bytes(memoryview(self.buffer)[: self.pending * RECORD.size]))
+        self.count += self.pending
+        self.pending = 0
+
+    def _write_block(self, payload: bytes) -> None:
+        if self.compress is not None:
+            payload = self.compress(payload)
+        self.file.write(BLOCK.pack(len(payload)))
+        self.file.write(payload)
+        self.bytes_written += BLOCK.size + len(payload)
+
+    def close(self) -> None:
+        """Flush and close (files passed in by the caller are only flushed)."""
+        self.flush()
+        if self.owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self) -> "TraceWriter":
+        """Use as a context manager."""
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Close on leaving the with block."""
+        self.close()
+
+
+class TraceReader:
+    """Streams records back from a trace file."""
+
+    def __init__(self, file: Union[str, BinaryIO]):
+        """Open a trace and read its header."""
+        self.owns_file = isinstance(file, str)
+        self.file: BinaryIO = open(file, "rb") if isinstance(file, str) else file
+        magic, version, code, size = HEADER.unpack(self.file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION or size != RECORD.size:
+            raise ValueError("Not a trace file (or an unsupported version)")
+        self.compression = {v: k for k, v in COMPRESSIONS.items()}[code]
+        self.decompress = None
+        if self.compression == "zlib":
+            self.decompress = zlib.decompress
+        elif self.compression == "zstd":
+            if zstandard is None:
+                raise ImportError("zstd compression needs the 'zstandard' package")
+            self.decompress = zstandard.ZstdDecompressor().decompress
+
+    def blocks(self) -> Iterator[bytes]:
+        """Yield the raw (decompressed) record bytes of each block."""
+        while True:
+            header = self.file.read(BLOCK.size)
+            if len(header) < BLOCK.size:
+                return
+            payload = self.file.read(BLOCK.unpack(header)[0])
+            yield self.decompress(payload) if self.decompress is not None else payload
+
+    def records(self) -> Iterator[TraceRecord]:
+        """Yield every record as a TraceRecord."""
+        # TODO: Unpack every block from blocks() (RECORD.iter_unpack)
+        # and yield each record as a TraceRecord
+        ...
+
+    def __iter__(self) -> Iterator[TraceRecord]:
+        """Iterate over records."""
+        return self.records()
+
+    def to_numpy(self):
+        """Read all remaining records into a NumPy structured array."""
+        if np is None:
+            raise ImportError("to_numpy() needs NumPy")
+        dtype = np.dtype([(name, code) for name, code in zip(FIELDS, ["<u4", "u1", "<u2"] + ["u1"] * 6)])
+        return np.frombuffer(b"".join(self.blocks()), dtype=dtype)
+
+    def close(self) -> None:
+        """Close the file if it was opened by path."""
+        if self.owns_file:
+            self.file.close()
+
+    def __enter__(self) -> "TraceReader":
+        """Use as a context manager."""
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Close on leaving the with block."""
+        self.close()
+
+
+def trace_fast(fast, writer: TraceWriter, max_cycles: int = 1000) -> int:
+    """Run a FastCPU one instruction at a time, recording each one.
+
+    Returns:
+        Steps executed, like FastCPU.run (HALT is recorded but not counted)
+    """
+    mem, regs, flags = fast.mem, fast.regs, fast.flags
+    record, step = writer.record, fast.step
+    count = 0
+    while count < max_cycles and not fast.halted:
+        pc = fast.pc
+        word = mem[pc] | (mem[(pc + 1) & 0xFF] << 8)
+        cycle = fast.ticks >> 1
+        running = step()
+        writes = _WRITES[word >> 12]
+        fl = flags[0] | flags[1] << 1 | flags[2] << 2 | flags[3] << 3
+        if writes == WRITE_REG:
+            rd = (word >> 8) & 7
+            record(cycle, pc, word, fl, writes, rd, regs[rd], 0, 0)
+        elif writes == WRITE_MEM:
+            record(cycle, pc, word, fl, writes, 0, 0, word & 0xFF, regs[(word >> 8) & 7])
+        else:
+            record(cycle, pc, word, fl, 0, 0, 0, 0, 0)
+        count += running
+    return count
+
+
+def trace_program(source, file, max_cycles: int = 1000, compression: Optional[str] = None) -> int:
+    """Assemble and run a program on the FastCPU, writing its trace to file; returns steps."""
+    from computer.fastcpu import FastCPU
+    from computer.system import Computer
+
+    computer = Computer()
+    computer.load_program(source)
+    fast = FastCPU.from_computer(computer)
+    with TraceWriter(file, compression) as writer:
+        return trace_fast(fast, writer, max_cycles)
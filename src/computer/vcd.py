@@ -0,0 +1,320 @@
+"""VCD Waveform Export.
+
+Records internal signals of the gate-level CPU over time as a Value
+Change Dump (VCD), the text format read by waveform viewers such as
+GTKWave.
+
+Only changes are written: a signal appears at a time step only if its
+value differs from the last value written, so quiet signals cost almost
+nothing and the file stays small.
+
+    $var wire 8 ! pc $end        declare signal "pc" (8 bits) as code "!"
+    #12                          time 12
+    b1010 !                      pc = 0b1010 (vectors)
+    1#                           signal "#" = 1 (single bits)
+
+Signals (select by name or group with VCDRecorder(signals=[...])):
+    pc, ir                       program counter and instruction register
+    control.*                    every ControlSignals field
+    alu.result, alu.flags        last ALU output and its Z C N V flags
+    registers.R0 - R7            q outputs of each register's D flip-flops
+    flags.Z, .C, .N, .V          datapath flags
+
+Usage:
+    recorder = VCDRecorder(computer.cpu, "run.vcd", signals=["pc", "control"])
+    computer.cpu.run(100)
+    recorder.close()
+"""
+
+from functools import partial
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+from computer.bits import bits_to_int
+from computer.clock import ControlSignals
+
+# Identifier codes are printable ASCII '!' to '~'
+ID_FIRST = 33
+ID_COUNT = 94
+
+Probe = Tuple[str, int, Callable[[], int]]  # name, width, getter
+
+
+def identifier(index: int) -> str:
+    """VCD identifier code of the index-th signal (base-94, shortest first)."""
+    code = chr(ID_FIRST + index % ID_COUNT)
+    index //= ID_COUNT
+    while index:
+        index -= 1
+        code += chr(ID_FIRST + index % ID_COUNT)
+        index //= ID_COUNT
+    return code
+
+
+def _int(value) -> int:
+    """Signal value as an integer (bit lists are LSB first)."""
+    if isinstance(value, list):
+        return bits_to_int(value)
+    return int(value)
+
+
+class VCDWriter:
+    """Value Change Dump writer that only emits signals whose value changed.
+
+    Signal names may contain one dot ("control.pc_load"); the part before
+    it becomes a $scope. Output lines are buffered and written in batches.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, BinaryIO],
+        timescale: str = "1ns",
+        scope: str = "cpu",
+        buffer_lines: int = 4096,
+    ):
+        """Open a VCD file for writing.
+
+        Args:
+            file: Path or binary file object
+            timescale: VCD time unit of one time step
+            scope: Top-level module name
+            buffer_lines: Lines buffered before each write
+        """
+        self.owns_file = isinstance(file, str)
+        self.file: BinaryIO = open(file, "wb") if isinstance(file, str) else file
+        self.timescale = timescale
+        self.scope = scope
+        self.buffer_lines = buffer_lines
+        self.names: List[str] = []
+        self.widths: List[int] = []
+        self.ids: List[str] = []
+        self.last: List[Optional[int]] = []
+        self.lines: List[str] = []
+        self.started = False
+        self.time: Optional[int] = None
+        self.changes = 0
+
+    def add_signal(self, name: str, width: int = 1) -> str:
+        """Declare a signal (before the first dump); returns its identifier code."""
+        if self.started:
+            raise RuntimeError("Signals must be declared before the first dump")
+        if name in self.names:
+            raise ValueError(f"Duplicate signal: {name}")
+        code = identifier(len(self.names))
+        self.names.append(name)
+        self.widths.append(width)
+        self.ids.append(code)
+        self.last.append(None)
+        return code
+
+    def _header(self) -> None:
+        self.lines += ["$version py8bit $end", f"$timescale {self.timescale} $end", f"$scope module {self.scope} $end"]
+        current = None
+        for name, width, code in zip(self.names, self.widths, self.ids):
+            group, _, short = name.rpartition(".")
+            if group != current:
+                if current:
+                    self.lines.append("$upscope $end")
+                if group:
+                    self.lines.append(f"$scope module {group} $end")
+                current = group
+            self.lines.append(f"$var wire {width} {code} {short} $end")
+        if current:
+            self.lines.append("$upscope $end")
+        self.lines += ["$upscope $end", "$enddefinitions $end"]
+        self.started = True
+
+    def dump_values(self, time: int, values: List[int]) -> int:
+        """Record all signals (in declaration order) at a time; returns changes written."""
+        # TODO: Write only the signals whose value changed since the last dump
+        # 1. Write the header (_header) on the first call
+        # 2. Time must increase (ValueError otherwise)
+        # 3. For each changed value append "0!"/"1!" (1 bit) or "b101 !" (vectors),
+        #    preceded by a "#time" line if anything changed; update self.last
+        # 4. Count changes in self.changes, flush() once buffer_lines are buffered
+        ...
+
+    def dump(self, time: int, values: Dict[str, int]) -> int:
+        """Record signals by name (others keep their value); returns changes written."""
+        row = [values.get(name, last) for name, last in zip(self.names, self.last)]
+        return self.dump_values(time, [0 if value is None else _int(value) for value in row])
+
+    def flush(self) -> None:
+        """Write buffered lines to the file."""
+        if self.lines:
+            self.file.write(("\n".join(self.lines) + "\n").encode("ascii"))
+            self.lines = []
+
+    def close(self) -> None:
+        """Flush and close (files passed in by the caller are only flushed)."""
+        if not self.started:
+            self._header()
+        self.flush()
+        if self.owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+
+def parse_vcd(text: str) -> Dict[str, List[Tuple[int, int]]]:
+    """Read a VCD written by VCDWriter into {signal name: [(time, value), ...]}."""
+    names: Dict[str, str] = {}
+    scopes: List[str] = []
+    changes: Dict[str, List[Tuple[int, int]]] = {}
+    time = 0
+    for line in text.splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+        if parts[0] == "$scope":
+            scopes.append(parts[2])
+        elif parts[0] == "$upscope":
+            scopes.pop()
+        elif parts[0] == "$var":
+            name = ".".join(scopes[1:] + [parts[4]])
+            names[parts[3]] = name
+            changes[name] = []
+        elif parts[0].startswith("#"):
+            time = int(parts[0][1:])
+        elif parts[0].startswith("b"):
+            changes[names[parts[1]]].append((time, int(parts[0][1:], 2)))
+        elif parts[0][0] in "01":
+            changes[names[parts[0][1:]]].append((time, int(parts[0][0])))
+    return changes
+
+
+class _RecordingControl:
+    """Control unit wrapper that keeps the last generated signals."""
+
+    def __init__(self, control):
+        self.control = control
+        self.signals = ControlSignals()
+
+    def generate_signals(self, decoded: Dict, flags: Dict[str, int]):
+        self.signals = self.control.generate_signals(decoded, flags)
+        return self.signals
+
+    def __getattr__(self, name):
+        return getattr(self.control, name)
+
+
+class _RecordingALU:
+    """ALU wrapper that keeps the last result and flags."""
+
+    def __init__(self, alu):
+        self.alu = alu
+        self.result = 0
+        self.flags = 0
+
+    def __call__(self, a: List[int], b: List[int], opcode: List[int]):
+        result, flags = self.alu(a, b, opcode)
+        self.result = _int(result)
+        self.flags = sum(flags.get(name, 0) << i for i, name in enumerate("ZCNV"))
+        return result, flags
+
+    def __getattr__(self, name):
+        return getattr(self.alu, name)
+
+
+def _control_signal(control: _RecordingControl, field: str) -> int:
+    """Current value of a control signal."""
+    return _int(getattr(control.signals, field, 0))
+
+
+def _register_value(bits: list) -> int:
+    """Register contents are the q outputs of its D flip-flops."""
+    return sum(ff.q << j for j, ff in enumerate(bits))
+
+
+def _flag(datapath, name: str) -> int:
+    """Current value of a flag (looked up each time, since every ALU operation replaces datapath.flags)."""
+    return datapath.flags.get(name, 0)
+
+
+def signal_probes(cpu, control: _RecordingControl, alu: _RecordingALU) -> List[Probe]:
+    """All signals a VCDRecorder can record."""
+    datapath = cpu.datapath
+    probes: List[Probe] = [
+        ("pc", 8, lambda: _int(datapath.pc.value)),
+        ("ir", 16, lambda: _int(datapath.ir)),
+    ]
+    for field, default in vars(ControlSignals()).items():
+        width = len(default) if isinstance(default, list) else 1
+        probes.append((f"control.{field}", width, partial(_control_signal, control, field)))
+    probes.append(("alu.result", 8, lambda: alu.result))
+    probes.append(("alu.flags", 4, lambda: alu.flags))
+    for i, register in enumerate(datapath.reg_file.registers):
+        probes.append((f"registers.R{i}", 8, partial(_register_value, register.bits)))
+    for name in "ZCNV":
+        probes.append((f"flags.{name}", 1, partial(_flag, datapath, name)))
+    return probes
+
+
+class VCDRecorder:
+    """Samples CPU signals after every instruction into a VCDWriter.
+
+    Installs itself as cpu.tracer, so CPU.step calls record_cpu(). Time is
+    measured in clock half-cycles (Clock.tick calls); CPU.step ticks once
+    per instruction.
+    """
+
+    def __init__(self, cpu, file: Union[str, BinaryIO], signals: Optional[List[str]] = None, **options):
+        """Attach to a single-cycle CPU.
+
+        Args:
+            cpu: CPU to record
+            file: Path or binary file object for the VCD
+            signals: Names or groups to record, e.g. ["pc", "control", "registers.R1"]
+                (default: everything)
+            **options: Passed to VCDWriter (timescale, scope, buffer_lines)
+        """
+        self.cpu = cpu
+        self.control = _RecordingControl(cpu.control)
+        self.alu = _RecordingALU(cpu.datapath.alu)
+        probes = signal_probes(cpu, self.control, self.alu)
+        if signals is not None:
+            probes = [p for p in probes if any(p[0] == s or p[0].startswith(s + ".") for s in signals)]
+            if not probes:
+                raise ValueError(f"No signals match {signals}")
+        self.writer = VCDWriter(file, **options)
+        for name, width, _ in probes:
+            self.writer.add_signal(name, width)
+        self.getters = [getter for _, _, getter in probes]
+        cpu.control = self.control
+        cpu.datapath.alu = self.alu
+        cpu.tracer = self
+        self.samples = 0
+        self.sample()
+
+    def time(self) -> int:
+        """Current time in clock half-cycles."""
+        clock = self.cpu.clock
+        return 2 * clock.cycle + clock.state
+
+    def sample(self, time: Optional[int] = None) -> int:
+        """Record the current value of every signal; returns changes written."""
+        self.samples += 1
+        return self.writer.dump_values(self.time() if time is None else time, [g() for g in self.getters])
+
+    def record_cpu(self, cpu, pc: int, instruction: List[int]) -> None:
+        """Called by CPU.step after each instruction, before its clock tick."""
+        # The new values are visible from the tick that ends the instruction
+        self.sample(self.time() + 1)
+
+    def close(self) -> None:
+        """Detach from the CPU and close the VCD."""
+        self.cpu.control = self.control.control
+        self.cpu.datapath.alu = self.alu.alu
+        if self.cpu.tracer is self:
+            self.cpu.tracer = None
+        self.writer.close()
+
+
+def record_vcd(source, file, signals: Optional[List[str]] = None, max_cycles: int = 1000) -> Dict:
+    """Run a program on the gate-level CPU while recording a VCD."""
+    from computer.system import Computer
+
+    computer = Computer()
+    computer.load_program(source)
+    recorder = VCDRecorder(computer.cpu, file, signals)
+    steps = computer.cpu.run(max_cycles)
+    recorder.close()
+    return {"instructions": steps, "samples": recorder.samples, "changes": recorder.writer.changes}
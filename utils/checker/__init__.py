@@ -9,10 +9,15 @@ Usage:
     check('gates')              # Run all gate tests
     check('gates', 'AND')       # Run only AND gate tests
     check('gates', verbose=True) # Show detailed error messages
+    check('gates', force=True)  # Re-run even if a cached pass is still valid
     check_all()                 # Run all tests for all components
+    check_all(parallel=4, timeout=10, json_path='results.json', junit_path='results.xml')
+    verify('adders')            # Check every input combination against a reference model
+    faults('adders')            # Which stuck-at/bit-flip gate faults the unit tests detect
 """
 
 import sys
+import time
 import traceback
 from pathlib import Path
 
@@ -20,19 +25,26 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
-from .runner import run_tests, display_results
+from . import cache, exhaustive, faultsim
+from .runner import TestResult, run_tests, display_results
+from .report import run_components, slowest_tests, to_json, to_junit
 from .tests import COMPONENT_TESTS
 
-__all__ = ["check", "check_all", "COMPONENT_TESTS"]
+__all__ = ["check", "check_all", "verify", "faults", "COMPONENT_TESTS"]
 
 
-def check(component_name: str, exercise: str | None = None, verbose: bool = False) -> bool:
+def check(component_name: str, exercise: str | None = None, verbose: bool = False, force: bool = False) -> bool:
     """Run tests for a component and display pass/fail results.
 
+    A full run that passes is cached under a hash of the component's source,
+    its test file and every computer.* module they import; while none of
+    those change, check() reports the cached result without running anything.
+
     Args:
         component_name: Name of the component to test (e.g., 'gates', 'adders')
         exercise: Optional specific exercise/function to test (e.g., 'AND', 'half_adder')
         verbose: If True, show more detailed output on failure
+        force: If True, run the tests even if a cached result is valid
 
     Returns:
         True if all tests passed, False otherwise
@@ -47,6 +59,14 @@ def check(component_name: str, exercise: str | None = None, verbose: bool = Fals
         print(f"Available components: {', '.join(COMPONENT_TESTS.keys())}")
         return False
 
+    digest = cache.component_hash(component_name) if exercise is None else None
+    cached = cache.load(component_name, digest) if digest and not force else None
+    if cached is not None:
+        results = [TestResult(t["name"], t["passed"], t["error"], t["duration"]) for t in cached["tests"]]
+        display_results(component_name, None, cached["passed"], 0, 0, verbose, results)
+        print("(cached: sources unchanged since the last passing run; use force=True to re-run)")
+        return True
+
     try:
         test_cases = COMPONENT_TESTS[component_name]()
     except ImportError as e:
@@ -61,13 +81,38 @@ def check(component_name: str, exercise: str | None = None, verbose: bool = Fals
 
     passed, failed, errors, results = run_tests(test_cases, exercise)
     display_results(component_name, exercise, passed, failed, errors, verbose, results)
+    if digest:
+        tests = [{"name": r.name, "passed": r.passed, "error": r.error, "duration": r.duration} for r in results]
+        summary = {"component": component_name, "passed": passed, "failed": failed, "errors": errors}
+        duration = sum(r.duration for r in results)
+        cache.store(component_name, digest, dict(summary, load_error=None, tests=tests, duration=duration))
 
     return (passed + failed + errors) > 0 and failed == 0 and errors == 0
 
 
-def check_all() -> bool:
+def check_all(
+    parallel: int | None = None,
+    timeout: float | None = 10,
+    json_path: str | None = None,
+    junit_path: str | None = None,
+    slowest: int = 0,
+    force: bool = False,
+) -> bool:
     """Run all tests for the entire project.
 
+    Components whose sources are unchanged since their last passing run are
+    reported from the cache (see check()) instead of being run.
+
+    Args:
+        parallel: Run components in this many worker processes (default: in-process, one by one)
+        timeout: Seconds allowed per test (None for no limit); a test that runs longer fails
+            with TimeoutError (Unix only - the limit uses SIGALRM). In parallel mode a worker
+            still busy after `timeout` seconds per test is stopped and its component is an error
+        json_path: Also write the results as JSON to this file
+        junit_path: Also write the results as JUnit XML to this file
+        slowest: Report this many of the slowest tests
+        force: If True, run every component even if a cached result is valid
+
     Returns:
         True if all tests passed, False otherwise
     """
@@ -80,25 +125,38 @@ def check_all() -> bool:
     print("FULL PROJECT TEST RESULTS")
     print("=" * 50)
 
-    for component_name, get_tests in COMPONENT_TESTS.items():
-        try:
-            test_cases = get_tests()
-            passed, failed, errors, _ = run_tests(test_cases)
-            total_passed += passed
-            total_failed += failed
-            total_errors += errors
+    start = time.perf_counter()
+    summaries = run_components(parallel=parallel, timeout=timeout, use_cache=not force)
+    wall_time = time.perf_counter() - start
 
+    for summary in summaries:
+        component_name = summary["component"]
+        passed, failed, errors = summary["passed"], summary["failed"], summary["errors"]
+        total_passed += passed
+        total_failed += failed
+        total_errors += errors
+        if summary["load_error"]:
+            print(f"  {component_name}: ERROR - {summary['load_error']}")
+        else:
             status = "PASS" if failed == 0 and errors == 0 else "FAIL"
-            print(f"  {component_name}: {status} ({passed} passed, {failed} failed, {errors} errors)")
+            timing = "cached" if summary["cached"] else f"in {summary['duration']:.2f}s"
+            print(f"  {component_name}: {status} ({passed} passed, {failed} failed, {errors} errors) {timing}")
 
-            if failed > 0 or errors > 0:
-                failed_components.append(component_name)
-        except Exception as e:
-            print(f"  {component_name}: ERROR - {e}")
-            total_errors += 1
+        if failed > 0 or errors > 0:
             failed_components.append(component_name)
 
+    if slowest:
+        print("\nSlowest tests:")
+        for component_name, test_name, duration in slowest_tests(summaries, slowest):
+            print(f"  {duration:7.3f}s  {component_name}: {test_name}")
+
+    if json_path:
+        Path(json_path).write_text(to_json(summaries, wall_time))
+    if junit_path:
+        Path(junit_path).write_text(to_junit(summaries))
+
     print("\n" + "-" * 50)
+    print(f"Finished in {wall_time:.2f}s")
     if total_failed == 0 and total_errors == 0:
         print(f"All {total_passed} tests passed!")
         return True
@@ -109,3 +167,92 @@ def check_all() -> bool:
         if failed_components:
             print(f"\nFailed components: {', '.join(failed_components)}")
         return False
+
+
+def verify(name: str | None = None, counterexamples: int = 5, workers: int | None = None) -> bool:
+    """Exhaustively verify combinational functions against reference models (needs NumPy).
+
+    Args:
+        name: A function ('ripple_carry_adder_8bit', 'alu_add', ...), a component
+            ('gates', 'adders', 'combinational', 'alu') or None for all of them
+        counterexamples: Show at most this many failing inputs per function
+        workers: Worker processes for implementations that must be called once per input
+
+    Returns:
+        True if every function matched its reference on every input
+    """
+    try:
+        names = exhaustive.spec_names(name)
+    except KeyError as e:
+        print(f"Error: {e.args[0]}")
+        return False
+
+    print("\n" + "=" * 50)
+    print(f"EXHAUSTIVE VERIFICATION: {name or 'all'}")
+    print("=" * 50)
+    failed = []
+    for spec_name in names:
+        result = exhaustive.verify(spec_name, counterexamples, workers)
+        print(exhaustive.format_result(result))
+        if result["mismatches"]:
+            failed.append(spec_name)
+
+    print("\n" + "-" * 50)
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+        return False
+    print(f"All {len(names)} function(s) match on every input!")
+    return True
+
+
+def faults(
+    name: str | None = None,
+    vectors="tests",
+    kinds=None,
+    program=None,
+    max_cycles: int = 1000,
+) -> dict:
+    """Inject stuck-at and bit-flip faults into gate outputs and report which ones the vectors detect.
+
+    Args:
+        name: A function ('ripple_carry_adder_8bit', 'alu_add', ...), a component
+            ('adders', 'combinational', 'alu') or None for all of them
+        vectors: 'tests' (the inputs the unit tests apply), 'exhaustive', a number
+            of random inputs, or a list of input cases
+        kinds: Fault kinds ('sa0', 'sa1', 'flip'; default: all three)
+        program: Assembly source or bytes; its ALU operands become the vectors
+            of the ALU operations it uses (name and vectors are ignored)
+        max_cycles: Instructions to run the program for
+
+    Returns:
+        {function name: campaign report} (see faultsim.campaign)
+    """
+    try:
+        if program is not None:
+            recorded = faultsim.vectors_from_program(program, max_cycles)
+            names = list(recorded)
+        else:
+            names = exhaustive.spec_names(name)
+    except KeyError as e:
+        print(f"Error: {e.args[0]}")
+        return {}
+
+    print("\n" + "=" * 50)
+    print(f"FAULT CAMPAIGN: {'program' if program is not None else name or 'all'}")
+    print("=" * 50)
+    reports = {}
+    for spec_name in names:
+        cases = recorded[spec_name] if program is not None else vectors
+        try:
+            reports[spec_name] = faultsim.campaign(spec_name, cases, kinds)
+        except Exception as e:
+            print(f"  {spec_name}: cannot trace ({type(e).__name__}: {e})")
+            continue
+        print(faultsim.format_campaign(reports[spec_name]))
+
+    total = sum(report["faults"] for report in reports.values())
+    detected = sum(report["detected"] for report in reports.values())
+    print("\n" + "-" * 50)
+    if total:
+        print(f"Detected {detected}/{total} faults ({detected / total:.1%}) in {len(reports)} function(s)")
+    return reports
@@ -0,0 +1,93 @@
+"""Cache of passing checker results, keyed by a hash of the tested sources."""
+
+import ast
+import hashlib
+import importlib.util
+import json
+from pathlib import Path
+
+CACHE_VERSION = 1
+CACHE_DIR = Path(__file__).parent.parent.parent / ".checker_cache"
+TESTS_DIR = Path(__file__).parent / "tests"
+HELPERS = Path(__file__).parent / "helpers.py"
+
+
+def _origin(module_name: str) -> Path | None:
+    """Source file of a module, or None if it cannot be found."""
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        return None
+    return Path(spec.origin)
+
+
+def _imports(source: str, packages: set) -> set:
+    """Modules of the given packages imported anywhere in source (including inside functions)."""
+    found = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            found |= {alias.name for alias in node.names if alias.name.split(".")[0] in packages}
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            if node.module in packages:
+                found |= {f"{node.module}.{alias.name}" for alias in node.names}
+            elif node.module.split(".")[0] in packages:
+                found.add(node.module)
+    return found
+
+
+def source_files(component_name: str) -> list:
+    """The component's module, its test file and everything they import from computer.*, transitively."""
+    files = {HELPERS}
+    test_file = TESTS_DIR / f"test_{component_name}.py"
+    pending = [(test_file, {"computer"})]
+    module_file = _origin(f"computer.{component_name}")
+    if module_file is not None:
+        pending.append((module_file, {"computer", module_file.parent.name}))
+
+    while pending:
+        path, packages = pending.pop()
+        if path in files or not path.exists():
+            continue
+        files.add(path)
+        for name in _imports(path.read_text(), packages):
+            origin = _origin(name)
+            if origin is not None and origin not in files:
+                pending.append((origin, packages | {origin.parent.name}))
+    return sorted(files)
+
+
+def component_hash(component_name: str) -> str:
+    """Hash of every source file the component's tests depend on."""
+    digest = hashlib.sha256(f"{CACHE_VERSION}:{component_name}".encode())
+    for path in source_files(component_name):
+        digest.update(path.name.encode() + b"\0" + path.read_bytes() + b"\0")
+    return digest.hexdigest()
+
+
+def load(component_name: str, digest: str, cache_dir: Path = CACHE_DIR) -> dict | None:
+    """Return the cached summary if it was stored for the same hash."""
+    path = Path(cache_dir) / f"{component_name}.json"
+    try:
+        entry = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if entry.get("hash") != digest:
+        return None
+    return entry["summary"]
+
+
+def store(component_name: str, digest: str, summary: dict, cache_dir: Path = CACHE_DIR) -> None:
+    """Remember a passing summary (failing runs are never cached)."""
+    if summary["failed"] or summary["errors"] or not summary["passed"]:
+        return
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    (cache_dir / f"{component_name}.json").write_text(json.dumps({"hash": digest, "summary": summary}))
+
+
+def clear(cache_dir: Path = CACHE_DIR) -> None:
+    """Delete every cached result."""
+    for path in Path(cache_dir).glob("*.json"):
+        path.unlink()
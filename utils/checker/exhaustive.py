@@ -0,0 +1,408 @@
+"""Exhaustive verification of combinational components against NumPy reference models.
+
+Every input combination is enumerated (2**17 cases for the 8-bit adder,
+2**16 per ALU operation) and compared with a reference model evaluated on
+whole NumPy arrays. The implementation is first called once, bit-sliced:
+each input bit is a NumPy array holding that bit for every case, which
+works for code built from arithmetic and bitwise operators. Code that
+branches on bit values (`if a == 1`) cannot run that way, so it is swept
+one case at a time in chunks spread over worker processes.
+"""
+
+import importlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+np: Any
+try:
+    import numpy as np
+except ImportError:  # Only needed for exhaustive verification
+    np = None
+
+
+class Spec:
+    """A component function with its input/output layout and a reference model."""
+
+    def __init__(self, name: str, component: str, inputs: list, outputs: list, call, reference, target: str = ""):
+        """Describe one exhaustively checkable function.
+
+        Args:
+            name: Spec name (the function name, or alu_<op>)
+            component: Checker component the function belongs to
+            inputs: (name, width) of each input; case bits are assigned in this order, LSB first
+            outputs: (name, width) of each output
+            call: call(impl, *input_bits) -> one value per output (a bit or a list of bits)
+            reference: reference(*input_ints) -> one int or int array per output
+            target: Attribute of computer.<component> to test (default: name); classes are instantiated
+        """
+        self.name = name
+        self.component = component
+        self.inputs = inputs
+        self.outputs = outputs
+        self.call = call
+        self.reference = reference
+        self.target = target or name
+        self.bits = sum(width for _, width in inputs)
+
+    def resolve(self):
+        """Import the implementation under test."""
+        impl = getattr(importlib.import_module(f"computer.{self.component}"), self.target)
+        return impl() if isinstance(impl, type) else impl
+
+    def split(self, cases):
+        """Input values of case numbers (ints or an array), in input order."""
+        values = []
+        offset = 0
+        for _, width in self.inputs:
+            values.append((cases >> offset) & ((1 << width) - 1))
+            offset += width
+        return values
+
+
+# ----- Reference models -----
+
+ALU_OPS = ["add", "sub", "and", "or", "xor", "not", "shl", "shr", "cmp"]  # Index = ALU op code
+
+
+def _priority(inputs):
+    """Priority encoder: index of the highest set input (0 when none is set)."""
+    table = np.array([max(value.bit_length() - 1, 0) for value in range(int(inputs.max()) + 1)], dtype=np.int64)
+    return (table[inputs],)
+
+
+def _alu_reference(op: str):
+    def reference(a, b):
+        zero = a & 0
+        if op == "add":
+            result = (a + b) & 0xFF
+            return result, result == 0, (a + b) >> 8, result >> 7, ((a ^ result) & ~(a ^ b) & 0x80) >> 7
+        if op in ("sub", "cmp"):
+            result = (a - b) & 0xFF
+            flags = (result == 0, (a < b).astype(np.int64), result >> 7, ((a ^ b) & (a ^ result) & 0x80) >> 7)
+            return (a if op == "cmp" else result,) + flags
+        if op in ("shl", "shr"):
+            result = (a << 1) & 0xFF if op == "shl" else a >> 1
+            carry = a >> 7 if op == "shl" else a & 1
+            return result, result == 0, carry, result >> 7, zero
+        result = {"and": a & b, "or": a | b, "xor": a ^ b, "not": ~a & 0xFF}[op]
+        return result, result == 0, zero, result >> 7, zero
+
+    return reference
+
+
+def _gate(name: str, reference) -> Spec:
+    return Spec(name, "gates", [("a", 1), ("b", 1)], [("out", 1)], lambda f, a, b: (f(a[0], b[0]),), reference)
+
+
+def _alu(op: str, code: int) -> Spec:
+    opcode = [(code >> i) & 1 for i in range(4)]
+
+    def call(alu, a, b):
+        result, flags = alu(a, b, list(opcode))
+        return (result,) + tuple(flags[name] for name in "ZCNV")
+
+    outputs = [("result", 8), ("Z", 1), ("C", 1), ("N", 1), ("V", 1)]
+    return Spec(f"alu_{op}", "alu", [("a", 8), ("b", 8)], outputs, call, _alu_reference(op), target="ALU")
+
+
+def _specs() -> dict:
+    specs = [
+        Spec("NOT", "gates", [("a", 1)], [("out", 1)], lambda f, a: (f(a[0]),), lambda a: (1 - a,)),
+        _gate("AND", lambda a, b: (a & b,)),
+        _gate("OR", lambda a, b: (a | b,)),
+        _gate("NAND", lambda a, b: (1 - (a & b),)),
+        _gate("NOR", lambda a, b: (1 - (a | b),)),
+        _gate("XOR", lambda a, b: (a ^ b,)),
+        _gate("XNOR", lambda a, b: (1 - (a ^ b),)),
+        Spec(
+            "half_adder",
+            "adders",
+            [("a", 1), ("b", 1)],
+            [("sum", 1), ("carry", 1)],
+            lambda f, a, b: f(a[0], b[0]),
+            lambda a, b: (a ^ b, a & b),
+        ),
+        Spec(
+            "full_adder",
+            "adders",
+            [("a", 1), ("b", 1), ("cin", 1)],
+            [("sum", 1), ("cout", 1)],
+            lambda f, a, b, cin: f(a[0], b[0], cin[0]),
+            lambda a, b, cin: ((a + b + cin) & 1, (a + b + cin) >> 1),
+        ),
+        Spec(
+            "ripple_carry_adder_8bit",
+            "adders",
+            [("a", 8), ("b", 8), ("cin", 1)],
+            [("sum", 8), ("cout", 1)],
+            lambda f, a, b, cin: f(a, b, cin[0]),
+            lambda a, b, cin: ((a + b + cin) & 0xFF, (a + b + cin) >> 8),
+        ),
+        Spec(
+            "subtractor_8bit",
+            "adders",
+            [("a", 8), ("b", 8)],
+            [("difference", 8), ("borrow", 1), ("overflow", 1)],
+            lambda f, a, b: f(a, b),
+            lambda a, b: ((a - b) & 0xFF, a < b, ((a ^ b) & (a ^ (a - b)) & 0x80) >> 7),
+        ),
+        Spec(
+            "twos_complement",
+            "adders",
+            [("bits", 8)],
+            [("result", 8)],
+            lambda f, bits: (f(bits),),
+            lambda bits: (-bits & 0xFF,),
+        ),
+        Spec(
+            "mux_2to1",
+            "combinational",
+            [("a", 1), ("b", 1), ("sel", 1)],
+            [("out", 1)],
+            lambda f, a, b, sel: (f(a[0], b[0], sel[0]),),
+            lambda a, b, sel: (np.where(sel == 1, b, a),),
+        ),
+        Spec(
+            "mux_4to1",
+            "combinational",
+            [("inputs", 4), ("sel", 2)],
+            [("out", 1)],
+            lambda f, inputs, sel: (f(inputs, sel),),
+            lambda inputs, sel: ((inputs >> sel) & 1,),
+        ),
+        Spec(
+            "mux_8to1",
+            "combinational",
+            [("inputs", 8), ("sel", 3)],
+            [("out", 1)],
+            lambda f, inputs, sel: (f(inputs, sel),),
+            lambda inputs, sel: ((inputs >> sel) & 1,),
+        ),
+        Spec(
+            "demux_1to2",
+            "combinational",
+            [("data", 1), ("sel", 1)],
+            [("out0", 1), ("out1", 1)],
+            lambda f, data, sel: f(data[0], sel[0]),
+            lambda data, sel: (data & (1 - sel), data & sel),
+        ),
+        Spec(
+            "demux_1to4",
+            "combinational",
+            [("data", 1), ("sel", 2)],
+            [("outputs", 4)],
+            lambda f, data, sel: (f(data[0], sel),),
+            lambda data, sel: (data << sel,),
+        ),
+        Spec(
+            "decoder_2to4",
+            "combinational",
+            [("sel", 2)],
+            [("outputs", 4)],
+            lambda f, sel: (f(sel),),
+            lambda sel: (1 << sel,),
+        ),
+        Spec(
+            "decoder_3to8",
+            "combinational",
+            [("sel", 3)],
+            [("outputs", 8)],
+            lambda f, sel: (f(sel),),
+            lambda sel: (1 << sel,),
+        ),
+        Spec(
+            "encoder_4to2",
+            "combinational",
+            [("inputs", 4)],
+            [("out", 2)],
+            lambda f, inputs: (f(inputs),),
+            _priority,
+        ),
+        Spec(
+            "encoder_8to3",
+            "combinational",
+            [("inputs", 8)],
+            [("out", 3)],
+            lambda f, inputs: (f(inputs),),
+            _priority,
+        ),
+    ]
+    for code, op in enumerate(ALU_OPS):
+        specs.append(_alu(op, code))
+    return {spec.name: spec for spec in specs}
+
+
+SPECS = _specs()
+
+
+def spec_names(name: str | None = None) -> list:
+    """Spec names for a spec, a component ('adders', 'alu', ...) or everything (None)."""
+    if name is None:
+        return list(SPECS)
+    if name in SPECS:
+        return [name]
+    names = [spec.name for spec in SPECS.values() if spec.component == name]
+    if not names:
+        raise KeyError(f"Unknown function or component: {name}")
+    return names
+
+
+# ----- Evaluation -----
+
+
+def _pack(value, width: int):
+    """Output value (a bit or a list of bits, LSB first) as an int or int array."""
+    if isinstance(value, (list, tuple)):
+        if len(value) != width:
+            raise ValueError(f"Expected {width} bits, got {len(value)}")
+        return sum(np.asarray(bit, dtype=np.int64) << i for i, bit in enumerate(value))
+    return np.asarray(value, dtype=np.int64)
+
+
+def _pack_int(value, width: int) -> int:
+    """Scalar version of _pack."""
+    if isinstance(value, (list, tuple)):
+        if len(value) != width:
+            raise ValueError(f"Expected {width} bits, got {len(value)}")
+        return sum(int(bit) << i for i, bit in enumerate(value))
+    if value is None:
+        raise ValueError("Returned None (function may be unimplemented)")
+    return int(value)
+
+
+def _run_batched(spec: Spec, values: list, count: int):
+    """One bit-sliced call over every case; raises if the implementation can't run on arrays."""
+    bits = [[(value >> i) & 1 for i in range(width)] for value, (_, width) in zip(values, spec.inputs)]
+    outputs = spec.call(spec.resolve(), *bits)
+    if len(outputs) != len(spec.outputs):
+        raise ValueError(f"Expected {len(spec.outputs)} outputs, got {len(outputs)}")
+    return np.stack([np.broadcast_to(_pack(out, w), (count,)) for out, (_, w) in zip(outputs, spec.outputs)])
+
+
+def _run_scalar(name: str, cases) -> tuple:
+    """Call the implementation once per case (any iterable of case numbers).
+
+    Returns:
+        (one row of packed values per output, first error message or None);
+        a case whose call raises gets -1 for every output
+    """
+    spec = SPECS[name]
+    impl = spec.resolve()
+    rows: list = [[] for _ in spec.outputs]
+    error = None
+    for case in cases:
+        case = int(case)
+        bits = [[(value >> i) & 1 for i in range(width)] for value, (_, width) in zip(spec.split(case), spec.inputs)]
+        try:
+            outputs = spec.call(impl, *bits)
+            if outputs is None or len(outputs) != len(spec.outputs):
+                raise ValueError(f"Expected {len(spec.outputs)} outputs, got {outputs!r}")
+            packed = [_pack_int(out, width) for out, (_, width) in zip(outputs, spec.outputs)]
+        except Exception as e:
+            packed = [-1] * len(spec.outputs)
+            error = error or f"{type(e).__name__}: {e}"
+        for row, value in zip(rows, packed):
+            row.append(value)
+    return rows, error
+
+
+def _sweep(spec: Spec, count: int, workers: int | None, chunk_size: int) -> tuple:
+    """Scalar calls over every case, chunked over a process pool."""
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    chunks = [range(start, min(start + chunk_size, count)) for start in range(0, count, chunk_size)]
+    if workers <= 1 or len(chunks) == 1:
+        results = [_run_scalar(spec.name, chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_scalar, [spec.name] * len(chunks), chunks))
+    rows = [[value for result in results for value in result[0][i]] for i in range(len(spec.outputs))]
+    return np.array(rows, dtype=np.int64), next((error for _, error in results if error), None)
+
+
+def verify(
+    name: str,
+    counterexamples: int = 5,
+    workers: int | None = None,
+    chunk_size: int = 8192,
+    batched: bool = True,
+) -> dict:
+    """Compare one function with its reference model on every possible input.
+
+    Args:
+        name: Spec name (see SPECS)
+        counterexamples: Report at most this many failing cases
+        workers: Worker processes for the scalar sweep (default: one per CPU)
+        chunk_size: Cases per scalar work item
+        batched: Try the bit-sliced call first
+
+    Returns:
+        Dict with name, cases, mode ('batched' or 'scalar'), mismatches, error
+        (first exception raised, if any), counterexamples (each with inputs,
+        expected and actual values by name; actual is None where the call
+        raised) and duration
+    """
+    if np is None:
+        raise ImportError("Exhaustive verification needs NumPy")
+    spec = SPECS[name]
+    start = time.perf_counter()
+    count = 1 << spec.bits
+    values = spec.split(np.arange(count, dtype=np.int64))
+    expected = np.stack([np.broadcast_to(np.asarray(v, dtype=np.int64), (count,)) for v in spec.reference(*values)])
+
+    actual = None
+    error = None
+    mode = "batched"
+    if batched:
+        try:
+            actual = _run_batched(spec, values, count)
+        except Exception:
+            actual = None
+    if actual is not None:
+        wrong = np.flatnonzero((actual != expected).any(axis=0))[:counterexamples]
+        # Array semantics can differ from ints (e.g. overflowing shifts): failures must reproduce per case
+        if wrong.size and not np.array_equal(np.array(_run_scalar(name, wrong)[0]), actual[:, wrong]):
+            actual = None
+    if actual is None:
+        mode = "scalar"
+        actual, error = _sweep(spec, count, workers, chunk_size)
+
+    mismatched = (actual != expected).any(axis=0)
+    examples = []
+    for case in np.flatnonzero(mismatched)[:counterexamples]:
+        examples.append(
+            {
+                "inputs": {n: int(v[case]) for (n, _), v in zip(spec.inputs, values)},
+                "expected": {n: int(expected[i, case]) for i, (n, _) in enumerate(spec.outputs)},
+                "actual": None
+                if actual[0, case] == -1
+                else {n: int(actual[i, case]) for i, (n, _) in enumerate(spec.outputs)},
+            }
+        )
+    return {
+        "name": name,
+        "cases": count,
+        "mode": mode,
+        "mismatches": int(mismatched.sum()),
+        "error": error,
+        "counterexamples": examples,
+        "duration": time.perf_counter() - start,
+    }
+
+
+def format_result(result: dict) -> str:
+    """Readable summary of a verify() result."""
+    status = "PASS" if not result["mismatches"] else "FAIL"
+    lines = [
+        f"  {result['name']}: {status} ({result['cases'] - result['mismatches']}/{result['cases']} cases,"
+        f" {result['mode']}) in {result['duration']:.2f}s"
+    ]
+    if result["error"]:
+        lines.append(f"    First error: {result['error']}")
+    for example in result["counterexamples"]:
+        inputs = ", ".join(f"{k}={v}" for k, v in example["inputs"].items())
+        expected = ", ".join(f"{k}={v}" for k, v in example["expected"].items())
+        actual = "error" if example["actual"] is None else ", ".join(f"{k}={v}" for k, v in example["actual"].items())
+        lines.append(f"    {inputs}: expected {expected}, got {actual}")
+    return "\n".join(lines)
@@ -0,0 +1,367 @@
+"""Fault-injection campaigns on the gate netlists of combinational components.
+
+A function from exhaustive.SPECS (an adder, a combinational circuit or an
+ALU operation) is traced into a netlist: it is called once with symbolic
+signals while the gate functions record every gate they compute. Each gate
+output is then a fault site, which can be stuck at 0, stuck at 1 or
+flipped. A fault is detected when some test vector makes an output of the
+faulty circuit differ from the fault-free one.
+
+Faults are simulated bit-parallel: every signal is one Python int whose
+bit 0 is the fault-free circuit and bit k the circuit with fault k, so a
+gate evaluates all faulty circuits at once with a single bitwise operation
+(64 faults per machine word, as many words as there are faults). The
+netlist is compiled into one straight-line Python function with the fault
+masks built in, and simulation stops once every fault is detected.
+
+Test vectors can be every input, random inputs, the inputs the checker's
+unit tests apply to the function, or the ALU operands a program produces.
+"""
+
+import importlib
+import random
+import sys
+import time
+from typing import Sequence
+
+from .exhaustive import ALU_OPS, SPECS
+
+GATES = {"NOT": 1, "AND": 2, "OR": 2, "XOR": 2, "NAND": 2, "NOR": 2, "XNOR": 2}
+KINDS = ["sa0", "sa1", "flip"]  # Stuck-at-0, stuck-at-1, bit flip
+
+# Python expression of each gate on machine words (`m` is the all-ones word)
+_EXPRESSIONS = {
+    "NOT": "{0} ^ m",
+    "AND": "{0} & {1}",
+    "OR": "{0} | {1}",
+    "XOR": "{0} ^ {1}",
+    "NAND": "({0} & {1}) ^ m",
+    "NOR": "({0} | {1}) ^ m",
+    "XNOR": "{0} ^ {1} ^ m",
+}
+
+
+class Signal:
+    """A symbolic wire while tracing: the netlist node that drives it."""
+
+    __slots__ = ("node",)
+
+    def __init__(self, node: int):
+        """Wire driven by netlist node `node`."""
+        self.node = node
+
+    def _not_a_bit(self, *args):
+        raise TypeError("A traced signal can only go into gate functions (the code branches on a bit value)")
+
+    __bool__ = __eq__ = __ne__ = __int__ = __index__ = _not_a_bit
+    __hash__ = object.__hash__
+
+
+class Netlist:
+    """Gates of a traced function.
+
+    Nodes 0 and 1 are the constants, then one node per input bit, then one
+    per gate in evaluation order; `outputs` lists the node of each output bit.
+    """
+
+    def __init__(self, name: str, input_names: list, gates: list, outputs: list):
+        """Build from traced gates ((kind, input nodes) per gate node)."""
+        self.name = name
+        self.input_names = input_names
+        self.first_gate = 2 + len(input_names)
+        self.gates = gates
+        self.outputs = outputs
+
+    def __len__(self) -> int:
+        """Number of gates."""
+        return len(self.gates)
+
+    def label(self, node: int) -> str:
+        """Short name of a node: 0, 1, an input bit (a3) or a gate (g12)."""
+        if node < 2:
+            return str(node)
+        if node < self.first_gate:
+            return self.input_names[node - 2]
+        return f"g{node - self.first_gate}"
+
+    def describe(self, node: int) -> str:
+        """A gate with its inputs, e.g. 'g12 = XOR(a3, g11)'."""
+        kind, inputs = self.gates[node - self.first_gate]
+        return f"{self.label(node)} = {kind}({', '.join(self.label(i) for i in inputs)})"
+
+    def faults(self, kinds=None) -> list:
+        """Every (gate node, kind) fault."""
+        kinds = KINDS if kinds is None else list(kinds)
+        for kind in kinds:
+            if kind not in KINDS:
+                raise ValueError(f"Unknown fault kind: {kind} (expected one of {', '.join(KINDS)})")
+        return [(self.first_gate + i, kind) for i in range(len(self.gates)) for kind in kinds]
+
+    def compile(self, faults: list):
+        """Straight-line function of the input words returning the output words, with faults built in."""
+        masks: dict = {}
+        for k, (node, kind) in enumerate(faults, start=1):
+            clear, set_, flip = masks.get(node, (0, 0, 0))
+            bit = 1 << k
+            if kind == "sa0":
+                clear |= bit
+            elif kind == "sa1":
+                set_ |= bit
+            else:
+                flip |= bit
+            masks[node] = (clear, set_, flip)
+
+        def name(node: int) -> str:
+            return ("z", "m")[node] if node < 2 else f"n{node}"
+
+        inputs = ", ".join(name(2 + i) for i in range(len(self.input_names)))
+        lines = [f"def run({inputs}):", f"    m = {(1 << (len(faults) + 1)) - 1}", "    z = 0"]
+        for i, (kind, operands) in enumerate(self.gates):
+            node = self.first_gate + i
+            lines.append(f"    {name(node)} = {_EXPRESSIONS[kind].format(*map(name, operands))}")
+            if node in masks:
+                clear, set_, flip = masks[node]
+                lines.append(f"    {name(node)} = (({name(node)} & ~{clear}) | {set_}) ^ {flip}")
+        lines.append(f"    return ({''.join(name(node) + ', ' for node in self.outputs)})")
+        namespace: dict = {}
+        exec("\n".join(lines), namespace)
+        return namespace["run"]
+
+    def evaluate(self, case: int) -> list:
+        """Fault-free output bits for one input case (bit i of case = input bit i)."""
+        run = self.compile([])
+        return [word & 1 for word in run(*[(case >> i) & 1 for i in range(len(self.input_names))])]
+
+
+def _computer_modules() -> list:
+    return [module for name, module in list(sys.modules.items()) if name.startswith("computer.") and module]
+
+
+def trace(name: str) -> Netlist:
+    """Trace a spec's implementation into a netlist by calling it once with symbolic inputs."""
+    spec = SPECS[name]
+    gates_module = importlib.import_module("computer.gates")
+    originals = {gate: getattr(gates_module, gate) for gate in GATES}
+    gates: list = []
+    first_gate = 2 + spec.bits
+
+    def traced(kind):
+        original = originals[kind]
+
+        def gate(*args):
+            if not any(isinstance(arg, Signal) for arg in args):
+                return original(*args)  # Constant inputs: nothing to trace
+            nodes = []
+            for arg in args:
+                if isinstance(arg, Signal):
+                    nodes.append(arg.node)
+                elif arg in (0, 1):
+                    nodes.append(int(arg))
+                else:
+                    raise TypeError(f"{kind} got {arg!r} instead of a bit")
+            gates.append((kind, nodes))
+            return Signal(first_gate + len(gates) - 1)
+
+        return gate
+
+    replacements = {original: traced(kind) for kind, original in originals.items()}
+    patched = []
+    for module in _computer_modules():
+        for attr, value in list(vars(module).items()):
+            if callable(value) and value in replacements:
+                patched.append((module, attr, value))
+                setattr(module, attr, replacements[value])
+
+    input_names = []
+    inputs = []
+    node = 2
+    for input_name, width in spec.inputs:
+        bits = []
+        for i in range(width):
+            input_names.append(input_name if width == 1 else f"{input_name}{i}")
+            bits.append(Signal(node))
+            node += 1
+        inputs.append(bits)
+    try:
+        results = spec.call(spec.resolve(), *inputs)  # Resolved after patching, so gate specs trace too
+    finally:
+        for module, attr, value in patched:
+            setattr(module, attr, value)
+
+    outputs = []
+    for value, (output_name, width) in zip(results, spec.outputs):
+        bits = list(value) if width > 1 or isinstance(value, (list, tuple)) else [value]
+        if len(bits) != width:
+            raise ValueError(f"{name}: expected {width} bits for {output_name}, got {len(bits)}")
+        for bit in bits:
+            if isinstance(bit, Signal):
+                outputs.append(bit.node)
+            elif bit in (0, 1):
+                outputs.append(int(bit))
+            else:
+                raise TypeError(f"{name}: output {output_name} is {bit!r}, not a bit")
+    return Netlist(name, input_names, gates, outputs)
+
+
+def simulate(netlist: Netlist, faults: list, vectors) -> list:
+    """Run test vectors on all faulty circuits at once.
+
+    Returns:
+        For each fault, the index of the first vector that detects it (None if undetected)
+    """
+    run = netlist.compile(faults)
+    everything = (1 << (len(faults) + 1)) - 2  # Bits of the faulty circuits
+    width = len(netlist.input_names)
+    words = [0, (1 << (len(faults) + 1)) - 1]
+    detected = 0
+    first: list = [None] * len(faults)
+    for index, case in enumerate(vectors):
+        outputs = run(*[words[(case >> i) & 1] for i in range(width)])
+        wrong = 0
+        for word in outputs:
+            wrong |= word ^ words[word & 1]  # Differs from the fault-free circuit (bit 0)
+        new = wrong & ~detected
+        if new:
+            detected |= new
+            for k in range(len(faults)):
+                if new >> (k + 1) & 1:
+                    first[k] = index
+            if detected == everything:
+                break
+    return first
+
+
+def _case(spec, args) -> int | None:
+    """Input case of a recorded call (None if it doesn't fit the spec)."""
+    if spec.target == "ALU":
+        a, b, opcode = args[:3]
+        if sum(bit << i for i, bit in enumerate(opcode)) != ALU_OPS.index(spec.name[4:]):
+            return None
+        args = (a, b)
+    bits = []
+    for arg in args:
+        bits.extend(list(arg) if isinstance(arg, (list, tuple)) or hasattr(arg, "__len__") else [arg])
+    if len(bits) > spec.bits or any(bit not in (0, 1) for bit in bits):
+        return None
+    return sum(int(bit) << i for i, bit in enumerate(bits))  # Omitted arguments (cin) are 0
+
+
+def _recording(spec, cases: list):
+    """Replace the spec's function with one recording its inputs; returns a restore function."""
+    module = importlib.import_module(f"computer.{spec.component}")
+    target = getattr(module, spec.target)
+    method = isinstance(target, type)  # A class (the ALU): record calls to its instances
+    owner, attr = (target, "__call__") if method else (module, spec.target)
+    original = getattr(owner, attr)
+
+    def record(*args):
+        case = _case(spec, args[1:] if method else args)
+        if case is not None:
+            cases.append(case)
+        return original(*args)
+
+    setattr(owner, attr, record)
+    return lambda: setattr(owner, attr, original)
+
+
+def vectors_from_tests(name: str) -> list:
+    """Input cases the checker's unit tests apply directly to a spec's function (in order, no repeats)."""
+    from .tests import COMPONENT_TESTS
+
+    spec = SPECS[name]
+    cases: list = []
+    restore = _recording(spec, cases)
+    try:
+        for test in COMPONENT_TESTS[spec.component]().values():
+            try:
+                test()
+            except Exception:
+                pass  # Failing tests still contribute the vectors they applied
+    finally:
+        restore()
+    return list(dict.fromkeys(cases))
+
+
+def vectors_from_program(source, max_cycles: int = 1000) -> dict:
+    """ALU operands a program produces, as {'alu_<op>': cases} (in order, no repeats)."""
+    from computer.system import Computer
+
+    recorded: dict = {f"alu_{op}": [] for op in ALU_OPS}
+    restores = [_recording(SPECS[name], cases) for name, cases in recorded.items()]
+    try:
+        computer = Computer()
+        computer.load_program(source)
+        computer.cpu.run(max_cycles)
+    finally:
+        for restore in reversed(restores):
+            restore()
+    return {name: list(dict.fromkeys(cases)) for name, cases in recorded.items() if cases}
+
+
+def campaign(name: str, vectors="tests", kinds=None, seed: int = 0) -> dict:
+    """Inject every fault into a spec's netlist and classify it as detected or undetected.
+
+    Args:
+        name: Spec name ('full_adder', 'alu_add', ...)
+        vectors: 'tests' (the unit tests' inputs), 'exhaustive', a number of
+            random inputs, or a list of input cases
+        kinds: Fault kinds to inject (default: sa0, sa1 and flip)
+        seed: Seed for random vectors
+
+    Returns:
+        Dict with name, gates, vectors, faults, detected, coverage, by_kind
+        ({kind: [detected, total]}), undetected (gate descriptions with the
+        fault kind) and duration
+    """
+    start = time.perf_counter()
+    spec = SPECS[name]
+    netlist = trace(name)
+    cases: Sequence[int]
+    if vectors == "tests":
+        cases = vectors_from_tests(name)
+    elif vectors == "exhaustive":
+        cases = range(1 << spec.bits)
+    elif isinstance(vectors, int):
+        rng = random.Random(seed)
+        cases = [rng.getrandbits(spec.bits) for _ in range(vectors)]
+    else:
+        cases = list(vectors)
+    faults = netlist.faults(kinds)
+    first = simulate(netlist, faults, cases)
+
+    by_kind: dict = {}
+    undetected = []
+    for (node, kind), index in zip(faults, first):
+        counts = by_kind.setdefault(kind, [0, 0])
+        counts[1] += 1
+        if index is None:
+            undetected.append(f"{netlist.describe(node)} {kind}")
+        else:
+            counts[0] += 1
+    detected = len(faults) - len(undetected)
+    return {
+        "name": name,
+        "gates": len(netlist),
+        "vectors": len(cases),
+        "faults": len(faults),
+        "detected": detected,
+        "coverage": detected / len(faults) if faults else 1.0,
+        "by_kind": by_kind,
+        "undetected": undetected,
+        "duration": time.perf_counter() - start,
+    }
+
+
+def format_campaign(report: dict, limit: int = 5) -> str:
+    """Readable summary of a campaign() result, listing at most `limit` undetected faults."""
+    kinds = ", ".join(f"{kind} {d}/{t}" for kind, (d, t) in report["by_kind"].items())
+    lines = [
+        f"  {report['name']}: {report['detected']}/{report['faults']} faults detected"
+        f" ({report['coverage']:.1%}) in {report['gates']} gates with {report['vectors']} vectors"
+        f" in {report['duration']:.2f}s ({kinds})"
+    ]
+    for fault in report["undetected"][:limit]:
+        lines.append(f"    undetected: {fault}")
+    if len(report["undetected"]) > limit:
+        lines.append(f"    ... and {len(report['undetected']) - limit} more")
+    return "\n".join(lines)
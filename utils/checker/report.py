@@ -0,0 +1,163 @@
+"""Component runs with timing, process-pool parallelism and JSON/JUnit output."""
+
+import json
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+
+from . import cache
+from .runner import run_tests
+from .tests import COMPONENT_TESTS
+
+
+def run_component(component_name: str, timeout: float | None = None) -> dict:
+    """Run one component's tests and return a picklable summary.
+
+    Args:
+        component_name: Key of COMPONENT_TESTS
+        timeout: Seconds allowed per test (None for no limit)
+
+    Returns:
+        Dict with component, passed, failed, errors, duration, load_error and
+        tests (name, passed, error, duration for each test)
+    """
+    start = time.perf_counter()
+    summary = {"component": component_name, "passed": 0, "failed": 0, "errors": 0, "load_error": None, "tests": []}
+    try:
+        test_cases = COMPONENT_TESTS[component_name]()
+    except Exception as e:
+        summary["errors"] = 1
+        summary["load_error"] = f"{type(e).__name__}: {e}"
+    else:
+        passed, failed, errors, results = run_tests(test_cases, timeout=timeout)
+        summary.update(passed=passed, failed=failed, errors=errors)
+        summary["tests"] = [
+            {"name": r.name, "passed": r.passed, "error": r.error, "duration": r.duration} for r in results
+        ]
+    summary["duration"] = time.perf_counter() - start
+    return summary
+
+
+def run_components(
+    components: list | None = None,
+    parallel: int | None = None,
+    timeout: float | None = None,
+    use_cache: bool = False,
+) -> list:
+    """Run components in order, or in a pool of `parallel` worker processes.
+
+    With use_cache, components whose sources are unchanged since their last
+    passing run are not run again; their summaries come from the cache with
+    "cached" set. Results are returned in the order of `components` either way.
+    """
+    components = list(COMPONENT_TESTS) if components is None else components
+    summaries = {}
+    digests = {}
+    if use_cache:
+        for name in components:
+            digests[name] = cache.component_hash(name)
+            cached = cache.load(name, digests[name])
+            if cached is not None:
+                summaries[name] = dict(cached, cached=True)
+
+    pending = [name for name in components if name not in summaries]
+    if not parallel or parallel <= 1 or len(pending) <= 1:
+        results = [run_component(name, timeout) for name in pending]
+    else:
+        results = _run_pool(pending, parallel, timeout)
+
+    for summary in results:
+        summary["cached"] = False
+        summaries[summary["component"]] = summary
+        if use_cache:
+            cache.store(summary["component"], digests[summary["component"]], summary)
+    return [summaries[name] for name in components]
+
+
+def _component_limit(component_name: str, timeout: float | None) -> float | None:
+    """Seconds a worker may take for a component: `timeout` per test, plus one for loading."""
+    if not timeout:
+        return None
+    try:
+        count = len(COMPONENT_TESTS[component_name]())
+    except Exception:
+        count = 0
+    return timeout * (count + 1)
+
+
+def _run_pool(components: list, parallel: int, timeout: float | None) -> list:
+    """Run components in worker processes; a worker that overruns its limit is reported as an error.
+
+    SIGALRM stops most hanging tests inside the worker, but not one that
+    swallows the TimeoutError or blocks outside Python. Such a worker is
+    killed once every other component has finished.
+    """
+    pool = ProcessPoolExecutor(max_workers=parallel)
+    futures = [pool.submit(run_component, name, timeout) for name in components]
+    results = []
+    hung = False
+    for name, future in zip(components, futures):
+        limit = _component_limit(name, timeout)
+        try:
+            results.append(future.result(timeout=limit))
+        except FutureTimeoutError:
+            hung = True
+            results.append(
+                {
+                    "component": name,
+                    "passed": 0,
+                    "failed": 0,
+                    "errors": 1,
+                    "load_error": f"TimeoutError: component did not finish within {limit}s",
+                    "tests": [],
+                    "duration": limit,
+                }
+            )
+    if hung:
+        # ProcessPoolExecutor has no public way to stop a busy worker before Python 3.14
+        for process in list(pool._processes.values()):
+            process.terminate()
+    pool.shutdown(cancel_futures=True)
+    return results
+
+
+def slowest_tests(summaries: list, count: int = 5) -> list:
+    """The `count` slowest tests as (component, test name, seconds)."""
+    timings = [(s["component"], t["name"], t["duration"]) for s in summaries for t in s["tests"]]
+    return sorted(timings, key=lambda timing: -timing[2])[:count]
+
+
+def to_json(summaries: list, wall_time: float = 0.0) -> str:
+    """Serialize summaries (plus totals) as JSON."""
+    totals = {key: sum(s[key] for s in summaries) for key in ("passed", "failed", "errors")}
+    return json.dumps({"totals": totals, "wall_time": wall_time, "components": summaries}, indent=2)
+
+
+def to_junit(summaries: list) -> str:
+    """Serialize summaries as JUnit XML (one testsuite per component)."""
+    root = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0}
+    for summary in summaries:
+        suite = ET.SubElement(root, "testsuite", name=summary["component"])
+        tests = summary["passed"] + summary["failed"] + summary["errors"]
+        suite.set("tests", str(tests))
+        suite.set("failures", str(summary["failed"]))
+        suite.set("errors", str(summary["errors"]))
+        suite.set("time", f"{summary['duration']:.6f}")
+        if summary["load_error"]:
+            case = ET.SubElement(suite, "testcase", classname=summary["component"], name="load_tests", time="0")
+            ET.SubElement(case, "error", message=summary["load_error"])
+        for test in summary["tests"]:
+            case = ET.SubElement(
+                suite, "testcase", classname=summary["component"], name=test["name"], time=f"{test['duration']:.6f}"
+            )
+            if not test["passed"]:
+                error = test["error"] or "Assertion failed"
+                tag = "error" if "Error" in error or "Exception" in error else "failure"
+                ET.SubElement(case, tag, message=error)
+        totals["tests"] += tests
+        totals["failures"] += summary["failed"]
+        totals["errors"] += summary["errors"]
+    for attribute, value in totals.items():
+        root.set(attribute, str(value))
+    return ET.tostring(root, encoding="unicode")
@@ -1,14 +1,20 @@
 """Test runner utilities for the checker."""
 
+import signal
+import threading
+import time
+from contextlib import contextmanager
+
 
 class TestResult:
     """Result of a single test."""
 
-    def __init__(self, name: str, passed: bool, error: str | None = None):
+    def __init__(self, name: str, passed: bool, error: str | None = None, duration: float = 0.0):
         """Initialize test result."""
         self.name = name
         self.passed = passed
         self.error = error
+        self.duration = duration
 
     def __repr__(self):
         """Return string representation."""
@@ -16,23 +22,52 @@ class TestResult:
         return f"TestResult({self.name}: {status})"
 
 
-def run_test(name: str, test_fn) -> TestResult:
-    """Run a single test function and return the result."""
+@contextmanager
+def time_limit(seconds: float | None):
+    """Raise TimeoutError in the block after `seconds`.
+
+    Uses SIGALRM, so the limit only applies on Unix in the main thread
+    (for example in a worker process); elsewhere the block runs unlimited.
+    """
+    usable = hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+    if seconds is None or seconds == 0 or not usable:
+        yield
+        return
+
+    def expire(signum, frame):
+        raise TimeoutError(f"Test timed out after {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def run_test(name: str, test_fn, timeout: float | None = None) -> TestResult:
+    """Run a single test function and return the result (with its duration)."""
+    start = time.perf_counter()
     try:
-        test_fn()
-        return TestResult(name, True)
+        with time_limit(timeout):
+            test_fn()
+        result = TestResult(name, True)
     except AssertionError as e:
-        return TestResult(name, False, str(e) if str(e) else "Assertion failed")
+        result = TestResult(name, False, str(e) if str(e) else "Assertion failed")
     except Exception as e:
-        return TestResult(name, False, f"{type(e).__name__}: {e}")
+        result = TestResult(name, False, f"{type(e).__name__}: {e}")
+    result.duration = time.perf_counter() - start
+    return result
 
 
-def run_tests(test_cases: dict, exercise: str | None = None) -> tuple:
+def run_tests(test_cases: dict, exercise: str | None = None, timeout: float | None = None) -> tuple:
     """Run a set of test cases and return (passed, failed, errors, results).
 
     Args:
         test_cases: Dict mapping test names to test functions
         exercise: Optional filter to run only tests containing this string
+        timeout: Optional limit in seconds for each test
 
     Returns:
         Tuple of (passed_count, failed_count, error_count, results_list)
@@ -47,7 +82,7 @@ def run_tests(test_cases: dict, exercise: str | None = None) -> tuple:
         if exercise and exercise.lower() not in name.lower():
             continue
 
-        result = run_test(name, test_fn)
+        result = run_test(name, test_fn, timeout)
         results.append(result)
 
         if result.passed:
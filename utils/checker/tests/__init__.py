@@ -16,6 +16,26 @@ from .test_datapath import get_tests as get_datapath_tests
 from .test_cpu import get_tests as get_cpu_tests
 from .test_assembler import get_tests as get_assembler_tests
 from .test_system import get_tests as get_system_tests
+from .test_linker import get_tests as get_linker_tests
+from .test_disassembler import get_tests as get_disassembler_tests
+from .test_optimizer import get_tests as get_optimizer_tests
+from .test_compiler import get_tests as get_compiler_tests
+from .test_fastcpu import get_tests as get_fastcpu_tests
+from .test_pipeline import get_tests as get_pipeline_tests
+from .test_predictor import get_tests as get_predictor_tests
+from .test_cache import get_tests as get_cache_tests
+from .test_bus import get_tests as get_bus_tests
+from .test_interrupts import get_tests as get_interrupts_tests
+from .test_multicore import get_tests as get_multicore_tests
+from .test_dma import get_tests as get_dma_tests
+from .test_trace import get_tests as get_trace_tests
+from .test_vcd import get_tests as get_vcd_tests
+from .test_debugger import get_tests as get_debugger_tests
+from .test_cosim import get_tests as get_cosim_tests
+from .test_fuzzer import get_tests as get_fuzzer_tests
+from .test_bits import get_tests as get_bits_tests
+from .test_memoalu import get_tests as get_memoalu_tests
+from .test_flags import get_tests as get_flags_tests
 
 # Component to test function mapping
 COMPONENT_TESTS = {
@@ -35,6 +55,26 @@ COMPONENT_TESTS = {
     "cpu": get_cpu_tests,
     "assembler": get_assembler_tests,
     "system": get_system_tests,
+    "linker": get_linker_tests,
+    "disassembler": get_disassembler_tests,
+    "optimizer": get_optimizer_tests,
+    "compiler": get_compiler_tests,
+    "fastcpu": get_fastcpu_tests,
+    "pipeline": get_pipeline_tests,
+    "predictor": get_predictor_tests,
+    "cache": get_cache_tests,
+    "bus": get_bus_tests,
+    "interrupts": get_interrupts_tests,
+    "multicore": get_multicore_tests,
+    "dma": get_dma_tests,
+    "trace": get_trace_tests,
+    "vcd": get_vcd_tests,
+    "debugger": get_debugger_tests,
+    "cosim": get_cosim_tests,
+    "fuzzer": get_fuzzer_tests,
+    "bits": get_bits_tests,
+    "memoalu": get_memoalu_tests,
+    "flags": get_flags_tests,
 }
 
 __all__ = ["COMPONENT_TESTS"]
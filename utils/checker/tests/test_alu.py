@@ -69,6 +69,12 @@ def get_tests() -> dict:
         "ALU_cmp_greater": lambda: _test_alu_cmp(make_alu(), 10, 5, {"Z": 0, "C": 0}),
         "ALU_cmp_less": lambda: _test_alu_cmp(make_alu(), 5, 10, {"Z": 0}),
         "ALU_cmp_preserves_a": lambda: _test_alu_cmp_preserves(make_alu()),
+        # All four flags
+        "ALU_flags_add_overflow": lambda: _test_alu_flags(make_alu(), 0x7F, 0x01, ALU.OP_ADD, [0, 0, 1, 1]),
+        "ALU_flags_add_carry_overflow": lambda: _test_alu_flags(make_alu(), 0x80, 0x80, ALU.OP_ADD, [1, 1, 0, 1]),
+        "ALU_flags_sub_overflow": lambda: _test_alu_flags(make_alu(), 0x80, 0x01, ALU.OP_SUB, [0, 0, 0, 1]),
+        "ALU_flags_cmp_borrow": lambda: _test_alu_flags(make_alu(), 0x01, 0x02, ALU.OP_CMP, [0, 1, 1, 0]),
+        "ALU_flags_after_result_changes": lambda: _test_alu_flags_kept(make_alu()),
     }
 
 
@@ -145,3 +151,21 @@ def _test_alu_cmp_preserves(alu):
         assert_not_none(output, "ALU returned None")
         result, _ = output
         assert_eq(bits_to_int(result), a_val)
+
+
+def _test_alu_flags(alu, a_val, b_val, op, expected):
+    """Test Z, C, N, V together (expected in that order)."""
+    output = alu(int_to_bits(a_val, 8), int_to_bits(b_val, 8), op)
+    assert_not_none(output, "ALU returned None")
+    _, flags = output
+    assert_eq({name: flags[name] for name in "ZCNV"}, dict(zip("ZCNV", expected)))
+
+
+def _test_alu_flags_kept(alu):
+    """Test flags still describe the result after the caller changes the result bits."""
+    from computer.alu import ALU
+
+    result, flags = alu(int_to_bits(0x80, 8), int_to_bits(0x01, 8), ALU.OP_ADD)
+    if isinstance(result, list):
+        result[:] = [0] * 8
+    assert_eq({name: flags[name] for name in "ZCNV"}, {"Z": 0, "C": 0, "N": 1, "V": 0})
@@ -0,0 +1,152 @@
+"""Test cases for bit conversion."""
+
+from ..helpers import assert_eq, assert_true
+
+
+def get_tests() -> dict:
+    """Return all test cases for bit conversion."""
+    from computer.bits import int_to_bits  # noqa: F401
+
+    return {
+        "Bits_int_to_bits": lambda: _test_int_to_bits(),
+        "Bits_bits_to_int": lambda: _test_bits_to_int(),
+        "Bits_new_lists": lambda: _test_new_lists(),
+        "Bits_rows": lambda: _test_rows(),
+        "Bits_matrix": lambda: _test_matrix(),
+        # BitVector
+        "BitVector_list_compatible": lambda: _test_vector_list_compatible(),
+        "BitVector_immutable": lambda: _test_vector_immutable(),
+        "BitVector_shared": lambda: _test_vector_shared(),
+    }
+
+
+def _test_int_to_bits():
+    """Test int_to_bits matches shifting for every width."""
+    from computer.bits import int_to_bits
+
+    for num_bits in (1, 3, 4, 8, 12, 16, 20):
+        for value in (0, 1, 5, 0x7F, 0x80, 0xFF, 0x1234, 0xFFFF, 0xABCDE, -1):
+            expected = [(value >> i) & 1 for i in range(num_bits)]
+            assert_eq(int_to_bits(value, num_bits), expected, f"int_to_bits({value}, {num_bits})")
+
+
+def _test_bits_to_int():
+    """Test bits_to_int for every byte, 16-bit words and other widths."""
+    from computer.bits import bits_to_int
+
+    for value in range(256):
+        assert_eq(bits_to_int([(value >> i) & 1 for i in range(8)]), value)
+    for value in (0, 0x00FF, 0x1234, 0xFFFF):
+        assert_eq(bits_to_int([(value >> i) & 1 for i in range(16)]), value)
+    assert_eq(bits_to_int([]), 0)
+    assert_eq(bits_to_int([1] * 12), 0xFFF)
+    assert_eq(bits_to_int(iter([1, 0, 1])), 5, "Any iterable of bits")
+
+
+def _test_new_lists():
+    """Test returned lists can be modified without changing the tables."""
+    from computer.bits import int_to_bits
+
+    bits = int_to_bits(0)
+    bits[0] = 1
+    assert_eq(int_to_bits(0), [0] * 8)
+    word = int_to_bits(0, 16)
+    word[15] = 1
+    assert_eq(int_to_bits(0, 16), [0] * 16)
+
+
+def _test_rows():
+    """Test whole-memory conversion round-trips."""
+    from computer.bits import bit_rows_to_bytes, bytes_to_bit_rows
+
+    data = bytes(range(256))
+    rows = bytes_to_bit_rows(data)
+    assert_eq(len(rows), 256)
+    assert_eq(rows[5], [1, 0, 1, 0, 0, 0, 0, 0])
+    assert_true(rows[0] is not rows[1], "Each row is its own list")
+    assert_eq(bit_rows_to_bytes(rows), data)
+
+
+def _test_matrix():
+    """Test the NumPy matrix conversion (skipped without NumPy)."""
+    from computer import bits
+
+    if bits.np is None:
+        return
+    from computer.bits import bit_matrix_to_bytes, bytes_to_bit_matrix
+
+    data = bytes([0, 1, 5, 0x80, 0xFF])
+    matrix = bytes_to_bit_matrix(data)
+    assert_eq(matrix.shape, (5, 8))
+    assert_eq(matrix[2].tolist(), [1, 0, 1, 0, 0, 0, 0, 0])
+    assert_eq(bit_matrix_to_bytes(matrix), data)
+
+
+def _test_vector_list_compatible():
+    """Test BitVector indexes, slices, iterates and compares like a bit list."""
+    from computer.bits import BitVector
+
+    bits = [1, 0, 1, 1, 0, 0, 0, 1, 0, 1, 0, 0, 1, 0, 0, 0]
+    vector = BitVector(bits)
+    assert_eq(vector, bits)
+    assert_eq(len(vector), 16)
+    assert_eq(int(vector), 0x128D)
+    assert_eq([vector[i] for i in range(16)], bits)
+    assert_eq(vector[-1], 0)
+    assert_eq(list(vector), bits)
+    assert_eq(vector[8:], bits[8:])
+    assert_eq(vector[::2], bits[::2])
+    assert_eq(vector[:8] + vector[8:], vector, "+ concatenates")
+    assert_eq([1, 0] + BitVector([1]), [1, 0, 1])
+    assert_eq(BitVector.from_int(-1, 4), [1, 1, 1, 1])
+    assert_true(vector != bits[:8] and vector != BitVector(bits[:8]))
+    try:
+        vector[16]
+        assert_true(False, "Index past the end should raise IndexError")
+    except IndexError:
+        pass
+    try:
+        BitVector([0, 2])
+        assert_true(False, "Bits other than 0/1 should raise ValueError")
+    except ValueError:
+        pass
+
+
+def _test_vector_immutable():
+    """Test BitVector cannot change and can be used as a dict key."""
+    from computer.bits import BitVector
+
+    vector = BitVector.from_int(5)
+    for change in (lambda: vector.__setitem__(0, 0), lambda: setattr(vector, "value", 6)):
+        try:
+            change()
+            assert_true(False, "BitVector should be immutable")
+        except (TypeError, AttributeError):
+            pass
+    assert_true(BitVector(vector) is vector and vector.copy() is vector, "No copies are needed")
+    assert_true(BitVector([1, 0, 1, 0, 0, 0, 0, 0]) is vector, "Bytes are interned")
+    cache = {vector: "five"}
+    assert_eq(cache[BitVector.from_int(5)], "five")
+    # Equal objects must hash alike, so a BitVector never equals a tuple (whose hash differs)
+    assert_true(vector != (1, 0, 1, 0, 0, 0, 0, 0))
+    assert_true((1, 0, 1, 0, 0, 0, 0, 0) not in cache)
+
+
+def _test_vector_shared():
+    """Test RAM and IR hand out the same immutable value without copying."""
+    from computer.bits import BitVector
+    from computer.system import Computer
+
+    computer = Computer()
+    computer.load_program("LOAD R1, 0x80\nHALT")
+    datapath = computer.cpu.datapath
+    ram = datapath.memory
+    row = ram.read([0] * 8)
+    assert_true(isinstance(row, BitVector) and ram.read([0] * 8) is row)
+    datapath.load_instruction(datapath.fetch_instruction())
+    assert_eq(datapath.ir, [0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 1, 0, 0, 0])
+    ir = datapath.ir
+    datapath.load_instruction(ir)
+    assert_true(datapath.ir is ir)
+    ram.write([0] * 8, [1] * 8, 1)
+    assert_eq(row, [0, 0, 0, 0, 0, 0, 0, 1], "Earlier reads keep their value")
@@ -0,0 +1,164 @@
+"""Test cases for memory-mapped I/O bus."""
+
+from ..helpers import assert_eq, assert_true, assert_not_none, int_to_bits
+
+
+HELLO = """
+    LOAD R0, h
+    STORE R0, 0xF0
+    LOAD R0, i
+    STORE R0, 0xF0
+    HALT
+h: .byte 72
+i: .byte 73
+"""
+
+# Copy input to output until the input is exhausted
+ECHO = """
+loop:
+    LOAD R1, 0xF3
+    OR R1, R1, R1
+    JZ done
+    LOAD R0, 0xF2
+    STORE R0, 0xF0
+    JMP loop
+done:
+    HALT
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for memory-mapped I/O bus."""
+    from computer.bus import Bus  # noqa: F401
+
+    return {
+        # Devices
+        "Bus_console_buffering": lambda: _test_console_buffering(),
+        "Bus_input_port": lambda: _test_input_port(),
+        "Bus_cycle_counter": lambda: _test_cycle_counter(),
+        # Address decoding
+        "Bus_ram_passthrough": lambda: _test_ram_passthrough(),
+        "Bus_page_table": lambda: _test_page_table(),
+        # Programs
+        "Bus_hello": lambda: _test_hello(),
+        "Bus_echo": lambda: _test_echo(),
+        "Bus_volatile_loads": lambda: _test_volatile_loads(),
+    }
+
+
+def _test_console_buffering():
+    """Test bytes reach the sink in chunks of buffer_size."""
+    from computer.bus import ConsoleOutput
+
+    chunks = []
+    console = ConsoleOutput(chunks.append, buffer_size=4)
+    for value in b"abcdef":
+        console.write(0, value)
+    assert_eq(chunks, [b"abcd"])
+    assert_eq(console.read(1), 2, "Two bytes should be pending")
+    console.flush()
+    assert_eq(chunks, [b"abcd", b"ef"])
+    assert_eq(console.text(), "abcdef")
+
+
+def _test_input_port():
+    """Test reading from an iterator."""
+    from computer.bus import InputPort
+
+    port = InputPort(iter([7, 8]))
+    assert_eq(port.read(1), 1)
+    assert_eq(port.read(0), 7)
+    assert_eq(port.read(0), 8)
+    assert_eq(port.read(1), 0, "Status should be 0 when exhausted")
+    assert_eq(port.read(0), 0)
+
+
+def _test_cycle_counter():
+    """Test the counter follows the clock."""
+    from computer.bus import CycleCounter
+    from computer.clock import Clock
+
+    clock = Clock()
+    counter = CycleCounter(clock)
+    for _ in range(2 * 300):
+        clock.tick()
+    assert_eq((counter.read(1) << 8) | counter.read(0), 300)
+    counter.write(0, 0)
+    assert_eq(counter.read(0), 0, "Writing should restart the counter")
+
+
+def _test_ram_passthrough():
+    """Test unmapped addresses behave like RAM."""
+    from computer.bus import Bus, ConsoleOutput
+    from computer.memory import RAM
+
+    ram = RAM()
+    bus = Bus(ram)
+    bus.map(0xF0, ConsoleOutput())
+    bus.write(int_to_bits(0x20, 8), int_to_bits(99, 8), 1)
+    result = bus.read(int_to_bits(0x20, 8))
+    assert_not_none(result, "Bus.read() returned None")
+    assert_eq(result, int_to_bits(99, 8))
+    bus.write(int_to_bits(0xF8, 8), int_to_bits(5, 8), 1)
+    assert_eq(bus.read(int_to_bits(0xF8, 8)), int_to_bits(5, 8), "Unmapped address in a device page is RAM")
+    assert_eq(ram.memory[0xF0], [0] * 8, "Device writes must not reach RAM")
+
+
+def _test_page_table():
+    """Test only device pages get an address table."""
+    from computer.bus import Bus, InputPort
+    from computer.memory import RAM
+
+    bus = Bus(RAM())
+    bus.map(0x42, InputPort())
+    assert_eq(sum(page is not None for page in bus.pages), 1)
+    assert_eq(bus.device_addresses(), {0x42, 0x43})
+    try:
+        bus.map(0x43, InputPort())
+    except ValueError:
+        return
+    assert_true(False, "Mapping over a device should raise ValueError")
+
+
+def _test_hello():
+    """Test a program printing through the console."""
+    from computer.bus import IOSystem
+    from computer.system import Computer
+
+    computer = Computer()
+    io = IOSystem(computer)
+    computer.load_program(HELLO)
+    computer.run()
+    assert_eq(io.console.text(), "HI")
+
+
+def _test_echo():
+    """Test polling the input port."""
+    from computer.bus import IOSystem
+    from computer.system import Computer
+
+    chunks = []
+    computer = Computer()
+    io = IOSystem(computer, "echo", chunks.append)
+    computer.load_program(ECHO)
+    state = computer.run()
+    assert_eq(state["halted"], True)
+    io.flush()
+    assert_eq(b"".join(chunks), b"echo")
+    assert_eq(len(chunks), 1, "Output should be flushed in one bulk write")
+
+
+def _test_volatile_loads():
+    """Test the optimizer never folds repeated loads from a device."""
+    from computer.assembler import Assembler
+    from computer.bus import INPUT_DATA, IOSystem
+    from computer.system import Computer
+
+    computer = Computer()
+    computer.assembler = Assembler(optimize=True)
+    io = IOSystem(computer, [1, 2])
+    assert_true(INPUT_DATA in computer.assembler.optimizer.volatile)
+    computer.load_program("LOAD R0, 0xF2\nLOAD R1, 0xF2\nHALT")
+    state = computer.run()
+    assert_eq((state["registers"]["R0"], state["registers"]["R1"]), (1, 2))
+    assert_eq(io.input.read(1), 0)
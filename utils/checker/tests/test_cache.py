@@ -0,0 +1,164 @@
+"""Test cases for cache hierarchy."""
+
+from ..helpers import assert_eq, assert_true, assert_not_none
+
+
+SUM_ARRAY = """
+    LOAD R0, a
+    LOAD R1, b
+    ADD R0, R0, R1
+    LOAD R1, c
+    ADD R0, R0, R1
+    LOAD R1, d
+    ADD R0, R0, R1
+    STORE R0, total
+    HALT
+a: .byte 1
+b: .byte 2
+c: .byte 3
+d: .byte 4
+total: .byte 0
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for cache hierarchy."""
+    from computer.cache import Cache  # noqa: F401
+
+    return {
+        # Single cache
+        "Cache_spatial_locality": lambda: _test_spatial_locality(),
+        "Cache_lru": lambda: _test_replacement("lru", [True, False, False]),
+        "Cache_fifo": lambda: _test_replacement("fifo", [True, True, False]),
+        "Cache_random_seeded": lambda: _test_random(),
+        "Cache_write_through": lambda: _test_write_through(),
+        "Cache_write_back": lambda: _test_write_back(),
+        "Cache_invalid_config": lambda: _test_invalid_config(),
+        # Hierarchy
+        "Cache_hierarchy_same_results": lambda: _test_same_results(),
+        "Cache_memory_profile": lambda: _test_memory_profile(),
+        "Cache_hierarchy_default_names": lambda: _test_default_names(),
+    }
+
+
+def _test_spatial_locality():
+    """Test one miss per line for sequential reads."""
+    from computer.cache import Cache
+
+    cache = Cache(size=16, line_size=4, associativity=1)
+    hits = [cache.access(address) for address in range(8)]
+    assert_eq(hits, [False, True, True, True, False, True, True, True])
+    report = cache.report()
+    assert_not_none(report, "Cache.report() returned None")
+    assert_eq(report["misses"], 2)
+    assert_eq(report["hit_rate"], 0.75)
+
+
+def _test_replacement(policy, expected):
+    """Test which line a 2-way set evicts."""
+    from computer.cache import Cache
+
+    # One set, two ways, 1-byte lines
+    cache = Cache(size=2, line_size=1, associativity=2, policy=policy)
+    cache.access(0)
+    cache.access(1)
+    cache.access(0)  # LRU: 1 is now least recently used; FIFO: 0 is still oldest
+    cache.access(2)  # evicts one line
+    result = [cache.access(2), cache.access(1), cache.access(0)]
+    assert_eq(result, expected, f"{policy} hits after eviction")
+
+
+def _test_random():
+    """Test random replacement is reproducible with a seed."""
+    from computer.cache import Cache
+
+    runs = []
+    for _ in range(2):
+        cache = Cache(size=4, line_size=1, associativity=4, policy="random", seed=7)
+        runs.append([cache.access(address % 6) for address in range(40)])
+    assert_eq(runs[0], runs[1])
+
+
+def _test_write_through():
+    """Test write-through writes do not allocate lines."""
+    from computer.cache import Cache
+
+    cache = Cache(size=8, line_size=2, associativity=1)
+    assert_eq(cache.access(4, write=True), False)
+    assert_eq(cache.access(4), False, "A write miss should not allocate")
+    assert_eq(cache.access(4, write=True), True)
+    assert_eq(cache.report()["writebacks"], 0)
+
+
+def _test_write_back():
+    """Test dirty lines are written back on eviction."""
+    from computer.cache import Cache
+
+    cache = Cache(size=4, line_size=2, associativity=1, write_back=True)
+    cache.access(0, write=True)
+    assert_eq(cache.access(1), True, "A write miss should allocate the line")
+    cache.access(4)  # same set as address 0: evicts the dirty line
+    report = cache.report(miss_penalty=10)
+    assert_eq(report["writebacks"], 1)
+    assert_eq(report["stall_cycles"], (2 + 1) * 10, "Two fills and one write-back")
+
+
+def _test_invalid_config():
+    """Test sizes must be powers of 2."""
+    from computer.cache import Cache
+
+    for kwargs in ({"size": 24}, {"line_size": 3}, {"policy": "mru"}):
+        try:
+            Cache(**kwargs)
+        except ValueError:
+            continue
+        assert_true(False, f"Cache({kwargs}) should raise ValueError")
+
+
+def _test_same_results():
+    """Test caches do not change what a program computes."""
+    from computer.cache import Cache, CacheHierarchy
+    from computer.system import Computer
+
+    computer = Computer()
+    computer.load_program(SUM_ARRAY)
+    hierarchy = CacheHierarchy(Cache(name="icache"), Cache(size=8, line_size=2, name="dcache"))
+    hierarchy.attach(computer.cpu.datapath)
+    state = computer.run()
+    assert_eq(state["registers"]["R0"], 10)
+    report = hierarchy.report()
+    assert_eq(report["icache"]["reads"], 2 * 9, "Two byte reads per instruction")
+    assert_eq(report["dcache"]["reads"], 4)
+    assert_eq(report["dcache"]["writes"], 1)
+    hierarchy.detach()
+    assert_eq(computer.cpu.datapath.memory, computer.cpu.datapath.instruction_memory)
+
+
+def _test_memory_profile():
+    """Test a profile run reports stall cycles."""
+    from computer.cache import Cache, memory_profile
+
+    report = memory_profile(SUM_ARRAY, Cache(name="icache"), Cache(name="dcache"), miss_penalty=5)
+    assert_not_none(report, "memory_profile() returned None")
+    assert_eq(report["instructions"], 8)
+    misses = report["icache"]["read_misses"] + report["dcache"]["read_misses"]
+    assert_eq(report["stall_cycles"], misses * 5)
+
+
+def _test_default_names():
+    """Test caches left with the default name are reported by role and both count."""
+    from computer.cache import Cache, CacheHierarchy
+    from computer.system import Computer
+
+    computer = Computer()
+    computer.load_program(SUM_ARRAY)
+    icache, dcache = Cache(size=16), Cache(size=64)
+    hierarchy = CacheHierarchy(icache, dcache, miss_penalty=5)
+    hierarchy.attach(computer.cpu.datapath)
+    computer.run()
+    report = hierarchy.report()
+    assert_eq(report["icache"]["reads"], 2 * 9)
+    assert_eq(report["dcache"]["reads"], 4)
+    stalls = icache.report(5)["stall_cycles"] + dcache.report(5)["stall_cycles"]
+    assert_true(icache.report(5)["stall_cycles"] > 0)
+    assert_eq(report["stall_cycles"], stalls)
@@ -148,11 +148,14 @@ def _test_decoder_3to8_one_hot():
 
 
 def _test_encoder_8to3_all():
-    """Test 8-to-3 encoder for all single inputs."""
+    """Test 8-to-3 encoder for all single inputs and with lower inputs also active."""
     from computer.combinational import encoder_8to3
 
     for i in range(8):
-        inputs = [0] * 8
-        inputs[i] = 1
         expected = [(i >> 0) & 1, (i >> 1) & 1, (i >> 2) & 1]
-        assert_eq(encoder_8to3(inputs), expected)
+        # The highest active input wins whatever is set below it
+        for lower in ([0] * i, [1] * i, [j & 1 for j in range(i)], [1 - (j & 1) for j in range(i)]):
+            inputs = lower + [1] + [0] * (7 - i)
+            assert_eq(encoder_8to3(inputs), expected, f"inputs={inputs}")
+    assert_eq(encoder_8to3([0, 1, 1, 0, 0, 0, 0, 0]), [0, 1, 0])
+    assert_eq(encoder_8to3([0, 0, 0, 0, 0, 1, 1, 0]), [0, 1, 1])
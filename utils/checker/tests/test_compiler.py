@@ -0,0 +1,125 @@
+"""Test cases for compiler."""
+
+from ..helpers import assert_eq, assert_true, assert_not_none, assert_in
+
+
+MULTIPLY = """
+a = 5
+b = 3
+r = 0
+while b {
+    r = r + a
+    b = b - 1
+}
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for compiler."""
+    from computer.compiler import Compiler  # noqa: F401
+
+    return {
+        # Front end
+        "Compiler_constant_folding": lambda: _test_constant_folding(),
+        "Compiler_fold_identities": lambda: _test_fold_identities(),
+        "Compiler_syntax_error": lambda: _test_syntax_error(),
+        # Code generation
+        "Compiler_strength_reduction": lambda: _test_strength_reduction(),
+        "Compiler_linear_scan": lambda: _test_linear_scan(),
+        "Compiler_linear_scan_spill": lambda: _test_linear_scan_spill(),
+        # Running compiled programs
+        "Compiler_run_multiply": lambda: _test_run(MULTIPLY, {"a": 5, "b": 0, "r": 15}),
+        "Compiler_run_if_else": lambda: _test_run(
+            "x = 7 if x == 7 { y = 1 } else { y = 2 } if x != 7 { z = 1 } else { z = 2 }",
+            {"x": 7, "y": 1, "z": 2},
+        ),
+        "Compiler_run_many_variables": lambda: _test_run(
+            "a=1 b=2 c=3 d=4 e=5 f=6 g=7 h=8 i=9 s=a+b+c+d+e+f+g+h+i", {"s": 45}
+        ),
+        "Compiler_benchmark": lambda: _test_benchmark(),
+    }
+
+
+def _test_constant_folding():
+    """Test constant subexpressions collapse to one number."""
+    from computer.compiler import fold
+
+    tree = ("bin", "+", ("bin", "*", ("num", 3), ("num", 4)), ("bin", "<<", ("num", 1), ("num", 2)))
+    assert_eq(fold(tree), ("num", 16))
+    assert_eq(fold(("bin", "-", ("num", 1), ("num", 2))), ("num", 255), "Results wrap to 8 bits")
+
+
+def _test_fold_identities():
+    """Test algebraic identities."""
+    from computer.compiler import fold
+
+    x = ("var", "x")
+    assert_eq(fold(("bin", "+", x, ("num", 0))), x)
+    assert_eq(fold(("bin", "*", ("num", 1), x)), x)
+    assert_eq(fold(("bin", "*", x, ("num", 0))), ("num", 0))
+    assert_eq(fold(("bin", "*", ("num", 4), x)), ("bin", "*", x, ("num", 4)))
+
+
+def _test_syntax_error():
+    """Test syntax errors are reported, not raised."""
+    from computer.compiler import Compiler
+
+    compiler = Compiler()
+    result = compiler.compile("x = (1 + ")
+    assert_eq(result, "")
+    assert_true(len(compiler.errors) == 1, "compile() should record one error")
+
+
+def _test_strength_reduction():
+    """Test x * 10 becomes shifts and adds."""
+    from computer.compiler import Compiler
+
+    assembly = Compiler().compile("y = 7 x = y * 10")
+    assert_not_none(assembly, "Compiler.compile() returned None")
+    opcodes = [line.split()[0] for line in assembly.split("\n") if line.startswith("    ") and "." not in line]
+    assert_eq(opcodes.count("SHL"), 3, "x * 10 (0b1010) needs 3 shifts")
+    assert_eq(opcodes.count("ADD"), 1, "x * 10 (0b1010) needs 1 add")
+    assert_true("JNZ" not in opcodes, "Multiplication by a constant should not loop")
+
+
+def _test_linear_scan():
+    """Test non-overlapping intervals share a register."""
+    from computer.compiler import linear_scan
+
+    assignment, spilled = linear_scan({0: (0, 6), 1: (1, 3), 2: (3, 5)}, 2)
+    assert_not_none(assignment, "linear_scan() returned None")
+    assert_eq(spilled, [])
+    assert_true(assignment[0] != assignment[1], "Overlapping intervals need different registers")
+    assert_eq(assignment[2], assignment[1], "Interval starting where another ends reuses its register")
+
+
+def _test_linear_scan_spill():
+    """Test the interval ending last is spilled."""
+    from computer.compiler import linear_scan
+
+    assignment, spilled = linear_scan({0: (0, 9), 1: (1, 3), 2: (2, 4)}, 2)
+    assert_eq(spilled, [0])
+    assert_eq(sorted(assignment), [1, 2])
+
+
+def _test_run(source, expected):
+    """Test a compiled program computes the expected variables."""
+    from computer.compiler import Compiler, run_compiled
+
+    compiler = Compiler()
+    assembly = compiler.compile(source)
+    assert_eq(compiler.errors, [])
+    _, values = run_compiled(assembly)
+    for name, value in expected.items():
+        assert_in(name, values)
+        assert_eq(values[name], value, f"Variable {name}")
+
+
+def _test_benchmark():
+    """Test optimized code runs fewer cycles than naive code."""
+    from computer.compiler import benchmark
+
+    report = benchmark(MULTIPLY)
+    assert_eq(report["results_match"], True)
+    assert_eq(report["variables"]["r"], 15)
+    assert_true(report["optimized"] < report["naive"], "Optimized code should execute fewer cycles")
@@ -0,0 +1,149 @@
+"""Test cases for co-simulation."""
+
+from ..helpers import assert_eq, assert_true, assert_in, assert_not_none
+
+
+# Sums 5 + 4 + ... + 1 into R3, storing each partial sum at 0x80
+SUM = """
+    LOAD R1, one
+    LOAD R2, count
+loop:
+    ADD R3, R3, R2
+    STORE R3, 0x80
+    SUB R2, R2, R1
+    JNZ loop
+    HALT
+one: .byte 1
+count: .byte 5
+"""
+
+ADD_PC = 0x04  # ADD R3, R3, R2
+STORE_PC = 0x06
+
+
+def get_tests() -> dict:
+    """Return all test cases for co-simulation."""
+    from computer.cosim import CoSimulator  # noqa: F401
+
+    return {
+        # Matching engines
+        "CoSim_agree": lambda: _test_agree(),
+        "CoSim_checkpoints": lambda: _test_checkpoints(),
+        "CoSim_differences": lambda: _test_differences(),
+        # Divergences
+        "CoSim_register_divergence": lambda: _test_register_divergence(1),
+        "CoSim_divergence_between_checkpoints": lambda: _test_register_divergence(16),
+        "CoSim_memory_divergence": lambda: _test_memory_divergence(),
+        "CoSim_halt_divergence": lambda: _test_halt_divergence(),
+    }
+
+
+def _buggy_fast(computer, bad_pc, corrupt):
+    """FastCPU whose handler at bad_pc calls corrupt(fast) after running."""
+    from computer.fastcpu import FastCPU
+
+    class BuggyFastCPU(FastCPU):
+        def _decode(self, pc):
+            handler = super()._decode(pc)
+            if pc != bad_pc:
+                return handler
+
+            def buggy():
+                next_pc = handler()
+                corrupt(self)
+                return next_pc
+
+            self._single[pc] = buggy
+            return buggy
+
+    return BuggyFastCPU.from_computer(computer, set())
+
+
+def _simulate(fast_factory=None, checkpoint=1):
+    from computer.cosim import CoSimulator
+    from computer.system import Computer
+
+    computer = Computer()
+    computer.load_program(SUM)
+    fast = fast_factory(computer) if fast_factory else None
+    report = CoSimulator(computer, fast, checkpoint).run(500)
+    assert_not_none(report, "CoSimulator.run() returned None")
+    return report
+
+
+def _test_agree():
+    """Test the gate-level CPU and FastCPU agree on a whole program."""
+    report = _simulate()
+    assert_eq(report["agree"], True, f"Unexpected divergence: {report['divergence']}")
+    assert_eq(report["cycles"], 22, "2 loads + 5 iterations x 4 instructions")
+    assert_eq(report["state"]["registers"][3], 15)
+    assert_eq(report["state"]["halted"], True)
+
+
+def _test_checkpoints():
+    """Test checkpoints compare less often with the same outcome."""
+    every = _simulate(checkpoint=1)
+    sparse = _simulate(checkpoint=8)
+    assert_eq(sparse["agree"], True)
+    assert_eq(sparse["cycles"], every["cycles"])
+    assert_eq(sparse["state"], every["state"])
+    assert_true(sparse["checks"] < every["checks"] // 4, f"{sparse['checks']} checks with checkpoint=8")
+
+
+def _test_differences():
+    """Test differences() names registers, flags and RAM bytes."""
+    from computer.cosim import differences, ram_digest
+
+    gate_mem = bytes(256)
+    fast_mem = bytearray(256)
+    fast_mem[0x80] = 7
+    gate = {"pc": 4, "registers": [0] * 8, "flags": [0, 0, 0, 0], "halted": False, "ram": ram_digest(gate_mem)}
+    fast = {"pc": 4, "registers": [0, 0, 9] + [0] * 5, "flags": [0, 1, 0, 0], "halted": False}
+    fast["ram"] = ram_digest(fast_mem)
+    assert_eq(differences(gate, gate), {})
+    diffs = differences(gate, fast, gate_mem, bytes(fast_mem))
+    assert_eq(diffs, {"R2": (0, 9), "C": (0, 1), "mem[0x80]": (0, 7)})
+    assert_eq(set(differences(gate, fast)), {"R2", "C", "ram"}, "Without RAM images only the hash differs")
+
+
+def _test_register_divergence(checkpoint):
+    """Test the first wrong instruction is found (also between checkpoints)."""
+
+    def corrupt(fast):
+        if fast.regs[3] == 12:  # Third iteration: 5 + 4 + 3
+            fast.regs[3] = 13
+
+    report = _simulate(lambda computer: _buggy_fast(computer, ADD_PC, corrupt), checkpoint)
+    assert_eq(report["agree"], False)
+    divergence = report["divergence"]
+    assert_eq(divergence["cycle"], 10, "2 loads + 2 iterations, then the third ADD")
+    assert_eq(divergence["pc"], ADD_PC)
+    assert_eq(divergence["instruction"], "ADD R3, R3, R2")
+    assert_eq(divergence["differences"], {"R3": (12, 13)})
+
+
+def _test_memory_divergence():
+    """Test a wrong STORE is reported by address."""
+
+    def corrupt(fast):
+        fast.mem[0x81] = fast.regs[3]
+
+    report = _simulate(lambda computer: _buggy_fast(computer, STORE_PC, corrupt), 4)
+    divergence = report["divergence"]
+    assert_not_none(divergence)
+    assert_eq(divergence["cycle"], 3)
+    assert_eq(divergence["pc"], STORE_PC)
+    assert_eq(divergence["differences"], {"mem[0x81]": (0, 5)})
+
+
+def _test_halt_divergence():
+    """Test an engine that stops early is caught."""
+
+    def corrupt(fast):
+        fast.halted = True
+
+    report = _simulate(lambda computer: _buggy_fast(computer, ADD_PC, corrupt), 8)
+    divergence = report["divergence"]
+    assert_not_none(divergence)
+    assert_eq(divergence["cycle"], 2)
+    assert_in("halted", divergence["differences"])
@@ -0,0 +1,128 @@
+"""Test cases for debugger."""
+
+from ..helpers import assert_eq, assert_true
+
+
+COUNTDOWN = """
+    LOAD R1, one
+    LOAD R2, count
+loop:
+    SUB R2, R2, R1
+    STORE R2, 0x80
+    JNZ loop
+    HALT
+one: .byte 1
+count: .byte 3
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for debugger."""
+    from computer.debugger import Debugger  # noqa: F401
+
+    return {
+        # Breakpoints
+        "Debugger_no_breakpoints": lambda: _test_no_breakpoints(),
+        "Debugger_breakpoint": lambda: _test_breakpoint(),
+        "Debugger_step": lambda: _test_step(),
+        "Debugger_cycle_breakpoint": lambda: _test_cycle_breakpoint(),
+        # Watchpoints
+        "Debugger_memory_write": lambda: _test_memory_write(),
+        "Debugger_memory_read": lambda: _test_memory_read(),
+        "Debugger_register_watch": lambda: _test_register_watch(),
+        "Debugger_clear": lambda: _test_clear(),
+    }
+
+
+def _debugger():
+    from computer.debugger import Debugger
+    from computer.system import Computer
+
+    computer = Computer()
+    computer.load_program(COUNTDOWN)
+    return computer, Debugger(computer)
+
+
+def _test_no_breakpoints():
+    """Test an empty debugger runs like CPU.run."""
+    computer, debugger = _debugger()
+    stop = debugger.run(1000)
+    assert_eq(stop["reason"], "halt")
+    assert_eq(stop["cycles"], 11)
+    assert_eq(computer.dump_state()["registers"]["R2"], 0)
+
+
+def _test_breakpoint():
+    """Test a breakpoint stops before its instruction every time it is reached."""
+    computer, debugger = _debugger()
+    debugger.break_at(0x06)
+    stops = [debugger.run(1000) for _ in range(4)]
+    assert_eq([stop["reason"] for stop in stops], ["breakpoint"] * 3 + ["halt"])
+    assert_eq([stop["cycles"] for stop in stops], [3, 6, 9, 11])
+    assert_eq(stops[0]["pc"], 0x06)
+    assert_eq(computer.dump_state()["registers"]["R2"], 0)
+
+
+def _test_step():
+    """Test step executes exactly one instruction, even at a breakpoint."""
+    computer, debugger = _debugger()
+    debugger.break_at(0x04)
+    assert_eq(debugger.run(1000)["pc"], 0x04)
+    stop = debugger.step()
+    assert_eq((stop["reason"], stop["pc"], stop["cycles"]), ("max_cycles", 0x06, 3))
+    assert_eq(debugger.run(1000)["reason"], "breakpoint")
+
+
+def _test_cycle_breakpoint():
+    """Test stopping after a number of instructions."""
+    computer, debugger = _debugger()
+    debugger.break_at_cycle(4)
+    stop = debugger.run(1000)
+    assert_eq((stop["reason"], stop["cycles"], stop["pc"]), ("cycle", 4, 0x08))
+    debugger.break_at_cycle(None)
+    assert_eq(debugger.run(1000)["reason"], "halt")
+
+
+def _test_memory_write():
+    """Test a write watchpoint with a value condition."""
+    computer, debugger = _debugger()
+    debugger.watch_memory(0x80, "w", condition=1)
+    stop = debugger.run(1000)
+    assert_eq(stop["reason"], "watchpoint")
+    assert_eq((stop["address"], stop["access"], stop["value"], stop["pc"]), (0x80, "write", 1, 0x06))
+    assert_eq(stop["cycles"], 7, "Watchpoints stop after the access")
+    debugger.watch_memory(0x80, "w", condition=lambda value: value > 5)
+    assert_eq(debugger.run(1000)["reason"], "halt")
+
+
+def _test_memory_read():
+    """Test a read watchpoint reports the value loaded."""
+    computer, debugger = _debugger()
+    debugger.watch_memory(computer.assembler.symbol_table["count"], "r")
+    stop = debugger.run(1000)
+    assert_eq((stop["access"], stop["value"], stop["pc"]), ("read", 3, 0x02))
+
+
+def _test_register_watch():
+    """Test register read and write watchpoints."""
+    computer, debugger = _debugger()
+    debugger.watch_register(2, "r")
+    reads = [debugger.run(1000) for _ in range(2)]
+    assert_eq([(stop["pc"], stop["value"]) for stop in reads], [(0x04, 3), (0x06, 2)])
+
+    computer, debugger = _debugger()
+    debugger.watch_register(2, "w", condition=0)
+    stop = debugger.run(1000)
+    assert_eq((stop["register"], stop["access"], stop["value"], stop["cycles"]), (2, "write", 0, 9))
+
+
+def _test_clear():
+    """Test clear removes every breakpoint and watchpoint."""
+    computer, debugger = _debugger()
+    debugger.break_at(0x04)
+    debugger.watch_memory(0x80)
+    debugger.watch_register(1, "rw")
+    debugger.break_at_cycle(2)
+    debugger.clear()
+    assert_true(not any(debugger.breakpoints) and not any(debugger.memory_watch))
+    assert_eq(debugger.run(1000)["reason"], "halt")
@@ -0,0 +1,112 @@
+"""Test cases for disassembler."""
+
+from ..helpers import assert_eq, assert_true, assert_not_none, assert_in, int_to_bits
+
+
+def get_tests() -> dict:
+    """Return all test cases for disassembler."""
+    from computer.disassembler import Disassembler  # noqa: F401
+
+    return {
+        # Single words
+        "Disassembler_NOP": lambda: _test_word(0x0000, "NOP"),
+        "Disassembler_HALT": lambda: _test_word(0xF000, "HALT"),
+        "Disassembler_LOAD": lambda: _test_word(0x1110, "LOAD R1, 0x10"),
+        "Disassembler_STORE": lambda: _test_word(0x2012, "STORE R0, 0x12"),
+        "Disassembler_ADD": lambda: _test_word(0x4012, "ADD R0, R1, R2"),
+        "Disassembler_MOV": lambda: _test_word(0x3140, "MOV R1, R4"),
+        "Disassembler_JNZ": lambda: _test_word(0xE008, "JNZ 0x08"),
+        "Disassembler_non_canonical": lambda: _test_non_canonical(),
+        # Images and RAM
+        "Disassembler_image_listing": lambda: _test_image_listing(),
+        "Disassembler_ram_listing": lambda: _test_ram_listing(),
+        "Disassembler_trace": lambda: _test_trace(),
+        # Round trip
+        "Disassembler_round_trip": lambda: _test_round_trip(),
+    }
+
+
+PROGRAM = """
+    LOAD R1, 0x12
+    LOAD R2, 0x13
+    MOV R0, R0
+loop:
+    ADD R0, R0, R1
+    SUB R2, R2, R3
+    JNZ loop
+    STORE R0, 0x15
+    NOT R5, R6
+    HALT
+"""
+
+
+def _words_to_image(words):
+    image = []
+    for word in words:
+        image += [word & 0xFF, word >> 8]
+    return image
+
+
+def _test_word(word, expected):
+    from computer.disassembler import Disassembler
+
+    result = Disassembler().disassemble_word(word)
+    assert_not_none(result, "Disassembler.disassemble_word() returned None")
+    assert_eq(result, expected)
+
+
+def _test_non_canonical():
+    """Test words the assembler cannot produce are flagged."""
+    from computer.disassembler import Disassembler
+
+    result = Disassembler().disassemble_word(0xF123)
+    assert_not_none(result, "Disassembler.disassemble_word() returned None")
+    assert_true(result.startswith("HALT"), "0xF123 should still decode as HALT")
+    assert_in("non-canonical", result)
+
+
+def _test_image_listing():
+    """Test listing of a byte image."""
+    from computer.disassembler import Disassembler
+
+    image = _words_to_image([0x1110, 0x4012, 0xF000])
+    listing = Disassembler().disassemble_image(image)
+    assert_not_none(listing, "Disassembler.disassemble_image() returned None")
+    assert_eq(listing.split("\n"), ["00: 1110  LOAD R1, 0x10", "02: 4012  ADD R0, R1, R2", "04: F000  HALT"])
+
+
+def _test_ram_listing():
+    """Test listing of RAM contents."""
+    from computer.disassembler import Disassembler
+    from computer.memory import RAM
+
+    ram = RAM()
+    ram.write(int_to_bits(4, 8), int_to_bits(0x08, 8), 1)
+    ram.write(int_to_bits(5, 8), int_to_bits(0xC0, 8), 1)
+    listing = Disassembler().disassemble_ram(ram, 4, 6)
+    assert_eq(listing, "04: C008  JMP 0x08")
+
+
+def _test_trace():
+    """Test batch disassembly of a long trace."""
+    from computer.disassembler import Disassembler
+
+    trace = [0x4001, 0x5223, 0xE008] * 1000
+    result = Disassembler().disassemble_words(trace)
+    assert_not_none(result, "Disassembler.disassemble_words() returned None")
+    assert_eq(len(result), 3000)
+    assert_eq(result[:3], ["ADD R0, R0, R1", "SUB R2, R2, R3", "JNZ 0x08"])
+    assert_eq(result[-1], "JNZ 0x08")
+
+
+def _test_round_trip():
+    """Test that disassembled source reassembles to the same words."""
+    from computer.assembler import Assembler
+    from computer.disassembler import Disassembler
+    from ..helpers import bits_to_int
+
+    words = [bits_to_int(instr) for instr in Assembler().assemble(PROGRAM)]
+    source = Disassembler().to_source(_words_to_image(words))
+    assert_not_none(source, "Disassembler.to_source() returned None")
+    again = [bits_to_int(instr) for instr in Assembler().assemble(source)]
+    assert_eq(again, words)
@@ -0,0 +1,188 @@
+"""Test cases for DMA controller."""
+
+from ..helpers import assert_eq, assert_true, int_to_bits
+
+
+# Copy 8 bytes from 0x80 to 0x90 and poll for DMA_DONE
+POLL = """
+    LOAD R0, src
+    STORE R0, 0xE8
+    LOAD R0, dst
+    STORE R0, 0xE9
+    LOAD R0, len
+    STORE R0, 0xEA
+    LOAD R0, go
+    STORE R0, 0xEB
+    LOAD R2, done
+wait:
+    LOAD R1, 0xEB
+    AND R1, R1, R2
+    JZ wait
+    HALT
+src: .byte 0x80
+dst: .byte 0x90
+len: .byte 8
+go: .byte 1
+done: .byte 0x80
+"""
+
+# Same copy, but sleep until the completion interrupt
+SLEEP = """
+    LOAD R0, vector
+    STORE R0, 0xFA
+    LOAD R0, mask
+    STORE R0, 0xF8
+    LOAD R0, src
+    STORE R0, 0xE8
+    LOAD R0, dst
+    STORE R0, 0xE9
+    LOAD R0, len
+    STORE R0, 0xEA
+    LOAD R0, go
+    STORE R0, 0xEB
+    HALT
+    STORE R6, 0xF8
+    HALT
+handler:
+    LOAD R5, mask
+    STORE R5, flag
+    STORE R5, 0xF9
+    STORE R5, 0xFB
+vector: .byte handler
+mask: .byte 2
+src: .byte 0x80
+dst: .byte 0x90
+len: .byte 8
+go: .byte 3
+flag: .byte 0
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for DMA controller."""
+    from computer.dma import DMAController  # noqa: F401
+
+    return {
+        # Copies
+        "DMA_copy": lambda: _test_copy(),
+        "DMA_overlapping_copy": lambda: _test_overlap(),
+        "DMA_wraparound_copy": lambda: _test_wraparound(),
+        # Timing
+        "DMA_cycle_cost": lambda: _test_cycle_cost(),
+        "DMA_start_while_busy": lambda: _test_start_while_busy(),
+        # Programs
+        "DMA_polling_program": lambda: _test_polling_program(),
+        "DMA_completion_interrupt": lambda: _test_completion_interrupt(),
+        "DMA_completion_interrupt_pipelined": lambda: _test_completion_interrupt(pipelined=True),
+    }
+
+
+def _system(**costs):
+    from computer.dma import DMASystem
+    from computer.system import Computer
+
+    computer = Computer()
+    return computer, DMASystem(computer, **costs)
+
+
+def _fill(ram, start, values):
+    for i, value in enumerate(values):
+        ram.write(int_to_bits((start + i) % ram.size), int_to_bits(value), 1)
+
+
+def _bytes(ram, start, length):
+    return [sum(bit << j for j, bit in enumerate(ram.memory[(start + i) % ram.size])) for i in range(length)]
+
+
+def _test_copy():
+    """Test a block is copied and the source is unchanged."""
+    computer, system = _system()
+    ram = system.bus.ram
+    _fill(ram, 0x40, [1, 2, 3, 4, 5])
+    system.dma.start(0x40, 0x60, 5)
+    assert_eq(_bytes(ram, 0x60, 5), [1, 2, 3, 4, 5])
+    assert_eq(_bytes(ram, 0x40, 5), [1, 2, 3, 4, 5])
+    try:
+        ram.memory[0x60][0] = 0
+    except TypeError:
+        pass  # Immutable rows (BitVector) can be shared
+    assert_eq(_bytes(ram, 0x40, 1), [1], "Copied bytes must not share mutable storage with the source")
+
+
+def _test_overlap():
+    """Test overlapping blocks copy as if the source was read first."""
+    computer, system = _system()
+    ram = system.bus.ram
+    _fill(ram, 0x40, [1, 2, 3, 4, 5])
+    system.dma.start(0x40, 0x42, 5)
+    assert_eq(_bytes(ram, 0x40, 7), [1, 2, 1, 2, 3, 4, 5])
+
+
+def _test_wraparound():
+    """Test blocks past the end of memory wrap to address 0."""
+    computer, system = _system()
+    ram = system.bus.ram
+    _fill(ram, 0xFE, [7, 8, 9])
+    system.dma.start(0xFE, 0x20, 3)
+    assert_eq(_bytes(ram, 0x20, 3), [7, 8, 9])
+
+
+def _test_cycle_cost():
+    """Test the controller is busy for setup + per-byte cycles."""
+    computer, system = _system(cycles_per_byte=2, setup_cycles=3)
+    dma, clock = system.dma, computer.cpu.clock
+    assert_eq(dma.read(3), 0, "Idle controller reports nothing")
+    for offset, value in enumerate([0x10, 0x20, 4]):
+        dma.write(offset, value)
+    dma.write(3, 0x01)
+    assert_eq(dma.stats["busy_cycles"], 11)
+    clock.cycle += 10
+    assert_eq(dma.read(3), 0x01, "Busy one cycle before completion")
+    clock.cycle += 1
+    assert_eq(dma.read(3), 0x80, "Done after 3 + 2 * 4 cycles")
+
+
+def _test_start_while_busy():
+    """Test a start written during a transfer is ignored."""
+    computer, system = _system()
+    dma = system.dma
+    dma.write(2, 8)
+    dma.write(3, 0x01)
+    dma.write(3, 0x01)
+    assert_eq(dma.stats["transfers"], 1)
+    assert_eq(dma.stats["ignored"], 1)
+
+
+def _test_polling_program():
+    """Test a program copies a buffer and waits for DMA_DONE."""
+    computer, system = _system()
+    computer.load_program(POLL)
+    ram = system.bus.ram
+    _fill(ram, 0x80, range(10, 18))
+    steps = computer.cpu.run(1000)
+    assert_eq(computer.cpu.halted, True)
+    assert_eq(_bytes(ram, 0x90, 8), list(range(10, 18)))
+    assert_true(computer.cpu.clock.cycle >= 12, "Must wait out the 4 + 8 cycle transfer")
+    assert_true(steps < 40, f"Copying 8 bytes took {steps} instructions")
+
+
+def _test_completion_interrupt(pipelined=False):
+    """Test the completion interrupt wakes a sleeping CPU."""
+    from computer.dma import DMASystem
+    from computer.interrupts import InterruptSystem
+    from computer.pipeline import PipelinedCPU
+    from computer.system import Computer
+
+    computer = Computer(cpu=PipelinedCPU() if pipelined else None)
+    interrupts = InterruptSystem(computer)
+    system = DMASystem(computer, controller=interrupts.controller, cycles_per_byte=10)
+    computer.load_program(SLEEP)
+    ram = system.bus.ram
+    _fill(ram, 0x80, range(8))
+    computer.cpu.run(1000)
+    symbols = computer.assembler.symbol_table
+    assert_eq(computer.cpu.halted, True)
+    assert_eq(_bytes(ram, symbols["flag"], 1), [2], "Handler should run once")
+    assert_eq(_bytes(ram, 0x90, 8), list(range(8)))
+    assert_eq(interrupts.controller.stats["interrupts"], 1)
+    assert_true(interrupts.controller.stats["idle_cycles"] > 50, "Waiting for the transfer should be skipped")
@@ -0,0 +1,182 @@
+"""Test cases for fast interpreter."""
+
+from ..helpers import assert_eq, assert_true, assert_not_none
+
+
+COUNTDOWN = """
+    LOAD R1, one
+    LOAD R2, count
+    LOAD R3, zero
+loop:
+    ADD R3, R3, R2
+    MOV R4, R3
+    SUB R2, R2, R1
+    JNZ loop
+    HALT
+one: .byte 1
+count: .byte 10
+zero: .byte 0
+"""
+
+# JNZ jumps to the MOV that is the second half of the ADD+MOV pair
+INTO_PAIR = """
+    LOAD R1, one
+    LOAD R2, count
+    ADD R3, R3, R1
+inner:
+    MOV R4, R2
+    SUB R2, R2, R1
+    JNZ inner
+    HALT
+one: .byte 1
+count: .byte 5
+"""
+
+# The loop rewrites its own ADD into a SUB halfway through
+SELF_MODIFYING = """
+    LOAD R1, one
+    LOAD R2, count
+    LOAD R5, patch
+loop:
+    ADD R3, R3, R1
+    SUB R2, R2, R1
+    STORE R5, 0x07
+    JNZ loop
+    HALT
+one: .byte 1
+count: .byte 4
+patch: .byte 0x53
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for fast interpreter."""
+    from computer.fastcpu import FastCPU  # noqa: F401
+
+    return {
+        # Matching CPU.step
+        "FastCPU_matches_cpu": lambda: _test_matches_cpu(COUNTDOWN),
+        "FastCPU_flags": lambda: _test_flags(),
+        "FastCPU_step": lambda: _test_step(),
+        "FastCPU_max_cycles": lambda: _test_max_cycles(),
+        "FastCPU_self_modifying": lambda: _test_matches_cpu(SELF_MODIFYING, {("ADD", "SUB"), ("SUB", "SUB")}),
+        # Superinstructions
+        "FastCPU_fused_dispatch": lambda: _test_fused_dispatch(),
+        "FastCPU_jump_into_pair": lambda: _test_matches_cpu(INTO_PAIR, {("ADD", "MOV"), ("MOV", "SUB")}),
+        "FastCPU_profile": lambda: _test_profile(),
+        "FastCPU_write_back": lambda: _test_write_back(),
+    }
+
+
+def _load(source):
+    from computer.system import Computer
+
+    computer = Computer()
+    computer.load_program(source)
+    return computer
+
+
+def _test_matches_cpu(source, pairs=None):
+    """Test FastCPU ends in the same state as the CPU."""
+    from computer.fastcpu import FastCPU
+
+    computer = _load(source)
+    fast = FastCPU.from_computer(computer, pairs)
+    expected_cycles = computer.cpu.run(500)
+    expected = computer.dump_state()
+    cycles = fast.run(500)
+    state = fast.get_state()
+    assert_not_none(state, "FastCPU.get_state() returned None")
+    assert_eq(cycles, expected_cycles, "run() should return the same count as CPU.run()")
+    assert_eq(state["registers"], expected["registers"])
+    assert_eq(state["flags"], expected["flags"])
+    assert_eq(state["pc"], sum(bit << i for i, bit in enumerate(expected["pc"])))
+    assert_eq(state["cycle"], expected["cycle"])
+    assert_eq(state["halted"], True)
+
+
+def _test_flags():
+    """Test flags of ALU instructions."""
+    from computer.fastcpu import FastCPU
+
+    cases = [
+        # (word, a, b, expected flags Z C N V)
+        (0x4012, 0x7F, 0x01, (0, 0, 1, 1)),  # ADD overflow
+        (0x4012, 0xFF, 0x01, (1, 1, 0, 0)),  # ADD carry to zero
+        (0x5012, 0x01, 0x02, (0, 1, 1, 0)),  # SUB borrow
+        (0x5012, 0x80, 0x01, (0, 0, 0, 1)),  # SUB overflow
+        (0xA010, 0x81, 0x00, (0, 1, 0, 0)),  # SHL carry out
+        (0xB010, 0x01, 0x00, (1, 1, 0, 0)),  # SHR carry out
+    ]
+    for word, a, b, flags in cases:
+        fast = FastCPU()
+        fast.load_bytes([word & 0xFF, word >> 8, 0x00, 0xF0])
+        fast.regs[1], fast.regs[2] = a, b
+        fast.run(10)
+        assert_eq(tuple(fast.get_state()["flags"].values()), flags, f"Flags for 0x{word:04X} with {a}, {b}")
+
+
+def _test_step():
+    """Test step() executes one instruction and stops at HALT."""
+    from computer.fastcpu import FastCPU
+
+    fast = FastCPU()
+    fast.load_bytes([0x10, 0x31, 0x00, 0xF0])  # MOV R1, R1 / HALT
+    assert_eq(fast.step(), True)
+    assert_eq(fast.get_state()["pc"], 2)
+    assert_eq(fast.step(), False, "HALT should return False")
+    assert_eq(fast.get_state()["pc"], 2, "HALT should not advance the PC")
+    assert_eq(fast.step(), False)
+
+
+def _test_max_cycles():
+    """Test a fused pair never runs past max_cycles."""
+    from computer.fastcpu import FastCPU
+
+    for limit in range(1, 12):
+        computer = _load(COUNTDOWN)
+        fast = FastCPU.from_computer(computer)
+        computer.cpu.run(limit)
+        assert_eq(fast.run(limit), limit)
+        assert_eq(fast.get_state()["registers"], computer.dump_state()["registers"], f"After {limit} steps")
+
+
+def _test_fused_dispatch():
+    """Test fused pairs take one dispatch."""
+    from computer.fastcpu import FastCPU
+
+    fused = FastCPU.from_computer(_load(COUNTDOWN), {("ADD", "MOV"), ("SUB", "JNZ")})
+    fused.run(500)
+    plain = FastCPU.from_computer(_load(COUNTDOWN), set())
+    plain.run(500)
+    assert_eq(fused.stats["steps"], plain.stats["steps"])
+    assert_eq(fused.stats["fused"], 20, "10 iterations x 2 pairs")
+    assert_eq(fused.stats["dispatches"], plain.stats["dispatches"] - 20)
+
+
+def _test_profile():
+    """Test pair selection from profile data."""
+    from computer.fastcpu import FastCPU, select_pairs
+
+    fast = FastCPU.from_computer(_load(COUNTDOWN))
+    counts = fast.profile(500)
+    assert_not_none(counts, "FastCPU.profile() returned None")
+    assert_eq(counts[("SUB", "JNZ")], 10)
+    assert_eq(counts[("JNZ", "HALT")], 0, "JNZ never falls into a pair")
+    assert_true(("ADD", "MOV") in select_pairs(counts, 3))
+    assert_eq(fast.get_state()["pc"], 0, "profile() should not change the machine")
+
+
+def _test_write_back():
+    """Test state copied back into a Computer."""
+    from computer.fastcpu import FastCPU
+    from computer.system import Computer
+
+    fast = FastCPU.from_computer(_load(COUNTDOWN))
+    fast.run(500)
+    computer = Computer()
+    fast.write_back(computer)
+    state = computer.dump_state()
+    assert_eq(state["registers"]["R3"], 55)
+    assert_eq(state["halted"], True)
+    assert_eq(state["cycle"], fast.get_state()["cycle"])
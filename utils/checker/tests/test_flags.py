@@ -0,0 +1,53 @@
+"""Test cases for lazy ALU flags."""
+
+from ..helpers import assert_eq, int_to_bits
+
+
+def get_tests() -> dict:
+    """Return all test cases for lazy ALU flags."""
+    from computer.flags import LazyFlags  # noqa: F401
+
+    return {
+        "LazyFlags_dict_compatible": lambda: _test_dict_compatible(),
+        "LazyFlags_add_overflow": lambda: _test_add_overflow(),
+        "LazyFlags_result_snapshot": lambda: _test_result_snapshot(),
+    }
+
+
+def _test_dict_compatible():
+    """Test LazyFlags reads, compares and copies like the flags dict."""
+    from computer.flags import LazyFlags
+
+    flags = LazyFlags([0] * 8, carry=1)
+    assert_eq(flags["Z"], 1)
+    assert_eq(flags.get("N"), 0)
+    assert_eq(flags, {"Z": 1, "C": 1, "N": 0, "V": 0})
+    assert_eq(list(flags), ["Z", "C", "N", "V"])
+    copy = flags.copy()
+    assert_eq(type(copy), dict)
+    flags["Z"] = 0
+    assert_eq(flags["Z"], 0, "A write is kept")
+    assert_eq(copy["Z"], 1, "copy() is independent")
+    assert_eq(flags.get("X", 0), 0)
+
+
+def _test_add_overflow():
+    """Test ADD overflow is worked out from the operands' sign bits."""
+    from computer.flags import LazyFlags
+
+    # 0x7F + 0x01 = 0x80
+    added = LazyFlags(int_to_bits(0x80), 0, signs=(0, 0))
+    assert_eq(dict(added), {"Z": 0, "C": 0, "N": 1, "V": 1})
+    assert_eq(LazyFlags(int_to_bits(0x00), 1, signs=(1, 1))["V"], 1, "0x80 + 0x80 overflows too")
+    assert_eq(LazyFlags(int_to_bits(0x7F), 1, signs=(1, 0))["V"], 0)
+
+
+def _test_result_snapshot():
+    """Test changing the result list afterwards does not change the flags."""
+    from computer.flags import LazyFlags
+
+    result = int_to_bits(0x80)
+    flags = LazyFlags(result)
+    result[:] = [0] * 8
+    assert_eq(flags["Z"], 0)
+    assert_eq(flags["N"], 1)
@@ -0,0 +1,180 @@
+"""Test cases for CPU fuzzer."""
+
+from ..helpers import assert_eq, assert_true
+
+
+def get_tests() -> dict:
+    """Return all test cases for CPU fuzzer."""
+    from computer.fuzzer import Fuzzer  # noqa: F401
+
+    return {
+        # Generation and the reference model
+        "Fuzzer_valid_instructions": lambda: _test_valid_instructions(),
+        "Fuzzer_reference_flags": lambda: _test_reference_flags(),
+        "Fuzzer_reference_program": lambda: _test_reference_program(),
+        # Fuzzing
+        "Fuzzer_fast_cpu_agrees": lambda: _test_fast_cpu_agrees(),
+        "Fuzzer_full_coverage": lambda: _test_full_coverage(),
+        "Fuzzer_gate_level_oracle": lambda: _test_gate_level_oracle(),
+        # Failures
+        "Fuzzer_minimize": lambda: _test_minimize(),
+        "Fuzzer_finds_bug": lambda: _test_finds_bug(),
+    }
+
+
+def _test_valid_instructions():
+    """Test generated words use R0-R7 and jump inside the program."""
+    import random
+    from computer.disassembler import is_canonical
+    from computer.fuzzer import random_instruction
+
+    rng = random.Random(0)
+    for _ in range(2000):
+        word = random_instruction(rng, 10)
+        op = word >> 12
+        assert_true(is_canonical(word), f"0x{word:04X} is not canonical")
+        if op in (0xC, 0xD, 0xE):
+            assert_true(word & 0xFF < 20 and word & 1 == 0, f"Jump target of 0x{word:04X}")
+        elif op in (0x1, 0x2):
+            assert_true(word & 0x0800 == 0, f"Register field of 0x{word:04X}")
+        elif op != 0x0 and op != 0xF:
+            assert_true(word & 0x0888 == 0, f"Register fields of 0x{word:04X}")
+
+
+def _test_reference_flags():
+    """Test reference model flags for ALU instructions."""
+    from computer.fuzzer import reference_run
+
+    cases = [
+        # (word, a, b, expected flags Z C N V)
+        (0x4012, 0x7F, 0x01, [0, 0, 1, 1]),  # ADD overflow
+        (0x4012, 0xFF, 0x01, [1, 1, 0, 0]),  # ADD carry to zero
+        (0x5012, 0x01, 0x02, [0, 1, 1, 0]),  # SUB borrow
+        (0x5012, 0x80, 0x01, [0, 0, 0, 1]),  # SUB overflow
+        (0xA010, 0x81, 0x00, [0, 1, 0, 0]),  # SHL carry out
+        (0xB010, 0x01, 0x00, [1, 1, 0, 0]),  # SHR carry out
+    ]
+    for word, a, b, flags in cases:
+        # LOAD R1, 0x80 / LOAD R2, 0x81 / op / HALT
+        mem = bytearray(256)
+        mem[0:8] = bytes([0x80, 0x11, 0x81, 0x12, word & 0xFF, word >> 8, 0x00, 0xF0])
+        mem[0x80], mem[0x81] = a, b
+        state = reference_run(mem, 10)
+        assert_eq(state["flags"], flags, f"Flags for 0x{word:04X} with {a}, {b}")
+        assert_eq(state["steps"], 3)
+        assert_eq(state["halted"], True)
+
+
+def _test_reference_program():
+    """Test the reference model runs an assembled loop and records coverage."""
+    from computer.assembler import Assembler
+    from computer.fuzzer import reference_run
+
+    assembler = Assembler()
+    code = assembler.assemble(
+        """
+        LOAD R1, one
+        LOAD R2, count
+    loop:
+        ADD R3, R3, R2
+        SUB R2, R2, R1
+        JNZ loop
+        STORE R3, 0x90
+        HALT
+    one: .byte 1
+    count: .byte 4
+    """
+    )
+    mem = bytearray(256)
+    for i, bits in enumerate(code):
+        word = sum(bit << j for j, bit in enumerate(bits))
+        mem[2 * i], mem[2 * i + 1] = word & 0xFF, word >> 8
+    for address, value in assembler.data_bytes.items():
+        mem[address] = value
+    coverage = set()
+    state = reference_run(mem, 100, coverage)
+    assert_eq(state["registers"][3], 10)
+    assert_eq(mem[0x90], 10, "STORE should write memory")
+    assert_eq(state["steps"], 2 + 4 * 3 + 1)
+    assert_eq(state["pc"], 12, "PC stays on HALT")
+    assert_true(("branch", "JNZ", True) in coverage and ("branch", "JNZ", False) in coverage)
+    assert_true(("flag", "SUB", "Z", 1) in coverage)
+    assert_true(("op", "HALT") in coverage)
+
+
+def _test_fast_cpu_agrees():
+    """Test FastCPU matches the reference model on random programs."""
+    from computer.fuzzer import Fuzzer
+
+    fuzzer = Fuzzer(seed=0)
+    report = fuzzer.fuzz(500, batch=50)
+    assert_eq(report["programs"], 500)
+    assert_eq(report["failures"], [])
+    assert_true(report["programs_per_second"] > 0)
+    assert_true(0 < report["corpus"] < 500, "Only programs with new coverage join the corpus")
+
+
+def _test_full_coverage():
+    """Test coverage feedback reaches every opcode, flag value and branch direction."""
+    from computer.fuzzer import Fuzzer
+
+    report = Fuzzer(seed=1).fuzz(1500)
+    assert_eq(report["uncovered"], [])
+    assert_eq(report["coverage"], report["coverage_total"])
+
+
+def _test_gate_level_oracle():
+    """Test differential execution against the gate-level CPU."""
+    from computer.fuzzer import Fuzzer
+
+    report = Fuzzer(seed=2, length=8, max_cycles=32, oracle="cpu").fuzz(15, batch=5)
+    assert_eq(report["programs"], 15)
+    assert_eq(report["failures"], [])
+    try:
+        Fuzzer(oracle="magic")
+        assert_true(False, "Unknown oracle should raise ValueError")
+    except ValueError:
+        pass
+
+
+def _test_minimize():
+    """Test minimize keeps only what makes a program fail."""
+    from computer.fuzzer import minimize
+
+    words = [0x1180, 0x4123, 0xB210, 0x3321, 0x5123, 0x2390, 0xF000]
+    data = bytes(range(128))
+    smallest = minimize((words, data), lambda p: 0xB210 in p[0])
+    assert_eq(smallest[0], [0, 0, 0xB210], "Everything else becomes NOP and trailing NOPs are dropped")
+    assert_eq(smallest[1], bytes(128))
+
+
+def _test_finds_bug():
+    """Test a wrong SHR carry in the engine is found and minimized."""
+    from computer.fastcpu import FastCPU
+    from computer.fuzzer import Fuzzer
+
+    class BuggyFastCPU(FastCPU):
+        def _decode(self, pc):
+            handler = super()._decode(pc)
+            word = self.mem[pc] | self.mem[(pc + 1) & 0xFF] << 8
+            if word >> 12 != 0xB:
+                return handler
+            rs1 = (word >> 4) & 7
+
+            def buggy():
+                value = self.regs[rs1]
+                next_pc = handler()
+                if value & 0x41 == 0x41:  # Drops the carry for some values
+                    self.flags[1] = 0
+                return next_pc
+
+            self._single[pc] = buggy
+            return buggy
+
+    report = Fuzzer(seed=3, engine=lambda: BuggyFastCPU(set())).fuzz(3000)
+    assert_true(report["failures"], "The fuzzer should find the SHR bug")
+    failure = report["failures"][0]
+    assert_eq(failure["differences"], {"C": (1, 0)})
+    kept = [word for word in failure["minimized"][0] if word]
+    assert_true(len(kept) < len(failure["program"][0]), "The failing program should shrink")
+    assert_true("SHR" in failure["listing"])
@@ -0,0 +1,192 @@
+"""Test cases for interrupts and timer."""
+
+from ..helpers import assert_eq, assert_true, int_to_bits
+
+
+# Sleep until three timer interrupts have been counted
+TICKS = """
+    LOAD R0, vector
+    STORE R0, 0xFA
+    LOAD R0, period
+    STORE R0, 0xFC
+    LOAD R0, control
+    STORE R0, 0xFD
+    LOAD R6, one
+    STORE R6, 0xF8
+    LOAD R4, target
+wait:
+    HALT
+    LOAD R2, ticks
+    SUB R3, R2, R4
+    JNZ wait
+    STORE R3, 0xF8
+    HALT
+handler:
+    LOAD R1, ticks
+    ADD R1, R1, R6
+    STORE R1, ticks
+    STORE R6, 0xF9
+    STORE R6, 0xFB
+vector: .byte handler
+period: .byte 100
+control: .byte 3
+one: .byte 1
+target: .byte 3
+ticks: .byte 0
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for interrupts and timer."""
+    from computer.interrupts import InterruptController  # noqa: F401
+
+    return {
+        # Controller
+        "Interrupts_enter_and_return": lambda: _test_enter_and_return(),
+        "Interrupts_mask": lambda: _test_mask(),
+        "Interrupts_no_nesting": lambda: _test_no_nesting(),
+        # Timer
+        "Interrupts_timer_one_shot": lambda: _test_timer_one_shot(),
+        "Interrupts_timer_repeat_merges": lambda: _test_timer_repeat(),
+        # Programs
+        "Interrupts_sleeping_program": lambda: _test_sleeping_program(),
+        "Interrupts_plain_halt": lambda: _test_plain_halt(),
+        "Interrupts_pipelined_cpu": lambda: _test_pipelined_cpu(),
+    }
+
+
+def _system(cpu=None):
+    from computer.interrupts import InterruptSystem
+    from computer.system import Computer
+
+    computer = Computer(cpu=cpu)
+    return computer, InterruptSystem(computer)
+
+
+def _pc(computer):
+    return sum(bit << i for i, bit in enumerate(computer.cpu.datapath.get_pc()))
+
+
+def _test_enter_and_return():
+    """Test PC and flags are saved and restored."""
+    computer, system = _system()
+    controller = system.controller
+    cpu = computer.cpu
+    cpu.datapath.set_pc(int_to_bits(0x10, 8))
+    cpu.datapath.flags = {"Z": 1, "C": 0, "N": 0, "V": 1}
+    controller.write(2, 0x40)  # vector
+    controller.write(0, 0x01)  # enable line 0
+    controller.raise_irq(0)
+    controller.service(cpu)
+    assert_eq(_pc(computer), 0x40, "Should jump to the vector")
+    assert_eq(controller.in_handler, True)
+
+    cpu.datapath.flags = {"Z": 0, "C": 1, "N": 1, "V": 0}
+    controller.write(1, 0x01)  # acknowledge
+    controller.write(3, 0)  # return
+    controller.service(cpu)
+    assert_eq(_pc(computer), 0x10, "PC should be restored")
+    assert_eq(cpu.datapath.flags, {"Z": 1, "C": 0, "N": 0, "V": 1}, "Flags should be restored")
+    assert_eq(controller.pending, 0)
+
+
+def _test_mask():
+    """Test disabled lines stay pending without interrupting."""
+    computer, system = _system()
+    controller = system.controller
+    controller.write(2, 0x40)
+    controller.write(0, 0x02)
+    controller.raise_irq(0)
+    controller.service(computer.cpu)
+    assert_eq(_pc(computer), 0, "Line 0 is masked")
+    assert_eq(controller.read(1), 0x01, "Line 0 should stay pending")
+    controller.write(0, 0x03)
+    controller.service(computer.cpu)
+    assert_eq(_pc(computer), 0x40)
+
+
+def _test_no_nesting():
+    """Test a second interrupt waits for the handler to return."""
+    computer, system = _system()
+    controller = system.controller
+    controller.write(2, 0x40)
+    controller.write(0, 0xFF)
+    controller.raise_irq(0)
+    controller.service(computer.cpu)
+    computer.cpu.datapath.set_pc(int_to_bits(0x42, 8))
+    controller.raise_irq(1)
+    controller.service(computer.cpu)
+    assert_eq(_pc(computer), 0x42, "No nested interrupt while in the handler")
+    assert_eq(controller.stats["interrupts"], 1)
+
+
+def _test_timer_one_shot():
+    """Test a one-shot timer fires once and stops."""
+    computer, system = _system()
+    timer, clock = system.timer, computer.cpu.clock
+    timer.write(0, 10)
+    timer.write(1, 0x01)
+    for _ in range(2 * 4):
+        clock.tick()
+    assert_eq(timer.read(2), 6, "COUNT should show cycles remaining")
+    for _ in range(2 * 6):
+        clock.tick()
+    timer.fire(clock.cycle)
+    assert_eq(system.controller.pending, 0x01)
+    assert_true(timer.deadline is None, "One-shot timer should stop")
+    assert_eq(timer.read(1) & 0x01, 0, "Enable bit should clear")
+
+
+def _test_timer_repeat():
+    """Test missed periods of a repeating timer raise a single interrupt."""
+    computer, system = _system()
+    timer, clock = system.timer, computer.cpu.clock
+    timer.write(0, 10)
+    timer.write(1, 0x03)
+    clock.cycle = 35
+    timer.fire(clock.cycle)
+    assert_eq(system.controller.pending, 0x01)
+    assert_eq(timer.deadline, 40, "Next deadline stays on the period grid")
+
+
+def _test_sleeping_program():
+    """Test HALT sleeps until the timer and idle time is skipped."""
+    computer, system = _system()
+    computer.load_program(TICKS)
+    steps = computer.cpu.run(1000)
+    state = computer.dump_state()
+    assert_eq(state["halted"], True)
+    assert_eq(state["registers"]["R2"], 3, "Handler should run three times")
+    assert_eq(system.controller.stats["interrupts"], 3)
+    assert_true(steps < 50, f"Sleeping should take few instructions, took {steps}")
+    assert_true(state["cycle"] >= 300, "Three 100-cycle periods should elapse")
+    assert_true(system.controller.stats["idle_cycles"] > 250, "Idle cycles should be skipped")
+
+
+def _test_plain_halt():
+    """Test HALT still stops when no interrupt can arrive."""
+    computer, system = _system()
+    computer.load_program("LOAD R0, 0x10\nHALT")
+    steps = computer.cpu.run(100)
+    assert_eq(steps, 1)
+    assert_eq(computer.cpu.halted, True)
+
+
+def _test_pipelined_cpu():
+    """Test the pipelined CPU takes the same interrupts as the single-cycle CPU."""
+    from computer.pipeline import PipelinedCPU
+
+    reference, _ = _system()
+    reference.load_program(TICKS)
+    reference.cpu.run(1000)
+    expected = reference.dump_state()
+
+    computer, system = _system(PipelinedCPU())
+    computer.load_program(TICKS)
+    computer.cpu.run(1000)
+    state = computer.dump_state()
+    assert_eq(system.controller.stats["interrupts"], 3)
+    assert_eq(state["halted"], True)
+    assert_eq(state["registers"], expected["registers"])
+    assert_eq(state["pc"], expected["pc"])
+    assert_true(system.controller.stats["idle_cycles"] > 250, "Idle cycles should be skipped")
@@ -0,0 +1,122 @@
+"""Test cases for linker."""
+
+from ..helpers import assert_eq, assert_true, assert_not_none, assert_in
+
+
+MAIN_MODULE = """
+.extern double
+    LOAD R1, value
+    JMP double
+back:
+    HALT
+.global back
+value:
+    .byte 21
+"""
+
+LIB_MODULE = """
+.global double
+.extern back
+double:
+    ADD R0, R1, R1
+    JMP back
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for linker."""
+    from computer.linker import Linker  # noqa: F401
+
+    return {
+        # Object output
+        "Assembler_object_relocations": lambda: _test_object_relocations(),
+        "Assembler_object_exports_imports": lambda: _test_object_exports_imports(),
+        "ObjectModule_round_trip": lambda: _test_object_round_trip(),
+        # Linking
+        "Linker_layout": lambda: _test_linker_layout(),
+        "Linker_resolves_symbols": lambda: _test_linker_resolves_symbols(),
+        "Linker_undefined_symbol": lambda: _test_linker_undefined_symbol(),
+        "Linker_run_linked_program": lambda: _test_linker_run_program(),
+    }
+
+
+def _assemble(source: str, name: str):
+    from computer.assembler import Assembler
+
+    module = Assembler().assemble_object(source, name)
+    assert_not_none(module, "Assembler.assemble_object() returned None")
+    return module
+
+
+def _test_object_relocations():
+    """Test that symbolic address fields get relocation entries."""
+    module = _assemble(MAIN_MODULE, "main")
+    targets = sorted((offset, symbol) for offset, symbol in module.relocations)
+    assert_eq(targets, [(0, "value"), (2, "double")])
+
+
+def _test_object_exports_imports():
+    """Test that .global and .extern are recorded."""
+    module = _assemble(MAIN_MODULE, "main")
+    assert_eq(module.exports, {"back": 4})
+    assert_eq(module.imports, ["double"])
+    assert_eq(len(module.code), 7, "Module should contain 3 instructions and 1 data byte")
+    assert_eq(module.code[6], 21)
+
+
+def _test_object_round_trip():
+    """Test ObjectModule serialization."""
+    from computer.assembler import ObjectModule
+
+    module = _assemble(LIB_MODULE, "lib")
+    copy = ObjectModule.from_dict(module.to_dict())
+    assert_eq(copy.code, module.code)
+    assert_eq(copy.relocations, module.relocations)
+    assert_eq(copy.exports, module.exports)
+
+
+def _test_linker_layout():
+    """Test modules are placed back to back on even addresses."""
+    from computer.linker import Linker
+
+    linker = Linker()
+    main = _assemble(MAIN_MODULE, "main")
+    lib = _assemble(LIB_MODULE, "lib")
+    layout = linker.layout_modules([main, lib], base=0)
+    assert_eq(layout, [0, 8], "7-byte module should push the next one to address 8")
+
+
+def _test_linker_resolves_symbols():
+    """Test relocations are patched with absolute addresses."""
+    from computer.linker import Linker
+
+    linker = Linker()
+    image = linker.link([_assemble(MAIN_MODULE, "main"), _assemble(LIB_MODULE, "lib")])
+    assert_not_none(image, "Linker.link() returned None")
+    assert_eq(linker.errors, [])
+    assert_eq(image[0], 6, "LOAD R1, value should point at address 6")
+    assert_eq(image[2], 8, "JMP double should point at the library base")
+    assert_eq(image[10], 4, "JMP back should point into the main module")
+    assert_eq(linker.symbol_table, {"back": 4, "double": 8})
+
+
+def _test_linker_undefined_symbol():
+    """Test that missing imports are reported."""
+    from computer.linker import Linker
+
+    linker = Linker()
+    linker.link([_assemble(MAIN_MODULE, "main")])
+    assert_true(len(linker.errors) > 0, "Linking without the library should report an error")
+    assert_in("double", linker.errors[0])
+
+
+def _test_linker_run_program():
+    """Test a linked image runs on the full system."""
+    from computer.linker import Linker
+    from computer.system import Computer
+
+    image = Linker().link([_assemble(MAIN_MODULE, "main"), _assemble(LIB_MODULE, "lib")])
+    comp = Computer()
+    comp.load_program(image)
+    state = comp.run(max_cycles=20)
+    assert_eq(state["registers"]["R0"], 42, "Linked program should double 21")
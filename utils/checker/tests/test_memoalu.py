@@ -0,0 +1,149 @@
+"""Test cases for memoized ALU."""
+
+from ..helpers import assert_eq, assert_true
+
+
+def get_tests() -> dict:
+    """Return all test cases for memoized ALU."""
+    from computer.memoalu import MemoALU  # noqa: F401
+
+    return {
+        # Results
+        "MemoALU_matches_alu_lru": lambda: _test_matches_alu("lru"),
+        "MemoALU_matches_alu_table": lambda: _test_matches_alu("table"),
+        "MemoALU_flags_are_new": lambda: _test_flags_are_new(),
+        # Caching
+        "MemoALU_lru_eviction": lambda: _test_lru_eviction(),
+        "MemoALU_table": lambda: _test_table(),
+        "MemoALU_fill": lambda: _test_fill(),
+        # In the CPU
+        "MemoALU_program": lambda: _test_program(),
+    }
+
+
+def _test_matches_alu(mode):
+    """Test cached results and flags equal the gate-level ALU's (twice, to include hits)."""
+    import random
+    from computer import int_to_bits
+    from computer.alu import ALU
+    from computer.memoalu import MemoALU
+
+    alu, memo = ALU(), MemoALU(mode, capacity=64)
+    rng = random.Random(0)
+    cases = [(rng.randrange(9), rng.randrange(256), rng.randrange(256)) for _ in range(300)]
+    for op, a, b in cases + cases:
+        args = (int_to_bits(a), int_to_bits(b), int_to_bits(op, 4))
+        result, flags = memo(*args)
+        expected, expected_flags = alu(*args)
+        assert_eq(list(result), expected, f"Result of op {op} on {a}, {b}")
+        assert_eq(flags, expected_flags, f"Flags of op {op} on {a}, {b}")
+    stats = memo.stats
+    assert_eq(stats["calls"], 600)
+    assert_eq(stats["hits"] + stats["misses"], 600)
+    assert_true(stats["hits"] > 0)
+
+
+def _test_flags_are_new():
+    """Test changing a returned flags dict does not change the cache."""
+    from computer import int_to_bits
+    from computer.memoalu import MemoALU
+
+    memo = MemoALU()
+    args = (int_to_bits(0), int_to_bits(0), int_to_bits(0, 4))
+    _, flags = memo(*args)
+    flags["Z"] = 0
+    _, flags = memo(*args)
+    assert_eq(flags, {"Z": 1, "C": 0, "N": 0, "V": 0})
+    assert_eq(memo.stats["hits"], 1)
+
+
+def _test_lru_eviction():
+    """Test the least recently used result is evicted at capacity."""
+    from computer.memoalu import MemoALU
+
+    memo = MemoALU("lru", capacity=2)
+    memo.lookup(0, 1, 1)
+    memo.lookup(0, 2, 2)
+    memo.lookup(0, 1, 1)  # Hit: (1, 1) is now the most recent
+    memo.lookup(0, 3, 3)  # Evicts (2, 2)
+    assert_eq(memo.size(), 2)
+    assert_eq(memo.stats["evictions"], 1)
+    memo.lookup(0, 1, 1)
+    assert_eq(memo.stats["hits"], 2, "(1, 1) should still be cached")
+    memo.lookup(0, 2, 2)
+    assert_eq(memo.stats["misses"], 4, "(2, 2) should have been evicted")
+    result, flags = memo.lookup(0, 0x7F, 0x01)
+    assert_eq(int(result), 0x80)
+    assert_eq(flags, (0, 0, 1, 1), "Z C N V as a tuple")
+    try:
+        MemoALU("magic")
+        assert_true(False, "Unknown mode should raise ValueError")
+    except ValueError:
+        pass
+
+
+def _test_table():
+    """Test the table never evicts and unary ops share one entry per a."""
+    from computer.memoalu import MemoALU
+
+    memo = MemoALU("table")
+    for b in range(256):
+        memo.lookup(6, 0x81, b)  # SHL ignores b
+    assert_eq(memo.stats["misses"], 1)
+    result, flags = memo.lookup(6, 0x81, 0)
+    assert_eq(int(result), 0x02)
+    assert_eq(flags, (0, 1, 0, 0))
+    for a in range(200):
+        memo.lookup(2, a, 0xF0)
+    report = memo.report()
+    assert_eq(report["entries"], 201)
+    assert_eq(report["evictions"], 0)
+    assert_eq(report["table_bytes"], 2 * 2 * 65536, "Two ops used, 2 bytes per entry")
+    assert_true(0 < report["hit_rate"] < 1)
+
+
+def _test_fill():
+    """Test fill() computes a whole op up front."""
+    from computer.memoalu import MemoALU
+
+    memo = MemoALU("table")
+    assert_eq(memo.fill(["NOT"]), 256)
+    assert_eq(memo.fill(["NOT"]), 0, "Filled entries are not computed again")
+    result, _ = memo.lookup(5, 0x0F, 0)
+    assert_eq(int(result), 0xF0)
+    assert_eq(memo.stats["misses"], 0)
+    try:
+        MemoALU("lru").fill()
+        assert_true(False, "fill() in 'lru' mode should raise ValueError")
+    except ValueError:
+        pass
+
+
+def _test_program():
+    """Test a program computes the same with a memoized ALU and hits the cache in its loop."""
+    from computer.memoalu import memoize_alu
+    from computer.system import Computer
+
+    source = """
+        LOAD R1, one
+        LOAD R2, count
+        LOAD R5, five
+    loop:
+        ADD R4, R5, R5
+        XOR R6, R4, R5
+        SUB R2, R2, R1
+        JNZ loop
+        HALT
+    one: .byte 1
+    count: .byte 10
+    five: .byte 5
+    """
+    computer = Computer()
+    computer.load_program(source)
+    alu = memoize_alu(computer.cpu.datapath, "lru", capacity=16)
+    computer.cpu.run(200)
+    registers = computer.cpu.datapath.reg_file
+    assert_eq(list(registers.read([0, 0, 1])), [0, 1, 0, 1, 0, 0, 0, 0], "R4 = 10")
+    assert_eq(list(registers.read([0, 1, 1])), [1, 1, 1, 1, 0, 0, 0, 0], "R6 = 10 ^ 5")
+    assert_eq(alu.stats["calls"], 30)
+    assert_eq(alu.stats["misses"], 12, "ADD and XOR miss once, each SUB misses")
@@ -0,0 +1,196 @@
+"""Test cases for multi-core computer."""
+
+from ..helpers import assert_eq, assert_true
+
+
+# Every core adds 1 to a shared counter `count` times, under lock 0
+LOCKED = """
+    LOAD R1, one
+    LOAD R2, count
+loop:
+    LOAD R3, 0xEC
+    SUB R4, R3, R0
+    JNZ loop
+    LOAD R4, counter
+    ADD R4, R4, R1
+    STORE R4, counter
+    STORE R0, 0xEC
+    SUB R2, R2, R1
+    JNZ loop
+    HALT
+one: .byte 1
+count: .byte 10
+counter: .byte 0
+"""
+
+# The same loop without the lock
+RACY = """
+    LOAD R1, one
+    LOAD R2, count
+loop:
+    LOAD R4, counter
+    ADD R4, R4, R1
+    STORE R4, counter
+    SUB R2, R2, R1
+    JNZ loop
+    HALT
+one: .byte 1
+count: .byte 10
+counter: .byte 0
+"""
+
+# Core 0 stores 5 at `a`, every other core stores its index at `b`
+CORE_IDS = """
+    LOAD R1, five
+    ADD R7, R7, R0
+    JNZ other
+    STORE R1, a
+    HALT
+other:
+    STORE R7, b
+    HALT
+five: .byte 5
+a: .byte 0
+b: .byte 0
+"""
+
+# Core 0 spins until core 1 overwrites the NOP with a HALT
+PATCH = """
+    ADD R7, R7, R0
+    JNZ patcher
+spin:
+    NOP
+    JMP spin
+patcher:
+    LOAD R1, halt
+    STORE R1, 0x05
+    HALT
+halt: .byte 0xF0
+"""
+
+COUNTDOWN = """
+    LOAD R1, one
+    LOAD R2, count
+loop:
+    ADD R3, R3, R2
+    SUB R2, R2, R1
+    JNZ loop
+    HALT
+one: .byte 1
+count: .byte 10
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for multi-core computer."""
+    from computer.multicore import MultiCoreComputer  # noqa: F401
+
+    return {
+        # Cores
+        "MultiCore_single_core_matches_cpu": lambda: _test_single_core(),
+        "MultiCore_core_ids": lambda: _test_core_ids(),
+        "MultiCore_shared_code": lambda: _test_shared_code(),
+        # Scheduler
+        "MultiCore_round_robin": lambda: _test_round_robin(),
+        "MultiCore_deterministic": lambda: _test_deterministic(),
+        "MultiCore_max_cycles": lambda: _test_max_cycles(),
+        # Synchronization
+        "MultiCore_race_loses_updates": lambda: _test_race(),
+        "MultiCore_test_and_set_lock": lambda: _test_lock(),
+    }
+
+
+def _machine(source, num_cores=2, quantum=1):
+    from computer.multicore import MultiCoreComputer
+
+    machine = MultiCoreComputer(num_cores, quantum=quantum)
+    machine.load_program(source)
+    return machine
+
+
+def _counter(machine):
+    return machine.read(machine.assembler.symbol_table["counter"])
+
+
+def _test_single_core():
+    """Test one core computes what the CPU computes."""
+    from computer.system import Computer
+
+    computer = Computer()
+    computer.load_program(COUNTDOWN)
+    expected_steps = computer.cpu.run(1000)
+    expected = computer.dump_state()
+
+    machine = _machine(COUNTDOWN, num_cores=1)
+    steps = machine.run(1000)
+    state = machine.get_state()["cores"][0]
+    assert_eq(steps, expected_steps)
+    assert_eq(state["registers"]["R3"], expected["registers"]["R3"])
+    assert_eq(state["flags"], expected["flags"])
+    assert_eq(state["cycle"], expected["cycle"])
+
+
+def _test_core_ids():
+    """Test each core starts with its index in R7."""
+    machine = _machine(CORE_IDS, num_cores=3)
+    machine.run(100)
+    symbols = machine.assembler.symbol_table
+    assert_eq(machine.halted, True)
+    assert_eq(machine.read(symbols["a"]), 5, "Core 0 stores 5")
+    assert_eq(machine.read(symbols["b"]), 2, "Core 2 stores last")
+    assert_eq([state["registers"]["R7"] for state in machine.get_state()["cores"]], [0, 1, 2])
+
+
+def _test_shared_code():
+    """Test a store by one core is seen by code another core already decoded."""
+    machine = _machine(PATCH)
+    machine.run(100)
+    assert_eq(machine.halted, True, "Core 0 should execute the patched HALT")
+    assert_true(machine.report()["cores"][0]["steps"] < 20)
+
+
+def _test_round_robin():
+    """Test each core runs `quantum` instructions per round."""
+    machine = _machine(COUNTDOWN, num_cores=3, quantum=4)
+    assert_eq(machine.step(), True)
+    assert_eq(machine.rounds, 1)
+    assert_eq([core["steps"] for core in machine.report()["cores"]], [4, 4, 4])
+    assert_eq([state["pc"] for state in machine.get_state()["cores"]], [8, 8, 8])
+
+
+def _test_deterministic():
+    """Test the same program always interleaves the same way."""
+    first = _machine(LOCKED, num_cores=3, quantum=3)
+    second = _machine(LOCKED, num_cores=3, quantum=3)
+    first.run(10000)
+    second.run(10000)
+    assert_eq(first.report(), second.report())
+    assert_eq(first.get_state(), second.get_state())
+
+
+def _test_max_cycles():
+    """Test max_cycles limits the instructions of each core."""
+    machine = _machine(COUNTDOWN, num_cores=2, quantum=3)
+    executed = machine.run(10)
+    assert_eq(executed, 20)
+    assert_eq([core["steps"] for core in machine.report()["cores"]], [10, 10])
+
+
+def _test_race():
+    """Test unsynchronized increments lose updates."""
+    machine = _machine(RACY, num_cores=4)
+    machine.run(10000)
+    assert_eq(machine.halted, True)
+    assert_true(_counter(machine) < 40, f"Expected lost updates, got {_counter(machine)}")
+
+
+def _test_lock():
+    """Test increments under the test-and-set lock are never lost."""
+    for quantum in [1, 3]:
+        machine = _machine(LOCKED, num_cores=4, quantum=quantum)
+        machine.run(10000)
+        assert_eq(machine.halted, True)
+        assert_eq(_counter(machine), 40, f"quantum={quantum}")
+        locks = machine.report()["locks"]
+        assert_eq(locks["acquired"], 40)
+        assert_true(locks["contended"] > 0, "Cores should have waited for the lock")
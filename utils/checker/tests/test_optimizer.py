@@ -0,0 +1,120 @@
+"""Test cases for peephole optimizer."""
+
+from ..helpers import assert_eq, assert_true, assert_not_none, bits_to_int
+
+
+def get_tests() -> dict:
+    """Return all test cases for peephole optimizer."""
+    from computer.optimizer import PeepholeOptimizer  # noqa: F401
+
+    return {
+        # Individual optimizations
+        "Optimizer_nop_move": lambda: _test_nop_move(),
+        "Optimizer_fold_loads": lambda: _test_fold_loads(),
+        "Optimizer_store_invalidates_load": lambda: _test_store_invalidates(),
+        "Optimizer_thread_jumps": lambda: _test_thread_jumps(),
+        "Optimizer_unreachable_code": lambda: _test_unreachable(),
+        # Whole programs
+        "Optimizer_disabled_by_default": lambda: _test_disabled_by_default(),
+        "Optimizer_measure_multiply": lambda: _test_measure_multiply(),
+    }
+
+
+MULTIPLY = """
+    LOAD R1, num_a
+    LOAD R2, num_b
+    MOV R0, R0
+    LOAD R3, one
+loop:
+    ADD R0, R0, R1
+    SUB R2, R2, R3
+    JNZ loop
+    STORE R0, result
+    HALT
+num_a:
+    .byte 5
+num_b:
+    .byte 3
+one:
+    .byte 1
+result:
+    .byte 0
+"""
+
+
+def _optimize(source):
+    from computer.assembler import Assembler
+
+    asm = Assembler(optimize=True)
+    code = asm.assemble(source)
+    assert_not_none(code, "Assembler.assemble() returned None")
+    return [bits_to_int(instr) for instr in code], asm.optimizer.stats
+
+
+def _test_nop_move():
+    """Test MOV Rx, Rx is removed."""
+    words, stats = _optimize("MOV R0, R0\nMOV R1, R2\nHALT")
+    assert_eq(words, [0x3120, 0xF000])
+    assert_eq(stats["nop_moves"], 1)
+
+
+def _test_fold_loads():
+    """Test repeated loads of one address reuse the register."""
+    words, stats = _optimize("LOAD R1, 0x40\nLOAD R2, 0x40\nLOAD R1, 0x40\nHALT")
+    assert_eq(words, [0x1140, 0x3210, 0xF000], "Second load becomes MOV, third load is dropped")
+    assert_eq(stats["folded_loads"], 2)
+
+
+def _test_store_invalidates():
+    """Test a STORE to the address forwards the stored register instead."""
+    words, _ = _optimize("LOAD R1, 0x40\nSTORE R2, 0x40\nLOAD R3, 0x40\nHALT")
+    assert_eq(words, [0x1140, 0x2240, 0x3320, 0xF000], "LOAD after STORE should copy the stored register")
+
+
+def _test_thread_jumps():
+    """Test jumps to jumps are threaded."""
+    source = """
+    JZ hop
+    HALT
+hop:
+    JMP end
+end:
+    HALT
+"""
+    words, stats = _optimize(source)
+    assert_eq(words, [0xD004, 0xF000, 0xF000], "JZ should go straight to 'end', JMP to next is dropped")
+    assert_true(stats["threaded_jumps"] >= 1)
+
+
+def _test_unreachable():
+    """Test code after HALT/JMP is removed."""
+    source = """
+    JMP skip
+    ADD R0, R1, R2
+skip:
+    HALT
+    NOP
+"""
+    words, stats = _optimize(source)
+    assert_eq(words, [0xF000])
+    assert_eq(stats["unreachable"], 2)
+
+
+def _test_disabled_by_default():
+    """Test the plain assembler output is unchanged."""
+    from computer.assembler import Assembler
+
+    code = Assembler().assemble("MOV R0, R0\nHALT")
+    assert_not_none(code, "Assembler.assemble() returned None")
+    assert_eq(len(code), 2)
+
+
+def _test_measure_multiply():
+    """Test the before/after cycle report on multiply."""
+    from computer.optimizer import measure_cycles
+
+    report = measure_cycles(MULTIPLY)
+    assert_eq(report["before"], 14)
+    assert_eq(report["after"], 13, "Removing MOV R0, R0 saves one cycle")
+    assert_eq(report["saved"], 1)
+    assert_eq(report["registers_match"], True)
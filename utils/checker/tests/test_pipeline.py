@@ -0,0 +1,158 @@
+"""Test cases for pipelined CPU."""
+
+from ..helpers import assert_eq, assert_true, assert_not_none
+
+
+COUNTDOWN = """
+    LOAD R1, one
+    LOAD R2, count
+    LOAD R3, zero
+loop:
+    ADD R3, R3, R2
+    MOV R4, R3
+    SUB R2, R2, R1
+    JNZ loop
+    HALT
+one: .byte 1
+count: .byte 10
+zero: .byte 0
+"""
+
+# Each instruction reads the register written by the one before it
+DEPENDENT = """
+    LOAD R1, value
+    ADD R2, R1, R1
+    ADD R3, R2, R2
+    STORE R3, result
+    HALT
+value: .byte 3
+result: .byte 0
+"""
+
+INDEPENDENT = """
+    LOAD R1, value
+    LOAD R2, value
+    ADD R3, R1, R2
+    NOP
+    HALT
+value: .byte 3
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for pipelined CPU."""
+    from computer.pipeline import PipelinedCPU  # noqa: F401
+
+    return {
+        # Same results as the single-cycle CPU
+        "Pipeline_matches_cpu": lambda: _test_matches_cpu(COUNTDOWN),
+        "Pipeline_matches_cpu_no_forwarding": lambda: _test_matches_cpu(COUNTDOWN, forwarding=False),
+        "Pipeline_matches_cpu_stall_policy": lambda: _test_matches_cpu(COUNTDOWN, branch_policy="stall"),
+        # Timing
+        "Pipeline_fill_and_drain": lambda: _test_fill_and_drain(),
+        "Pipeline_forwarding": lambda: _test_forwarding(),
+        "Pipeline_raw_stalls": lambda: _test_raw_stalls(),
+        "Pipeline_branch_flush": lambda: _test_branch_flush(),
+        "Pipeline_stage_latches": lambda: _test_stage_latches(),
+        "Pipeline_cpi_report": lambda: _test_cpi_report(),
+    }
+
+
+def _run(source, **options):
+    from computer.pipeline import PipelinedCPU
+    from computer.system import Computer
+
+    computer = Computer(cpu=PipelinedCPU(**options))
+    computer.load_program(source)
+    steps = computer.cpu.run(1000)
+    return computer, steps
+
+
+def _test_matches_cpu(source, **options):
+    """Test the pipeline computes what the single-cycle CPU computes."""
+    from computer.system import Computer
+
+    reference = Computer()
+    reference.load_program(source)
+    expected_steps = reference.cpu.run(1000)
+    expected = reference.dump_state()
+
+    computer, steps = _run(source, **options)
+    state = computer.dump_state()
+    assert_eq(steps, expected_steps, "run() should count the same instructions")
+    assert_eq(state["registers"], expected["registers"])
+    assert_eq(state["flags"], expected["flags"])
+    assert_eq(state["pc"], expected["pc"])
+    assert_eq(state["halted"], True)
+
+
+def _test_fill_and_drain():
+    """Test independent instructions take 3 extra cycles to fill the pipeline."""
+    computer, _ = _run(INDEPENDENT)
+    report = computer.cpu.report()
+    assert_not_none(report, "PipelinedCPU.report() returned None")
+    assert_eq(report["instructions"], 5)
+    assert_eq(report["cycles"], 5 + 3)
+    assert_eq(report["stalls"], 0)
+    assert_eq(computer.dump_state()["cycle"], 8, "The clock should count pipeline cycles")
+
+
+def _test_forwarding():
+    """Test forwarding removes RAW stalls."""
+    computer, _ = _run(DEPENDENT)
+    report = computer.cpu.report()
+    assert_eq(report["raw_hazards"], 3)
+    assert_eq(report["forwards"], 3)
+    assert_eq(report["stalls"], 0)
+    assert_eq(computer.dump_state()["registers"]["R3"], 12)
+
+
+def _test_raw_stalls():
+    """Test each RAW hazard costs one cycle without forwarding."""
+    forwarded, _ = _run(DEPENDENT)
+    stalled, _ = _run(DEPENDENT, forwarding=False)
+    report = stalled.cpu.report()
+    assert_eq(report["stalls"], 3)
+    assert_eq(report["forwards"], 0)
+    assert_eq(report["cycles"], forwarded.cpu.report()["cycles"] + 3)
+    assert_eq(stalled.dump_state()["registers"]["R3"], 12)
+
+
+def _test_branch_flush():
+    """Test taken branches flush two instructions; 'stall' pays for every branch."""
+    flush, _ = _run(COUNTDOWN)
+    stall, _ = _run(COUNTDOWN, branch_policy="stall")
+    flush_report = flush.cpu.report()
+    stall_report = stall.cpu.report()
+    assert_eq(flush_report["flushes"], 9, "JNZ is taken 9 times")
+    assert_eq(stall_report["flushes"], 0)
+    assert_eq(stall_report["stalls"], 2 * 10, "Two bubbles for each of the 10 branches")
+    assert_eq(stall_report["cycles"] - flush_report["cycles"], 2, "Only the not-taken branch costs more")
+
+
+def _test_stage_latches():
+    """Test instructions move through the stages one per cycle."""
+    from computer.pipeline import PipelinedCPU
+    from computer.system import Computer
+
+    computer = Computer(cpu=PipelinedCPU())
+    computer.load_program("NOP\nNOP\nNOP\nHALT")
+    cpu = computer.cpu
+    for _ in range(3):
+        cpu.clock_cycle()
+    state = cpu.pipeline_state()
+    assert_not_none(state, "PipelinedCPU.pipeline_state() returned None")
+    assert_eq(state, {"FETCH": 6, "DECODE": 4, "EXECUTE": 2, "WRITEBACK": 0})
+    retired = cpu.clock_cycle()
+    assert_eq(retired["pc"], 0, "The first NOP retires in cycle 4")
+
+
+def _test_cpi_report():
+    """Test the CPI summary."""
+    from computer.pipeline import cpi_report
+
+    report = cpi_report(COUNTDOWN)
+    assert_not_none(report, "cpi_report() returned None")
+    assert_eq(report["instructions"], 44)
+    assert_true(1.0 < report["cpi"] < 2.0, f"CPI should be between 1 and 2, got {report['cpi']:.2f}")
+    assert_eq(report["cpi"], report["cycles"] / report["instructions"])
@@ -0,0 +1,153 @@
+"""Test cases for branch predictors."""
+
+from ..helpers import assert_eq, assert_true, assert_not_none
+
+
+COUNTDOWN = """
+    LOAD R0, start
+    LOAD R1, one
+loop:
+    SUB R0, R0, R1
+    JNZ loop
+    JMP done
+done:
+    HALT
+start: .byte 5
+one: .byte 1
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for branch predictors."""
+    from computer.predictor import BranchPredictor  # noqa: F401
+
+    return {
+        # Direction predictors
+        "Predictor_static": lambda: _test_static(),
+        "Predictor_one_bit": lambda: _test_one_bit(),
+        "Predictor_two_bit_saturates": lambda: _test_two_bit(),
+        "Predictor_gshare_history": lambda: _test_gshare(),
+        # Targets
+        "Predictor_btb": lambda: _test_btb(),
+        # Statistics and CPU hook
+        "Predictor_cycles_saved": lambda: _test_cycles_saved(),
+        "Predictor_cpu_hook": lambda: _test_cpu_hook(),
+        "Predictor_pipeline_hook": lambda: _test_cpu_hook(pipelined=True),
+        "Predictor_compare": lambda: _test_compare(),
+    }
+
+
+def _loop(predictor, outcomes, pc=0x08, target=0x04):
+    """Feed a sequence of outcomes for one branch; return predictions made."""
+    predictions = []
+    for taken in outcomes:
+        predictions.append(predictor.predict(pc))
+        predictor.record(pc, "JNZ", taken, target)
+    return predictions
+
+
+def _test_static():
+    """Test backward-taken forward-not-taken."""
+    from computer.predictor import StaticPredictor
+
+    predictor = StaticPredictor("btfn")
+    predictor.record(0x08, "JNZ", True, 0x04)
+    assert_eq(predictor.predict(0x08), True, "Backward branch should be predicted taken")
+    predictor.record(0x10, "JZ", False, 0x20)
+    assert_eq(predictor.predict(0x10), False, "Forward branch should be predicted not taken")
+    assert_eq(StaticPredictor("taken").predict(0x10), True)
+
+
+def _test_one_bit():
+    """Test 1-bit predictor mispredicts twice per loop exit."""
+    from computer.predictor import OneBitPredictor
+
+    predictor = OneBitPredictor()
+    outcomes = [True, True, False] * 2
+    assert_eq(_loop(predictor, outcomes), [False, True, True, False, True, True])
+    assert_eq(predictor.report()["correct"], 2)
+
+
+def _test_two_bit():
+    """Test 2-bit counters need two misses to change prediction."""
+    from computer.predictor import TwoBitPredictor
+
+    predictor = TwoBitPredictor()
+    predictions = _loop(predictor, [True, True, True, False, True])
+    assert_eq(predictions, [False, True, True, True, True])
+    assert_eq(predictor.table[0x08 >> 1], 3, "Counter should saturate at 3")
+    _loop(predictor, [False] * 5)
+    assert_eq(predictor.table[0x08 >> 1], 0, "Counter should saturate at 0")
+
+
+def _test_gshare():
+    """Test gshare learns an alternating pattern a 2-bit counter cannot."""
+    from computer.predictor import GsharePredictor, TwoBitPredictor
+
+    outcomes = [True, False] * 20
+    gshare = GsharePredictor()
+    _loop(gshare, outcomes)
+    two_bit = TwoBitPredictor()
+    _loop(two_bit, outcomes)
+    assert_true(
+        gshare.report()["accuracy"] > 0.8, f"gshare accuracy {gshare.report()['accuracy']:.2f} should exceed 0.8"
+    )
+    assert_true(two_bit.report()["accuracy"] < 0.6, "A 2-bit counter should not learn alternation")
+
+
+def _test_btb():
+    """Test BTB hits after the first taken jump."""
+    from computer.predictor import BranchTargetBuffer
+
+    btb = BranchTargetBuffer(size=4)
+    assert_true(btb.target(0x08) is None, "Empty BTB should miss")
+    btb.record(0x08, "JMP", True, 0x20)
+    assert_eq(btb.target(0x08), 0x20)
+    assert_true(btb.target(0x10) is None, "0x10 maps to the same entry but has another tag")
+    btb.record(0x10, "JMP", True, 0x30)
+    assert_true(btb.target(0x08) is None, "Conflicting entry should be evicted")
+    assert_eq(btb.tags.itemsize, 2, "Tags should live in a compact array")
+
+
+def _test_cycles_saved():
+    """Test cycle estimate against the predict-not-taken baseline."""
+    from computer.predictor import BranchTargetBuffer, TwoBitPredictor
+
+    # Taken 4 times then exits: the weakly-not-taken counter predicts T from the 2nd branch
+    two_bit = TwoBitPredictor()
+    _loop(two_bit, [True, True, True, True, False])
+    # A miss on taken saves 0, a hit without BTB saves 1, the final miss costs 2
+    assert_eq(two_bit.report()["cycles_saved"], 0 + 1 + 1 + 1 - 2)
+    btb = BranchTargetBuffer()
+    _loop(btb, [True, True, True, True, False])
+    # Hits from the 2nd branch on save the full 2 cycles
+    assert_eq(btb.report()["cycles_saved"], 0 + 2 + 2 + 2 - 2)
+
+
+def _test_cpu_hook(pipelined=False):
+    """Test CPU.step (or the pipeline's EXECUTE stage) reports every jump."""
+    from computer.pipeline import PipelinedCPU
+    from computer.predictor import OneBitPredictor
+    from computer.system import Computer
+
+    computer = Computer(cpu=PipelinedCPU() if pipelined else None)
+    predictor = OneBitPredictor()
+    computer.cpu.branch_predictor = predictor
+    computer.load_program(COUNTDOWN)
+    computer.run()
+    report = predictor.report()
+    assert_not_none(report, "BranchPredictor.report() returned None")
+    assert_eq(report["branches"], 5)
+    assert_eq(report["taken"], 4)
+    assert_eq(report["jumps"], 1)
+    assert_eq(report["accuracy"], 3 / 5)
+
+
+def _test_compare():
+    """Test running a program once per predictor."""
+    from computer.predictor import compare_predictors
+
+    reports = compare_predictors(COUNTDOWN)
+    assert_not_none(reports, "compare_predictors() returned None")
+    assert_true({"static-btfn", "1-bit", "2-bit", "gshare", "btb"} <= set(reports))
+    assert_eq(reports["1-bit"]["branches"], 5)
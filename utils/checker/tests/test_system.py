@@ -1,6 +1,6 @@
 """Test cases for full system integration."""
 
-from ..helpers import assert_eq, assert_not_none, int_to_bits
+from ..helpers import assert_eq, assert_not_none, bits_to_int, int_to_bits
 
 
 def get_tests() -> dict:
@@ -12,6 +12,7 @@ def get_tests() -> dict:
         "System_run_add_program": lambda: _test_system_add_program(),
         "System_run_mov_program": lambda: _test_system_mov_program(),
         "System_run_memory_program": lambda: _test_system_memory_program(),
+        "System_flags_after_add": lambda: _test_system_flags_after_add(),
     }
 
 
@@ -70,3 +71,27 @@ def _test_system_memory_program():
     state = comp.run(max_cycles=100)
     assert_not_none(state, "Computer.run() returned None")
     assert_eq(state["registers"]["R1"], 99, "LOAD should retrieve 99 from memory")
+
+
+def _test_system_flags_after_add():
+    """Test the flags JZ/JNZ and get_state() see after an ADD."""
+    from computer.system import Computer
+
+    computer = Computer()
+    computer.load_program(
+        """
+        LOAD R1, big
+        ADD R2, R1, R1
+        JZ skip
+        STORE R2, 0x90
+    skip:
+        HALT
+    big: .byte 0x80
+    """
+    )
+    computer.cpu.run(10)
+    state = computer.cpu.get_state()
+    assert_eq(state["flags"], {"Z": 1, "C": 1, "N": 0, "V": 1}, "0x80 + 0x80 = 0x00 with carry and overflow")
+    assert_eq(type(state["flags"]), dict, "get_state() returns a plain dict")
+    memory = computer.cpu.datapath.memory
+    assert_eq(bits_to_int(memory.read(int_to_bits(0x90))), 0, "JZ should skip the STORE")
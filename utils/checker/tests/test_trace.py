@@ -0,0 +1,188 @@
+"""Test cases for execution trace."""
+
+import io
+
+from ..helpers import assert_eq, assert_true
+
+
+COUNTDOWN = """
+    LOAD R1, one
+    LOAD R2, count
+loop:
+    SUB R2, R2, R1
+    STORE R2, 0x80
+    JNZ loop
+    HALT
+one: .byte 1
+count: .byte 3
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for execution trace."""
+    from computer.trace import TraceWriter  # noqa: F401
+
+    return {
+        # Format
+        "Trace_round_trip": lambda: _test_round_trip(),
+        "Trace_blocks": lambda: _test_blocks(),
+        "Trace_zlib": lambda: _test_zlib(),
+        "Trace_bad_input": lambda: _test_bad_input(),
+        "Trace_optional_dependencies": lambda: _test_optional_dependencies(),
+        # Recording
+        "Trace_cpu_records": lambda: _test_cpu_records(),
+        "Trace_fast_matches_cpu": lambda: _test_fast_matches_cpu(),
+        "Trace_pipeline_matches_cpu": lambda: _test_pipeline_matches_cpu(),
+    }
+
+
+def _read(buffer):
+    from computer.trace import TraceReader
+
+    buffer.seek(0)
+    return list(TraceReader(buffer))
+
+
+def _cpu_trace(source, cpu=None, **options):
+    from computer.system import Computer
+    from computer.trace import TraceWriter
+
+    computer = Computer(cpu=cpu)
+    computer.load_program(source)
+    buffer = io.BytesIO()
+    writer = TraceWriter(buffer, **options)
+    computer.cpu.tracer = writer
+    steps = computer.cpu.run(1000)
+    writer.close()
+    return buffer, steps
+
+
+def _test_round_trip():
+    """Test records are read back exactly."""
+    from computer.trace import RECORD, TraceWriter
+
+    buffer = io.BytesIO()
+    writer = TraceWriter(buffer)
+    writer.record(70000, 0x12, 0x2380, 0b0101, 2, 0, 0, 0x80, 7)
+    writer.record(70001, 0x14, 0x4123, 0b0001, 1, 1, 0, 0, 0)
+    writer.close()
+    records = _read(buffer)
+    assert_eq(len(records), 2)
+    assert_eq(tuple(records[0]), (70000, 0x12, 0x2380, 0b0101, 2, 0, 0, 0x80, 7))
+    assert_eq(records[1].reg, 1)
+    assert_eq(RECORD.size, 13, "Records are 13 bytes")
+
+
+def _test_blocks():
+    """Test records spanning several blocks stream back in order."""
+    from computer.trace import TraceReader, TraceWriter
+
+    buffer = io.BytesIO()
+    writer = TraceWriter(buffer, block_records=3)
+    for i in range(10):
+        writer.record(i, i, 0, 0, 0, 0, 0, 0, 0)
+    writer.close()
+    assert_eq(writer.count, 10)
+    buffer.seek(0)
+    assert_eq(len(list(TraceReader(buffer).blocks())), 4)
+    assert_eq([record.cycle for record in _read(buffer)], list(range(10)))
+
+
+def _test_zlib():
+    """Test zlib blocks are smaller and hold the same records."""
+    plain, _ = _cpu_trace(COUNTDOWN)
+    packed, _ = _cpu_trace(COUNTDOWN, compression="zlib")
+    assert_eq(_read(packed), _read(plain))
+    assert_true(len(packed.getvalue()) < len(plain.getvalue()), "zlib trace should be smaller")
+
+
+def _test_bad_input():
+    """Test unknown compression and foreign files are rejected."""
+    from computer.trace import TraceReader, TraceWriter
+
+    try:
+        TraceWriter(io.BytesIO(), compression="lzma")
+        assert_true(False, "Should reject unknown compression")
+    except ValueError:
+        pass
+    try:
+        TraceReader(io.BytesIO(b"NOPE\x01\x00\x0d"))
+        assert_true(False, "Should reject a file without the trace header")
+    except ValueError:
+        pass
+
+
+def _test_optional_dependencies():
+    """Test zstd and NumPy work when installed and fail clearly otherwise."""
+    from computer import trace
+
+    if trace.zstandard is None:
+        try:
+            trace.TraceWriter(io.BytesIO(), compression="zstd")
+            assert_true(False, "zstd without zstandard should raise ImportError")
+        except ImportError:
+            pass
+    else:
+        packed, _ = _cpu_trace(COUNTDOWN, compression="zstd")
+        plain, _ = _cpu_trace(COUNTDOWN)
+        assert_eq(_read(packed), _read(plain))
+
+    buffer, steps = _cpu_trace(COUNTDOWN)
+    buffer.seek(0)
+    if trace.np is None:
+        try:
+            trace.TraceReader(buffer).to_numpy()
+            assert_true(False, "to_numpy without NumPy should raise ImportError")
+        except ImportError:
+            pass
+    else:
+        array = trace.TraceReader(buffer).to_numpy()
+        assert_eq(len(array), steps + 1)
+        assert_eq(int(array["pc"][-1]), 10)
+
+
+def _test_cpu_records():
+    """Test CPU.step records PCs, register and memory writes, and flags."""
+    from computer.trace import WRITE_MEM, WRITE_REG, unpack_flags
+
+    buffer, steps = _cpu_trace(COUNTDOWN)
+    records = _read(buffer)
+    assert_eq(len(records), steps + 1, "One record per instruction, including HALT")
+    assert_eq([r.pc for r in records[:6]], [0, 2, 4, 6, 8, 4])
+    assert_eq((records[1].writes, records[1].reg, records[1].reg_value), (WRITE_REG, 2, 3))
+    store = records[3]
+    assert_eq((store.writes, store.address, store.mem_value), (WRITE_MEM, 0x80, 2))
+    last_sub = records[-4]
+    assert_eq(last_sub.reg_value, 0)
+    assert_eq(unpack_flags(last_sub.flags)["Z"], 1)
+    assert_eq(records[-1].word >> 12, 0xF, "Last record is the HALT")
+
+
+def _test_fast_matches_cpu():
+    """Test trace_fast records the same trace as the CPU."""
+    from computer.fastcpu import FastCPU
+    from computer.system import Computer
+    from computer.trace import TraceWriter, trace_fast
+
+    expected, expected_steps = _cpu_trace(COUNTDOWN)
+    computer = Computer()
+    computer.load_program(COUNTDOWN)
+    buffer = io.BytesIO()
+    writer = TraceWriter(buffer, compression="zlib")
+    steps = trace_fast(FastCPU.from_computer(computer), writer, 1000)
+    writer.close()
+    assert_eq(steps, expected_steps)
+    assert_eq(_read(buffer), _read(expected))
+
+
+def _test_pipeline_matches_cpu():
+    """Test the pipelined CPU records each instruction as it retires."""
+    from computer.pipeline import PipelinedCPU
+
+    expected, expected_steps = _cpu_trace(COUNTDOWN)
+    buffer, steps = _cpu_trace(COUNTDOWN, PipelinedCPU())
+    records = _read(buffer)
+    assert_eq(steps, expected_steps)
+    assert_eq([tuple(r)[1:] for r in records], [tuple(r)[1:] for r in _read(expected)], "Same records apart from cycle")
+    cycles = [r.cycle for r in records]
+    assert_eq(cycles, sorted(cycles), "Cycles should increase")
@@ -0,0 +1,140 @@
+"""Test cases for VCD waveform export."""
+
+import io
+
+from ..helpers import assert_eq, assert_in, assert_true
+
+
+COUNTDOWN = """
+    LOAD R1, one
+    LOAD R2, count
+loop:
+    SUB R2, R2, R1
+    STORE R2, 0x80
+    JNZ loop
+    HALT
+one: .byte 1
+count: .byte 3
+"""
+
+
+def get_tests() -> dict:
+    """Return all test cases for VCD waveform export."""
+    from computer.vcd import VCDWriter  # noqa: F401
+
+    return {
+        # Writer
+        "VCD_identifiers": lambda: _test_identifiers(),
+        "VCD_header": lambda: _test_header(),
+        "VCD_only_changes": lambda: _test_only_changes(),
+        "VCD_time_increases": lambda: _test_time_increases(),
+        # Recorder
+        "VCD_program_waveforms": lambda: _test_program_waveforms(),
+        "VCD_signal_selection": lambda: _test_signal_selection(),
+        "VCD_detach": lambda: _test_detach(),
+    }
+
+
+def _text(buffer):
+    return buffer.getvalue().decode("ascii")
+
+
+def _test_identifiers():
+    """Test identifier codes are unique printable strings."""
+    from computer.vcd import identifier
+
+    codes = [identifier(i) for i in range(500)]
+    assert_eq(len(set(codes)), 500)
+    assert_eq(codes[0], "!")
+    assert_eq(len(codes[93]), 1)
+    assert_eq(len(codes[94]), 2)
+    assert_true(all(33 <= ord(c) <= 126 for code in codes for c in code))
+
+
+def _test_header():
+    """Test declarations, scopes and vector/scalar value lines."""
+    from computer.vcd import VCDWriter
+
+    buffer = io.BytesIO()
+    writer = VCDWriter(buffer, timescale="10ns")
+    writer.add_signal("pc", 8)
+    writer.add_signal("control.mem_write")
+    writer.dump(0, {"pc": 5, "control.mem_write": 1})
+    writer.close()
+    lines = _text(buffer).splitlines()
+    assert_in("$timescale 10ns $end", lines)
+    assert_in("$var wire 8 ! pc $end", lines)
+    assert_in("$scope module control $end", lines)
+    assert_in('$var wire 1 " mem_write $end', lines)
+    assert_eq(lines[lines.index("$enddefinitions $end") + 1 :], ["#0", "b101 !", '1"'])
+
+
+def _test_only_changes():
+    """Test unchanged signals and quiet time steps are not written."""
+    from computer.vcd import VCDWriter, parse_vcd
+
+    buffer = io.BytesIO()
+    writer = VCDWriter(buffer)
+    writer.add_signal("a", 4)
+    writer.add_signal("b")
+    assert_eq(writer.dump_values(0, [3, 0]), 2)
+    assert_eq(writer.dump_values(1, [3, 0]), 0)
+    assert_eq(writer.dump_values(2, [3, 1]), 1)
+    writer.close()
+    assert_true("#1" not in _text(buffer).split(), "A time step without changes is skipped")
+    assert_eq(parse_vcd(_text(buffer)), {"a": [(0, 3)], "b": [(0, 0), (2, 1)]})
+
+
+def _test_time_increases():
+    """Test time must move forward."""
+    from computer.vcd import VCDWriter
+
+    writer = VCDWriter(io.BytesIO())
+    writer.add_signal("a")
+    writer.dump_values(5, [1])
+    try:
+        writer.dump_values(5, [0])
+    except ValueError:
+        return
+    assert_true(False, "Repeating a time step should raise ValueError")
+
+
+def _test_program_waveforms():
+    """Test PC, register and control waveforms of a program."""
+    from computer.vcd import parse_vcd, record_vcd
+
+    buffer = io.BytesIO()
+    report = record_vcd(COUNTDOWN, buffer)
+    waves = parse_vcd(_text(buffer))
+    assert_eq(report["instructions"], 11)
+    assert_eq([value for _, value in waves["pc"]], [0, 2, 4, 6, 8, 4, 6, 8, 4, 6, 8, 10])
+    assert_eq([value for _, value in waves["registers.R2"]], [0, 3, 2, 1, 0])
+    assert_eq([value for _, value in waves["control.mem_write"]], [0, 1, 0, 1, 0, 1, 0])
+    assert_eq(waves["flags.Z"][-1][1], 1)
+    total = report["samples"] * len(waves)
+    assert_true(report["changes"] < total / 2, "Most signals should not change every sample")
+
+
+def _test_signal_selection():
+    """Test only the selected signals and groups are declared."""
+    from computer.vcd import parse_vcd, record_vcd
+
+    buffer = io.BytesIO()
+    record_vcd(COUNTDOWN, buffer, signals=["pc", "alu", "registers.R2"])
+    waves = parse_vcd(_text(buffer))
+    assert_eq(sorted(waves), ["alu.flags", "alu.result", "pc", "registers.R2"])
+    assert_eq(waves["alu.result"][-1][1], 0)
+
+
+def _test_detach():
+    """Test closing the recorder restores the CPU."""
+    from computer.system import Computer
+    from computer.vcd import VCDRecorder
+
+    computer = Computer()
+    control, alu = computer.cpu.control, computer.cpu.datapath.alu
+    recorder = VCDRecorder(computer.cpu, io.BytesIO(), signals=["pc"])
+    assert_true(computer.cpu.tracer is recorder)
+    recorder.close()
+    assert_true(computer.cpu.tracer is None)
+    assert_true(computer.cpu.control is control and computer.cpu.datapath.alu is alu)